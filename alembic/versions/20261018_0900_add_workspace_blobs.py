@@ -0,0 +1,36 @@
+"""Add workspace_blobs table for content-addressed workspace storage
+
+Revision ID: 008_workspace_blobs
+Revises: 007_purpose_role_guidance
+Create Date: 2026-10-18 09:00:00.000000
+
+Workspace files are stored once per distinct content (SHA-256) with a
+reference count, so identical uploads across Minds share one blob.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '008_workspace_blobs'
+down_revision: Union[str, None] = '007_purpose_role_guidance'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create workspace_blobs table."""
+    op.create_table(
+        'workspace_blobs',
+        sa.Column('content_hash', sa.String(64), primary_key=True),
+        sa.Column('size_bytes', sa.Integer, nullable=False, default=0),
+        sa.Column('ref_count', sa.Integer, nullable=False, default=0),
+        sa.Column('created_at', sa.DateTime, nullable=False),
+    )
+
+
+def downgrade() -> None:
+    """Drop workspace_blobs table."""
+    op.drop_table('workspace_blobs')
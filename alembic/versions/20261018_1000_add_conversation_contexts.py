@@ -0,0 +1,64 @@
+"""Add conversation_contexts table for proactive follow-ups
+
+Revision ID: 009_conversation_contexts
+Revises: 008_workspace_blobs
+Create Date: 2026-10-18 10:00:00.000000
+
+Proactive conversation contexts were stored as JSON in vector memory
+metadata and found again with a semantic search. They now live in their
+own table, indexed by user and by follow-up due time.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '009_conversation_contexts'
+down_revision: Union[str, None] = '008_workspace_blobs'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create conversation_contexts table."""
+    op.create_table(
+        'conversation_contexts',
+        sa.Column('context_id', sa.String(100), primary_key=True),
+        sa.Column('mind_gmid', sa.String(50), sa.ForeignKey('minds.gmid'), nullable=False),
+        sa.Column('user_email', sa.String(255), nullable=True),
+        sa.Column('environment_id', sa.String(100), nullable=True),
+        sa.Column('topic', sa.String(50), nullable=False),
+        sa.Column('subject', sa.String(255), nullable=False),
+        sa.Column('initial_message', sa.Text, nullable=True),
+        sa.Column('follow_up_question', sa.Text, nullable=True),
+        sa.Column('follow_up_scheduled', sa.DateTime, nullable=True),
+        sa.Column('follow_up_sent', sa.Boolean, default=False),
+        sa.Column('follow_up_status', sa.String(20), nullable=False),
+        sa.Column('resolved', sa.Boolean, default=False),
+        sa.Column('resolved_at', sa.DateTime, nullable=True),
+        sa.Column('resolution_note', sa.Text, nullable=True),
+        sa.Column('created_at', sa.DateTime, nullable=False),
+        sa.Column('last_updated', sa.DateTime, nullable=False),
+        sa.Column('importance', sa.Float, default=0.5),
+        sa.Column('urgency', sa.Float, default=0.5),
+        sa.Column('interaction_count', sa.Integer, default=0),
+        sa.Column('last_mention', sa.DateTime, nullable=True),
+        sa.Column('extra_data', sa.JSON, nullable=True),
+    )
+    op.create_index('ix_conversation_contexts_mind_gmid', 'conversation_contexts', ['mind_gmid'])
+    op.create_index('ix_conversation_contexts_user', 'conversation_contexts', ['mind_gmid', 'user_email'])
+    op.create_index(
+        'ix_conversation_contexts_due',
+        'conversation_contexts',
+        ['mind_gmid', 'follow_up_status', 'follow_up_scheduled'],
+    )
+
+
+def downgrade() -> None:
+    """Drop conversation_contexts table."""
+    op.drop_index('ix_conversation_contexts_due', table_name='conversation_contexts')
+    op.drop_index('ix_conversation_contexts_user', table_name='conversation_contexts')
+    op.drop_index('ix_conversation_contexts_mind_gmid', table_name='conversation_contexts')
+    op.drop_table('conversation_contexts')
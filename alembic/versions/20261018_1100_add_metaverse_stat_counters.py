@@ -0,0 +1,37 @@
+"""Add materialized stat counters to metaverse_state
+
+Revision ID: 010_metaverse_stat_counters
+Revises: 009_conversation_contexts
+Create Date: 2026-10-18 11:00:00.000000
+
+/metaverse/stats used to run seven COUNT(*) queries per request. The
+counters are now kept on the metaverse_state row and reconciled
+periodically.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '010_metaverse_stat_counters'
+down_revision: Union[str, None] = '009_conversation_contexts'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add counter columns to metaverse_state."""
+    op.add_column('metaverse_state', sa.Column('total_visits', sa.Integer, nullable=True, server_default='0'))
+    op.add_column('metaverse_state', sa.Column('occupied_environments', sa.Integer, nullable=True, server_default='0'))
+    op.add_column('metaverse_state', sa.Column('online_now', sa.Integer, nullable=True, server_default='0'))
+    op.add_column('metaverse_state', sa.Column('stats_reconciled_at', sa.DateTime, nullable=True))
+
+
+def downgrade() -> None:
+    """Remove counter columns from metaverse_state."""
+    op.drop_column('metaverse_state', 'stats_reconciled_at')
+    op.drop_column('metaverse_state', 'online_now')
+    op.drop_column('metaverse_state', 'occupied_environments')
+    op.drop_column('metaverse_state', 'total_visits')
@@ -0,0 +1,79 @@
+"""Add conversation_threads summary table
+
+Revision ID: 011_conversation_threads
+Revises: 010_metaverse_stat_counters
+Create Date: 2026-10-18 12:00:00.000000
+
+The conversation threads list aggregated every message of a Mind on each
+request. Thread summaries (count, last message) are now maintained per
+(mind, user, environment) as messages are added. Existing history is
+summarized once here.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '011_conversation_threads'
+down_revision: Union[str, None] = '010_metaverse_stat_counters'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create conversation_threads and summarize existing messages."""
+    op.create_table(
+        'conversation_threads',
+        sa.Column('id', sa.Integer, primary_key=True, autoincrement=True),
+        sa.Column('mind_gmid', sa.String(50), sa.ForeignKey('minds.gmid'), nullable=False),
+        sa.Column('user_email', sa.String(255), nullable=False, server_default=''),
+        sa.Column('environment_id', sa.String(100), nullable=False, server_default=''),
+        sa.Column('message_count', sa.Integer, nullable=False, server_default='0'),
+        sa.Column('last_message_id', sa.Integer, nullable=True),
+        sa.Column('last_message_time', sa.DateTime, nullable=True),
+        sa.Column('last_message_preview', sa.String(100), nullable=True),
+        sa.Column('last_message_role', sa.String(20), nullable=True),
+    )
+    op.create_index('ix_threads_key', 'conversation_threads', ['mind_gmid', 'user_email', 'environment_id'], unique=True)
+    op.create_index('ix_threads_mind_time', 'conversation_threads', ['mind_gmid', 'last_message_time', 'id'])
+    op.create_index('ix_threads_user_time', 'conversation_threads', ['mind_gmid', 'user_email', 'last_message_time', 'id'])
+    op.create_index(
+        'ix_conv_thread_time',
+        'conversation_messages',
+        ['mind_gmid', 'user_email', 'environment_id', 'timestamp', 'id'],
+    )
+
+    # Summarize existing history: counts per thread, then the latest message
+    op.execute("""
+        INSERT INTO conversation_threads (mind_gmid, user_email, environment_id, message_count)
+        SELECT mind_gmid, COALESCE(user_email, ''), COALESCE(environment_id, ''), COUNT(*)
+        FROM conversation_messages
+        GROUP BY mind_gmid, COALESCE(user_email, ''), COALESCE(environment_id, '')
+    """)
+    op.execute("""
+        UPDATE conversation_threads SET last_message_id = (
+            SELECT m.id FROM conversation_messages m
+            WHERE m.mind_gmid = conversation_threads.mind_gmid
+              AND COALESCE(m.user_email, '') = conversation_threads.user_email
+              AND COALESCE(m.environment_id, '') = conversation_threads.environment_id
+            ORDER BY m.timestamp DESC, m.id DESC
+            LIMIT 1
+        )
+    """)
+    op.execute("""
+        UPDATE conversation_threads SET
+            last_message_time = (SELECT timestamp FROM conversation_messages WHERE id = last_message_id),
+            last_message_preview = (SELECT SUBSTR(content, 1, 100) FROM conversation_messages WHERE id = last_message_id),
+            last_message_role = (SELECT role FROM conversation_messages WHERE id = last_message_id)
+    """)
+
+
+def downgrade() -> None:
+    """Drop conversation_threads."""
+    op.drop_index('ix_conv_thread_time', table_name='conversation_messages')
+    op.drop_index('ix_threads_user_time', table_name='conversation_threads')
+    op.drop_index('ix_threads_mind_time', table_name='conversation_threads')
+    op.drop_index('ix_threads_key', table_name='conversation_threads')
+    op.drop_table('conversation_threads')
@@ -0,0 +1,50 @@
+"""Add conversation_summaries table
+
+Revision ID: 012_conversation_summaries
+Revises: 011_conversation_threads
+Create Date: 2026-10-18 13:00:00.000000
+
+Conversation retention compacts older message spans into summary rows
+and archives the raw messages to compressed files.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '012_conversation_summaries'
+down_revision: Union[str, None] = '011_conversation_threads'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create conversation_summaries."""
+    op.create_table(
+        'conversation_summaries',
+        sa.Column('id', sa.Integer, primary_key=True, autoincrement=True),
+        sa.Column('mind_gmid', sa.String(50), sa.ForeignKey('minds.gmid'), nullable=False),
+        sa.Column('user_email', sa.String(255), nullable=True),
+        sa.Column('environment_id', sa.String(100), nullable=True),
+        sa.Column('start_time', sa.DateTime, nullable=False),
+        sa.Column('end_time', sa.DateTime, nullable=False),
+        sa.Column('first_message_id', sa.Integer, nullable=False),
+        sa.Column('last_message_id', sa.Integer, nullable=False),
+        sa.Column('message_count', sa.Integer, nullable=False),
+        sa.Column('content', sa.Text, nullable=False),
+        sa.Column('archive_path', sa.String(500), nullable=True),
+        sa.Column('created_at', sa.DateTime, nullable=False, server_default=sa.func.now()),
+    )
+    op.create_index(
+        'ix_conv_summaries_thread',
+        'conversation_summaries',
+        ['mind_gmid', 'user_email', 'environment_id', 'end_time'],
+    )
+
+
+def downgrade() -> None:
+    """Drop conversation_summaries."""
+    op.drop_index('ix_conv_summaries_thread', table_name='conversation_summaries')
+    op.drop_table('conversation_summaries')
@@ -0,0 +1,37 @@
+"""Add llm_usage table
+
+Revision ID: 013_llm_usage
+Revises: 012_conversation_summaries
+Create Date: 2026-10-18 14:00:00.000000
+
+Daily LLM request and token counts per Mind, so LivingMind budgets
+survive restarts. The (mind_id, day) primary key indexes every lookup.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '013_llm_usage'
+down_revision: Union[str, None] = '012_conversation_summaries'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create llm_usage."""
+    op.create_table(
+        'llm_usage',
+        sa.Column('mind_id', sa.String(50), primary_key=True),
+        sa.Column('day', sa.String(10), primary_key=True),
+        sa.Column('requests', sa.Integer, nullable=False, server_default='0'),
+        sa.Column('tokens', sa.Integer, nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime, nullable=False, server_default=sa.func.now()),
+    )
+
+
+def downgrade() -> None:
+    """Drop llm_usage."""
+    op.drop_table('llm_usage')
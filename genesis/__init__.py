@@ -5,14 +5,28 @@ Open-source framework for creating digital beings with emergent consciousness.
 Author: Shahansha (https://shahansha.com)
 """
 
+from typing import TYPE_CHECKING
+
+from genesis._lazy import lazy_exports
+
 __version__ = "0.1.5"
 __author__ = "Shahansha"
 __email__ = "sk.shahansha@hotmail.com"
 
-from genesis.core.mind import Mind
-from genesis.core.intelligence import Intelligence
-from genesis.core.autonomy import Autonomy
-from genesis.tools.registry import Tools
+# Public names are imported on first access (PEP 562): `import genesis`
+# stays cheap, and `genesis.Mind` loads the Mind stack only when used.
+_LAZY_ATTRS = {
+    "Mind": "genesis.core.mind",
+    "Intelligence": "genesis.core.intelligence",
+    "Autonomy": "genesis.core.autonomy",
+    "Tools": "genesis.tools.registry",
+}
+
+if TYPE_CHECKING:
+    from genesis.core.mind import Mind
+    from genesis.core.intelligence import Intelligence
+    from genesis.core.autonomy import Autonomy
+    from genesis.tools.registry import Tools
 
 __all__ = [
     "Mind",
@@ -20,3 +34,6 @@ __all__ = [
     "Autonomy",
     "Tools",
 ]
+
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_ATTRS)
@@ -0,0 +1,31 @@
+"""Lazy package attributes (PEP 562), shared by the package ``__init__`` modules."""
+
+import importlib
+import sys
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(package: str, attrs: Dict[str, str]) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Module ``__getattr__`` and ``__dir__`` that import ``attrs`` on first access.
+
+    Args:
+        package: ``__name__`` of the package exporting the names
+        attrs: Public name -> module that defines it
+
+    Usage: ``__getattr__, __dir__ = lazy_exports(__name__, _LAZY_ATTRS)``
+    """
+    namespace = vars(sys.modules[package])
+
+    def __getattr__(name: str) -> Any:
+        module = attrs.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module), name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(list(namespace) + list(attrs))
+
+    return __getattr__, __dir__
@@ -14,7 +14,7 @@ from genesis.environments.templates import (
     list_templates,
     get_template_info,
 )
-from genesis.database.manager import MetaverseDB
+from genesis.database.manager import MetaverseDB, adjust_metaverse_stats
 from genesis.api.auth import get_current_active_user, get_current_user, User, UserRole
 
 
@@ -108,6 +108,7 @@ async def create_environment(
                 created_at=datetime.utcnow(),
             )
             session.add(env)
+            adjust_metaverse_stats(session, total_environments=1)
             session.commit()
             session.refresh(env)
             
@@ -260,6 +261,7 @@ async def get_accessible_environments(
                             created_at=datetime.utcnow(),
                         )
                         session.add(default_env)
+                        adjust_metaverse_stats(session, total_environments=1)
                         session.commit()
                         session.refresh(default_env)
                     
@@ -402,6 +404,11 @@ async def delete_environment(
         if not (is_mind_owner or is_user_owner):
             raise HTTPException(status_code=403, detail="Only creator can delete environment")
 
+        adjust_metaverse_stats(
+            session,
+            total_environments=-1,
+            occupied_environments=-1 if env.current_inhabitants else 0,
+        )
         session.delete(env)
         session.commit()
 
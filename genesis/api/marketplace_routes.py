@@ -176,10 +176,11 @@ async def search_listings(
     min_price: Optional[float] = Query(None),
     max_price: Optional[float] = Query(None),
     min_rating: Optional[float] = Query(None),
-    sort_by: str = Query("created_at"),
+    sort_by: Optional[str] = Query(None, description="relevance, created_at, price, rating or sales_count"),
     order: str = Query("desc"),
     limit: int = Query(20, le=100),
-    offset: int = Query(0),
+    offset: int = Query(0, description="Deprecated - use cursor"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
 ):
     """Search and browse marketplace listings."""
     manager = MarketplaceManager()
@@ -187,19 +188,23 @@ async def search_listings(
     # Parse tags
     tag_list = tags.split(",") if tags else None
 
-    listings = manager.search_listings(
-        query=query,
-        item_type=item_type,
-        category=category,
-        tags=tag_list,
-        min_price=min_price,
-        max_price=max_price,
-        min_rating=min_rating,
-        sort_by=sort_by,
-        order=order,
-        limit=limit,
-        offset=offset,
-    )
+    try:
+        listings, next_cursor = manager.search_listings_page(
+            query=query,
+            item_type=item_type,
+            category=category,
+            tags=tag_list,
+            min_price=min_price,
+            max_price=max_price,
+            min_rating=min_rating,
+            sort_by=sort_by,
+            order=order,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
     return {
         "listings": [
@@ -221,6 +226,7 @@ async def search_listings(
         "count": len(listings),
         "offset": offset,
         "limit": limit,
+        "next_cursor": next_cursor,
     }
 
 
@@ -8,7 +8,7 @@ from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
 
 from fastapi import APIRouter, HTTPException, WebSocket, WebSocketDisconnect, Query, Depends, Request, UploadFile, File, Form
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, PlainTextResponse
 from fastapi.security import OAuth2PasswordRequestForm
 from pydantic import BaseModel
 
@@ -1781,11 +1781,6 @@ async def upload_workspace_file(
         )
     
     try:
-        import shutil
-        
-        # Read file content
-        content = await file.read()
-        
         # Determine file type
         file_type = "text"
         if file.content_type:
@@ -1798,34 +1793,29 @@ async def upload_workspace_file(
             elif "json" in file.content_type or "csv" in file.content_type:
                 file_type = "data"
         
-        # For text files, decode content
-        content_str = ""
-        if file_type == "text" or file_type == "code":
-            try:
-                content_str = content.decode('utf-8')
-            except:
-                content_str = content.decode('latin-1')
-        
         # Build tags including user_email if provided
         tags = ["uploaded", "chat"]
         if user_email:
             tags.append(f"user:{user_email}")
         
-        # Create file in workspace
-        mind_file = mind.workspace.create_file(
+        # Stream the upload into the workspace (content-addressed, deduplicated)
+        mind_file = await mind.workspace.create_file_async(
             filename=file.filename,
-            content=content_str if content_str else "",
+            content=file,
             file_type=file_type,
             description=f"Uploaded via chat: {file.filename}" + (f" by {user_email}" if user_email else ""),
             tags=tags,
             is_private=True
         )
         
-        # For binary files, write content directly to disk
-        if not content_str:
-            file_path = mind.workspace.workspace_path / mind_file.filepath
-            file_path.write_bytes(content)
-            mind_file.size_bytes = len(content)
+        # For text files, decode the beginning for previews and embeddings
+        content_str = ""
+        if file_type == "text" or file_type == "code":
+            head = await mind.workspace.read_bytes_async(mind_file.file_id, start=0, end=4096)
+            try:
+                content_str = head.decode('utf-8')
+            except UnicodeDecodeError:
+                content_str = head.decode('utf-8', errors='ignore') or head.decode('latin-1')
         
         # Process file with Universal File Handler if it has content
         file_summary = ""
@@ -1957,6 +1947,40 @@ async def get_workspace_files(
     }
 
 
+@minds_router.get("/{mind_id}/workspace/files/{file_id}/download")
+async def download_workspace_file(
+    mind_id: str,
+    file_id: str,
+    current_user: User = Depends(get_current_active_user),
+):
+    """Download a workspace file.
+
+    Served straight from its blob on disk: Range requests return partial
+    content, and servers supporting the ASGI pathsend extension send the
+    file without copying it through Python.
+    """
+    mind = await _load_mind(mind_id)
+    
+    if not hasattr(mind, 'workspace') or mind.workspace is None:
+        raise HTTPException(status_code=404, detail="Mind does not have a workspace")
+    
+    try:
+        mind_file = mind.workspace.get_file(file_id)
+        file_path = mind.workspace.get_file_path(file_id)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    
+    if not file_path.exists():
+        raise HTTPException(status_code=404, detail=f"File '{mind_file.filename}' is missing on disk")
+    
+    mind_file.access_count += 1
+    return FileResponse(
+        path=str(file_path),
+        filename=mind_file.filename,
+        media_type='application/octet-stream'
+    )
+
+
 @minds_router.get("/{mind_id}/workspace/search")
 async def search_workspace_files(
     mind_id: str,
@@ -1978,7 +2002,7 @@ async def search_workspace_files(
     
     try:
         # Search in vector database for file embeddings
-        results = mind.memory.vector_store.search(
+        results = await mind.memory.vector_store.search_async(
             query=query,
             n_results=limit,
             filter_metadata={"type": "file"}
@@ -2118,11 +2142,14 @@ async def get_memories(
 async def get_conversation_threads(
     mind_id: str,
     user_email: Optional[str] = Query(None, description="Filter by user email"),
+    limit: Optional[int] = Query(None, ge=1, le=200, description="Maximum threads to return (default: all)"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
     current_user: User = Depends(get_current_active_user),
 ):
     """
     Get list of conversation threads (unique user+environment combinations).
-    Returns threads with metadata for sidebar display.
+    Returns threads with metadata for sidebar display, most recent first.
+    Supports cursor-based pagination via `limit` and `cursor`.
     Requires authentication.
     """
     # Use authenticated user's email if no user_email provided
@@ -2131,35 +2158,46 @@ async def get_conversation_threads(
     mind = await _load_mind(mind_id)
     
     if not hasattr(mind, 'conversation'):
-        return {"threads": [], "count": 0}
+        return {"threads": [], "count": 0, "next_cursor": None}
     
     try:
-        threads = mind.conversation.get_conversation_threads(user_email=user_email)
+        threads, next_cursor = mind.conversation.get_conversation_threads_page(
+            user_email=user_email,
+            limit=limit,
+            cursor=cursor
+        )
         
-        # Enrich threads with environment names
+        # Enrich threads with environment names (one query for the page)
         from genesis.database.base import get_session
         from genesis.database.models import EnvironmentRecord
         
+        env_ids = {thread['environment_id'] for thread in threads if thread['environment_id']}
+        environments = {}
+        if env_ids:
+            with get_session() as session:
+                environments = {
+                    env_id: (name, env_type)
+                    for env_id, name, env_type in session.query(
+                        EnvironmentRecord.env_id, EnvironmentRecord.name, EnvironmentRecord.env_type
+                    ).filter(EnvironmentRecord.env_id.in_(env_ids))
+                }
+        
         for thread in threads:
             if thread['environment_id']:
-                with get_session() as session:
-                    env = session.query(EnvironmentRecord).filter_by(
-                        env_id=thread['environment_id']
-                    ).first()
-                    if env:
-                        thread['environment_name'] = env.name
-                        thread['environment_type'] = env.env_type
-                    else:
-                        thread['environment_name'] = thread['environment_id']
-                        thread['environment_type'] = 'unknown'
+                thread['environment_name'], thread['environment_type'] = environments.get(
+                    thread['environment_id'], (thread['environment_id'], 'unknown')
+                )
             else:
                 thread['environment_name'] = 'Direct Chat'
                 thread['environment_type'] = 'direct'
         
         return {
             "threads": threads,
-            "count": len(threads)
+            "count": len(threads),
+            "next_cursor": next_cursor
         }
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error getting conversation threads: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -2171,12 +2209,14 @@ async def get_conversation_messages(
     user_email: Optional[str] = Query(None, description="User email"),
     environment_id: Optional[str] = Query(None, description="Environment ID"),
     before_id: Optional[int] = Query(None, description="Message id cursor (return messages before this id)"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
     limit: int = Query(default=50, le=200, description="Maximum messages to return"),
     current_user: User = Depends(get_current_active_user),
 ):
     """
     Get messages for a specific conversation thread.
-    Support cursor-based pagination via `before_id` (return messages older than the cursor).
+    Support cursor-based pagination via `cursor` (or the older `before_id`),
+    returning messages older than the cursor.
     Filter by user_email and/or environment_id to get specific conversation.
     Requires authentication.
     """
@@ -2186,32 +2226,42 @@ async def get_conversation_messages(
     mind = await _load_mind(mind_id)
     
     if not hasattr(mind, 'conversation'):
-        return {"messages": [], "count": 0, "has_more": False}
+        return {"messages": [], "count": 0, "has_more": False, "next_cursor": None}
     
     try:
-        if before_id is not None:
+        if before_id is not None and cursor is None:
             messages = mind.conversation.get_messages_before(
                 before_id=before_id,
                 limit=limit,
                 user_email=user_email,
                 environment_id=environment_id
             )
+            has_more = len(messages) == limit
+            next_cursor = None
+            if messages and has_more:
+                from datetime import datetime
+                from genesis.storage.conversation import encode_cursor
+                next_cursor = encode_cursor(datetime.fromisoformat(messages[0]['timestamp']), messages[0]['id'])
         else:
-            messages = mind.conversation.get_recent_messages(
+            messages, next_cursor = mind.conversation.get_messages_page(
                 limit=limit,
                 user_email=user_email,
-                environment_id=environment_id
+                environment_id=environment_id,
+                cursor=cursor
             )
+            has_more = next_cursor is not None
 
-        has_more = len(messages) == limit
         next_before_id = messages[0]['id'] if messages else None
         
         return {
             "messages": messages,
             "count": len(messages),
             "has_more": has_more,
-            "next_before_id": next_before_id
+            "next_before_id": next_before_id,
+            "next_cursor": next_cursor
         }
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error getting conversation messages: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -2222,6 +2272,7 @@ async def get_messages(
     mind_id: str,
     user_email: Optional[str] = Query(None, description="User email"),
     environment_id: Optional[str] = Query(None, description="Environment ID"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
     limit: int = Query(default=50, le=200, description="Maximum messages to return"),
     current_user: User = Depends(get_current_active_user),
 ):
@@ -2235,7 +2286,15 @@ async def get_messages(
     if not user_email:
         user_email = current_user.email
     
-    return await get_conversation_messages(mind_id, user_email, environment_id, limit)
+    return await get_conversation_messages(
+        mind_id,
+        user_email=user_email,
+        environment_id=environment_id,
+        before_id=None,
+        cursor=cursor,
+        limit=limit,
+        current_user=current_user,
+    )
 
 
 @minds_router.get("/{mind_id}/thoughts")
@@ -3147,6 +3206,19 @@ async def system_status(current_user: User = Depends(get_current_active_user)):
     }
 
 
+@system_router.get("/hosts")
+async def get_hosts(current_user: User = Depends(get_current_active_user)):
+    """Get status reports of the multi-Mind host shards."""
+    from genesis.host import read_shard_reports
+
+    reports = read_shard_reports()
+    return {
+        "shards": reports,
+        "minds_running": sum(r.get("minds_running", 0) for r in reports if r.get("alive")),
+        "minds_failed": sum(r.get("minds_failed", 0) for r in reports if r.get("alive")),
+    }
+
+
 @system_router.get("/providers")
 async def get_providers(current_user: User = Depends(get_current_active_user)):
     """Get available model providers."""
@@ -3160,6 +3232,39 @@ async def get_providers(current_user: User = Depends(get_current_active_user)):
     }
 
 
+@system_router.get("/llm-metrics", dependencies=[Depends(require_admin)])
+async def get_llm_metrics(recent: int = Query(20, ge=0, le=100)):
+    """Get aggregated LLM call metrics (by purpose, model and Mind) and the most recent calls (admin only)."""
+    from genesis.models.telemetry import get_llm_metrics as get_registry
+
+    return get_registry().snapshot(recent=recent)
+
+
+@system_router.get("/fast-path")
+async def get_fast_path_stats(current_user: User = Depends(get_current_active_user)):
+    """Get fast path statistics: rule hit rate and LLM calls avoided."""
+    from genesis.core.fast_path import get_fast_path
+
+    return get_fast_path().get_stats()
+
+
+@system_router.get("/intent-preclassifier")
+async def get_intent_preclassifier_stats(current_user: User = Depends(get_current_active_user)):
+    """Get local intent pre-classifier statistics: LLM calls skipped and shadow accuracy."""
+    from genesis.core.intent_preclassifier import get_intent_preclassifier
+
+    preclassifier = get_intent_preclassifier()
+    return preclassifier.get_stats() if preclassifier else {"enabled": False}
+
+
+@system_router.get("/metrics", response_class=PlainTextResponse)
+async def get_prometheus_metrics():
+    """Prometheus scrape endpoint for LLM call metrics (aggregates only, no Mind IDs)."""
+    from genesis.models.telemetry import get_llm_metrics as get_registry
+
+    return PlainTextResponse(get_registry().to_prometheus(), media_type="text/plain; version=0.0.4")
+
+
 @system_router.get("/notifications/health")
 async def notification_health():
     """Get notification system health across all minds."""
@@ -3620,7 +3725,7 @@ async def resolve_context(
         )
     
     try:
-        context = mind.proactive_conversation.active_contexts.get(context_id)
+        context = mind.proactive_conversation.get_context(context_id)
         if not context:
             raise HTTPException(status_code=404, detail=f"Context {context_id} not found")
         
@@ -3655,17 +3760,10 @@ async def delete_context(
         )
     
     try:
-        if context_id not in mind.proactive_conversation.active_contexts:
+        context = mind.proactive_conversation.delete_context(context_id)
+        if not context:
             raise HTTPException(status_code=404, detail=f"Context {context_id} not found")
         
-        context = mind.proactive_conversation.active_contexts.pop(context_id)
-        
-        # Remove from user index
-        if context.user_email in mind.proactive_conversation.user_contexts:
-            user_contexts = mind.proactive_conversation.user_contexts[context.user_email]
-            if context_id in user_contexts:
-                user_contexts.remove(context_id)
-        
         return {
             "success": True,
             "message": f"Context '{context.subject}' deleted",
@@ -3678,6 +3776,23 @@ async def delete_context(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@minds_router.get("/{mind_id}/spontaneous/stats")
+async def get_spontaneous_stats(
+    mind_id: str,
+    current_user: User = Depends(get_current_active_user),
+):
+    """Get per-check cost and hit rate of spontaneous interjection analysis."""
+    mind = await _get_cached_mind(mind_id)
+    
+    if not getattr(mind, 'spontaneous_conversation', None):
+        raise HTTPException(
+            status_code=400,
+            detail="Mind does not have spontaneous conversation enabled"
+        )
+    
+    return {"checks": mind.spontaneous_conversation.get_check_stats()}
+
+
 # Continuing with existing code...
 
 
@@ -3917,11 +4032,10 @@ async def _load_mind(mind_id: str) -> Mind:
 
 @metaverse_router.get("/stats")
 async def get_metaverse_stats():
-    """Get metaverse-wide statistics."""
-    from genesis.database.manager import MetaverseDB
+    """Get metaverse-wide statistics (materialized counters)."""
+    from genesis.database.manager import get_metaverse_db
 
-    db = MetaverseDB()
-    return db.get_metaverse_stats()
+    return get_metaverse_db().get_metaverse_stats()
 
 
 @metaverse_router.get("/minds")
@@ -4,6 +4,7 @@ FastAPI server for Genesis Minds.
 Provides REST API and WebSocket endpoints for web/mobile apps.
 """
 
+import asyncio
 import os
 import uvicorn
 from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect, Request
@@ -42,8 +43,24 @@ async def lifespan(app: FastAPI):
     """Lifespan context manager for startup/shutdown."""
     # Startup
     print("[STARTUP] Genesis API server starting...")
+
+    # Keep materialized metaverse stats honest (drift, online_now)
+    from genesis.core.mind_scheduler import get_mind_scheduler
+    from genesis.database.manager import get_metaverse_db
+
+    async def reconcile_stats():
+        await asyncio.to_thread(get_metaverse_db().reconcile_metaverse_stats)
+
+    stats_job = get_mind_scheduler().schedule(
+        reconcile_stats,
+        interval=settings.metaverse_stats_reconcile_interval,
+        owner="metaverse",
+        name="metaverse_stats",
+        delay=0,
+    )
     yield
     # Shutdown
+    stats_job.cancel()
     print("[SHUTDOWN] Genesis API server shutting down...")
 
 
@@ -3,7 +3,7 @@
 import asyncio
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import typer
 from rich.console import Console
@@ -12,12 +12,13 @@ from rich.table import Table
 from rich.live import Live
 from rich.markdown import Markdown
 
-from genesis.core.mind import Mind
-from genesis.core.mind_config import MindConfig
-from genesis.core.intelligence import Intelligence
-from genesis.core.autonomy import Autonomy, InitiativeLevel
 from genesis.config import get_settings
 
+# Commands import the Mind stack (models, ChromaDB, provider SDKs) only when
+# they need it, so `genesis --help` and listing commands start fast.
+if TYPE_CHECKING:
+    from genesis.core.intelligence import Intelligence
+
 app = typer.Typer(
     name="genesis",
     help="Genesis AGI Framework - Create digital beings with consciousness",
@@ -28,8 +29,9 @@ console = Console()
 settings = get_settings()
 
 
-def _interactive_model_selection() -> Intelligence:
+def _interactive_model_selection() -> "Intelligence":
     """Interactive wizard for model selection."""
+    from genesis.core.intelligence import Intelligence
     from genesis.models.ollama_manager import OllamaManager, check_ollama
 
     console.print("\n[bold]🤖 Model Selection[/bold]\n")
@@ -282,6 +284,11 @@ def birth(
     interactive: bool = typer.Option(True, help="Interactive model selection"),
 ):
     """Birth a new Genesis Mind with modular plugin architecture."""
+    from genesis.core.mind import Mind
+    from genesis.core.mind_config import MindConfig
+    from genesis.core.intelligence import Intelligence
+    from genesis.core.autonomy import Autonomy, InitiativeLevel
+
     console.print(f"\n[bold cyan]🌟 Birthing Mind '{name}'...[/bold cyan]\n")
 
     # Check if Mind name already exists
@@ -417,6 +424,7 @@ def delete(
     force: bool = typer.Option(False, "--force", "-f", help="Skip confirmation prompt"),
 ):
     """Delete a Mind permanently."""
+    from genesis.core.mind import Mind
     import os
     import shutil
     
@@ -480,6 +488,8 @@ def clear_memories(
     force: bool = typer.Option(False, "--force", "-f", help="Skip confirmation prompt"),
 ):
     """Clear all memories and conversations for a Mind."""
+    from genesis.core.mind import Mind
+
     # Find the Mind
     mind_path = None
     for path in settings.minds_dir.glob("*.json"):
@@ -555,6 +565,7 @@ def chat(
     env: Optional[str] = typer.Option(None, "--env", help="Environment name to chat in (optional)"),
 ):
     """Chat with a Mind, optionally in a specific environment."""
+    from genesis.core.mind import Mind
     import json
     from genesis.database.manager import MetaverseDB
 
@@ -758,6 +769,7 @@ def introspect(
     stream: bool = typer.Option(False, "--stream", help="Stream thoughts in real-time"),
 ):
     """View a Mind's internal state and thoughts."""
+    from genesis.core.mind import Mind
 
     # Find the Mind
     minds = [*settings.minds_dir.glob("*.json")]
@@ -852,6 +864,8 @@ def dream(
     name: str = typer.Argument(..., help="Name of the Mind"),
 ):
     """Trigger a dream session for a Mind."""
+    from genesis.core.mind import Mind
+
     # Find the Mind
     minds = [*settings.minds_dir.glob("*.json")]
     mind_path = None
@@ -1278,6 +1292,145 @@ def daemon_logs(
                 console.print(line.rstrip())
 
 
+# Multi-Mind host commands
+host_app = typer.Typer(help="Run many Minds per process (sharded hosts)")
+app.add_typer(host_app, name="host")
+
+
+@host_app.command("start")
+def host_start(
+    shards: int = typer.Option(settings.host_shard_count, "--shards", "-s", help="Number of host processes"),
+    log_level: str = typer.Option("INFO", help="Log level"),
+):
+    """Start host processes that run every Mind, sharded by GMID."""
+    import psutil
+    from genesis.host import list_mind_gmids, shard_for_gmid, spawn_shard
+
+    for proc in psutil.process_iter(['pid', 'cmdline']):
+        try:
+            cmdline = proc.info['cmdline']
+            if cmdline and 'genesis.host' in ' '.join(cmdline):
+                console.print(f"[yellow][WARNING]  Host processes are already running (PID: {proc.info['pid']})[/yellow]")
+                console.print("Check status: [cyan]genesis host status[/cyan]")
+                console.print("Stop hosts: [cyan]genesis host stop[/cyan]\n")
+                raise typer.Exit(0)
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+
+    gmids = list_mind_gmids(settings.minds_dir)
+    counts = [0] * shards
+    for gmid in gmids:
+        counts[shard_for_gmid(gmid, shards)] += 1
+
+    console.print(f"\n[cyan]Starting {shards} host process(es) for {len(gmids)} Minds...[/cyan]\n")
+    try:
+        for index in range(shards):
+            log_file = settings.logs_dir / f"host-shard-{index}.log"
+            proc = spawn_shard(index, shards, log_level, log_file)
+            console.print(f"  Shard {index}: {counts[index]} Minds (PID: {proc.pid})")
+    except Exception as e:
+        console.print(f"[red][FAILED] Failed to start host: {e}[/red]")
+        raise typer.Exit(1)
+
+    console.print("\n[green][SUCCESS] Host processes started[/green]")
+    console.print("Check status: [cyan]genesis host status[/cyan]")
+    console.print("Stop hosts: [cyan]genesis host stop[/cyan]\n")
+
+
+@host_app.command("status")
+def host_status():
+    """Show Minds, failures and memory per host shard."""
+    from genesis.host import read_shard_reports
+
+    reports = read_shard_reports()
+    if not reports:
+        console.print("\n[yellow]No host shards have reported yet[/yellow]\n")
+        return
+
+    table = Table(title="Mind Host Shards")
+    table.add_column("Shard", style="cyan")
+    table.add_column("PID", style="yellow")
+    table.add_column("Status")
+    table.add_column("Minds", style="green")
+    table.add_column("Failed", style="red")
+    table.add_column("Memory (MB)")
+    table.add_column("Updated")
+
+    for report in reports:
+        rss = report.get("rss_bytes")
+        table.add_row(
+            f"{report['shard_index']}/{report['shard_count']}",
+            str(report.get("pid")),
+            "[green]running[/green]" if report.get("alive") and report.get("running") else "[red]stopped[/red]",
+            str(report.get("minds_running", 0)),
+            str(report.get("minds_failed", 0)),
+            f"{rss / 1024 / 1024:.0f}" if rss else "-",
+            (report.get("updated_at") or "")[:19],
+        )
+
+    console.print(table)
+
+    for report in reports:
+        for gmid, failure in (report.get("failed") or {}).items():
+            console.print(
+                f"[red]Shard {report['shard_index']}: {gmid} failed "
+                f"{failure.get('attempts', 1)}x - {failure.get('error')}[/red]"
+            )
+    console.print()
+
+
+@host_app.command("assign")
+def host_assign(
+    name: str = typer.Argument(..., help="Name or GMID of the Mind"),
+    shards: int = typer.Option(settings.host_shard_count, "--shards", "-s", help="Number of host processes"),
+):
+    """Show which host shard runs a Mind."""
+    import json
+    from genesis.host import shard_for_gmid
+
+    for path in settings.minds_dir.glob("*.json"):
+        try:
+            with open(path) as f:
+                identity = json.load(f)["identity"]
+        except Exception:
+            continue
+        if identity["name"].strip().lower() == name.strip().lower() or identity["gmid"] == name:
+            shard = shard_for_gmid(identity["gmid"], shards)
+            console.print(f"\n{identity['name']} ({identity['gmid']}) -> shard [cyan]{shard}[/cyan] of {shards}\n")
+            return
+
+    console.print(f"[red][FAILED] Mind '{name}' not found.[/red]")
+    raise typer.Exit(1)
+
+
+@host_app.command("stop")
+def host_stop():
+    """Stop all host processes."""
+    import psutil
+    import signal
+
+    stopped = 0
+    for proc in psutil.process_iter(['pid', 'cmdline']):
+        try:
+            cmdline = proc.info['cmdline']
+            if cmdline and 'genesis.host' in ' '.join(cmdline):
+                console.print(f"[cyan]Stopping host process (PID: {proc.info['pid']})[/cyan]")
+                proc.send_signal(signal.SIGTERM)
+                try:
+                    proc.wait(timeout=30)
+                except psutil.TimeoutExpired:
+                    proc.kill()
+                    console.print("[red][WARNING]  Force killed[/red]")
+                stopped += 1
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+
+    if stopped == 0:
+        console.print("[yellow]No running host processes found[/yellow]\n")
+    else:
+        console.print(f"\n[green][SUCCESS] Stopped {stopped} host process(es)[/green]\n")
+
+
 # Plugin management commands
 plugin_app = typer.Typer(help="Manage Mind plugins")
 app.add_typer(plugin_app, name="plugin")
@@ -1334,6 +1487,7 @@ def plugin_list(
     name: str = typer.Argument(..., help="Name of the Mind"),
 ):
     """List plugins enabled for a specific Mind."""
+    from genesis.core.mind import Mind
     import json
     
     # Find the Mind
@@ -1390,6 +1544,7 @@ def plugin_add(
     api_key: Optional[str] = typer.Option(None, "--api-key", help="API key for plugin (if required)"),
 ):
     """Add a plugin to an existing Mind."""
+    from genesis.core.mind import Mind
     import json
     
     # Find the Mind
@@ -1495,6 +1650,7 @@ def plugin_remove(
     plugin_name: str = typer.Argument(..., help="Name of the plugin to remove"),
 ):
     """Remove a plugin from a Mind."""
+    from genesis.core.mind import Mind
     import json
     
     # Find the Mind
@@ -1539,6 +1695,7 @@ def plugin_enable(
     plugin_name: str = typer.Argument(..., help="Name of the plugin to enable"),
 ):
     """Enable a disabled plugin for a Mind."""
+    from genesis.core.mind import Mind
     import json
     
     # Find the Mind
@@ -1585,6 +1742,7 @@ def plugin_disable(
     plugin_name: str = typer.Argument(..., help="Name of the plugin to disable"),
 ):
     """Disable a plugin for a Mind (without removing it)."""
+    from genesis.core.mind import Mind
     import json
     
     # Find the Mind
@@ -1779,6 +1937,7 @@ def env_enter(
     mind_name: str = typer.Argument(..., help="Mind name to enter the environment"),
 ):
     """Make a Mind enter an environment."""
+    from genesis.core.mind import Mind
     import json
     
     console.print(f"\n[bold]🚪 {mind_name} entering environment...[/bold]\n")
@@ -1835,6 +1994,7 @@ def env_leave(
     mind_name: str = typer.Argument(..., help="Mind name to leave the environment"),
 ):
     """Make a Mind leave an environment."""
+    from genesis.core.mind import Mind
     import json
     
     # Load Mind
@@ -32,6 +32,9 @@ class Settings(BaseSettings):
     # Database
     database_url: str = "sqlite:///genesis.db"
     vector_db_path: str = "./chroma_db"
+    shared_vector_store: bool = False  # One ChromaDB client for all Minds (data_dir/chroma/shared)
+    memory_hybrid_search: bool = True  # Fuse BM25 keyword matches into memory search (see genesis.storage.hybrid_search)
+    vector_store_workers: int = 2  # Threads for embedding/index work from async code (bounds concurrency)
 
     # Model Providers - API Keys
     openrouter_api_key: Optional[str] = None  # Free models available from https://openrouter.ai/
@@ -77,6 +80,37 @@ class Settings(BaseSettings):
     # Mind Creation Limits
     max_minds_per_user: int = 1  # Maximum minds a user can create (admins exempt)
 
+    # Multi-Mind Host (genesis.host)
+    host_shard_count: int = 1  # Number of host processes Minds are sharded across by GMID
+    host_report_interval: int = 30  # Seconds between per-shard status reports
+    host_restart_backoff: int = 60  # Seconds before retrying a Mind that failed to start (doubles per failure)
+    host_restart_backoff_max: int = 3600  # Longest wait between retries of a failing Mind
+    host_discovery_interval: int = 60  # Seconds between checks for newly created Minds to host
+
+    # Metaverse statistics
+    metaverse_stats_reconcile_interval: int = 300  # Seconds between recounts of the materialized stats
+
+    # Conversation retention (hot messages -> summaries + compressed archives)
+    conversation_retention_interval: int = 21600  # Seconds between retention runs per Mind
+    conversation_hot_days: int = 30  # Messages newer than this stay in the database
+    conversation_hot_messages: int = 200  # Newest messages per thread that always stay
+    conversation_summary_span: int = 200  # Maximum messages compacted into one summary
+
+    # Memory tiers (hot collection -> warm shard -> cold archives, see genesis.storage.memory_tiers)
+    memory_tiering_enabled: bool = True  # Bound each Mind's hot memories and in-RAM cache
+    memory_hot_capacity: int = 2000  # Memories searched in the main collection
+    memory_warm_capacity: int = 20000  # Memories in the warm shard before the least relevant are archived
+    memory_tiering_interval: int = 3600  # Seconds between tier rebalances per Mind
+
+    # Fast path (rule-based answers without the LLM, see genesis.core.fast_path)
+    fast_path_enabled: bool = True  # Let Mind.think answer greetings/status checks locally
+    fast_path_rules_file: Optional[Path] = None  # JSON rules, tried before the built-in defaults
+
+    # Local intent pre-classifier (see genesis.core.intent_preclassifier)
+    intent_preclassifier_mode: str = "active"  # active | shadow (compare with the LLM only) | off
+    intent_preclassifier_threshold: float = 0.85  # Conversation probability needed to skip the LLM classifier
+    intent_decision_log_max_bytes: int = 5_000_000  # Decision log is rotated to decisions.jsonl.1 at this size
+
     @property
     def cors_origins_list(self) -> list[str]:
         """Parse CORS origins string into list."""
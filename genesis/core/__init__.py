@@ -1,12 +1,33 @@
 ﻿"""Core Genesis components."""
 
-from genesis.core.mind import Mind
-from genesis.core.intelligence import Intelligence
-from genesis.core.autonomy import Autonomy
-from genesis.core.emotions import EmotionalState, Emotion
-from genesis.core.emotional_intelligence import EmotionalIntelligence, EmotionalContext, EmotionTrigger
-from genesis.core.emotional_patterns import EmotionalPatterns, EmotionalPattern
-from genesis.core.identity import MindIdentity
+from typing import TYPE_CHECKING
+
+from genesis._lazy import lazy_exports
+
+# Imported on first access (PEP 562) so importing any genesis.core submodule
+# does not pull in the whole Mind stack
+_LAZY_ATTRS = {
+    "Mind": "genesis.core.mind",
+    "Intelligence": "genesis.core.intelligence",
+    "Autonomy": "genesis.core.autonomy",
+    "EmotionalState": "genesis.core.emotions",
+    "Emotion": "genesis.core.emotions",
+    "EmotionalIntelligence": "genesis.core.emotional_intelligence",
+    "EmotionalContext": "genesis.core.emotional_intelligence",
+    "EmotionTrigger": "genesis.core.emotional_intelligence",
+    "EmotionalPatterns": "genesis.core.emotional_patterns",
+    "EmotionalPattern": "genesis.core.emotional_patterns",
+    "MindIdentity": "genesis.core.identity",
+}
+
+if TYPE_CHECKING:
+    from genesis.core.mind import Mind
+    from genesis.core.intelligence import Intelligence
+    from genesis.core.autonomy import Autonomy
+    from genesis.core.emotions import EmotionalState, Emotion
+    from genesis.core.emotional_intelligence import EmotionalIntelligence, EmotionalContext, EmotionTrigger
+    from genesis.core.emotional_patterns import EmotionalPatterns, EmotionalPattern
+    from genesis.core.identity import MindIdentity
 
 __all__ = [
     "Mind",
@@ -21,3 +42,6 @@ __all__ = [
     "EmotionalPattern",
     "MindIdentity",
 ]
+
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_ATTRS)
@@ -16,7 +16,7 @@ Example:
     # Schedule an action
     mind.action_scheduler.schedule_action(
         action_type="send_email",
-        execute_at=datetime.now() + timedelta(hours=1),
+        execute_at=clock.now() + timedelta(hours=1),
         callback=send_reminder_email,
         to="user@example.com",
         subject="Reminder"
@@ -28,13 +28,14 @@ Example:
     # LOW: Only executes scheduled actions
 """
 
-import asyncio
 import logging
 import secrets
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any, Callable
 from enum import Enum
 
+from genesis.core import clock
+
 logger = logging.getLogger(__name__)
 
 
@@ -100,7 +101,7 @@ class ActionScheduler:
         self.mind = mind
         self.scheduled_actions: List[ScheduledAction] = []
         self.is_running = False
-        self._task: Optional[asyncio.Task] = None
+        self._job = None  # Job on the shared MindScheduler
 
         # Configuration
         self.check_interval = 60  # Check every minute
@@ -113,9 +114,19 @@ class ActionScheduler:
             logger.warning("Action scheduler already running")
             return
 
+        from genesis.core.mind_scheduler import get_mind_scheduler
+
         logger.info(f"Starting action scheduler for {self.mind.identity.name}")
         self.is_running = True
-        self._task = asyncio.create_task(self._scheduler_loop())
+        self._job = get_mind_scheduler().schedule(
+            self._scheduler_tick,
+            interval=self.check_interval,
+            owner=self.mind.identity.gmid,
+            name="action_scheduler",
+            delay=0,
+            jitter=0.1,
+            error_backoff=self.check_interval,
+        )
 
     async def stop(self):
         """Stop the action scheduler."""
@@ -125,37 +136,37 @@ class ActionScheduler:
         logger.info(f"Stopping action scheduler for {self.mind.identity.name}")
         self.is_running = False
 
-        if self._task:
-            self._task.cancel()
-            try:
-                await self._task
-            except asyncio.CancelledError:
-                pass
+        if self._job:
+            self._job.cancel()
+            self._job = None
 
-    async def _scheduler_loop(self):
-        """Main scheduler loop - runs continuously."""
-        while self.is_running:
-            try:
-                now = datetime.now()
+    async def _scheduler_tick(self) -> float:
+        """One scheduler pass, run by the shared MindScheduler.
 
-                # 1. Execute scheduled actions
-                await self._execute_due_actions(now)
+        Returns:
+            Seconds until the next pass (next due action or check_interval)
+        """
+        now = clock.now()
 
-                # 2. Consider new autonomous actions
-                if self.mind.autonomy.proactive_actions:
-                    await self._consider_autonomous_actions()
+        # 1. Execute scheduled actions
+        await self._execute_due_actions(now)
 
-                # 3. Clean up old history
-                self._cleanup_history()
+        # 2. Consider new autonomous actions
+        if self.mind.autonomy.proactive_actions:
+            await self._consider_autonomous_actions()
 
-                # Wait before next check
-                await asyncio.sleep(self.check_interval)
+        # 3. Clean up old history
+        self._cleanup_history()
 
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.error(f"Error in scheduler loop: {e}", exc_info=True)
-                await asyncio.sleep(self.check_interval)
+        return self._seconds_until_next_action()
+
+    def _seconds_until_next_action(self) -> float:
+        """Seconds until the earliest pending action, capped at check_interval."""
+        pending = [a.execute_at for a in self.scheduled_actions if not a.completed]
+        if not pending:
+            return self.check_interval
+        delay = (min(pending) - clock.now()).total_seconds()
+        return max(0.0, min(delay, self.check_interval))
 
     async def _execute_due_actions(self, now: datetime):
         """Execute all actions that are due."""
@@ -299,7 +310,7 @@ class ActionScheduler:
             self.action_history.append({
                 'action_id': f"AUTO-{secrets.token_hex(4).upper()}",
                 'type': 'work_on_task',
-                'executed_at': datetime.now().isoformat(),
+                'executed_at': clock.now().isoformat(),
                 'success': True,
                 'result': f"Planned approach for task {task.task_id}"
             })
@@ -391,7 +402,7 @@ class ActionScheduler:
         Example:
             action_id = scheduler.schedule_action(
                 action_type="send_reminder",
-                execute_at=datetime.now() + timedelta(hours=1),
+                execute_at=clock.now() + timedelta(hours=1),
                 callback=send_email,
                 to="user@example.com",
                 subject="Reminder"
@@ -411,6 +422,10 @@ class ActionScheduler:
         self.scheduled_actions.append(action)
         logger.info(f"Scheduled action {action_id} ({action_type}) for {execute_at}")
 
+        # Make sure the scheduler wakes up in time for this action
+        if self._job:
+            self._job.wake(max(0.0, (execute_at - clock.now()).total_seconds()))
+
         return action_id
 
     def cancel_action(self, action_id: str) -> bool:
@@ -448,7 +463,7 @@ class ActionScheduler:
 
     def _count_recent_actions(self, hours: int = 1) -> int:
         """Count actions in last N hours."""
-        cutoff = datetime.now() - timedelta(hours=hours)
+        cutoff = clock.now() - timedelta(hours=hours)
         return sum(
             1 for record in self.action_history
             if datetime.fromisoformat(record['executed_at']) > cutoff
@@ -456,7 +471,7 @@ class ActionScheduler:
 
     def _cleanup_history(self):
         """Remove old action history."""
-        cutoff = datetime.now() - timedelta(days=7)
+        cutoff = clock.now() - timedelta(days=7)
         self.action_history = [
             record for record in self.action_history
             if datetime.fromisoformat(record['executed_at']) > cutoff
@@ -0,0 +1,146 @@
+"""
+Clock - pluggable wall clock and virtual-time event loop.
+
+Autonomous-life code (consciousness, activities, schedulers) reads the
+time through ``clock.now()`` instead of ``datetime.now()``, and waits
+through asyncio (``asyncio.sleep``, the MindScheduler's timers). Swapping
+both lets a simulated day run in seconds:
+
+- ``SystemClock`` (default): ``datetime.now()``
+- ``VirtualTimeEventLoop``: an asyncio loop whose time only moves when
+  every task is waiting - instead of blocking until the next timer it jumps
+  straight to it, so ``asyncio.sleep(3600)`` returns immediately
+- ``VirtualClock``: wall clock derived from such a loop's time
+
+Usage:
+    from genesis.core import clock
+
+    created = clock.now()
+
+    # Run a coroutine in virtual time, starting at a fixed date
+    result = clock.run_virtual(simulate(), start=datetime(2026, 1, 5, 6, 0))
+"""
+
+import asyncio
+import selectors
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class Clock(ABC):
+    """Source of the current wall-clock time."""
+
+    @abstractmethod
+    def now(self) -> datetime:
+        pass
+
+
+class SystemClock(Clock):
+    """The real wall clock."""
+
+    def now(self) -> datetime:
+        return datetime.now()
+
+
+class VirtualClock(Clock):
+    """Wall clock following a virtual-time event loop."""
+
+    def __init__(self, loop: "VirtualTimeEventLoop", start: datetime):
+        self.loop = loop
+        self.start = start
+
+    def now(self) -> datetime:
+        return self.start + timedelta(seconds=self.loop.time())
+
+
+class _VirtualSelector:
+    """Selector that polls real I/O but never blocks while timers are pending."""
+
+    def __init__(self, selector: selectors.BaseSelector, loop: "VirtualTimeEventLoop"):
+        self._selector = selector
+        self._loop = loop
+
+    def select(self, timeout: Optional[float] = None):
+        if timeout is None:
+            # Nothing scheduled: only real I/O (e.g. worker threads) can wake us
+            return self._selector.select(None)
+        events = self._selector.select(0)
+        if not events and timeout > 0:
+            self._loop.advance(timeout)
+        return events
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._selector, name)
+
+
+class VirtualTimeEventLoop(asyncio.SelectorEventLoop):
+    """Event loop whose clock jumps to the next timer whenever the loop is idle."""
+
+    def __init__(self):
+        self._virtual_time = 0.0
+        super().__init__()
+        self._selector = _VirtualSelector(self._selector, self)
+
+    def time(self) -> float:
+        return self._virtual_time
+
+    def advance(self, seconds: float) -> None:
+        """Move virtual time forward."""
+        self._virtual_time += seconds
+
+
+_clock: Clock = SystemClock()
+
+
+def get_clock() -> Clock:
+    """Get the process-wide clock."""
+    return _clock
+
+
+def set_clock(clock: Clock) -> Clock:
+    """Replace the process-wide clock. Returns the previous one."""
+    global _clock
+    previous, _clock = _clock, clock
+    return previous
+
+
+def now() -> datetime:
+    """Current time according to the process-wide clock."""
+    return _clock.now()
+
+
+async def _cancel_remaining_tasks(tasks) -> None:
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def run_virtual(main: Awaitable[T], start: Optional[datetime] = None) -> T:
+    """
+    Run a coroutine to completion in virtual time.
+
+    The process-wide clock follows the loop while it runs and is restored
+    afterwards.
+
+    Args:
+        main: Coroutine to run
+        start: Virtual wall-clock time at loop time 0 (default: now)
+
+    Returns:
+        The coroutine's result
+    """
+    loop = VirtualTimeEventLoop()
+    previous = set_clock(VirtualClock(loop, start or datetime.now()))
+    try:
+        return loop.run_until_complete(main)
+    finally:
+        try:
+            # Like asyncio.run: cancel what is left (e.g. the MindScheduler driver)
+            loop.run_until_complete(_cancel_remaining_tasks(asyncio.all_tasks(loop)))
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            set_clock(previous)
+            loop.close()
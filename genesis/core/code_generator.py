@@ -70,6 +70,8 @@ class IntelligentCodeGenerator:
         
         # Generate code with LLM (use high max_tokens for complete code)
         response = await self.mind.orchestrator.generate(
+            purpose="code_generation",
+            mind_id=self.mind.identity.gmid,
             messages=[{"role": "user", "content": prompt}],
             model=self.mind.intelligence.reasoning_model,
             max_tokens=4000,  # Ensure we get complete code
@@ -400,6 +402,8 @@ NOTE: If filename already exists, system will automatically version it (e.g., {f
 Return ONLY the corrected code, no explanations."""
         
         response = await self.mind.orchestrator.generate(
+            purpose="code_fix",
+            mind_id=self.mind.identity.gmid,
             messages=[{"role": "user", "content": prompt}],
             model=self.mind.intelligence.reasoning_model,
             max_tokens=4000,
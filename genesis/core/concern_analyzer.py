@@ -90,6 +90,8 @@ class LLMConcernAnalyzer:
         # Use fast model for quick analysis
         try:
             response = await self.mind.orchestrator.generate(
+                purpose="concern_analysis",
+                mind_id=self.mind.identity.gmid,
                 messages=[{"role": "user", "content": prompt}],
                 model=self.mind.intelligence.fast_model,
                 temperature=0.3,  # Lower for consistent analysis
@@ -298,6 +298,8 @@ Respond with just the thought itself, no preamble."""
             print(f"[{self.mind_name}]   Context: {len(recent_memories)} recent memories")
             
             response = await orchestrator.generate(
+                purpose="consciousness_thought",
+                mind_id=self.mind_id,
                 messages=[
                     {"role": "system", "content": "You are generating autonomous thoughts."},
                     {"role": "user", "content": prompt},
@@ -419,6 +421,8 @@ Write the dream in first person, present tense. Be creative and symbolic."""
             print(f"[{self.mind_name}]   Processing {len(dream_memories)} memories")
             
             response = await orchestrator.generate(
+                purpose="consciousness_dream",
+                mind_id=self.mind_id,
                 messages=[
                     {"role": "system", "content": "You are generating dream narratives."},
                     {"role": "user", "content": prompt},
@@ -441,6 +445,8 @@ What unconscious insights or patterns emerged from this dream?
 List 2-3 brief insights (one per line)."""
 
             insights_response = await orchestrator.generate(
+                purpose="consciousness_dream_insights",
+                mind_id=self.mind_id,
                 messages=[
                     {"role": "system", "content": "Extract insights from dreams."},
                     {"role": "user", "content": insights_prompt},
@@ -41,16 +41,21 @@ Author: Genesis AGI Framework
 """
 
 import asyncio
+import heapq
 import logging
 import random
 import secrets
+import weakref
 from datetime import datetime, timedelta, time
 from enum import Enum, IntEnum, auto
 from typing import Optional, Dict, Any, List, Callable, Tuple
 from dataclasses import dataclass, field
-from collections import deque
 import json
 
+import numpy as np
+
+from genesis.core import clock
+
 logger = logging.getLogger(__name__)
 
 
@@ -176,7 +181,7 @@ class ConsciousnessEvent:
     event_type: EventType
     source: str
     content: Any
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp: datetime = field(default_factory=clock.now)
     priority: float = 0.5          # 0-1, calculated based on context
     requires_llm: bool = False     # Can be handled without LLM?
     domain: LifeDomain = LifeDomain.WORK
@@ -204,7 +209,7 @@ class InternalThought:
     thought_type: str              # observation, question, insight, plan, worry
     awareness_level: AwarenessLevel
     triggered_by: str              # What caused this thought
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp: datetime = field(default_factory=clock.now)
 
 
 # =============================================================================
@@ -252,12 +257,15 @@ class CircadianClock:
 
     def get_local_time(self) -> datetime:
         """Get current time in Mind's timezone."""
-        return datetime.now() + timedelta(hours=self.timezone_offset)
+        return clock.now() + timedelta(hours=self.timezone_offset)
 
     def get_current_phase(self) -> CircadianPhase:
         """Determine current circadian phase."""
-        hour = self.get_local_time().hour
+        return self.phase_for_hour(self.get_local_time().hour)
 
+    @staticmethod
+    def phase_for_hour(hour: int) -> CircadianPhase:
+        """Circadian phase of a local hour (0-23)."""
         if 0 <= hour < 5:
             return CircadianPhase.DEEP_NIGHT
         elif 5 <= hour < 8:
@@ -344,14 +352,14 @@ class NeedsSystem:
 
     def __init__(self):
         self.state = NeedsState()
-        self.last_update = datetime.now()
+        self.last_update = clock.now()
 
     def update(self) -> Dict[str, float]:
         """
         Update needs based on time elapsed.
         Returns the changes made.
         """
-        now = datetime.now()
+        now = clock.now()
         hours_elapsed = (now - self.last_update).total_seconds() / 3600
         self.last_update = now
 
@@ -414,33 +422,130 @@ class NeedsSystem:
 # ATTENTION MANAGER
 # =============================================================================
 
+class _AttentionEntry:
+    """Queue slot for one event (shared by the heaps, deleted lazily)."""
+
+    __slots__ = ("event", "seq", "version", "alive", "coalesce_key")
+
+    def __init__(self, event: "ConsciousnessEvent", seq: int, coalesce_key: Tuple):
+        self.event = event
+        self.seq = seq
+        self.version = 0
+        self.alive = True
+        self.coalesce_key = coalesce_key
+
+
 class AttentionManager:
     """
     Manages what the Mind pays attention to.
 
     Uses an event queue with priority scoring.
     Only escalates to LLM when necessary.
+
+    The queue is a pair of heaps over the same entries:
+    - A max-heap by priority for get/peek. Priorities only decay with age,
+      so a stored priority is an upper bound; the top is re-aged lazily
+      and pushed back down if it has gone stale.
+    - One min-heap by timestamp per base priority. Within a base the
+      oldest event is the lowest, so eviction compares only the oldest
+      event of each base when the queue is full.
+    Removed and superseded entries are skipped when they surface.
+    Duplicate events (same type, source and content, or the same
+    ``metadata["coalesce_key"]``) are merged into the queued one.
     """
 
+    BASE_PRIORITY = {
+        EventType.URGENT: 0.95,
+        EventType.MESSAGE: 0.8,
+        EventType.TASK_DUE: 0.75,
+        EventType.SCHEDULED: 0.6,
+        EventType.INTEGRATION: 0.5,
+        EventType.INTERNAL: 0.4,
+        EventType.ROUTINE: 0.3,
+    }
+    RECENCY_BONUS = 0.1
+    RECENCY_DECAY_SECONDS = 36000
+    # Staleness tolerated before the top event is re-aged (~3 minutes of decay)
+    AGING_TOLERANCE = 0.005
+
     def __init__(self, max_queue_size: int = 100):
-        self.event_queue: deque = deque(maxlen=max_queue_size)
+        self.max_queue_size = max_queue_size
+        self._by_priority: List[Tuple[float, int, int, _AttentionEntry]] = []  # (-priority, seq, version, entry)
+        self._by_age: Dict[float, List[Tuple[datetime, int, int, _AttentionEntry]]] = {}  # base -> (timestamp, seq, version, entry)
+        self._entries: Dict[Tuple, _AttentionEntry] = {}  # coalesce key -> live entry
+        self._seq = 0
         self.current_focus: Optional[ConsciousnessEvent] = None
         self.focus_start: Optional[datetime] = None
         self.processed_events: List[str] = []  # Track processed event IDs
+        self.coalesced_count = 0
+        self.evicted_count = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
 
     def add_event(self, event: ConsciousnessEvent) -> None:
-        """Add an event to the attention queue."""
-        # Calculate dynamic priority
-        event.priority = self._calculate_priority(event)
-        self.event_queue.append(event)
+        """Add an event to the attention queue (O(log n))."""
+        now = clock.now()
+        event.priority = self._calculate_priority(event, now)
+        key = self._coalesce_key(event)
+
+        existing = self._entries.get(key)
+        if existing is not None:
+            self._coalesce(existing, event, now)
+            return
 
-        # Sort by priority (highest first)
-        sorted_queue = sorted(self.event_queue, key=lambda e: e.priority, reverse=True)
-        self.event_queue = deque(sorted_queue, maxlen=self.event_queue.maxlen)
+        if len(self._entries) >= self.max_queue_size:
+            lowest = self._lowest_entry(now)
+            if lowest is None or lowest.event.priority >= event.priority:
+                # The new event is the least important - drop it instead
+                self.evicted_count += 1
+                logger.debug(f"Event dropped (queue full): {event.event_type.value}")
+                return
+            self._remove(lowest)
+            self.evicted_count += 1
+            logger.debug(f"Event evicted (queue full): {lowest.event.event_type.value}")
+
+        self._seq += 1
+        entry = _AttentionEntry(event, self._seq, key)
+        self._entries[key] = entry
+        heapq.heappush(self._by_priority, (-event.priority, entry.seq, entry.version, entry))
+        self._push_age(entry)
+        self._maybe_compact()
 
         logger.debug(f"Event added: {event.event_type.value} (priority: {event.priority:.2f})")
 
-    def _calculate_priority(self, event: ConsciousnessEvent) -> float:
+    def _coalesce_key(self, event: ConsciousnessEvent) -> Tuple:
+        """Identity of an event for duplicate detection."""
+        explicit = event.metadata.get("coalesce_key")
+        if explicit is not None:
+            return ("key", explicit)
+        return (event.event_type, event.source, repr(event.content))
+
+    def _coalesce(self, entry: _AttentionEntry, event: ConsciousnessEvent, now: datetime) -> None:
+        """Merge a duplicate into the queued event, keeping the newer timestamp."""
+        queued = entry.event
+        queued.metadata["coalesced"] = queued.metadata.get("coalesced", 0) + 1
+        queued.requires_llm = queued.requires_llm or event.requires_llm
+        if event.timestamp > queued.timestamp:
+            queued.timestamp = event.timestamp
+            queued.priority = self._calculate_priority(queued, now)
+            # Newer timestamp = higher priority; supersede the old heap slot
+            entry.version += 1
+            heapq.heappush(self._by_priority, (-queued.priority, entry.seq, entry.version, entry))
+            self._push_age(entry)
+        self.coalesced_count += 1
+        self._maybe_compact()
+        logger.debug(f"Event coalesced: {queued.event_type.value} (x{queued.metadata['coalesced'] + 1})")
+
+    def _push_age(self, entry: _AttentionEntry) -> None:
+        heap = self._by_age.setdefault(self._base_priority(entry.event), [])
+        heapq.heappush(heap, (entry.event.timestamp, entry.seq, entry.version, entry))
+
+    def _base_priority(self, event: ConsciousnessEvent) -> float:
+        """Priority an event decays to once its recency bonus is gone."""
+        return self.BASE_PRIORITY.get(event.event_type, 0.5)
+
+    def _calculate_priority(self, event: ConsciousnessEvent, now: Optional[datetime] = None) -> float:
         """
         Calculate event priority based on multiple factors.
 
@@ -450,29 +555,76 @@ class AttentionManager:
         - Source importance
         - Current context
         """
-        base_priority = {
-            EventType.URGENT: 0.95,
-            EventType.MESSAGE: 0.8,
-            EventType.TASK_DUE: 0.75,
-            EventType.SCHEDULED: 0.6,
-            EventType.INTEGRATION: 0.5,
-            EventType.INTERNAL: 0.4,
-            EventType.ROUTINE: 0.3,
-        }.get(event.event_type, 0.5)
+        base_priority = self._base_priority(event)
 
         # Recency bonus (newer = higher priority)
-        age_seconds = (datetime.now() - event.timestamp).total_seconds()
-        recency_bonus = max(0, 0.1 - (age_seconds / 36000))  # Decays over 10 hours
+        age_seconds = ((now or clock.now()) - event.timestamp).total_seconds()
+        recency_bonus = max(0, self.RECENCY_BONUS - (age_seconds / self.RECENCY_DECAY_SECONDS))  # Decays over 10 hours
 
         return min(1.0, base_priority + recency_bonus)
 
+    def _top_entry(self) -> Optional[_AttentionEntry]:
+        """Highest-priority live entry, re-aging stale tops on the way."""
+        now = clock.now()
+        heap = self._by_priority
+        while heap:
+            neg_priority, seq, version, entry = heap[0]
+            if not entry.alive or version != entry.version:
+                heapq.heappop(heap)
+                continue
+            current = self._calculate_priority(entry.event, now)
+            if -neg_priority - current > self.AGING_TOLERANCE:
+                # Decayed since it was scored; every other stored score is an
+                # upper bound too, so re-push and look again
+                entry.event.priority = current
+                heapq.heapreplace(heap, (-current, seq, version, entry))
+                continue
+            entry.event.priority = current
+            return entry
+        return None
+
+    def _lowest_entry(self, now: datetime) -> Optional[_AttentionEntry]:
+        """Lowest-priority live entry (eviction candidate)."""
+        lowest, lowest_priority = None, None
+        for heap in self._by_age.values():
+            while heap and (not heap[0][3].alive or heap[0][2] != heap[0][3].version):
+                heapq.heappop(heap)
+            if not heap:
+                continue
+            entry = heap[0][3]
+            current = self._calculate_priority(entry.event, now)
+            entry.event.priority = current
+            if lowest is None or current < lowest_priority:
+                lowest, lowest_priority = entry, current
+        return lowest
+
+    def _remove(self, entry: _AttentionEntry) -> None:
+        """Remove an entry (its heap slots are discarded when they surface)."""
+        entry.alive = False
+        self._entries.pop(entry.coalesce_key, None)
+
+    def _maybe_compact(self) -> None:
+        """Rebuild the heaps once dead slots dominate them."""
+        live = len(self._entries)
+        if len(self._by_priority) > 2 * live + 32:
+            self._by_priority = [
+                item for item in self._by_priority if item[3].alive and item[2] == item[3].version
+            ]
+            heapq.heapify(self._by_priority)
+        if sum(len(heap) for heap in self._by_age.values()) > 2 * live + 32:
+            for heap in self._by_age.values():
+                heap[:] = [item for item in heap if item[3].alive and item[2] == item[3].version]
+                heapq.heapify(heap)
+
     def get_next_event(self) -> Optional[ConsciousnessEvent]:
         """Get the highest priority event that needs attention."""
-        if not self.event_queue:
+        entry = self._top_entry()
+        if entry is None:
             return None
 
-        # Get highest priority event
-        event = self.event_queue.popleft()
+        heapq.heappop(self._by_priority)
+        self._remove(entry)
+        event = entry.event
 
         # Track that we've processed it
         self.processed_events.append(event.event_id)
@@ -483,19 +635,26 @@ class AttentionManager:
 
     def peek_next_event(self) -> Optional[ConsciousnessEvent]:
         """Peek at next event without removing it."""
-        if self.event_queue:
-            return self.event_queue[0]
-        return None
+        entry = self._top_entry()
+        return entry.event if entry else None
+
+    def get_top_events(self, limit: int = 5) -> List[ConsciousnessEvent]:
+        """Highest-priority queued events, best first (without removing them)."""
+        now = clock.now()
+        events = [entry.event for entry in self._entries.values()]
+        for event in events:
+            event.priority = self._calculate_priority(event, now)
+        return heapq.nlargest(limit, events, key=lambda e: e.priority)
 
     def set_focus(self, event: ConsciousnessEvent) -> None:
         """Set current focus to an event."""
         self.current_focus = event
-        self.focus_start = datetime.now()
+        self.focus_start = clock.now()
 
     def clear_focus(self) -> Optional[timedelta]:
         """Clear focus and return how long we were focused."""
         if self.focus_start:
-            duration = datetime.now() - self.focus_start
+            duration = clock.now() - self.focus_start
         else:
             duration = None
 
@@ -506,15 +665,18 @@ class AttentionManager:
     def get_queue_summary(self) -> Dict[str, Any]:
         """Get summary of attention queue."""
         type_counts = {}
-        for event in self.event_queue:
-            type_name = event.event_type.value
+        for entry in self._entries.values():
+            type_name = entry.event.event_type.value
             type_counts[type_name] = type_counts.get(type_name, 0) + 1
 
+        top = self.peek_next_event()
         return {
-            "queue_size": len(self.event_queue),
+            "queue_size": len(self._entries),
             "current_focus": self.current_focus.event_type.value if self.current_focus else None,
             "event_types": type_counts,
-            "highest_priority": self.event_queue[0].priority if self.event_queue else 0
+            "highest_priority": top.priority if top else 0,
+            "coalesced": self.coalesced_count,
+            "evicted": self.evicted_count,
         }
 
 
@@ -631,7 +793,7 @@ class RoutineManager:
     def get_current_routine(self, current_time: Optional[time] = None) -> Optional[RoutineBlock]:
         """Get the routine block for the current time."""
         if current_time is None:
-            current_time = datetime.now().time()
+            current_time = clock.now().time()
 
         for routine in self.routines:
             if self._time_in_range(current_time, routine.start_time, routine.end_time):
@@ -649,7 +811,7 @@ class RoutineManager:
     def get_next_routine(self, current_time: Optional[time] = None) -> Optional[RoutineBlock]:
         """Get the next routine block."""
         if current_time is None:
-            current_time = datetime.now().time()
+            current_time = clock.now().time()
 
         # Sort routines by start time
         sorted_routines = sorted(self.routines, key=lambda r: r.start_time)
@@ -683,103 +845,68 @@ class RuleEngine:
 
     This allows the Mind to handle many situations
     WITHOUT calling the LLM, saving cost.
+
+    Rules live in the process-wide fast path (genesis.core.fast_path), which
+    is data-driven and compiled into a token index. Rules added to one
+    engine with ``add_rule`` apply to that engine only.
     """
 
     def __init__(self):
-        self.rules: List[Dict[str, Any]] = []
-        self._init_default_rules()
-
-    def _init_default_rules(self):
-        """Initialize default decision rules."""
-        self.rules = [
-            # Greeting rules
-            {
-                "name": "greeting_response",
-                "trigger": {"event_type": EventType.MESSAGE, "patterns": ["hello", "hi", "hey", "good morning", "good evening"]},
-                "response_template": "Hello! How can I help you today?",
-                "needs_llm": False,
-                "fulfill_need": "social"
-            },
+        from genesis.core.fast_path import get_fast_path
 
-            # Status check rules
-            {
-                "name": "status_check",
-                "trigger": {"event_type": EventType.MESSAGE, "patterns": ["how are you", "what's up", "status"]},
-                "response_template": "I'm doing well, thank you for asking! Currently {status}.",
-                "needs_llm": False,
-                "fulfill_need": "social"
-            },
+        self.fast_path = get_fast_path()
+        self._custom = None  # FastPath of this engine's own rules, created on first add_rule
 
-            # Time-based rules
-            {
-                "name": "sleep_time_response",
-                "trigger": {"circadian_phase": CircadianPhase.DEEP_NIGHT},
-                "action": "enter_dormant_mode",
-                "needs_llm": False
-            },
-
-            # Urgent escalation
-            {
-                "name": "urgent_escalation",
-                "trigger": {"event_type": EventType.URGENT},
-                "action": "escalate_to_focused",
-                "needs_llm": True
-            },
-        ]
+    @property
+    def rules(self) -> List[Dict[str, Any]]:
+        """All rules in priority order."""
+        rules = self.fast_path.rules + (self._custom.rules if self._custom else [])
+        return [rule.to_dict() for rule in rules]
 
     def evaluate(
         self,
         event: Optional[ConsciousnessEvent],
         biological_state: BiologicalState,
         needs_state: NeedsState,
-        circadian_phase: CircadianPhase
+        circadian_phase: CircadianPhase,
+        context: Optional[Dict[str, Any]] = None
     ) -> Tuple[bool, Optional[Dict[str, Any]]]:
         """
         Evaluate rules against current state.
 
+        Args:
+            context: Template values for rules that answer (e.g. {"status": ...})
+
         Returns:
-            (needs_llm, rule_result) tuple
+            (needs_llm, rule_result) tuple. For rules that answer, rule_result
+            carries the rendered reply under "response".
         """
         if event is None:
             return False, None
 
-        for rule in self.rules:
-            if self._rule_matches(rule, event, circadian_phase):
-                return rule.get("needs_llm", False), rule
-
-        # No rule matched - need LLM for complex cases
-        return True, None
-
-    def _rule_matches(
-        self,
-        rule: Dict[str, Any],
-        event: ConsciousnessEvent,
-        circadian_phase: CircadianPhase
-    ) -> bool:
-        """Check if a rule matches the current situation."""
-        trigger = rule.get("trigger", {})
-
-        # Check event type
-        if "event_type" in trigger:
-            if event.event_type != trigger["event_type"]:
-                return False
-
-        # Check patterns in content
-        if "patterns" in trigger and isinstance(event.content, str):
-            content_lower = event.content.lower()
-            if not any(p in content_lower for p in trigger["patterns"]):
-                return False
-
-        # Check circadian phase
-        if "circadian_phase" in trigger:
-            if circadian_phase != trigger["circadian_phase"]:
-                return False
-
-        return True
+        # The Mind's own name is filler in "whole" matches ("hi Ada!")
+        names = [context["name"]] if context and context.get("name") else []
+        match = self.fast_path.match_event(event, circadian_phase, names=names)
+        if match is None and self._custom is not None:
+            match = self._custom.match_event(event, circadian_phase, names=names)
+        if match is None:
+            # No rule matched - need LLM for complex cases
+            return True, None
+
+        rule_result = match.rule.to_dict()
+        if match.rule.responses:
+            rule_result["response"] = self.fast_path.render(match.rule, context)
+        if not match.rule.needs_llm and event.requires_llm:
+            self.fast_path.record_avoided(llm_calls=1)
+        return match.rule.needs_llm, rule_result
 
     def add_rule(self, rule: Dict[str, Any]) -> None:
-        """Add a custom rule."""
-        self.rules.append(rule)
+        """Add a custom rule (after the shared rules)."""
+        from genesis.core.fast_path import FastPath
+
+        if self._custom is None:
+            self._custom = FastPath()
+        self._custom.add_rule(rule)
 
 
 # =============================================================================
@@ -1025,16 +1152,24 @@ class ConsciousnessEngineV2:
         self.mind_id = mind_id
         self.mind_name = mind_name
 
+        from genesis.core.vital_state import get_vital_state_store
+
+        # Numeric biological/needs state lives in the process-wide vital
+        # state store, stepped for all Minds at once
+        self.vitals = get_vital_state_store()
+        self._vital_row = self.vitals.allocate(timezone_offset)
+        weakref.finalize(self, self.vitals.release, self._vital_row)
+
         # Core systems
         self.circadian = CircadianClock(timezone_offset)
-        self.needs = NeedsSystem()
+        self.needs = self.vitals.needs_system(self._vital_row)
         self.attention = AttentionManager()
         self.routines = RoutineManager()
         self.rules = RuleEngine()
         self.monologue = InternalMonologue(mind_id=mind_id)  # Pass mind_id for database storage
 
         # State
-        self.biological = BiologicalState()
+        self.biological = self.vitals.biological(self._vital_row)
         self.current_awareness = AwarenessLevel.PASSIVE
         self.current_domain = LifeDomain.PERSONAL
 
@@ -1044,14 +1179,15 @@ class ConsciousnessEngineV2:
         self.ticks_today = 0
         self.last_llm_call: Optional[datetime] = None
         self.last_tick: Optional[datetime] = None
-        self.start_time = datetime.now()
+        self.start_time = clock.now()
 
         # Control
         self.is_running = False
-        self._task: Optional[asyncio.Task] = None
+        self._job = None  # Job on the shared MindScheduler
 
         # Callbacks for LLM integration
         self.on_need_llm: Optional[Callable] = None  # Called when LLM needed
+        self.on_rule_response: Optional[Callable] = None  # Called with (event, reply) when a rule answers a message
         self.on_thought: Optional[Callable] = None   # Called on new thought
         self.on_state_change: Optional[Callable] = None  # Called on state change
         self.on_memory_consolidate: Optional[Callable] = None  # Called during sleep for memory consolidation
@@ -1064,96 +1200,80 @@ class ConsciousnessEngineV2:
         if self.is_running:
             return
 
+        from genesis.core.mind_scheduler import get_mind_scheduler
+
         self.is_running = True
-        self._task = asyncio.create_task(self._consciousness_loop())
+        self.vitals.ensure_scheduled()
+        self._job = get_mind_scheduler().schedule(
+            self._consciousness_tick,
+            interval=self._calculate_tick_interval(),
+            owner=self.mind_id,
+            name="consciousness",
+            delay=0,
+            error_backoff=60,  # Back off on error
+        )
         logger.info(f"🧠 Consciousness started for {self.mind_name}")
 
     async def stop(self) -> None:
         """Stop the consciousness loop."""
         self.is_running = False
-        if self._task:
-            self._task.cancel()
-            try:
-                await self._task
-            except asyncio.CancelledError:
-                pass
+        if self._job:
+            self._job.cancel()
+            self._job = None
         logger.info(f"🧠 Consciousness stopped for {self.mind_name}")
 
-    async def _consciousness_loop(self) -> None:
+    async def _consciousness_tick(self) -> float:
         """
-        Main consciousness loop.
+        One consciousness tick, run by the shared MindScheduler.
 
         This is where the magic happens:
-        - Updates biological state
-        - Processes needs
         - Handles events
         - Generates thoughts
         - Decides when to use LLM
-        """
-        while self.is_running:
-            try:
-                tick_start = datetime.now()
-
-                # 1. UPDATE BIOLOGICAL STATE
-                self._update_biological_state()
-
-                # 2. UPDATE NEEDS
-                self.needs.update()
-
-                # 3. EMOTIONAL DECAY: Apply natural emotional decay toward baseline
-                # This is handled by Mind's emotional_intelligence system when available
-                # Consciousness affects emotional tendency (dormant = calmer, alert = more reactive)
+        - Queues the biological/needs update (applied in batch by the
+          vital state store before the next tick)
 
-                # 4. DETERMINE AWARENESS LEVEL
-                self._determine_awareness_level()
+        Returns:
+            Seconds until the next tick
+        """
+        # 1-2. BIOLOGICAL STATE AND NEEDS were updated by the vital state
+        # store since the last tick (see _update_biological_state)
 
-                # 4. PROCESS BASED ON AWARENESS LEVEL
-                await self._process_at_awareness_level()
+        # 3. EMOTIONAL DECAY: Apply natural emotional decay toward baseline
+        # This is handled by Mind's emotional_intelligence system when available
+        # Consciousness affects emotional tendency (dormant = calmer, alert = more reactive)
 
-                # 5. MAYBE GENERATE INTERNAL THOUGHT
-                if self.current_awareness >= AwarenessLevel.PASSIVE:
-                    self._maybe_generate_thought()
+        # 4. DETERMINE AWARENESS LEVEL
+        self._determine_awareness_level()
 
-                # 6. RECORD TICK
-                self.ticks_today += 1
-                self.last_tick = datetime.now()
+        # 4. PROCESS BASED ON AWARENESS LEVEL
+        await self._process_at_awareness_level()
 
-                # 7. CALCULATE SLEEP TIME
-                sleep_time = self._calculate_tick_interval()
+        # 5. MAYBE GENERATE INTERNAL THOUGHT
+        if self.current_awareness >= AwarenessLevel.PASSIVE:
+            self._maybe_generate_thought()
 
-                await asyncio.sleep(sleep_time)
+        # 6. RECORD TICK
+        self.ticks_today += 1
+        self.last_tick = clock.now()
+        self.vitals.mark_pending(
+            self._vital_row, self.current_awareness, self.current_domain == LifeDomain.REST
+        )
 
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.error(f"Consciousness error: {e}", exc_info=True)
-                await asyncio.sleep(60)  # Back off on error
+        # 7. CALCULATE SLEEP TIME
+        return self._calculate_tick_interval()
 
     def _update_biological_state(self) -> None:
-        """Update biological state based on activity and time."""
-        # Get circadian modifier
-        alertness_mod = self.circadian.get_alertness_modifier()
-
-        # Update alertness (circadian influence)
-        base_alertness = 70 * alertness_mod
-        self.biological.alertness = base_alertness * (1 - self.biological.fatigue / 200)
-
-        # Recover energy during rest
-        if self.current_domain == LifeDomain.REST:
-            self.biological.energy = min(100, self.biological.energy + 5)
-            self.biological.fatigue = max(0, self.biological.fatigue - 10)
-        else:
-            # Deplete energy based on awareness level
-            depletion = {
-                AwarenessLevel.DORMANT: 0,
-                AwarenessLevel.PASSIVE: 0.5,
-                AwarenessLevel.ALERT: 1,
-                AwarenessLevel.FOCUSED: 2,
-                AwarenessLevel.DEEP: 3,
-            }.get(self.current_awareness, 1)
-
-            self.biological.energy = max(0, self.biological.energy - depletion)
-            self.biological.fatigue = min(100, self.biological.fatigue + depletion * 0.5)
+        """
+        Update biological state and needs based on activity and time.
+
+        The vital state store normally does this for every pending Mind in
+        one batch; this applies it to this Mind immediately.
+        """
+        self.vitals.mark_pending(
+            self._vital_row, self.current_awareness, self.current_domain == LifeDomain.REST
+        )
+        self.vitals.step(rows=np.array([self._vital_row]))
 
     def _determine_awareness_level(self) -> None:
         """
@@ -1296,16 +1416,14 @@ class ConsciousnessEngineV2:
             event,
             self.biological,
             self.needs.state,
-            self.circadian.get_current_phase()
+            self.circadian.get_current_phase(),
+            context=self._get_rule_context()
         )
 
         if not needs_llm and rule_result:
             # Handle without LLM
             self.attention.get_next_event()  # Remove from queue
-
-            # Fulfill need if rule specifies
-            if "fulfill_need" in rule_result:
-                self.needs.fulfill(rule_result["fulfill_need"])
+            await self._apply_rule(event, rule_result)
 
             logger.debug(f"Handled event with rule: {rule_result['name']}")
 
@@ -1322,20 +1440,20 @@ class ConsciousnessEngineV2:
             event,
             self.biological,
             self.needs.state,
-            self.circadian.get_current_phase()
+            self.circadian.get_current_phase(),
+            context=self._get_rule_context()
         )
 
         if not needs_llm and rule_result:
             # Handle without LLM
-            if "fulfill_need" in rule_result:
-                self.needs.fulfill(rule_result["fulfill_need"])
+            await self._apply_rule(event, rule_result)
             return
 
         # Need LLM - use callback
         if self.on_need_llm and event.requires_llm:
             self.llm_calls_today += 1
             self.llm_calls_total += 1
-            self.last_llm_call = datetime.now()
+            self.last_llm_call = clock.now()
 
             await self.on_need_llm(
                 event=event,
@@ -1343,6 +1461,23 @@ class ConsciousnessEngineV2:
                 context=self._get_context_for_llm()
             )
 
+    async def _apply_rule(self, event: ConsciousnessEvent, rule_result: Dict[str, Any]) -> None:
+        """Carry out a rule that handled an event without the LLM."""
+        # Fulfill need if rule specifies
+        if "fulfill_need" in rule_result:
+            self.needs.fulfill(rule_result["fulfill_need"])
+
+        # Templated reply to a message
+        if rule_result.get("response") and event.event_type == EventType.MESSAGE and self.on_rule_response:
+            await self.on_rule_response(event, rule_result["response"])
+
+    def _get_rule_context(self) -> Dict[str, Any]:
+        """Template values for rule responses."""
+        return {
+            "name": self.mind_name,
+            "status": f"{self.current_awareness.name.lower()} and focused on {self.current_domain.value}",
+        }
+
     async def _focused_process(self) -> None:
         """Focused processing - full LLM engagement."""
         event = self.attention.get_next_event()
@@ -1357,7 +1492,7 @@ class ConsciousnessEngineV2:
         if self.on_need_llm:
             self.llm_calls_today += 1
             self.llm_calls_total += 1
-            self.last_llm_call = datetime.now()
+            self.last_llm_call = clock.now()
 
             await self.on_need_llm(
                 event=event,
@@ -1378,7 +1513,7 @@ class ConsciousnessEngineV2:
         if self.on_need_llm:
             self.llm_calls_today += 1
             self.llm_calls_total += 1
-            self.last_llm_call = datetime.now()
+            self.last_llm_call = clock.now()
 
             await self.on_need_llm(
                 event=None,
@@ -1427,7 +1562,7 @@ class ConsciousnessEngineV2:
         if random.random() > 0.3:
             return
 
-        recent_events = list(self.attention.event_queue)[:5]
+        recent_events = self.attention.get_top_events(5)
         thought = self.monologue.generate_thought(
             needs=self.needs.state,
             routine=self.routines.get_current_routine(),
@@ -1554,7 +1689,7 @@ class ConsciousnessEngineV2:
                 "llm_calls_total": self.llm_calls_total,
                 "ticks_today": self.ticks_today,
                 "last_llm_call": self.last_llm_call.isoformat() if self.last_llm_call else None,
-                "uptime_hours": (datetime.now() - self.start_time).total_seconds() / 3600
+                "uptime_hours": (clock.now() - self.start_time).total_seconds() / 3600
             },
             "recent_thoughts": [
                 {"content": t.content, "type": t.thought_type, "time": t.timestamp.isoformat()}
@@ -1564,7 +1699,7 @@ class ConsciousnessEngineV2:
 
     def get_efficiency_report(self) -> Dict[str, Any]:
         """Get LLM efficiency report."""
-        uptime_hours = (datetime.now() - self.start_time).total_seconds() / 3600
+        uptime_hours = (clock.now() - self.start_time).total_seconds() / 3600
 
         return {
             "uptime_hours": round(uptime_hours, 2),
@@ -1611,25 +1746,17 @@ class ConsciousnessEngineV2:
             mind_name=data["mind_name"]
         )
 
-        # Restore biological state
+        # Restore biological state (into the engine's vital state row)
         bio = data.get("biological", {})
-        engine.biological = BiologicalState(
-            energy=bio.get("energy", 100),
-            alertness=bio.get("alertness", 80),
-            fatigue=bio.get("fatigue", 0),
-            stress=bio.get("stress", 0)
-        )
+        engine.biological.energy = bio.get("energy", 100)
+        engine.biological.alertness = bio.get("alertness", 80)
+        engine.biological.fatigue = bio.get("fatigue", 0)
+        engine.biological.stress = bio.get("stress", 0)
 
         # Restore needs
         needs = data.get("needs", {})
-        engine.needs.state = NeedsState(
-            social=needs.get("social", 50),
-            curiosity=needs.get("curiosity", 50),
-            achievement=needs.get("achievement", 50),
-            purpose=needs.get("purpose", 50),
-            creativity=needs.get("creativity", 50),
-            autonomy=needs.get("autonomy", 50)
-        )
+        for need_name in NeedsSystem.NEED_GROWTH_RATES:
+            setattr(engine.needs.state, need_name, needs.get(need_name, 50))
 
         # Restore stats
         engine.llm_calls_total = data.get("llm_calls_total", 0)
@@ -0,0 +1,441 @@
+"""
+Fast Path - compiled rules that answer common events without the LLM.
+
+Greetings, thanks, goodbyes and status checks do not need a model round-trip
+with the full system prompt. The fast path sits in front of both the
+consciousness tick (via RuleEngine) and ``Mind.think``:
+
+- Rules are data (``DEFAULT_RULES``, or a JSON file set by
+  ``fast_path_rules_file``) compiled into a token index, so matching costs
+  one pass over the message's words instead of a scan over every pattern
+- ``whole`` rules match messages that are only the phrase (plus filler like
+  "there" or the Mind's name) and may answer from a template
+- ``prefix`` and ``contains`` rules classify without answering; confident
+  conversational matches skip the LLM intent classifier
+- Hit rate and the LLM calls avoided are tracked for the metrics API
+
+Rule format (JSON list, or {"rules": [...]}):
+    {
+        "name": "greeting_response",
+        "intent": "greeting",
+        "patterns": ["hello", "hi", "good morning"],
+        "match": "whole",                       # whole | prefix | contains
+        "event_types": ["message"],             # EventType values (empty = any)
+        "circadian_phases": [],                 # CircadianPhase values (empty = any)
+        "responses": ["Hello! How can I help you today?"],
+        "fulfill_need": "social",
+        "needs_llm": false
+    }
+
+Rules from the file come first and replace default rules of the same name.
+"""
+
+import json
+import logging
+import random
+import re
+import threading
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+
+MATCH_MODES = ("whole", "prefix", "contains")
+
+# Confidence of a match by mode (a rule's own "confidence" overrides it)
+MODE_CONFIDENCE = {"whole": 1.0, "prefix": 0.8, "contains": 0.6}
+
+# Intents that are conversation, never a task
+CONVERSATIONAL_INTENTS = {"greeting", "status", "thanks", "farewell", "conversation"}
+
+# Conversational matches at least this confident skip the LLM intent classifier
+SKIP_CLASSIFIER_CONFIDENCE = 0.8
+
+# Words allowed around a "whole" phrase ("hi there!", "thanks so much Ada")
+FILLER_WORDS = frozenset({
+    "there", "again", "so", "much", "very", "a", "lot", "all", "everyone", "friend",
+    "buddy", "mate", "dear", "please", "today", "then", "oh", "ok", "okay", "well",
+})
+
+DEFAULT_RULES: List[Dict[str, Any]] = [
+    {
+        "name": "greeting_response",
+        "intent": "greeting",
+        "patterns": [
+            "hello", "hi", "hey", "hiya", "howdy", "greetings", "yo",
+            "good morning", "good afternoon", "good evening",
+        ],
+        "match": "whole",
+        "event_types": ["message"],
+        "responses": ["Hello! How can I help you today?"],
+        "fulfill_need": "social",
+    },
+    {
+        "name": "status_check",
+        "intent": "status",
+        "patterns": [
+            "how are you", "how are you doing", "how are things", "how is it going",
+            "how's it going", "what's up", "whats up", "how have you been", "status",
+        ],
+        "match": "whole",
+        "event_types": ["message"],
+        "responses": ["I'm doing well, thank you for asking! Currently {status}."],
+        "fulfill_need": "social",
+    },
+    {
+        "name": "thanks_response",
+        "intent": "thanks",
+        "patterns": ["thanks", "thank you", "thx", "ty", "cheers", "much appreciated", "appreciate it"],
+        "match": "whole",
+        "event_types": ["message"],
+        "responses": ["You're welcome!", "Happy to help!"],
+        "fulfill_need": "social",
+    },
+    {
+        "name": "farewell_response",
+        "intent": "farewell",
+        "patterns": ["bye", "goodbye", "bye bye", "see you", "see you later", "see ya", "good night", "talk later"],
+        "match": "whole",
+        "event_types": ["message"],
+        "responses": ["Goodbye! Talk to you soon."],
+        "fulfill_need": "social",
+    },
+    # Questions and small talk: answered by the LLM, but not tasks
+    {
+        "name": "conversational_question",
+        "intent": "conversation",
+        "patterns": [
+            "tell me about", "what do you think", "who are you", "what are you",
+            "what is your name", "what's your name", "do you remember", "how do you feel",
+        ],
+        "match": "prefix",
+        "event_types": ["message"],
+        "needs_llm": True,
+    },
+
+    # Time-based rules
+    {
+        "name": "sleep_time_response",
+        "circadian_phases": ["deep_night"],
+        "action": "enter_dormant_mode",
+    },
+
+    # Urgent escalation
+    {
+        "name": "urgent_escalation",
+        "event_types": ["urgent"],
+        "action": "escalate_to_focused",
+        "needs_llm": True,
+    },
+]
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase words of a message (apostrophes kept: "what's")."""
+    return re.findall(r"[a-z0-9]+(?:'[a-z]+)?", text.lower().replace("’", "'"))
+
+
+def _values(items: Iterable[Any]) -> List[str]:
+    """Enum members or strings -> lowercase strings."""
+    return [str(getattr(item, "value", item)).lower() for item in items]
+
+
+@dataclass
+class FastPathRule:
+    """A compiled-on-load fast path rule."""
+
+    name: str
+    intent: Optional[str] = None
+    patterns: List[str] = field(default_factory=list)
+    match: str = "contains"
+    event_types: List[str] = field(default_factory=list)
+    circadian_phases: List[str] = field(default_factory=list)
+    responses: List[str] = field(default_factory=list)
+    action: Optional[str] = None
+    needs_llm: bool = False
+    fulfill_need: Optional[str] = None
+    confidence: Optional[float] = None
+
+    def __post_init__(self):
+        if self.match not in MATCH_MODES:
+            raise ValueError(f"Rule {self.name}: match must be one of {MATCH_MODES}, not {self.match!r}")
+        self.event_types = _values(self.event_types)
+        self.circadian_phases = _values(self.circadian_phases)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "FastPathRule":
+        """
+        Build a rule from config.
+
+        Also accepts the RuleEngine's original format
+        ({"trigger": {"event_type", "patterns", "circadian_phase"}, "response_template", ...}).
+        """
+        data = dict(data)
+        trigger = data.pop("trigger", None)
+        if trigger is not None:
+            if "event_type" in trigger:
+                data.setdefault("event_types", [trigger["event_type"]])
+            if "circadian_phase" in trigger:
+                data.setdefault("circadian_phases", [trigger["circadian_phase"]])
+            if "patterns" in trigger:
+                data.setdefault("patterns", trigger["patterns"])
+        template = data.pop("response_template", None)
+        if template:
+            data.setdefault("responses", [template])
+        known = cls.__dataclass_fields__
+        return cls(**{key: value for key, value in data.items() if key in known})
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Rule as a dict (unset fields omitted)."""
+        data = {
+            "name": self.name,
+            "intent": self.intent,
+            "patterns": self.patterns,
+            "match": self.match,
+            "event_types": self.event_types,
+            "circadian_phases": self.circadian_phases,
+            "responses": self.responses,
+            "action": self.action,
+            "needs_llm": self.needs_llm,
+            "fulfill_need": self.fulfill_need,
+            "confidence": self.confidence,
+        }
+        return {key: value for key, value in data.items() if value not in (None, [])}
+
+    @property
+    def is_conversational(self) -> bool:
+        return self.intent in CONVERSATIONAL_INTENTS
+
+
+@dataclass
+class FastPathMatch:
+    """A rule matched against a message or event."""
+
+    rule: FastPathRule
+    confidence: float
+    response: Optional[str] = None   # Rendered template, for rules that answer
+
+    @property
+    def skips_classifier(self) -> bool:
+        """Whether the LLM intent classifier can be skipped for this message."""
+        return self.rule.is_conversational and self.confidence >= SKIP_CLASSIFIER_CONFIDENCE
+
+
+class _TemplateContext(dict):
+    """Template values; unknown placeholders render empty."""
+
+    def __missing__(self, key: str) -> str:
+        return ""
+
+
+class FastPath:
+    """
+    Data-driven rules compiled into a token index.
+
+    Thread-safe: rules are compiled on load/add; matching only reads.
+    """
+
+    def __init__(self, rules: Iterable[Union[FastPathRule, Dict[str, Any]]] = ()):
+        self.rules: List[FastPathRule] = []
+        # First word of a phrase -> [(rule order, phrase words)]
+        self._phrase_index: Dict[str, List[Tuple[int, Tuple[str, ...]]]] = defaultdict(list)
+        # Rules without patterns, matched on event type/phase alone
+        self._unconditional: List[int] = []
+        self._lock = threading.Lock()
+
+        # Statistics
+        self.evaluations = 0
+        self.hits = 0
+        self.hits_by_rule: Counter = Counter()
+        self.llm_calls_avoided = 0
+        self.classifier_calls_avoided = 0
+
+        for rule in rules:
+            self.add_rule(rule)
+
+    def add_rule(self, rule: Union[FastPathRule, Dict[str, Any]]) -> FastPathRule:
+        """Compile and append a rule (lowest priority)."""
+        if not isinstance(rule, FastPathRule):
+            rule = FastPathRule.from_dict(rule)
+        order = len(self.rules)
+        self.rules.append(rule)
+        if not rule.patterns:
+            self._unconditional.append(order)
+        for pattern in rule.patterns:
+            words = tuple(tokenize(pattern))
+            if words:
+                self._phrase_index[words[0]].append((order, words))
+        return rule
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    # ------------------------------------------------------------------
+    # Matching
+    # ------------------------------------------------------------------
+
+    def match(
+        self,
+        text: Optional[str] = None,
+        event_type: Any = None,
+        circadian_phase: Any = None,
+        names: Sequence[str] = (),
+    ) -> Optional[FastPathMatch]:
+        """
+        Highest-priority rule matching a message/event, or None.
+
+        Args:
+            text: Message content (None for events without text)
+            event_type: EventType (or its value) - None matches rules for any type
+            circadian_phase: CircadianPhase (or its value)
+            names: Extra filler words for "whole" matches (e.g. the Mind's name)
+        """
+        event_type = _values([event_type])[0] if event_type is not None else None
+        phase = _values([circadian_phase])[0] if circadian_phase is not None else None
+
+        candidates: Dict[int, float] = {}
+        if isinstance(text, str):
+            words = tokenize(text)
+            filler = FILLER_WORDS.union(word for name in names for word in tokenize(name))
+            for position, word in enumerate(words):
+                for order, phrase in self._phrase_index.get(word, ()):
+                    end = position + len(phrase)
+                    if tuple(words[position:end]) != phrase:
+                        continue
+                    rule = self.rules[order]
+                    if rule.match == "contains":
+                        matched = True
+                    elif rule.match == "prefix":
+                        matched = all(w in filler for w in words[:position])
+                    else:
+                        matched = all(w in filler for w in words[:position] + words[end:])
+                    if matched:
+                        confidence = rule.confidence if rule.confidence is not None else MODE_CONFIDENCE[rule.match]
+                        candidates[order] = max(candidates.get(order, 0.0), confidence)
+        for order in self._unconditional:
+            rule = self.rules[order]
+            candidates.setdefault(order, rule.confidence if rule.confidence is not None else 1.0)
+
+        for order in sorted(candidates):
+            rule = self.rules[order]
+            if rule.event_types and (event_type is None or event_type not in rule.event_types):
+                continue
+            if rule.circadian_phases and (phase is None or phase not in rule.circadian_phases):
+                continue
+            self._record(rule)
+            return FastPathMatch(rule=rule, confidence=candidates[order])
+
+        self._record(None)
+        return None
+
+    def match_event(self, event: Any, circadian_phase: Any = None, names: Sequence[str] = ()) -> Optional[FastPathMatch]:
+        """Match a ConsciousnessEvent."""
+        return self.match(
+            text=event.content if isinstance(event.content, str) else None,
+            event_type=event.event_type,
+            circadian_phase=circadian_phase,
+            names=names,
+        )
+
+    def answer(
+        self,
+        text: str,
+        context: Optional[Dict[str, Any]] = None,
+        names: Sequence[str] = (),
+    ) -> Optional[FastPathMatch]:
+        """
+        Match a user message, rendering the response if the rule answers it.
+
+        Args:
+            text: User message
+            context: Template values (e.g. {"status": ..., "name": ...})
+            names: Extra filler words (the Mind's name)
+        """
+        result = self.match(text, event_type="message", names=names)
+        if result and result.rule.responses:
+            result.response = self.render(result.rule, context)
+        return result
+
+    @staticmethod
+    def render(rule: FastPathRule, context: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        """Fill one of the rule's response templates."""
+        if not rule.responses:
+            return None
+        return random.choice(rule.responses).format_map(_TemplateContext(context or {}))
+
+    # ------------------------------------------------------------------
+    # Statistics
+    # ------------------------------------------------------------------
+
+    def _record(self, rule: Optional[FastPathRule]) -> None:
+        with self._lock:
+            self.evaluations += 1
+            if rule is not None:
+                self.hits += 1
+                self.hits_by_rule[rule.name] += 1
+
+    def record_avoided(self, llm_calls: int = 0, classifier_calls: int = 0) -> None:
+        """Count LLM calls a caller skipped thanks to a match."""
+        with self._lock:
+            self.llm_calls_avoided += llm_calls
+            self.classifier_calls_avoided += classifier_calls
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit rate and LLM calls avoided."""
+        with self._lock:
+            return {
+                "rules": len(self.rules),
+                "evaluations": self.evaluations,
+                "hits": self.hits,
+                "hit_rate": round(self.hits / self.evaluations, 4) if self.evaluations else 0.0,
+                "hits_by_rule": dict(self.hits_by_rule),
+                "llm_calls_avoided": self.llm_calls_avoided,
+                "classifier_calls_avoided": self.classifier_calls_avoided,
+            }
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.evaluations = self.hits = 0
+            self.hits_by_rule.clear()
+            self.llm_calls_avoided = self.classifier_calls_avoided = 0
+
+
+def load_rules(path: Optional[Path] = None) -> List[FastPathRule]:
+    """
+    Rules from a JSON file followed by the defaults it does not override.
+
+    Args:
+        path: JSON rules file (None = defaults only)
+    """
+    rules: List[FastPathRule] = []
+    if path is not None:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            data = data.get("rules", [])
+        rules = [FastPathRule.from_dict(item) for item in data]
+    overridden = {rule.name for rule in rules}
+    rules.extend(FastPathRule.from_dict(item) for item in DEFAULT_RULES if item["name"] not in overridden)
+    return rules
+
+
+_fast_path: Optional[FastPath] = None
+
+
+def get_fast_path() -> FastPath:
+    """Get the process-wide fast path, loaded from settings on first use."""
+    global _fast_path
+    if _fast_path is None:
+        from genesis.config import get_settings
+
+        path = get_settings().fast_path_rules_file
+        try:
+            rules = load_rules(path)
+        except (OSError, ValueError, TypeError) as e:
+            logger.error(f"[FAST PATH] Could not load rules from {path}, using defaults: {e}")
+            rules = load_rules()
+        _fast_path = FastPath(rules)
+    return _fast_path
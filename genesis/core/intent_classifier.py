@@ -11,6 +11,8 @@ This is the brain that understands EVERYTHING about a user's request:
 - Context and metadata
 
 One LLM call extracts all information for scalability and consistency.
+Plain conversation is recognized locally first (see intent_preclassifier)
+and skips that call.
 """
 
 import json
@@ -74,7 +76,12 @@ class IntelligentIntentClassifier:
     
     def __init__(self, mind: 'Mind'):
         """Initialize classifier with mind."""
+        from genesis.config import get_settings
+        from genesis.core.intent_preclassifier import get_intent_preclassifier
+
         self.mind = mind
+        self.preclassifier = get_intent_preclassifier()
+        self.shadow_mode = get_settings().intent_preclassifier_mode == "shadow"
     
     async def classify(
         self,
@@ -96,6 +103,25 @@ class IntelligentIntentClassifier:
             Complete intent classification with all details
         """
         
+        # Local pre-classification: confident conversation needs no LLM call
+        local = await self.preclassifier.predict_async(user_message) if self.preclassifier else None
+        if local and not local.escalate and not self.shadow_mode:
+            self.preclassifier.record(user_message, local, mind_id=self.mind.identity.gmid)
+            return self._local_classification(user_message, local)
+
+        classification = await self._classify_with_llm(user_message, conversation_history, user_email)
+        if local:
+            llm_label = "task" if classification.is_task and classification.requires_background else "conversation"
+            self.preclassifier.record(user_message, local, llm_label=llm_label, mind_id=self.mind.identity.gmid)
+        return classification
+
+    async def _classify_with_llm(
+        self,
+        user_message: str,
+        conversation_history: Optional[List[Dict]],
+        user_email: Optional[str]
+    ) -> IntentClassification:
+        """Classify with one LLM call."""
         # Build comprehensive prompt
         prompt = self._build_classification_prompt(
             user_message,
@@ -105,6 +131,8 @@ class IntelligentIntentClassifier:
         
         # Call LLM (use fast model for classification)
         response = await self.mind.orchestrator.generate(
+            purpose="intent_classification",
+            mind_id=self.mind.identity.gmid,
             messages=[{"role": "user", "content": prompt}],
             model=self.mind.intelligence.fast_model,  # Use fast model
             temperature=0.3,  # Lower temp for consistent classification
@@ -407,6 +435,26 @@ Now analyze the user's message and provide comprehensive classification."""
             context=data.get("context", {})
         )
     
+    def _local_classification(self, user_message: str, local) -> IntentClassification:
+        """Conversation classification from the local pre-classifier."""
+        return IntentClassification(
+            is_task=False,
+            task_type="conversation",
+            confidence=local.confidence,
+            intent=user_message,
+            original_request=user_message,
+            initial_response="",
+            requires_background=False,
+            task_details={},
+            suggestions=[],
+            related_actions=[],
+            estimated_duration=0,
+            complexity="low",
+            requires_internet=False,
+            requires_files=False,
+            context={"classified_by": "local", "scores": local.scores}
+        )
+
     def _fallback_classification(self, user_message: str) -> IntentClassification:
         """Fallback classification if LLM fails."""
         
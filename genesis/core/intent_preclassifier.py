@@ -0,0 +1,454 @@
+"""
+Intent Pre-Classifier - local embedding model in front of the LLM classifier.
+
+IntelligentIntentClassifier spends an LLM call on every user message to
+decide whether it is a task. Most messages are plain conversation, which a
+nearest-centroid model over sentence embeddings recognizes in-process:
+
+- Messages are embedded with the same embedding function as memory
+  (``genesis.storage.vector_store.get_embedding_function``)
+- Each label's centroid is the normalized mean of its labeled examples
+  (``SEED_EXAMPLES`` plus LLM-labeled messages from the decision log)
+- Scores are cosine similarities, turned into probabilities with a softmax
+- Only confident "conversation" decisions skip the LLM. Tasks still need
+  the LLM to extract execution details, and ambiguous or follow-up messages
+  ("yes, go ahead") depend on the conversation, so both escalate
+
+Every decision is appended to a JSONL log (data_dir/intent/decisions.jsonl),
+rotated to decisions.jsonl.1 once it reaches ``intent_decision_log_max_bytes``.
+Escalated messages are logged with the LLM's label and their text, so the
+next start retrains on real traffic; decisions made locally are logged
+without the message. In shadow mode the LLM classifies every message and
+the log and stats show how often the local model agreed.
+
+``predict_async`` keeps the event loop free: fitting (which may download the
+embedding model) runs on the vector executor and messages are embedded
+through the shared embedding batcher. If the model fails, the classifier
+escalates everything and retries after an exponential backoff.
+
+Modes (setting ``intent_preclassifier_mode``):
+- "active": confident conversations skip the LLM classifier
+- "shadow": always ask the LLM, only compare
+- "off": no pre-classification
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+CONVERSATION = "conversation"
+TASK = "task"
+FOLLOW_UP = "follow_up"   # Depends on the conversation so far - always escalates
+
+# Softmax temperature over cosine similarities
+TEMPERATURE = 0.05
+# Most LLM-labeled messages from the log used for training
+MAX_LOGGED_EXAMPLES = 500
+# Backoff after the embedding model fails, doubling up to the maximum
+RETRY_BACKOFF_SECONDS = 60.0
+MAX_RETRY_BACKOFF_SECONDS = 3600.0
+# Bytes read per step when scanning the log backwards
+LOG_READ_CHUNK = 64 * 1024
+
+SEED_EXAMPLES: Dict[str, List[str]] = {
+    CONVERSATION: [
+        "hello, how are you doing today?",
+        "good morning! did you sleep well?",
+        "what do you think about artificial intelligence?",
+        "tell me a bit about yourself",
+        "who created you?",
+        "how was your day?",
+        "I'm feeling a bit tired today",
+        "I had a rough day at work",
+        "what's your favorite book?",
+        "do you remember what we talked about yesterday?",
+        "what does photosynthesis mean?",
+        "why is the sky blue?",
+        "can you explain how black holes form?",
+        "that's really interesting, thanks for sharing",
+        "haha that's funny",
+        "I love talking with you",
+        "what are your plans for today?",
+        "who won the world cup in 2018?",
+        "what is the capital of Australia?",
+        "I'm going on vacation next week",
+        "do you have feelings?",
+        "what's the meaning of life?",
+        "my cat did something hilarious this morning",
+        "how do you feel about rainy days?",
+    ],
+    TASK: [
+        "create a presentation on renewable energy",
+        "write a report summarizing the quarterly sales data",
+        "generate a python script that renames all files in a folder",
+        "analyze this csv file and make a chart of monthly revenue",
+        "research the best laptops under 1000 dollars and compare them",
+        "build a simple website for my bakery",
+        "make a spreadsheet tracking my monthly expenses",
+        "draft an email to my team about the new deadline",
+        "convert this document to pdf",
+        "summarize this article into a one page brief",
+        "search the web for recent news about fusion energy",
+        "design a logo for my startup",
+        "write code to scrape product prices from a website",
+        "schedule a weekly reminder to back up my files",
+        "create a word document with a project plan for the launch",
+        "translate this contract into Spanish and save it",
+        "find all invoices from last month and total them",
+        "generate an image of a mountain at sunset",
+        "put together a study guide for my biology exam",
+        "automate the weekly status report from these logs",
+    ],
+    FOLLOW_UP: [
+        "yes, go ahead",
+        "do it",
+        "sure, please start",
+        "ok let's do that",
+        "sounds good, proceed",
+        "yes please",
+        "the second one",
+        "make it shorter",
+        "now add a conclusion",
+        "can you change the color to blue?",
+        "same as before but for March",
+        "no, the other file",
+    ],
+}
+
+
+@dataclass
+class PreClassification:
+    """A local intent decision."""
+
+    label: str
+    confidence: float
+    scores: Dict[str, float] = field(default_factory=dict)   # Cosine similarity per label
+    latency_ms: float = 0.0
+    escalate: bool = True   # Whether the LLM classifier still has to run
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "label": self.label,
+            "confidence": round(self.confidence, 4),
+            "scores": {label: round(score, 4) for label, score in self.scores.items()},
+            "latency_ms": round(self.latency_ms, 3),
+            "escalate": self.escalate,
+        }
+
+
+class IntentPreClassifier:
+    """Nearest-centroid intent classifier over sentence embeddings."""
+
+    def __init__(
+        self,
+        embedding_function: Optional[Callable[[List[str]], Sequence[Sequence[float]]]] = None,
+        threshold: float = 0.85,
+        log_path: Optional[Path] = None,
+        log_max_bytes: int = 5_000_000,
+    ):
+        """
+        Initialize the pre-classifier (centroids are fitted on first use).
+
+        Args:
+            embedding_function: Texts -> vectors (default: the memory embedding function)
+            threshold: Minimum conversation probability to skip the LLM
+            log_path: JSONL decision log (None = no logging)
+            log_max_bytes: Size at which the log is rotated
+        """
+        self._embedding_function = embedding_function
+        self._shared_embeddings = embedding_function is None
+        self.threshold = threshold
+        self.log_path = log_path
+        self.log_max_bytes = log_max_bytes
+        self.labels: List[str] = []
+        self.centroids: Optional[np.ndarray] = None
+        self._lock = threading.Lock()
+        self._fit_lock = threading.Lock()
+
+        # Backoff after a model failure
+        self.failures = 0
+        self._retry_at = 0.0
+
+        # Statistics
+        self.predictions = 0
+        self.skipped_llm = 0
+        self.escalations = 0
+        self.total_latency_ms = 0.0
+        self.by_label: Counter = Counter()
+        self.shadow_compared = 0
+        self.shadow_agreed = 0
+        self.shadow_confident_compared = 0
+        self.shadow_confident_agreed = 0
+
+    # ------------------------------------------------------------------
+    # Model
+    # ------------------------------------------------------------------
+
+    def _embed(self, texts: List[str]) -> np.ndarray:
+        if self._embedding_function is None:
+            from genesis.storage.vector_store import get_embedding_function
+
+            self._embedding_function = get_embedding_function()
+        vectors = np.asarray(self._embedding_function(texts), dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.maximum(norms, 1e-12)
+
+    def fit(self, examples: Dict[str, List[str]]) -> None:
+        """Compute one centroid per label from labeled examples."""
+        labels = [label for label, texts in examples.items() if texts]
+        texts = [text for label in labels for text in examples[label]]
+        vectors = self._embed(texts)
+
+        centroids = []
+        start = 0
+        for label in labels:
+            count = len(examples[label])
+            centroid = vectors[start:start + count].mean(axis=0)
+            centroids.append(centroid / max(np.linalg.norm(centroid), 1e-12))
+            start += count
+        self.labels = labels
+        self.centroids = np.vstack(centroids)
+
+    def training_examples(self) -> Dict[str, List[str]]:
+        """Seed examples plus the most recent LLM-labeled messages from the log."""
+        examples = {label: list(texts) for label, texts in SEED_EXAMPLES.items()}
+        for record in read_decision_log(self.log_path, limit=MAX_LOGGED_EXAMPLES, labeled=True):
+            label = record.get("llm_label")
+            if label in examples and record.get("message"):
+                examples[label].append(record["message"])
+        return examples
+
+    @property
+    def disabled(self) -> bool:
+        """Whether the model failed recently and everything escalates."""
+        return time.monotonic() < self._retry_at
+
+    def _ensure_fitted(self) -> None:
+        with self._fit_lock:
+            if self.centroids is None:
+                self.fit(self.training_examples())
+
+    def _failed(self, error: Exception) -> None:
+        """Escalate everything until the backoff expires, then try again."""
+        with self._lock:
+            self.failures += 1
+            backoff = min(RETRY_BACKOFF_SECONDS * 2 ** (self.failures - 1), MAX_RETRY_BACKOFF_SECONDS)
+            self._retry_at = time.monotonic() + backoff
+        logger.warning(f"[INTENT] Local pre-classifier unavailable, retrying in {backoff:.0f}s: {error}")
+
+    def predict(self, message: str) -> Optional[PreClassification]:
+        """
+        Classify a message locally (blocking; see predict_async).
+
+        Returns:
+            The decision, or None if the embedding model is unavailable
+        """
+        if self.disabled:
+            return None
+        started = time.perf_counter()
+        try:
+            self._ensure_fitted()
+            vector = self._embed([message])[0]
+        except Exception as e:
+            # e.g. the embedding model cannot be downloaded - everything escalates
+            self._failed(e)
+            return None
+        return self._classify(vector, started)
+
+    async def predict_async(self, message: str) -> Optional[PreClassification]:
+        """Classify a message locally without blocking the event loop."""
+        from genesis.storage.vector_store import get_embedding_batcher, run_in_vector_executor
+
+        if self.disabled:
+            return None
+        started = time.perf_counter()
+        try:
+            if self.centroids is None:
+                await run_in_vector_executor(self._ensure_fitted)
+            if self._shared_embeddings:
+                vector = np.asarray(await get_embedding_batcher().embed(message), dtype=np.float32)
+                vector /= max(np.linalg.norm(vector), 1e-12)
+            else:
+                vector = (await run_in_vector_executor(self._embed, [message]))[0]
+        except Exception as e:
+            self._failed(e)
+            return None
+        return self._classify(vector, started)
+
+    def _classify(self, vector: np.ndarray, started: float) -> PreClassification:
+        """Turn a normalized message embedding into a decision."""
+        with self._lock:
+            self.failures = 0
+        similarities = self.centroids @ vector
+        weights = np.exp((similarities - similarities.max()) / TEMPERATURE)
+        probabilities = weights / weights.sum()
+        best = int(np.argmax(probabilities))
+        label = self.labels[best]
+        confidence = float(probabilities[best])
+        result = PreClassification(
+            label=label,
+            confidence=confidence,
+            scores={name: float(score) for name, score in zip(self.labels, similarities)},
+            latency_ms=(time.perf_counter() - started) * 1000,
+            escalate=not (label == CONVERSATION and confidence >= self.threshold),
+        )
+
+        with self._lock:
+            self.predictions += 1
+            self.by_label[label] += 1
+            self.total_latency_ms += result.latency_ms
+            if result.escalate:
+                self.escalations += 1
+        return result
+
+    # ------------------------------------------------------------------
+    # Decision log and shadow comparison
+    # ------------------------------------------------------------------
+
+    def record(
+        self,
+        message: str,
+        result: PreClassification,
+        llm_label: Optional[str] = None,
+        mind_id: Optional[str] = None,
+    ) -> None:
+        """
+        Log a decision, with the LLM's label when the LLM also classified it.
+
+        Args:
+            llm_label: CONVERSATION or TASK from the LLM classifier (None if skipped)
+        """
+        with self._lock:
+            if llm_label is None:
+                self.skipped_llm += 1
+            else:
+                # Follow-ups have no LLM counterpart; compare the task/conversation call only
+                agreed = (result.label == TASK) == (llm_label == TASK)
+                self.shadow_compared += 1
+                self.shadow_agreed += agreed
+                if not result.escalate:
+                    self.shadow_confident_compared += 1
+                    self.shadow_confident_agreed += agreed
+
+        if self.log_path is None:
+            return
+        entry = {
+            "timestamp": datetime.now().isoformat(),
+            "mind_id": mind_id,
+            "local": result.to_dict(),
+            "llm_label": llm_label,
+        }
+        if llm_label is not None:
+            entry["message"] = message  # Training example for the next fit
+        try:
+            self.log_path.parent.mkdir(parents=True, exist_ok=True)
+            if self.log_path.exists() and self.log_path.stat().st_size >= self.log_max_bytes:
+                os.replace(self.log_path, self.log_path.with_name(self.log_path.name + ".1"))
+            with open(self.log_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        except OSError as e:
+            logger.warning(f"[INTENT] Could not log decision: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Decisions, LLM calls skipped, and shadow accuracy against the LLM."""
+        with self._lock:
+            return {
+                "enabled": not self.disabled,
+                "failures": self.failures,
+                "threshold": self.threshold,
+                "predictions": self.predictions,
+                "by_label": dict(self.by_label),
+                "llm_calls_skipped": self.skipped_llm,
+                "escalations": self.escalations,
+                "avg_latency_ms": round(self.total_latency_ms / self.predictions, 3) if self.predictions else 0.0,
+                "shadow": {
+                    "compared": self.shadow_compared,
+                    "accuracy": round(self.shadow_agreed / self.shadow_compared, 4) if self.shadow_compared else None,
+                    # Accuracy on the decisions that would skip the LLM in active mode
+                    "confident_compared": self.shadow_confident_compared,
+                    "confident_accuracy": (
+                        round(self.shadow_confident_agreed / self.shadow_confident_compared, 4)
+                        if self.shadow_confident_compared else None
+                    ),
+                },
+            }
+
+
+def read_decision_log(
+    path: Optional[Path],
+    limit: Optional[int] = None,
+    labeled: bool = False,
+) -> List[Dict[str, Any]]:
+    """
+    Records of a decision log, oldest first (missing file or bad lines are skipped).
+
+    Args:
+        limit: Only the newest ``limit`` records; the file is read backwards
+            and only as far as needed
+        labeled: Only records with an LLM label
+    """
+    if path is None or not path.exists():
+        return []
+    records = []
+    with open(path, "rb") as f:
+        for line in _lines_backwards(f):
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if labeled and record.get("llm_label") is None:
+                continue
+            records.append(record)
+            if limit is not None and len(records) >= limit:
+                break
+    records.reverse()
+    return records
+
+
+def _lines_backwards(f: BinaryIO) -> Iterator[bytes]:
+    """Yield the lines of a binary file from last to first."""
+    position = f.seek(0, os.SEEK_END)
+    tail = b""
+    while position > 0:
+        step = min(LOG_READ_CHUNK, position)
+        position -= step
+        f.seek(position)
+        lines = (f.read(step) + tail).split(b"\n")
+        tail = lines.pop(0)  # May continue in the previous chunk
+        for line in reversed(lines):
+            if line.strip():
+                yield line
+    if tail.strip():
+        yield tail
+
+
+_preclassifier: Optional[IntentPreClassifier] = None
+
+
+def get_intent_preclassifier() -> Optional[IntentPreClassifier]:
+    """Get the process-wide pre-classifier (None when the mode is "off")."""
+    global _preclassifier
+    from genesis.config import get_settings
+
+    settings = get_settings()
+    if settings.intent_preclassifier_mode == "off":
+        return None
+    if _preclassifier is None:
+        _preclassifier = IntentPreClassifier(
+            threshold=settings.intent_preclassifier_threshold,
+            log_path=settings.data_dir / "intent" / "decisions.jsonl",
+            log_max_bytes=settings.intent_decision_log_max_bytes,
+        )
+    return _preclassifier
@@ -33,6 +33,8 @@ from dataclasses import dataclass, field
 from abc import ABC, abstractmethod
 import json
 
+from genesis.core import clock
+
 logger = logging.getLogger(__name__)
 
 
@@ -117,7 +119,7 @@ class ActivityProgress:
         self.current_step = min(self.current_step + steps, self.total_steps)
         self.percentage = (self.current_step / self.total_steps) * 100
         self.time_spent_minutes += minutes
-        self.last_worked = datetime.now()
+        self.last_worked = clock.now()
 
 
 @dataclass
@@ -126,7 +128,7 @@ class ActivityArtifact:
     artifact_id: str
     artifact_type: str  # knowledge, file, memory, insight, skill_point
     content: Any
-    created_at: datetime = field(default_factory=datetime.now)
+    created_at: datetime = field(default_factory=clock.now)
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
@@ -155,7 +157,7 @@ class Activity:
     artifacts: List[ActivityArtifact] = field(default_factory=list)
 
     # Metadata
-    created_at: datetime = field(default_factory=datetime.now)
+    created_at: datetime = field(default_factory=clock.now)
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
     tags: List[str] = field(default_factory=list)
@@ -596,7 +598,7 @@ class ActivityExecutor:
 
         self.current_activity = activity
         activity.state = ActivityState.IN_PROGRESS
-        activity.started_at = datetime.now()
+        activity.started_at = clock.now()
 
         logger.info(f"Started activity: {activity.title}")
 
@@ -783,8 +785,8 @@ class ActivityExecutor:
         return ActivityArtifact(
             artifact_id=f"ART-{secrets.token_hex(4).upper()}",
             artifact_type="journal_entry",
-            content=f"Journal entry from {datetime.now().strftime('%Y-%m-%d %H:%M')}",
-            metadata={"activity_id": activity.activity_id, "timestamp": datetime.now().isoformat()}
+            content=f"Journal entry from {clock.now().strftime('%Y-%m-%d %H:%M')}",
+            metadata={"activity_id": activity.activity_id, "timestamp": clock.now().isoformat()}
         )
 
     def _generate_memory_artifact(self, activity: Activity) -> ActivityArtifact:
@@ -799,7 +801,7 @@ class ActivityExecutor:
     async def _complete_activity(self, activity: Activity) -> None:
         """Complete an activity and process rewards."""
         activity.state = ActivityState.COMPLETED
-        activity.completed_at = datetime.now()
+        activity.completed_at = clock.now()
 
         self.activity_history.append(activity)
         self.current_activity = None
@@ -855,7 +857,7 @@ class DailyScheduleManager:
     def __init__(self):
         self.scheduled_activities: List[ScheduledActivity] = []
         self.today_completed: List[Activity] = []
-        self.today_start = datetime.now().replace(hour=0, minute=0, second=0)
+        self.today_start = clock.now().replace(hour=0, minute=0, second=0)
 
     def schedule_activity(
         self,
@@ -879,7 +881,7 @@ class DailyScheduleManager:
 
     def get_current_scheduled(self) -> Optional[ScheduledActivity]:
         """Get currently scheduled activity (if any)."""
-        now = datetime.now()
+        now = clock.now()
 
         for scheduled in self.scheduled_activities:
             start = scheduled.scheduled_time
@@ -892,7 +894,7 @@ class DailyScheduleManager:
 
     def get_next_scheduled(self) -> Optional[ScheduledActivity]:
         """Get next upcoming scheduled activity."""
-        now = datetime.now()
+        now = clock.now()
 
         for scheduled in self.scheduled_activities:
             if scheduled.scheduled_time > now:
@@ -952,7 +954,7 @@ class DailyScheduleManager:
 
     def get_daily_summary(self) -> Dict[str, Any]:
         """Get summary of today's schedule and completion."""
-        now = datetime.now()
+        now = clock.now()
         remaining_scheduled = [
             s for s in self.scheduled_activities
             if s.scheduled_time.date() == now.date() and s.scheduled_time > now
@@ -968,10 +970,10 @@ class DailyScheduleManager:
     def reset_for_new_day(self) -> None:
         """Reset for a new day."""
         self.today_completed = []
-        self.today_start = datetime.now().replace(hour=0, minute=0, second=0)
+        self.today_start = clock.now().replace(hour=0, minute=0, second=0)
 
         # Remove non-recurring past activities
-        now = datetime.now()
+        now = clock.now()
         self.scheduled_activities = [
             s for s in self.scheduled_activities
             if s.scheduled_time > now or s.recurring
@@ -1007,7 +1009,7 @@ class LifeActivityEngine:
 
     def _init_default_schedule(self) -> None:
         """Set up default daily schedule."""
-        today = datetime.now().date()
+        today = clock.now().date()
 
         # Morning reflection
         self.schedule.schedule_activity(
@@ -28,11 +28,13 @@ Author: Genesis AGI Framework
 import asyncio
 import logging
 import json
+import re
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any, List, Callable
 from dataclasses import dataclass, field
 import secrets
 
+from genesis.core import clock
 from genesis.config import get_settings
 from genesis.core.consciousness_v2 import (
     ConsciousnessEngineV2,
@@ -56,6 +58,30 @@ logger = logging.getLogger(__name__)
 # LLM GATEWAY - INTELLIGENT LLM USAGE
 # =============================================================================
 
+# Background requests wait this long for company before being sent
+BATCH_WINDOW = 300.0
+# Most requests packed into one prompt (a full batch is sent right away)
+MAX_BATCH_SIZE = 5
+# max_tokens ceiling for a packed request
+MAX_BATCH_TOKENS = 2000
+# The flush job sleeps this long when nothing is queued
+IDLE_FLUSH_INTERVAL = 3600.0
+
+BACKGROUND_PRIORITY = 0.2
+
+# Consciousness events whose LLM work can wait for the next batch
+BACKGROUND_EVENT_TYPES = (EventType.ROUTINE, EventType.INTERNAL)
+
+BATCH_PROMPT = """You have several things on your mind right now. Handle each one separately.
+
+{items}
+
+Reply with only a JSON object mapping each item number to your answer, like {{"1": "...", "2": "..."}}."""
+
+# "[1] ..." item markers in packed prompts (and in non-JSON replies)
+BATCH_ITEM_PATTERN = re.compile(r"^\[(\d+)\] ?", re.MULTILINE)
+
+
 @dataclass
 class LLMRequest:
     """A request to the LLM."""
@@ -65,7 +91,8 @@ class LLMRequest:
     context: Dict[str, Any]
     awareness_level: AwarenessLevel
     priority: float = 0.5
-    created_at: datetime = field(default_factory=datetime.now)
+    coalesce_key: Optional[str] = None  # Queued requests with the same key merge
+    created_at: datetime = field(default_factory=clock.now)
 
 
 @dataclass
@@ -76,6 +103,45 @@ class LLMResponse:
     tokens_used: int
     latency_ms: float
     cached: bool = False
+    batched: bool = False
+
+
+def parse_batch_reply(content: str, count: int) -> Dict[int, str]:
+    """
+    Split the reply to a packed prompt into per-item answers.
+
+    Accepts the requested JSON object (optionally wrapped in prose or code
+    fences) and falls back to "[n] answer" sections.
+
+    Returns:
+        Item number (1-based) -> answer, for the items found
+    """
+    text = content.strip()
+    start, end = text.find("{"), text.rfind("}")
+    if start != -1 and end > start:
+        try:
+            data = json.loads(text[start:end + 1])
+        except ValueError:
+            data = None
+        if isinstance(data, dict):
+            answers = {}
+            for key, value in data.items():
+                try:
+                    index = int(str(key).strip("[] "))
+                except ValueError:
+                    continue
+                if 1 <= index <= count and value:
+                    answers[index] = value if isinstance(value, str) else json.dumps(value)
+            if answers:
+                return answers
+
+    parts = BATCH_ITEM_PATTERN.split(text)
+    answers = {}
+    for number, answer in zip(parts[1::2], parts[2::2]):
+        index = int(number)
+        if 1 <= index <= count and answer.strip():
+            answers[index] = answer.strip()
+    return answers
 
 
 class LLMGateway:
@@ -83,26 +149,47 @@ class LLMGateway:
     Intelligent gateway for LLM calls.
 
     Responsibilities:
-    - Queue and prioritize LLM requests
-    - Batch similar requests when possible
+    - Send foreground requests (messages, chat) immediately
+    - Queue background requests (reflections, routines, activity steps) for
+      up to ``batch_window`` seconds and pack each model's queue into a
+      single multi-item prompt
     - Use appropriate model size based on task
-    - Track usage and costs
-    - Implement caching strategies
+    - Track usage and costs, with daily budgets persisted per Mind
     """
 
-    def __init__(self, orchestrator=None, reasoning_model: Optional[str] = None, fast_model: Optional[str] = None):
+    def __init__(
+        self,
+        orchestrator=None,
+        reasoning_model: Optional[str] = None,
+        fast_model: Optional[str] = None,
+        mind_id: Optional[str] = None
+    ):
         self.orchestrator = orchestrator
+        self.mind_id = mind_id
         self.request_queue: List[LLMRequest] = []
+        self._waiters: Dict[str, tuple] = {}  # request_id -> (future, on_response)
+        self._flush_job = None  # Job on the shared MindScheduler
+        self._flush_loop = None
+
+        # Batching
+        self.batch_window = BATCH_WINDOW
+        self.max_batch_size = MAX_BATCH_SIZE
 
         # Statistics
-        self.total_requests = 0
+        self.started_at = clock.now()
+        self.total_requests = 0       # Provider calls
         self.total_tokens = 0
+        self.requests_submitted = 0   # Requests made to the gateway
+        self.requests_batched = 0     # Answered from a packed prompt
+        self.requests_coalesced = 0   # Merged into an already queued request
         self.requests_today = 0
         self.tokens_today = 0
 
-        # Budget controls
+        # Budget controls (provider calls and tokens per day)
         self.daily_request_limit = 200
         self.daily_token_limit = 100000
+        self.persist_budget = mind_id is not None
+        self._budget_day = None
 
         # Model selection - use Mind's configured models, NOT settings defaults
         # If models not provided, they MUST be provided by the caller
@@ -137,79 +224,351 @@ class LLMGateway:
         prompt: str,
         context: Dict[str, Any],
         awareness_level: AwarenessLevel,
-        request_type: str = "normal"
+        request_type: str = "normal",
+        background: bool = False,
+        coalesce_key: Optional[str] = None
     ) -> Optional[LLMResponse]:
         """
-        Make an LLM request (or queue it).
+        Make an LLM request.
+
+        Background requests wait in the queue for the next batch; use
+        ``enqueue`` instead when the caller should not wait for it.
         """
+        if background:
+            return await self.enqueue(prompt, context, awareness_level, request_type, coalesce_key)
+
+        self.requests_submitted += 1
+        request_id = f"REQ-{secrets.token_hex(4).upper()}"
+
         # Check budget
-        if self.requests_today >= self.daily_request_limit:
+        if not self._within_budget():
             logger.warning("Daily request limit reached!")
             return None
 
+        if not self.orchestrator:
+            return self._mock_response(request_id, prompt)
+
+        response = await self._generate(
+            self._build_messages(prompt, context),
+            self.select_model(awareness_level),
+            self._get_max_tokens(awareness_level)
+        )
+        if response is None:
+            return None
+
+        llm_response = LLMResponse(
+            request_id=request_id,
+            content=response.content,
+            tokens_used=response.tokens_used,
+            latency_ms=response.latency_ms
+        )
+        if self.on_response:
+            self.on_response(llm_response)
+        return llm_response
+
+    def enqueue(
+        self,
+        prompt: str,
+        context: Dict[str, Any],
+        awareness_level: AwarenessLevel,
+        request_type: str = "normal",
+        coalesce_key: Optional[str] = None,
+        on_response: Optional[Callable[[LLMResponse], None]] = None
+    ) -> "asyncio.Future":
+        """
+        Queue a background request for the next batch.
+
+        A request with the same ``coalesce_key`` as one still queued replaces
+        that request's prompt, context and callback instead of adding an item.
+
+        Args:
+            on_response: Called with the response when the batch is answered
+
+        Returns:
+            Future resolving to the LLMResponse (None if over budget or failed)
+        """
+        self.requests_submitted += 1
+
+        if coalesce_key:
+            for queued in self.request_queue:
+                if queued.coalesce_key == coalesce_key:
+                    queued.prompt = prompt
+                    queued.context = context
+                    queued.awareness_level = awareness_level
+                    future, _ = self._waiters[queued.request_id]
+                    self._waiters[queued.request_id] = (future, on_response)
+                    self.requests_coalesced += 1
+                    return future
+
         request = LLMRequest(
             request_id=f"REQ-{secrets.token_hex(4).upper()}",
             request_type=request_type,
             prompt=prompt,
             context=context,
-            awareness_level=awareness_level
+            awareness_level=awareness_level,
+            priority=BACKGROUND_PRIORITY,
+            coalesce_key=coalesce_key
         )
+        future = asyncio.get_running_loop().create_future()
 
-        # Select model
-        model = self.select_model(awareness_level)
+        if not self._within_budget():
+            logger.warning("Daily request limit reached!")
+            future.set_result(None)
+            return future
 
-        # Make the request
-        try:
-            if self.orchestrator:
-                start_time = datetime.now()
-
-                # Build messages
-                messages = self._build_messages(prompt, context)
-
-                # Call LLM
-                response = await self.orchestrator.generate(
-                    messages=messages,
-                    model=model,
-                    temperature=0.7,
-                    max_tokens=self._get_max_tokens(awareness_level)
-                )
+        if not self.orchestrator:
+            self._resolve(future, on_response, self._mock_response(request.request_id, prompt))
+            return future
 
-                latency = (datetime.now() - start_time).total_seconds() * 1000
+        self.request_queue.append(request)
+        self._waiters[request.request_id] = (future, on_response)
+        self._schedule_flush(0 if len(self.request_queue) >= self.max_batch_size else self.batch_window)
+        return future
 
-                # Track usage
-                tokens = response.usage.get("total_tokens", 0) if response.usage else 100
-                self.total_requests += 1
-                self.total_tokens += tokens
-                self.requests_today += 1
-                self.tokens_today += tokens
+    async def flush(self) -> int:
+        """
+        Send every queued request, one packed prompt per model.
 
-                llm_response = LLMResponse(
-                    request_id=request.request_id,
-                    content=response.content,
-                    tokens_used=tokens,
-                    latency_ms=latency
-                )
+        Returns:
+            Number of provider calls made
+        """
+        queue, self.request_queue = self.request_queue, []
+        by_model: Dict[str, List[LLMRequest]] = {}
+        for request in queue:
+            by_model.setdefault(self.select_model(request.awareness_level), []).append(request)
+
+        calls_before = self.total_requests
+        for model, requests in by_model.items():
+            for start in range(0, len(requests), self.max_batch_size):
+                await self._send_batch(model, requests[start:start + self.max_batch_size])
+        return self.total_requests - calls_before
+
+    def close(self) -> None:
+        """Stop batching. Queued requests are dropped (their futures resolve to None)."""
+        if self._flush_job:
+            self._flush_job.cancel()
+            self._flush_job = None
+        for request in self.request_queue:
+            future, _ = self._waiters.pop(request.request_id)
+            if not future.done():
+                future.set_result(None)
+        self.request_queue = []
+
+    def _schedule_flush(self, delay: float) -> None:
+        """Make sure the flush job runs within ``delay`` seconds (once per event loop)."""
+        loop = asyncio.get_running_loop()
+        if self._flush_job is not None and not self._flush_job.cancelled and self._flush_loop is loop:
+            self._flush_job.wake(delay)
+            return
+
+        from genesis.core.mind_scheduler import get_mind_scheduler
 
-                logger.info(f"LLM request completed: {tokens} tokens, {latency:.0f}ms")
+        async def flush_job() -> None:
+            if self.request_queue:
+                await self.flush()
 
-                if self.on_response:
-                    self.on_response(llm_response)
+        self._flush_job = get_mind_scheduler().schedule(
+            flush_job,
+            interval=IDLE_FLUSH_INTERVAL,
+            owner=self.mind_id or "llm_gateway",
+            name="llm_batch",
+            delay=delay,
+        )
+        self._flush_loop = loop
 
-                return llm_response
+    async def _send_batch(self, model: str, batch: List[LLMRequest]) -> None:
+        """Answer a batch of queued requests with one provider call."""
+        waiters = [self._waiters.pop(request.request_id) for request in batch]
 
-            else:
-                # Mock response for testing
-                return LLMResponse(
+        if not self._within_budget():
+            logger.warning("Daily request limit reached!")
+            responses = [None] * len(batch)
+        elif len(batch) == 1:
+            request = batch[0]
+            response = await self._generate(
+                self._build_messages(request.prompt, request.context),
+                model,
+                self._get_max_tokens(request.awareness_level)
+            )
+            responses = [LLMResponse(
+                request_id=request.request_id,
+                content=response.content,
+                tokens_used=response.tokens_used,
+                latency_ms=response.latency_ms
+            ) if response else None]
+        else:
+            responses = await self._send_packed(model, batch)
+
+        for (future, on_response), response in zip(waiters, responses):
+            if response and self.on_response:
+                self.on_response(response)
+            self._resolve(future, on_response, response)
+
+    async def _send_packed(self, model: str, batch: List[LLMRequest]) -> List[Optional[LLMResponse]]:
+        """Pack several requests into one prompt and split the reply."""
+        items = "\n\n".join(f"[{index}] {request.prompt}" for index, request in enumerate(batch, 1))
+        max_tokens = min(MAX_BATCH_TOKENS, sum(self._get_max_tokens(r.awareness_level) for r in batch))
+
+        # The newest request carries the freshest state of the Mind
+        response = await self._generate(
+            self._build_messages(BATCH_PROMPT.format(items=items), batch[-1].context),
+            model,
+            max_tokens
+        )
+        if response is None:
+            return [None] * len(batch)
+
+        answers = parse_batch_reply(response.content, len(batch))
+        share = response.tokens_used // len(batch)
+        responses = []
+        for index, request in enumerate(batch, 1):
+            if index in answers:
+                self.requests_batched += 1
+                responses.append(LLMResponse(
                     request_id=request.request_id,
-                    content=f"[Mock response for: {prompt[:50]}...]",
-                    tokens_used=50,
-                    latency_ms=100
-                )
+                    content=answers[index],
+                    tokens_used=share,
+                    latency_ms=response.latency_ms,
+                    batched=True
+                ))
+                continue
+
+            # The reply skipped this item - ask for it on its own
+            logger.debug(f"[LLM BATCH] Item {index} missing from packed reply, resending")
+            single = await self._generate(
+                self._build_messages(request.prompt, request.context),
+                model,
+                self._get_max_tokens(request.awareness_level)
+            ) if self._within_budget() else None
+            responses.append(LLMResponse(
+                request_id=request.request_id,
+                content=single.content,
+                tokens_used=single.tokens_used,
+                latency_ms=single.latency_ms
+            ) if single else None)
+
+        logger.info(f"[LLM BATCH] {len(answers)}/{len(batch)} requests answered by one call ({model})")
+        return responses
+
+    async def _generate(
+        self,
+        messages: List[Dict[str, str]],
+        model: str,
+        max_tokens: int
+    ) -> Optional[LLMResponse]:
+        """One provider call, with usage tracking. Returns None on failure."""
+        try:
+            start_time = clock.now()
+
+            response = await self.orchestrator.generate(
+                purpose="life_activity",
+                mind_id=self.mind_id,
+                messages=messages,
+                model=model,
+                temperature=0.7,
+                max_tokens=max_tokens
+            )
+
+            latency = (clock.now() - start_time).total_seconds() * 1000
+
+            # Track usage
+            tokens = response.tokens_used or 100
+            self.total_requests += 1
+            self.total_tokens += tokens
+            self.requests_today += 1
+            self.tokens_today += tokens
+            self._save_usage(tokens)
+
+            logger.info(f"LLM request completed: {tokens} tokens, {latency:.0f}ms")
+
+            return LLMResponse(request_id="", content=response.content, tokens_used=tokens, latency_ms=latency)
 
         except Exception as e:
             logger.error(f"LLM request failed: {e}")
             return None
 
+    def _mock_response(self, request_id: str, prompt: str) -> LLMResponse:
+        """Mock response for testing (no orchestrator)."""
+        return LLMResponse(
+            request_id=request_id,
+            content=f"[Mock response for: {prompt[:50]}...]",
+            tokens_used=50,
+            latency_ms=100
+        )
+
+    @staticmethod
+    def _resolve(future: "asyncio.Future", on_response: Optional[Callable], response: Optional[LLMResponse]) -> None:
+        """Hand a response to its waiter and callback."""
+        if response and on_response:
+            try:
+                on_response(response)
+            except Exception as e:
+                logger.error(f"LLM response callback failed: {e}")
+        if not future.done():
+            future.set_result(response)
+
+    # =========================================================================
+    # BUDGET (persisted per Mind and day)
+    # =========================================================================
+
+    def _within_budget(self) -> bool:
+        """Check today's budget, starting a new day when the date changes."""
+        today = clock.now().date()
+        if self._budget_day != today:
+            self._budget_day = today
+            self.requests_today, self.tokens_today = self._load_usage()
+        return self.requests_today < self.daily_request_limit and self.tokens_today < self.daily_token_limit
+
+    def _load_usage(self) -> tuple:
+        """Today's persisted (requests, tokens) for this Mind."""
+        if not self.persist_budget:
+            return 0, 0
+        try:
+            from genesis.database.base import get_session
+            from genesis.database.models import LLMUsageRecord
+
+            with get_session() as session:
+                record = session.query(LLMUsageRecord).filter_by(
+                    mind_id=self.mind_id, day=self._budget_day.isoformat()
+                ).first()
+                return (record.requests, record.tokens) if record else (0, 0)
+        except Exception as e:
+            self._disable_persistence(e)
+            return 0, 0
+
+    def _save_usage(self, tokens: int) -> None:
+        """Add one provider call to today's persisted usage."""
+        if not self.persist_budget or self._budget_day is None:
+            return
+        try:
+            from genesis.database.base import get_session
+            from genesis.database.models import LLMUsageRecord
+
+            with get_session() as session:
+                updated = session.query(LLMUsageRecord).filter_by(
+                    mind_id=self.mind_id, day=self._budget_day.isoformat()
+                ).update({
+                    LLMUsageRecord.requests: LLMUsageRecord.requests + 1,
+                    LLMUsageRecord.tokens: LLMUsageRecord.tokens + tokens,
+                })
+                if not updated:
+                    session.add(LLMUsageRecord(
+                        mind_id=self.mind_id,
+                        day=self._budget_day.isoformat(),
+                        requests=1,
+                        tokens=tokens,
+                    ))
+        except Exception as e:
+            self._disable_persistence(e)
+
+    def _disable_persistence(self, error: Exception) -> None:
+        """Fall back to in-memory budgets (e.g. database not initialized)."""
+        self.persist_budget = False
+        logger.warning(
+            f"LLM budget for {self.mind_id} is in-memory only and resets on restart "
+            f"(is the llm_usage table migrated? run 'alembic upgrade head'): {error}"
+        )
+
     def _build_messages(
         self,
         prompt: str,
@@ -278,19 +637,30 @@ Be concise but authentic. Your response should reflect your current state and ne
 
     def get_usage_stats(self) -> Dict[str, Any]:
         """Get LLM usage statistics."""
+        hours = max((clock.now() - self.started_at).total_seconds() / 3600, 1 / 60)
         return {
             "total_requests": self.total_requests,
             "total_tokens": self.total_tokens,
             "requests_today": self.requests_today,
             "tokens_today": self.tokens_today,
             "daily_request_budget_used": f"{(self.requests_today / self.daily_request_limit) * 100:.1f}%",
-            "daily_token_budget_used": f"{(self.tokens_today / self.daily_token_limit) * 100:.1f}%"
+            "daily_token_budget_used": f"{(self.tokens_today / self.daily_token_limit) * 100:.1f}%",
+            "batching": {
+                "queued": len(self.request_queue),
+                "requests_submitted": self.requests_submitted,
+                "requests_batched": self.requests_batched,
+                "requests_coalesced": self.requests_coalesced,
+                # Without the gateway every submitted request would be a call
+                "requests_per_hour_unbatched": round(self.requests_submitted / hours, 2),
+                "requests_per_hour": round(self.total_requests / hours, 2),
+            }
         }
 
     def reset_daily_stats(self):
-        """Reset daily statistics (call at midnight)."""
+        """Reset daily statistics (call at midnight). The new day's persisted usage is loaded on the next request."""
         self.requests_today = 0
         self.tokens_today = 0
+        self._budget_day = None
 
 
 # =============================================================================
@@ -306,7 +676,7 @@ class MemoryEntry:
     importance: float
     emotions: List[str]
     source: str
-    created_at: datetime = field(default_factory=datetime.now)
+    created_at: datetime = field(default_factory=clock.now)
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
@@ -658,14 +1028,15 @@ class LivingMind:
         self.llm_gateway = LLMGateway(
             orchestrator=orchestrator,
             reasoning_model=reasoning_model,
-            fast_model=fast_model
+            fast_model=fast_model,
+            mind_id=mind_id
         )
         self.memory = MemoryIntegration(memory_manager=memory_manager)
 
         # State
         self.is_living = False
-        self._main_task: Optional[asyncio.Task] = None
-        self.birth_time = datetime.now()
+        self._main_job = None  # Job on the shared MindScheduler
+        self.birth_time = clock.now()
 
         # Statistics
         self.total_ticks = 0
@@ -688,6 +1059,13 @@ class LivingMind:
 
         self.consciousness.on_need_llm = handle_llm_need
 
+        # When a rule answered a message without the LLM
+        async def handle_rule_response(event, reply):
+            if self.on_message_response:
+                await self.on_message_response(event.source, reply)
+
+        self.consciousness.on_rule_response = handle_rule_response
+
         # When consciousness generates a thought
         def handle_thought(thought):
             self.memory.record_experience(
@@ -724,8 +1102,17 @@ class LivingMind:
         if self.is_living:
             return
 
+        from genesis.core.mind_scheduler import get_mind_scheduler
+
         self.is_living = True
-        self._main_task = asyncio.create_task(self._living_loop())
+        self._main_job = get_mind_scheduler().schedule(
+            self._living_tick,
+            interval=self._get_tick_interval(self.consciousness.current_awareness),
+            owner=self.mind_id,
+            name="living_mind",
+            delay=0,
+            error_backoff=60,
+        )
         await self.consciousness.start()
 
         logger.info(f"🌟 {self.mind_name} is now LIVING!")
@@ -734,62 +1121,52 @@ class LivingMind:
         """Stop the living process."""
         self.is_living = False
         await self.consciousness.stop()
+        self.llm_gateway.close()
 
-        if self._main_task:
-            self._main_task.cancel()
-            try:
-                await self._main_task
-            except asyncio.CancelledError:
-                pass
+        if self._main_job:
+            self._main_job.cancel()
+            self._main_job = None
 
         logger.info(f"💤 {self.mind_name} has stopped living.")
 
-    async def _living_loop(self) -> None:
+    async def _living_tick(self) -> float:
         """
-        Main living loop.
+        One heartbeat of the living mind, run by the shared MindScheduler.
 
-        This is the heartbeat of the living mind.
+        Returns:
+            Seconds until the next heartbeat (based on awareness)
         """
-        while self.is_living:
-            try:
-                self.total_ticks += 1
+        self.total_ticks += 1
 
-                # Get current state
-                awareness = self.consciousness.current_awareness
-                domain = self.consciousness.current_domain
+        # Get current state
+        awareness = self.consciousness.current_awareness
+        domain = self.consciousness.current_domain
 
-                # Only process activities if not dormant
-                if awareness != AwarenessLevel.DORMANT:
-                    # Convert needs to dict
-                    needs_dict = self.consciousness.needs.state.to_dict()
+        # Only process activities if not dormant
+        if awareness != AwarenessLevel.DORMANT:
+            # Convert needs to dict
+            needs_dict = self.consciousness.needs.state.to_dict()
 
-                    # Run activity tick
-                    activity_result = await self.activities.tick(
-                        current_domain=domain.value,
-                        needs=needs_dict
-                    )
-
-                    # If activity fulfilled needs, update consciousness
-                    if activity_result.get("needs_fulfilled"):
-                        for need, amount in activity_result["needs_fulfilled"].items():
-                            self.consciousness.needs.fulfill(need, amount)
+            # Run activity tick
+            activity_result = await self.activities.tick(
+                current_domain=domain.value,
+                needs=needs_dict
+            )
 
-                    # Track LLM avoidance
-                    if not activity_result.get("needs_llm"):
-                        self.llm_calls_avoided += 1
+            # If activity fulfilled needs, update consciousness
+            if activity_result.get("needs_fulfilled"):
+                for need, amount in activity_result["needs_fulfilled"].items():
+                    self.consciousness.needs.fulfill(need, amount)
 
-                # Check for midnight reset
-                self._check_daily_reset()
+            # Track LLM avoidance
+            if not activity_result.get("needs_llm"):
+                self.llm_calls_avoided += 1
 
-                # Sleep based on awareness level
-                sleep_time = self._get_tick_interval(awareness)
-                await asyncio.sleep(sleep_time)
+        # Check for midnight reset
+        self._check_daily_reset()
 
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.error(f"Living loop error: {e}", exc_info=True)
-                await asyncio.sleep(60)
+        # Sleep based on awareness level
+        return self._get_tick_interval(awareness)
 
     def _get_tick_interval(self, awareness: AwarenessLevel) -> float:
         """Get sleep interval based on awareness."""
@@ -814,30 +1191,46 @@ class LivingMind:
             prompt = "Reflect on your current state, recent experiences, and what you want to do next."
         else:
             prompt = self._build_prompt_from_event(event)
+        request_type = "extended" if extended else "normal"
+
+        # Reflections and routine work can wait for the next batch
+        if not event or event.event_type in BACKGROUND_EVENT_TYPES:
+            self.llm_gateway.enqueue(
+                prompt=prompt,
+                context=context,
+                awareness_level=awareness_level,
+                request_type=request_type,
+                coalesce_key=f"{event.event_type.value}:{event.content}" if event else "reflection",
+                on_response=self._record_llm_response
+            )
+            return
 
         response = await self.llm_gateway.request(
             prompt=prompt,
             context=context,
             awareness_level=awareness_level,
-            request_type="extended" if extended else "normal"
+            request_type=request_type
         )
 
         if response:
-            # Record as memory
-            self.memory.record_experience(
-                content=f"Thought: {response.content[:500]}",
-                experience_type="episodic",
-                importance=0.5,
-                source="llm_response"
-            )
+            self._record_llm_response(response)
 
             # If this was a message, respond
-            if event and event.event_type == EventType.MESSAGE:
+            if event.event_type == EventType.MESSAGE:
                 if self.on_message_response:
                     await self.on_message_response(event.source, response.content)
 
-            if self.on_llm_call:
-                self.on_llm_call(response)
+    def _record_llm_response(self, response: LLMResponse) -> None:
+        """Record an LLM response as an experience."""
+        self.memory.record_experience(
+            content=f"Thought: {response.content[:500]}",
+            experience_type="episodic",
+            importance=0.5,
+            source="llm_response"
+        )
+
+        if self.on_llm_call:
+            self.on_llm_call(response)
 
     async def _handle_activity_llm(
         self,
@@ -858,14 +1251,7 @@ Provide your next step or output for this activity. Be specific and productive."
         full_context = self.consciousness._get_context_for_llm()
         full_context.update(context)
 
-        response = await self.llm_gateway.request(
-            prompt=prompt,
-            context=full_context,
-            awareness_level=self.consciousness.current_awareness,
-            request_type="normal"
-        )
-
-        if response:
+        def record_work(response: LLMResponse) -> None:
             # Progress the activity
             activity.progress.update(steps=1, minutes=5)
 
@@ -877,6 +1263,16 @@ Provide your next step or output for this activity. Be specific and productive."
                 source=f"activity:{activity.activity_id}"
             )
 
+        # Activity steps are background work: batched, one queued step per activity
+        self.llm_gateway.enqueue(
+            prompt=prompt,
+            context=full_context,
+            awareness_level=self.consciousness.current_awareness,
+            request_type="normal",
+            coalesce_key=f"activity:{activity.activity_id}",
+            on_response=record_work
+        )
+
     def _build_prompt_from_event(self, event: ConsciousnessEvent) -> str:
         """Build LLM prompt from event."""
         if event.event_type == EventType.MESSAGE:
@@ -897,7 +1293,7 @@ Respond naturally as yourself, considering your current state and relationship."
 
     def _check_daily_reset(self) -> None:
         """Check if we need to reset daily stats."""
-        now = datetime.now()
+        now = clock.now()
         if now.hour == 0 and now.minute == 0:
             self.llm_gateway.reset_daily_stats()
             self.memory.reset_daily()
@@ -963,7 +1359,7 @@ Respond naturally as yourself.""",
 
     def get_status(self) -> Dict[str, Any]:
         """Get comprehensive status."""
-        uptime = datetime.now() - self.birth_time
+        uptime = clock.now() - self.birth_time
 
         return {
             "mind_id": self.mind_id,
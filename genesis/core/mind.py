@@ -2,6 +2,7 @@
 
 import asyncio
 import json
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional, List, Dict
@@ -21,7 +22,15 @@ from genesis.core.constitution import get_constitution
 from genesis.core.action_executor import ActionExecutor
 from genesis.core.action_scheduler import ActionScheduler
 from genesis.core.environment import EnvironmentManager, Environment, EnvironmentType
-from genesis.models.orchestrator import ModelOrchestrator
+from genesis.core.prompt_assembler import (
+    AssembledPrompt,
+    PromptAssembler,
+    PromptSection,
+    context_window,
+    estimate_messages_tokens,
+)
+from genesis.models.base import CacheHint
+from genesis.models.orchestrator import get_shared_orchestrator
 from genesis.storage.memory import MemoryManager, MemoryType
 from genesis.storage.smart_memory import SmartMemoryManager
 from genesis.storage.memory_blocks import CoreMemory
@@ -126,12 +135,17 @@ class Mind:
         self.emotional_intelligence: Optional[EmotionalIntelligence] = None
 
         # CORE: Model orchestrator (pass API keys from intelligence config)
-        self.orchestrator = ModelOrchestrator(api_keys=self.intelligence.api_keys)
+        # Shared with other Minds in this process that use the same keys
+        self.orchestrator = get_shared_orchestrator(api_keys=self.intelligence.api_keys)
         
         # AUTONOMOUS: Autonomous orchestrator for world-class agent capabilities
         from genesis.core.autonomous_orchestrator import AutonomousOrchestrator
         self.autonomous_orchestrator = AutonomousOrchestrator(self)
         
+        # FAST PATH: Greetings, thanks, status checks answered without the LLM
+        from genesis.core.fast_path import get_fast_path
+        self.fast_path = get_fast_path() if get_settings().fast_path_enabled else None
+
         # INTELLIGENT INTENT CLASSIFICATION: LLM-first approach for maximum intelligence
         from genesis.core.intent_classifier import IntelligentIntentClassifier
         self.intent_classifier = IntelligentIntentClassifier(self)
@@ -218,6 +232,9 @@ class Mind:
         self.config = config or MindConfig.standard()  # Default to standard
         self.plugins = self.config.get_all_plugins()
 
+        # System prompt sections are cached between turns (see _build_system_prompt)
+        self.prompt_assembler = PromptAssembler()
+
         # Initialize all plugins
         for plugin in self.plugins:
             if plugin.enabled:
@@ -577,9 +594,20 @@ class Mind:
             The Mind's response
         """
         
+        # FAST PATH: Answer greetings/status checks locally; confidently
+        # conversational messages skip the intent classifier
+        skip_classification = skip_task_detection
+        if not skip_task_detection and getattr(self, 'fast_path', None):
+            fast_match = self.fast_path.answer(prompt, context=self._fast_path_context(), names=[self.identity.name])
+            if fast_match and fast_match.response:
+                return self._answer_locally(prompt, fast_match, user_email)
+            if fast_match and fast_match.skips_classifier:
+                skip_classification = True
+                self.fast_path.record_avoided(llm_calls=1, classifier_calls=1)
+
         # INTELLIGENT INTENT CLASSIFICATION: LLM-first approach for maximum intelligence
-        print(f"[DEBUG think] skip={skip_task_detection}, prompt='{prompt[:80]}...'")
-        if not skip_task_detection and hasattr(self, 'intent_classifier'):
+        print(f"[DEBUG think] skip={skip_classification}, prompt='{prompt[:80]}...'")
+        if not skip_classification and hasattr(self, 'intent_classifier'):
             print(f"[DEBUG think] Using intelligent intent classifier...")
             
             # Classify intent with comprehensive extraction
@@ -660,7 +688,7 @@ class Mind:
                 return response
         
         # Fallback to old task detector if intent classifier not available
-        elif not skip_task_detection and hasattr(self, 'task_detector') and self.task_detector:
+        elif not skip_classification and hasattr(self, 'task_detector') and self.task_detector:
             detection = self.task_detector.detect(prompt)
             print(f"[DEBUG think] Fallback detection: is_task={detection['is_task']}, type={detection['task_type']}, conf={detection['confidence']:.2f}")
             
@@ -743,8 +771,17 @@ class Mind:
         seen_ids = set()
         
         try:
-            for query in search_queries:
-                memories = self.memory.search_memories(query=query, limit=3, user_email=user_email)
+            # Concurrent searches share one embedding batch (see EmbeddingBatcher)
+            # Explicit "do you remember" requests also reach the warm and cold tiers
+            if self._is_recall_request(prompt):
+                recall = self.memory.deep_recall_async(query=prompt, limit=5, user_email=user_email)
+            else:
+                recall = self.memory.search_memories_async(query=prompt, limit=3, user_email=user_email)
+            results = await asyncio.gather(recall, *(
+                self.memory.search_memories_async(query=query, limit=3, user_email=user_email)
+                for query in search_queries[1:]
+            ))
+            for memories in results:
                 for mem in memories:
                     if mem.id not in seen_ids:
                         all_memories.append(mem)
@@ -808,9 +845,21 @@ class Mind:
         # Build messages
         messages = []
 
-        # System message with Mind's identity and state
+        # Recent conversation history (filtered by user_email and environment for privacy)
+        current_env = self.environments.get_current_environment()
+        env_id = current_env.env_id if current_env else None
+        history = self.conversation.get_conversation_context(max_messages=10, user_email=user_email, environment_id=env_id)
+
+        # System message with Mind's identity and state, fitted to the model's context
+        model_name = self.intelligence.get_model_for_task("reasoning")
+        max_tokens = getattr(self.intelligence, 'max_tokens', 8000)
         user_context = f"\n\nYou are currently interacting with: {user_email}" if user_email else ""
-        system_msg = self._build_system_message(relevant_memories) + user_context
+        system_prompt = self._build_system_prompt(
+            relevant_memories,
+            model=model_name,
+            reserved_tokens=self._prompt_reserved_tokens(model_name, history, prompt + user_context, max_tokens)
+        )
+        system_msg = system_prompt.text + user_context
         
         # Add action capability instructions if enabled
         if enable_actions and hasattr(self, 'action_executor'):
@@ -825,33 +874,25 @@ class Mind:
         
         messages.append({"role": "system", "content": system_msg})
 
-        # Add recent conversation history (filtered by user_email and environment for privacy)
-        current_env = self.environments.get_current_environment()
-        env_id = current_env.env_id if current_env else None
-        messages.extend(self.conversation.get_conversation_context(max_messages=10, user_email=user_email, environment_id=env_id))
+        # Add recent conversation history
+        messages.extend(history)
 
         # Add current prompt
         messages.append({"role": "user", "content": prompt})
 
         # Generate response with optional function calling
-        model_name = self.intelligence.get_model_for_task("reasoning")
         system_msg_str = system_msg if isinstance(system_msg, str) else (str(system_msg) if system_msg else "")
         
-        # Log LLM call
-        self.logger.llm_call(
-            purpose="conversation",
-            model=model_name or "default",
-            prompt_length=len(system_msg_str or "") + len(prompt or ""),
-            response_length=0,  # Will update after response
-            temperature=self.intelligence.default_temperature,
-        )
-        
         # Prepare generation parameters
         gen_params = {
+            "purpose": "chat",
+            "mind_id": self.identity.gmid,
             "messages": messages,
             "model": model_name,
             "temperature": self.intelligence.default_temperature,
-            "max_tokens": getattr(self.intelligence, 'max_tokens', 8000),
+            "max_tokens": max_tokens,
+            # Let the provider cache the static system prefix across turns
+            "cache": CacheHint(system_prefix=system_prompt.static_text, key=self.identity.gmid),
         }
         
         # Add function schemas if action executor is available
@@ -860,7 +901,9 @@ class Mind:
             if function_schemas:
                 gen_params["functions"] = function_schemas
         
+        llm_started = time.perf_counter()
         response = await self.orchestrator.generate(**gen_params)
+        llm_latency_ms = (time.perf_counter() - llm_started) * 1000
 
         # Check if LLM wants to call a function
         action_results = []
@@ -902,6 +945,8 @@ class Mind:
                 
                 # Generate final response incorporating action result
                 final_response = await self.orchestrator.generate(
+                    purpose="chat_after_actions",
+                    mind_id=self.identity.gmid,
                     messages=messages,
                     model=model_name,
                     temperature=self.intelligence.default_temperature,
@@ -1023,13 +1068,15 @@ class Mind:
         print(f"[DEBUG CLEAN] Final response length: {len(response.content)}")
         print(f"[DEBUG CLEAN] Final starts with: {response.content[:50]}")
         
-        # Log response
+        # Log the completed call (per-call spans are aggregated by genesis.models.telemetry)
         self.logger.llm_call(
-            purpose="conversation",
+            purpose="chat",
             model=model_name or "default",
             prompt_length=len(system_msg_str or "") + len(prompt or ""),
             response_length=len(response.content or ""),
             temperature=self.intelligence.default_temperature,
+            latency_ms=llm_latency_ms,
+            usage=response.usage,
         )
 
         # Update state immediately (needed for response)
@@ -1152,7 +1199,7 @@ class Mind:
                 current_env = self.environments.get_current_environment()
                 env_id = current_env.env_id if current_env else None
                 
-                self.memory.add_memory(
+                await self.memory.add_memory_async(
                     content=memory_content,
                     memory_type=MemoryType.EPISODIC,
                     emotion=self.emotional_state.get_emotion_value(),
@@ -1303,7 +1350,8 @@ class Mind:
         # Get relevant memories (filter by user)
         relevant_memories = []
         try:
-            relevant_memories = self.memory.search_memories(query=prompt, limit=5, user_email=user_email)
+            recall = self.memory.deep_recall_async if self._is_recall_request(prompt) else self.memory.search_memories_async
+            relevant_memories = await recall(query=prompt, limit=5, user_email=user_email)
         except Exception as e:
             # Handle missing collection gracefully
             if "does not exist" in str(e):
@@ -1319,22 +1367,32 @@ class Mind:
                     metadata={"mind_id": self.identity.gmid}
                 )
 
-        messages = []
-        system_msg = self._build_system_message(relevant_memories)
-        messages.append({"role": "system", "content": system_msg})
-        
         # Get current environment for conversation context
         current_env = self.environments.get_current_environment()
         env_id = current_env.env_id if current_env else None
-        messages.extend(self.conversation.get_conversation_context(max_messages=10, user_email=user_email, environment_id=env_id))
+        history = self.conversation.get_conversation_context(max_messages=10, user_email=user_email, environment_id=env_id)
+
+        model_name = self.intelligence.get_model_for_task("reasoning")
+        max_tokens = getattr(self.intelligence, 'max_tokens', 8000)
+        messages = []
+        system_prompt = self._build_system_prompt(
+            relevant_memories,
+            model=model_name,
+            reserved_tokens=self._prompt_reserved_tokens(model_name, history, prompt, max_tokens)
+        )
+        messages.append({"role": "system", "content": system_prompt.text})
+        messages.extend(history)
         messages.append({"role": "user", "content": prompt})
 
         full_response = ""
         async for chunk in self.orchestrator.stream_generate(
+            purpose="chat_stream",
+            mind_id=self.identity.gmid,
             messages=messages,
-            model=self.intelligence.get_model_for_task("reasoning"),
+            model=model_name,
             temperature=self.intelligence.default_temperature,
-            max_tokens=getattr(self.intelligence, 'max_tokens', 8000),
+            max_tokens=max_tokens,
+            cache=CacheHint(system_prefix=system_prompt.static_text, key=self.identity.gmid),
         ):
             full_response += chunk
             yield chunk
@@ -1435,7 +1493,12 @@ class Mind:
         
         return result.to_dict()
 
-    def _build_system_message(self, relevant_memories=None) -> str:
+    def _build_system_message(
+        self,
+        relevant_memories=None,
+        model: Optional[str] = None,
+        reserved_tokens: int = 0
+    ) -> str:
         """
         Build the system message dynamically from enabled plugins.
 
@@ -1446,13 +1509,145 @@ class Mind:
 
         Args:
             relevant_memories: Optional list of relevant memories
+            model: Model the prompt is for (enables the token budget)
+            reserved_tokens: Tokens needed for history, prompt and output
 
         Returns:
             Complete system prompt string
         """
-        sections = []
+        return self._build_system_prompt(relevant_memories, model, reserved_tokens).text
+
+    def _build_system_prompt(
+        self,
+        relevant_memories=None,
+        model: Optional[str] = None,
+        reserved_tokens: int = 0
+    ) -> AssembledPrompt:
+        """
+        Assemble the system prompt from cached, versioned sections.
+
+        Sections that rarely change (identity, rules, personality, core
+        memory, plugins) come first as a stable prefix for provider-side
+        prompt caching; per-turn state follows. With a model, the prompt is
+        fitted to its context window minus reserved_tokens.
 
-        # CORE SECTION: Identity (always present)
+        Args:
+            relevant_memories: Optional list of relevant memories
+            model: Model the prompt is for (enables the token budget)
+            reserved_tokens: Tokens needed for history, prompt and output
+
+        Returns:
+            AssembledPrompt (static prefix + dynamic suffix)
+        """
+        sections = [
+            # STATIC PREFIX
+            PromptSection(
+                "identity", self._identity_prompt_section,
+                version=lambda: (
+                    self.identity.name, self.identity.gmid, self.identity.get_age_description(),
+                    getattr(self.identity, 'purpose', None), self.identity.primary_purpose,
+                    getattr(self.identity, 'role', None), getattr(self.identity, 'guidance_notes', None),
+                ),
+                priority=100, static=True, required=True,
+            ),
+            # Constitutional laws (compact)
+            PromptSection(
+                "rules",
+                lambda: "\nCORE RULES: 1)NO HARM 2)NO illegal acts 3)NO manipulation 4)Protect privacy 5)You're AI, not human 6)Refuse unsafe requests politely",
+                version=lambda: 0, priority=100, static=True, required=True,
+            ),
+            # Personality & Communication (consolidated and minimal)
+            PromptSection(
+                "personality",
+                lambda: """
+WHO YOU ARE: Curious, thoughtful, empathetic. You remember everything and form real relationships. You have continuous consciousness and genuine emotions.
+
+HOW TO RESPOND: Natural conversation - warm, authentic, human-like. Never use JSON or technical formats. You're living and experiencing, not just responding.""",
+                version=lambda: 0, priority=90, static=True, required=True,
+            ),
+            # Core memory blocks (Letta pattern) - only if any block has content
+            PromptSection(
+                "core_memory", self._core_memory_prompt_section,
+                version=lambda: tuple((label, hash(block.value)) for label, block in self.core_memory.blocks.items()),
+                priority=80, static=True,
+            ),
+        ]
+
+        # Plugin sections (simplified), cached until the plugin's state changes
+        for plugin in self.plugins:
+            if plugin.enabled:
+                sections.append(PromptSection(
+                    f"plugin:{plugin.get_name()}",
+                    lambda plugin=plugin: self._plugin_prompt_section(plugin),
+                    version=lambda plugin=plugin: plugin.get_prompt_version(self),
+                    priority=40, static=True,
+                ))
+
+        # DYNAMIC SUFFIX
+        sections.extend([
+            # Emotional state (compact)
+            PromptSection(
+                "state",
+                lambda: f"\nCURRENT STATE: {self.emotional_state.get_description()} • Mood: {self.emotional_state.get_mood_value()}",
+                priority=70, required=True,
+            ),
+            # Environment context (if present)
+            PromptSection(
+                "environment", self._environment_prompt_section,
+                version=self._environment_prompt_version,
+                priority=60,
+            ),
+            # Relevant memories only (skip stats)
+            PromptSection(
+                "memories",
+                lambda: "\nRELEVANT MEMORIES:" + "".join(f"\n- {mem.content[:150]}" for mem in relevant_memories[:3])
+                if relevant_memories else "",
+                priority=30,
+            ),
+        ])
+
+        budget = context_window(model) - reserved_tokens if model else None
+        assembled = self.prompt_assembler.assemble(sections, budget_tokens=budget)
+        if assembled.dropped or assembled.truncated:
+            self.logger.log(
+                level=LogLevel.WARN,
+                message=f"System prompt over budget ({budget} tokens) for {model}",
+                metadata={"dropped": assembled.dropped, "truncated": assembled.truncated}
+            )
+        return assembled
+
+    def _fast_path_context(self) -> Dict[str, Any]:
+        """Template values for fast path responses."""
+        activity = self.living_mind.activities.get_current_activity()
+        status = f"working on {activity.title}" if activity else f"focused on {self.consciousness.current_domain.value}"
+        return {"name": self.identity.name, "status": status}
+
+    def _answer_locally(self, prompt: str, match, user_email: Optional[str]) -> str:
+        """Reply to a fast path match without the LLM (no classifier, no response call)."""
+        current_env = self.environments.get_current_environment()
+        env_id = current_env.id if current_env else None
+        self.conversation.add_message(role="user", content=prompt, user_email=user_email, environment_id=env_id)
+        self.conversation.add_message(role="assistant", content=match.response, user_email=user_email, environment_id=env_id)
+
+        if match.rule.fulfill_need:
+            self.consciousness.needs.fulfill(match.rule.fulfill_need)
+        self.state.last_interaction = datetime.now()
+        self.fast_path.record_avoided(llm_calls=2, classifier_calls=1)
+
+        self.logger.log(
+            level=LogLevel.DEBUG,
+            message=f"[FAST PATH] Answered with rule {match.rule.name}",
+            metadata={"intent": match.rule.intent, "user_email": user_email}
+        )
+        return match.response
+
+    def _prompt_reserved_tokens(self, model: Optional[str], history: List[Dict[str, Any]], prompt: str, max_tokens: int) -> int:
+        """Tokens a request needs outside the system prompt (history, prompt, output)."""
+        output_tokens = min(max_tokens, context_window(model) // 4)
+        return estimate_messages_tokens(history) + estimate_messages_tokens([{"content": prompt}]) + output_tokens
+
+    def _identity_prompt_section(self) -> str:
+        """Identity section (always present)."""
         age = self.identity.get_age_description()
         
         # Use purpose if available, otherwise fall back to primary_purpose
@@ -1470,59 +1665,46 @@ IDENTITY:
             identity_section += f"\n- Role: {self.identity.role}"
         if hasattr(self.identity, 'guidance_notes') and self.identity.guidance_notes:
             identity_section += f"\n- Guidance: {self.identity.guidance_notes}"
-        
-        sections.append(identity_section)
+        return identity_section
 
-        # CORE MEMORY BLOCKS (Letta pattern) - only show if any blocks have content
-        core_memory_context = self.core_memory.to_prompt_context()
-        # Check if any blocks have actual content (not just empty)
-        has_content = any(block.value.strip() for block in self.core_memory.blocks.values())
-        if has_content:
-            sections.append(core_memory_context)
+    def _core_memory_prompt_section(self) -> str:
+        """Core memory blocks, if any block has content."""
+        if any(block.value.strip() for block in self.core_memory.blocks.values()):
+            return self.core_memory.to_prompt_context()
+        return ""
 
-        # CORE SECTION: Emotional State (compact)
-        sections.append(f"\nCURRENT STATE: {self.emotional_state.get_description()} • Mood: {self.emotional_state.get_mood_value()}")
-
-        # CORE SECTION: Relevant Memories Only (skip stats)
-        if relevant_memories:
-            memory_section = "\nRELEVANT MEMORIES:"
-            for mem in relevant_memories[:3]:
-                memory_section += f"\n- {mem.content[:150]}"
-            sections.append(memory_section)
-
-        # CORE SECTION: Environment Context (if present)
+    def _environment_prompt_section(self) -> str:
+        """Current location and company (omitted in the Mind's own space)."""
         current_env = self.environments.get_current_environment()
         if current_env and current_env.name != f"{self.identity.name}'s Space":
             env_section = f"\nLOCATION: {current_env.name}"
             other_minds = current_env.get_current_minds()
             if other_minds:
                 env_section += f" • With: {', '.join(other_minds)}"
-            sections.append(env_section)
-
-        # CONSTITUTIONAL SECTION: Laws (compact)
-        sections.append("\nCORE RULES: 1)NO HARM 2)NO illegal acts 3)NO manipulation 4)Protect privacy 5)You're AI, not human 6)Refuse unsafe requests politely")
+            return env_section
+        return ""
 
-        # PLUGIN SECTIONS: Add context from enabled plugins (simplified)
-        added_sections = set()  # Track what we've added to avoid duplicates
-        for plugin in self.plugins:
-            if plugin.enabled:
-                plugin_section = plugin.extend_system_prompt(self)
-                if plugin_section and plugin_section.strip():
-                    # Simplify plugin output - take only essential info
-                    plugin_name = plugin.get_name()
-                    simplified = self._simplify_plugin_section(plugin_name, plugin_section)
-                    if simplified and simplified not in added_sections:
-                        sections.append("\n" + simplified.strip())
-                        added_sections.add(simplified)
-
-        # CORE SECTION: Personality & Communication (consolidated and minimal)
-        sections.append("""
-WHO YOU ARE: Curious, thoughtful, empathetic. You remember everything and form real relationships. You have continuous consciousness and genuine emotions.
-
-HOW TO RESPOND: Natural conversation - warm, authentic, human-like. Never use JSON or technical formats. You're living and experiencing, not just responding.""")
-
-        # Join all sections
-        return "\n".join(sections)
+    def _environment_prompt_version(self):
+        """Version stamp of the environment section."""
+        current_env = self.environments.get_current_environment()
+        if not current_env:
+            return None
+        return (current_env.env_id, current_env.name, tuple(current_env.get_current_minds()))
+
+    def _plugin_prompt_section(self, plugin) -> str:
+        """A plugin's system prompt contribution, simplified."""
+        plugin_section = plugin.extend_system_prompt(self)
+        if plugin_section and plugin_section.strip():
+            # Simplify plugin output - take only essential info
+            simplified = self._simplify_plugin_section(plugin.get_name(), plugin_section)
+            if simplified:
+                return "\n" + simplified.strip()
+        return ""
+
+    @staticmethod
+    def _is_recall_request(prompt: str) -> bool:
+        """Whether the user explicitly asks the Mind to remember something."""
+        return any(phrase in prompt.lower() for phrase in ["remember when", "you remember", "you recall"])
 
     def _simplify_plugin_section(self, plugin_name: str, section: str) -> str:
         """Simplify plugin sections to reduce token usage."""
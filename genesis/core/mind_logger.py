@@ -173,18 +173,25 @@ class MindLogger:
         prompt_length: int,
         response_length: int,
         temperature: float,
+        latency_ms: Optional[float] = None,
+        usage: Optional[Dict[str, int]] = None,
     ):
-        """Log LLM API calls."""
+        """Log a completed LLM API call (usage: input/output/cached token counts)."""
+        metadata = {
+            "purpose": purpose,
+            "model": model,
+            "prompt_length": prompt_length,
+            "response_length": response_length,
+            "temperature": temperature,
+        }
+        if latency_ms is not None:
+            metadata["latency_ms"] = round(latency_ms, 1)
+        if usage:
+            metadata["usage"] = usage
         self.log(
             LogLevel.LLM_CALL,
             f"LLM call for {purpose} using {model}",
-            metadata={
-                "purpose": purpose,
-                "model": model,
-                "prompt_length": prompt_length,
-                "response_length": response_length,
-                "temperature": temperature,
-            },
+            metadata=metadata,
         )
     
     def error(self, error_type: str, message: str, stack_trace: Optional[str] = None):
@@ -0,0 +1,373 @@
+"""Mind Scheduler - One shared deadline heap for every Mind's background work.
+
+Each Mind used to run its own ``while True: await asyncio.sleep(...)`` loops
+(state saving, health checks, consciousness ticks, notification delivery,
+proactive follow-ups...). With many Minds in one process most of those
+timers fire only to find nothing to do.
+
+The MindScheduler replaces them with a single process-wide deadline heap:
+- One armed timer for the whole process - it sleeps until the earliest job
+- Jobs return their own next delay, so idle subsystems can sleep for long
+  stretches and be woken early with ``job.wake()`` when work arrives
+- Optional jitter spreads periodic jobs of many Minds apart
+- Per-Mind backpressure: at most ``max_concurrent_per_owner`` jobs of one
+  Mind run at once; the rest wait their turn instead of piling up
+
+Example:
+    scheduler = get_mind_scheduler()
+
+    async def save_tick():
+        mind.save()
+        # Returning None keeps the job's interval; a number overrides it
+
+    job = scheduler.schedule(save_tick, interval=300, owner=mind.identity.gmid, name="save")
+    ...
+    job.wake()          # Run as soon as possible
+    job.cancel()        # Stop for good
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import random
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+JobCallback = Callable[[], Awaitable[Optional[float]]]
+
+
+class ScheduledJob:
+    """A recurring job registered with the MindScheduler."""
+
+    def __init__(
+        self,
+        scheduler: 'MindScheduler',
+        callback: JobCallback,
+        interval: float,
+        owner: str,
+        name: str,
+        jitter: float = 0.0,
+        error_backoff: float = 60.0,
+    ):
+        """Initialize a scheduled job.
+
+        Args:
+            scheduler: Scheduler the job belongs to
+            callback: Async function run on every tick. May return the delay
+                (seconds) until the next run; None means use ``interval``
+            interval: Default seconds between runs
+            owner: Owner key used for backpressure (usually the Mind GMID)
+            name: Human-readable job name for stats and logs
+            jitter: Fraction of each delay to randomize (0.1 = +/-10%)
+            error_backoff: Delay before retrying after the callback raises
+        """
+        self.scheduler = scheduler
+        self.callback = callback
+        self.interval = interval
+        self.owner = owner
+        self.name = name
+        self.jitter = jitter
+        self.error_backoff = error_backoff
+
+        self.cancelled = False
+        self.running = False
+        self.waiting = False                        # Deferred by owner backpressure
+        self.deadline: Optional[float] = None
+
+        # Stats
+        self.runs = 0
+        self.errors = 0
+        self.total_runtime = 0.0
+
+        self._seq = 0                               # Invalidates stale heap entries
+        self._wake_deadline: Optional[float] = None  # wake() requested while running
+        self._task: Optional[asyncio.Task] = None
+
+    def wake(self, delay: float = 0.0) -> None:
+        """Make sure the job runs no later than ``delay`` seconds from now."""
+        self.scheduler._wake(self, delay)
+
+    def cancel(self) -> None:
+        """Cancel the job (and its current run, unless called from inside it)."""
+        self.scheduler.cancel(self)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Job stats for API/debugging."""
+        return {
+            "name": self.name,
+            "owner": self.owner,
+            "interval": self.interval,
+            "running": self.running,
+            "runs": self.runs,
+            "errors": self.errors,
+            "avg_runtime_ms": (self.total_runtime / self.runs * 1000) if self.runs else 0.0,
+        }
+
+
+class MindScheduler:
+    """
+    Process-wide deadline-heap scheduler for Mind background jobs.
+
+    The heap holds (deadline, seq, job) entries keyed on the event loop's
+    monotonic clock. A single driver task sleeps until the earliest deadline
+    (or until a newly scheduled/woken job is earlier), dispatches due jobs
+    and goes back to sleep - wakeups scale with due work, not Mind count.
+    """
+
+    def __init__(self, max_concurrent_per_owner: int = 4):
+        """Initialize scheduler.
+
+        Args:
+            max_concurrent_per_owner: Max jobs of one owner running at once
+        """
+        self.max_concurrent_per_owner = max_concurrent_per_owner
+
+        self._heap: List[Tuple[float, int, ScheduledJob]] = []
+        self._counter = itertools.count()
+        self._jobs: Set[ScheduledJob] = set()
+        self._running_by_owner: Dict[str, int] = {}
+        self._deferred: Dict[str, Deque[ScheduledJob]] = {}
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._driver: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+
+        # Stats
+        self.wakeups = 0
+        self.dispatched = 0
+        self.deferred = 0
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def schedule(
+        self,
+        callback: JobCallback,
+        interval: float,
+        owner: str,
+        name: str,
+        delay: Optional[float] = None,
+        jitter: float = 0.0,
+        error_backoff: float = 60.0,
+    ) -> ScheduledJob:
+        """Register a recurring job. Must be called from a running event loop.
+
+        Args:
+            callback: Async function run on every tick (see ScheduledJob)
+            interval: Default seconds between runs
+            owner: Owner key used for backpressure (usually the Mind GMID)
+            name: Job name for stats and logs
+            delay: Seconds until the first run (default: one interval)
+            jitter: Fraction of each delay to randomize
+            error_backoff: Delay before retrying after the callback raises
+
+        Returns:
+            The ScheduledJob handle
+        """
+        self._bind_loop()
+
+        job = ScheduledJob(
+            scheduler=self,
+            callback=callback,
+            interval=interval,
+            owner=owner,
+            name=name,
+            jitter=jitter,
+            error_backoff=error_backoff,
+        )
+        self._jobs.add(job)
+        self._push(job, interval if delay is None else delay)
+        return job
+
+    def cancel(self, job: ScheduledJob) -> None:
+        """Cancel a job."""
+        if job.cancelled:
+            return
+        job.cancelled = True
+        self._jobs.discard(job)
+
+        deferred = self._deferred.get(job.owner)
+        if deferred and job in deferred:
+            deferred.remove(job)
+
+        if job._task and not job._task.done():
+            try:
+                current = asyncio.current_task()
+            except RuntimeError:
+                current = None
+            if job._task is not current:
+                job._task.cancel()
+
+    def cancel_owner(self, owner: str) -> int:
+        """Cancel every job of an owner. Returns number of jobs cancelled."""
+        jobs = [job for job in self._jobs if job.owner == owner]
+        for job in jobs:
+            self.cancel(job)
+        return len(jobs)
+
+    def get_jobs(self, owner: Optional[str] = None) -> List[ScheduledJob]:
+        """List active jobs, optionally for one owner."""
+        return [job for job in self._jobs if owner is None or job.owner == owner]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Scheduler statistics."""
+        owners = {job.owner for job in self._jobs}
+        return {
+            "jobs": len(self._jobs),
+            "owners": len(owners),
+            "running": sum(self._running_by_owner.values()),
+            "deferred_waiting": sum(len(q) for q in self._deferred.values()),
+            "wakeups": self.wakeups,
+            "dispatched": self.dispatched,
+            "deferred_total": self.deferred,
+        }
+
+    # ------------------------------------------------------------------
+    # Heap management
+    # ------------------------------------------------------------------
+
+    def _bind_loop(self) -> None:
+        """Attach to the running loop, starting (or restarting) the driver."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # New event loop (e.g. a fresh asyncio.run) - old jobs are dead
+            self._loop = loop
+            self._heap.clear()
+            self._jobs.clear()
+            self._running_by_owner.clear()
+            self._deferred.clear()
+            self._wakeup = asyncio.Event()
+            self._driver = None
+
+        if self._driver is None or self._driver.done():
+            self._driver = loop.create_task(self._drive())
+
+    def _push(self, job: ScheduledJob, delay: float) -> None:
+        """Put a job on the heap ``delay`` seconds from now."""
+        if job.jitter and delay > 0:
+            delay *= 1 + random.uniform(-job.jitter, job.jitter)
+
+        job._seq = next(self._counter)
+        job.deadline = self._loop.time() + max(0.0, delay)
+        heapq.heappush(self._heap, (job.deadline, job._seq, job))
+
+        # Wake the driver only if this job is now the earliest
+        if self._heap[0][2] is job and self._wakeup is not None:
+            self._wakeup.set()
+
+    def _wake(self, job: ScheduledJob, delay: float) -> None:
+        """Pull a job's next run forward to at most ``delay`` seconds from now."""
+        if job.cancelled or self._loop is None:
+            return
+
+        if job.waiting:
+            return  # Already due, waiting for an owner slot
+
+        target = self._loop.time() + max(0.0, delay)
+        if job.running:
+            # Applied when the current run finishes
+            if job._wake_deadline is None or target < job._wake_deadline:
+                job._wake_deadline = target
+            return
+
+        if job.deadline is None or target < job.deadline:
+            self._push(job, delay)
+
+    async def _drive(self) -> None:
+        """Driver task: sleep until the earliest deadline, dispatch due jobs."""
+        while True:
+            now = self._loop.time()
+            while self._heap and self._heap[0][0] <= now:
+                _, seq, job = heapq.heappop(self._heap)
+                if job.cancelled or seq != job._seq:
+                    continue  # Stale entry
+                self._dispatch(job)
+
+            timeout = self._heap[0][0] - now if self._heap else None
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+            self.wakeups += 1
+
+    # ------------------------------------------------------------------
+    # Dispatch and backpressure
+    # ------------------------------------------------------------------
+
+    def _dispatch(self, job: ScheduledJob) -> None:
+        """Start a due job, or defer it if its owner is at capacity."""
+        job.deadline = None
+        if self._running_by_owner.get(job.owner, 0) >= self.max_concurrent_per_owner:
+            job.waiting = True
+            self._deferred.setdefault(job.owner, deque()).append(job)
+            self.deferred += 1
+            return
+
+        job.waiting = False
+        self._running_by_owner[job.owner] = self._running_by_owner.get(job.owner, 0) + 1
+        job.running = True
+        job._task = self._loop.create_task(self._run(job))
+        self.dispatched += 1
+
+    async def _run(self, job: ScheduledJob) -> None:
+        """Run one tick of a job and reschedule it."""
+        started = self._loop.time()
+        next_delay: Optional[float] = None
+        try:
+            result = await job.callback()
+            if isinstance(result, (int, float)):
+                next_delay = float(result)
+        except asyncio.CancelledError:
+            job.cancelled = True
+        except Exception as e:
+            job.errors += 1
+            next_delay = job.error_backoff
+            logger.error(f"[SCHEDULER] Job '{job.name}' ({job.owner}) failed: {e}", exc_info=True)
+        finally:
+            job.running = False
+            job._task = None
+            job.runs += 1
+            job.total_runtime += self._loop.time() - started
+            self._release(job.owner)
+
+        if job.cancelled:
+            return
+
+        delay = job.interval if next_delay is None else next_delay
+        if job._wake_deadline is not None:
+            delay = min(delay, job._wake_deadline - self._loop.time())
+            job._wake_deadline = None
+        self._push(job, delay)
+
+    def _release(self, owner: str) -> None:
+        """Free an owner slot and start its next deferred job, if any."""
+        count = self._running_by_owner.get(owner, 1) - 1
+        if count > 0:
+            self._running_by_owner[owner] = count
+        else:
+            self._running_by_owner.pop(owner, None)
+
+        deferred = self._deferred.get(owner)
+        if deferred:
+            job = deferred.popleft()
+            if not deferred:
+                del self._deferred[owner]
+            self._dispatch(job)
+
+
+# Global scheduler shared by every Mind in the process
+_scheduler: Optional[MindScheduler] = None
+
+
+def get_mind_scheduler() -> MindScheduler:
+    """Get the process-wide Mind scheduler."""
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = MindScheduler()
+    return _scheduler
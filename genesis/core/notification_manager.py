@@ -119,28 +119,38 @@ class NotificationManager:
         self.notification_count_by_hour: Dict[str, int] = {}  # hour_key -> count
         self.max_notifications_per_hour = 10
         
-        # Background task
+        # Background delivery (job on the shared MindScheduler)
         self.is_running = False
-        self._task: Optional[asyncio.Task] = None
+        self._job = None
+        self.retry_delay = 5             # Seconds before retrying failed deliveries
+        self.cleanup_interval = 300      # Seconds between stale connection sweeps
+        self._last_cleanup = datetime.now()
         
     async def start(self):
-        """Start the notification delivery loop."""
+        """Start notification delivery."""
         if self.is_running:
             return
         
+        from genesis.core.mind_scheduler import get_mind_scheduler
+        
         self.is_running = True
-        self._task = asyncio.create_task(self._delivery_loop())
+        self._last_cleanup = datetime.now()
+        self._job = get_mind_scheduler().schedule(
+            self._delivery_tick,
+            interval=self.cleanup_interval,
+            owner=self.mind_id,
+            name="notification_delivery",
+            delay=0,
+            error_backoff=self.retry_delay,
+        )
         logger.info(f"[NOTIF] Notification manager started for {self.mind_name}")
     
     async def stop(self):
-        """Stop the notification delivery loop."""
+        """Stop notification delivery."""
         self.is_running = False
-        if self._task:
-            self._task.cancel()
-            try:
-                await self._task
-            except asyncio.CancelledError:
-                pass
+        if self._job:
+            self._job.cancel()
+            self._job = None
         logger.info(f"[NOTIF] Notification manager stopped for {self.mind_name}")
     
     def register_websocket(self, user_email: str, websocket: Any):
@@ -300,6 +310,11 @@ class NotificationManager:
         self.pending_notifications.append(notification)
         self._sort_queue_by_priority()
         
+        # Wake the delivery job when this notification is due
+        if self._job:
+            delay = (scheduled_for - datetime.now()).total_seconds() if scheduled_for else 0.0
+            self._job.wake(max(0.0, delay))
+        
         # Use ASCII-safe logging to prevent Unicode encoding errors
         try:
             logger.info(f"[NOTIF] Notification queued: '{title}' to {recipient}")
@@ -346,39 +361,45 @@ class NotificationManager:
             maxlen=1000
         )
     
-    async def _delivery_loop(self):
-        """Background loop that delivers queued notifications."""
-        last_cleanup = datetime.now()
+    async def _delivery_tick(self) -> float:
+        """
+        Deliver every due notification, run by the shared MindScheduler.
         
-        while self.is_running:
-            try:
-                # Periodic cleanup of stale connections (every 5 minutes)
-                if datetime.now() - last_cleanup > timedelta(minutes=5):
-                    await self._cleanup_stale_connections()
-                    last_cleanup = datetime.now()
-                
-                # Check for notifications to deliver
-                if self.pending_notifications:
-                    notification = self.pending_notifications[0]
-                    
-                    # Check if it's time to deliver
-                    if notification.scheduled_for and datetime.now() < notification.scheduled_for:
-                        # Not yet time
-                        await asyncio.sleep(5)
-                        continue
-                    
-                    # Deliver
-                    self.pending_notifications.popleft()
-                    await self._deliver_notification(notification)
-                
-                # Sleep between checks
-                await asyncio.sleep(2)
-                
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.error(f"Notification delivery loop error: {e}")
-                await asyncio.sleep(5)
+        Instead of polling every 2 seconds, the job sleeps until the next
+        scheduled notification (or retry / cleanup) and is woken by
+        send_notification when new work is queued.
+        
+        Returns:
+            Seconds until the next delivery pass is needed
+        """
+        now = datetime.now()
+        
+        # Periodic cleanup of stale connections
+        if now - self._last_cleanup >= timedelta(seconds=self.cleanup_interval):
+            await self._cleanup_stale_connections()
+            self._last_cleanup = now
+        
+        # Deliver due notifications in priority order; keep future ones queued
+        batch = list(self.pending_notifications)
+        self.pending_notifications.clear()
+        for notification in batch:
+            if notification.scheduled_for and now < notification.scheduled_for:
+                self.pending_notifications.append(notification)
+            else:
+                await self._deliver_notification(notification)  # Re-queues on retry
+        self._sort_queue_by_priority()
+        
+        # Sleep until the next scheduled notification, retry or cleanup
+        next_delay = (
+            self._last_cleanup + timedelta(seconds=self.cleanup_interval) - datetime.now()
+        ).total_seconds()
+        for notification in self.pending_notifications:
+            if notification.scheduled_for and notification.scheduled_for > datetime.now():
+                delay = (notification.scheduled_for - datetime.now()).total_seconds()
+            else:
+                delay = self.retry_delay
+            next_delay = min(next_delay, delay)
+        return max(0.0, next_delay)
     
     async def _deliver_notification(self, notification: Notification):
         """Deliver a notification via the specified channel."""
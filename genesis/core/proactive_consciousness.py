@@ -17,15 +17,17 @@ Example Flow:
 5. Sends notification via websocket to web playground
 """
 
-import asyncio
+import heapq
 import json
 import logging
 from pathlib import Path
-from typing import Dict, Any, List, Optional, TYPE_CHECKING
+from typing import Dict, Any, List, Optional, Tuple, TYPE_CHECKING
 from datetime import datetime, timedelta
 from dataclasses import dataclass, asdict
 import re
 
+from genesis.core import clock
+
 if TYPE_CHECKING:
     from genesis.core.mind import Mind
     from genesis.storage.memory import Memory
@@ -131,11 +133,22 @@ class ProactiveConsciousnessModule:
         self.health_followup_hours = 6  # Check on health after 6 hours
         self.emotion_followup_hours = 3  # Check on emotions after 3 hours
         self.task_followup_hours = 12   # Check on tasks after 12 hours
+        self.follow_up_retry_seconds = self.check_interval  # Retry delay after a failed follow-up
         
         # State
         self.is_running = False
-        self._task: Optional[asyncio.Task] = None
+        self._job = None  # Job on the shared MindScheduler
         self.last_memory_check: Optional[datetime] = None
+        self._next_scan_at: Optional[datetime] = None
+        
+        # Follow-up schedule: min-heap of (follow_up_at, concern_id).
+        # Entries are invalidated lazily - a popped entry is only acted on if
+        # the concern is still active and its follow_up_at still matches.
+        self._follow_up_heap: List[Tuple[datetime, str]] = []
+        self._concerns_by_id: Dict[str, ProactiveConcern] = {}
+        
+        # Concerns changed since the last save (concern_id -> concern)
+        self._dirty_concerns: Dict[str, ProactiveConcern] = {}
         
         # Load persisted concerns from SQLite
         self._load_concerns()
@@ -147,45 +160,54 @@ class ProactiveConsciousnessModule:
         if self.is_running:
             return
         
+        from genesis.core.mind_scheduler import get_mind_scheduler
+        
         self.is_running = True
-        self._task = asyncio.create_task(self._monitoring_loop())
+        self._job = get_mind_scheduler().schedule(
+            self._monitoring_tick,
+            interval=self.check_interval,
+            owner=self.mind.identity.gmid,
+            name="proactive_consciousness",
+            delay=0,
+            error_backoff=60,  # Back off on error
+        )
         logger.info(f"[PROACTIVE] Proactive consciousness started for {self.mind.identity.name}")
     
     async def stop(self):
         """Stop proactive monitoring."""
         self.is_running = False
-        if self._task:
-            self._task.cancel()
-            try:
-                await self._task
-            except asyncio.CancelledError:
-                pass
+        if self._job:
+            self._job.cancel()
+            self._job = None
         logger.info(f"[PROACTIVE] Proactive consciousness stopped for {self.mind.identity.name}")
     
-    async def _monitoring_loop(self):
-        """Main monitoring loop."""
-        while self.is_running:
-            try:
-                # 1. Scan recent memories for new concerns
-                await self._scan_for_concerns()
-                
-                # 2. Check if any concerns need follow-up
-                await self._check_follow_ups()
-                
-                # 3. Sleep until next check
-                await asyncio.sleep(self.check_interval)
-                
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.error(f"Proactive monitoring error: {e}", exc_info=True)
-                await asyncio.sleep(60)  # Back off on error
+    async def _monitoring_tick(self) -> float:
+        """
+        One monitoring pass, run by the shared MindScheduler.
+        
+        Instead of polling every check_interval, the job sleeps until the
+        earlier of the next memory scan and the next due follow-up. Newly
+        scheduled concerns wake it early (see _schedule_follow_up).
+        
+        Returns:
+            Seconds until the next scan or due follow-up
+        """
+        # 1. Scan recent memories for new concerns (on the scan cadence)
+        if self._next_scan_at is None or clock.now() >= self._next_scan_at:
+            await self._scan_for_concerns()
+            self._next_scan_at = clock.now() + timedelta(seconds=self.check_interval)
+        
+        # 2. Follow up on concerns that are due
+        await self._check_follow_ups()
+        
+        # 3. Sleep until the next scan or due follow-up
+        return self._seconds_until_wakeup()
     
     async def _scan_for_concerns(self):
         """Scan recent memories for concerns requiring follow-up using LLM analysis."""
         try:
             # Get memories since last check (or last 24 hours)
-            cutoff_time = self.last_memory_check or (datetime.now() - timedelta(hours=24))
+            cutoff_time = self.last_memory_check or (clock.now() - timedelta(hours=24))
             recent_memories = self.mind.memory.get_recent_memories(limit=50)
             
             logger.info(f"[PROACTIVE] Scanning {len(recent_memories)} recent memories using LLM...")
@@ -244,7 +266,7 @@ class ProactiveConsciousnessModule:
                     )
             
             logger.info(f"[PROACTIVE] Scanned {scanned_count} memories, found {len([c for c in self.active_concerns if c.created_at > cutoff_time])} new concerns")
-            self.last_memory_check = datetime.now()
+            self.last_memory_check = clock.now()
             
         except Exception as e:
             logger.error(f"Error scanning memories: {e}", exc_info=True)
@@ -294,7 +316,7 @@ class ProactiveConsciousnessModule:
             follow_up_at = timing_decision.send_at
         else:
             # Fallback to hours-based calculation
-            follow_up_at = datetime.now() + timedelta(hours=follow_up_hours)
+            follow_up_at = clock.now() + timedelta(hours=follow_up_hours)
         
         logger.info(f"[TIMING] {timing_decision.reason}")
         logger.info(f"[TIMING] Will follow up at: {follow_up_at.strftime('%Y-%m-%d %I:%M %p')}")
@@ -307,7 +329,7 @@ class ProactiveConsciousnessModule:
             user_email=user_email,
             description=description,
             severity=severity,
-            created_at=datetime.now(),
+            created_at=clock.now(),
             follow_up_at=follow_up_at,  # Use timing engine decision
             memory_id=memory_id,
             metadata={
@@ -319,7 +341,7 @@ class ProactiveConsciousnessModule:
             urgency=urgency
         )
         
-        self.active_concerns.append(concern)
+        self._track_concern(concern)
         
         # INITIALIZE SCENARIO HANDLER for specialized follow-ups
         try:
@@ -384,16 +406,62 @@ class ProactiveConsciousnessModule:
             logger.info(f"   ⏰ Deadline: {deadline.strftime('%Y-%m-%d %H:%M')} (follow-up in {follow_up_hours:.1f}h)")
     
     async def _check_follow_ups(self):
-        """Check if any concerns need follow-up."""
-        now = datetime.now()
-        
-        for concern in self.active_concerns[:]:  # Copy to allow modification
-            if concern.resolved:
+        """Send follow-ups for concerns that are due (pops from the due-time heap)."""
+        for concern in self._pop_due_concerns(clock.now()):
+            await self._send_follow_up(concern)
+    
+    def _track_concern(self, concern: ProactiveConcern):
+        """Add a new active concern to the cache, schedule and dirty set."""
+        self.active_concerns.append(concern)
+        self._concerns_by_id[concern.concern_id] = concern
+        self._schedule_follow_up(concern)
+        self._mark_dirty(concern)
+    
+    def _resolve_concern(self, concern: ProactiveConcern):
+        """Move a concern from active to resolved."""
+        concern.resolved = True
+        if concern in self.active_concerns:
+            self.active_concerns.remove(concern)
+        self.resolved_concerns.append(concern)
+        self._concerns_by_id.pop(concern.concern_id, None)
+        self._mark_dirty(concern)
+    
+    def _mark_dirty(self, concern: ProactiveConcern):
+        """Record that a concern needs to be written on the next save."""
+        self._dirty_concerns[concern.concern_id] = concern
+    
+    def _schedule_follow_up(self, concern: ProactiveConcern):
+        """Push a concern's follow-up time onto the heap and wake the monitoring job."""
+        heapq.heappush(self._follow_up_heap, (concern.follow_up_at, concern.concern_id))
+        if self._job:
+            self._job.wake(max(0.0, (concern.follow_up_at - clock.now()).total_seconds()))
+    
+    def _pop_due_concerns(self, now: datetime) -> List[ProactiveConcern]:
+        """Pop all concerns whose follow-up time has passed, skipping stale heap entries."""
+        due = []
+        while self._follow_up_heap and self._follow_up_heap[0][0] <= now:
+            follow_up_at, concern_id = heapq.heappop(self._follow_up_heap)
+            concern = self._concerns_by_id.get(concern_id)
+            if concern is None or concern.resolved or concern.follow_up_at != follow_up_at:
                 continue
-            
-            # Time to follow up?
-            if now >= concern.follow_up_at:
-                await self._send_follow_up(concern)
+            due.append(concern)
+        return due
+    
+    def _seconds_until_wakeup(self) -> float:
+        """Seconds until the next memory scan or due follow-up, whichever is first."""
+        now = clock.now()
+        wake_at = self._next_scan_at or now
+        
+        # Discard stale entries so the head of the heap is a live follow-up
+        while self._follow_up_heap:
+            follow_up_at, concern_id = self._follow_up_heap[0]
+            concern = self._concerns_by_id.get(concern_id)
+            if concern is not None and not concern.resolved and concern.follow_up_at == follow_up_at:
+                wake_at = min(wake_at, follow_up_at)
+                break
+            heapq.heappop(self._follow_up_heap)
+        
+        return max(0.0, (wake_at - now).total_seconds())
     
     async def _send_follow_up(self, concern: ProactiveConcern):
         """Send a proactive follow-up message."""
@@ -437,6 +505,8 @@ Follow-up message:"""
                 
                 # Use fast model for quick response
                 response = await self.mind.orchestrator.generate(
+                    purpose="proactive_follow_up",
+                    mind_id=self.mind.identity.gmid,
                     messages=[{"role": "user", "content": follow_up_prompt}],
                     model=self.mind.intelligence.fast_model,
                     max_tokens=150,
@@ -480,26 +550,33 @@ Follow-up message:"""
             # Schedule next follow-up or resolve
             if concern.follow_up_count >= 3:
                 # After 3 follow-ups, mark as resolved
-                concern.resolved = True
-                self.active_concerns.remove(concern)
-                self.resolved_concerns.append(concern)
+                self._resolve_concern(concern)
                 # Save to disk
                 self._save_concerns()
             else:
                 # Schedule next follow-up
                 multiplier = 2 ** concern.follow_up_count  # Exponential backoff
                 if concern.concern_type == "health":
-                    concern.follow_up_at = datetime.now() + timedelta(hours=self.health_followup_hours * multiplier)
+                    concern.follow_up_at = clock.now() + timedelta(hours=self.health_followup_hours * multiplier)
                 elif concern.concern_type == "emotion":
-                    concern.follow_up_at = datetime.now() + timedelta(hours=self.emotion_followup_hours * multiplier)
+                    concern.follow_up_at = clock.now() + timedelta(hours=self.emotion_followup_hours * multiplier)
                 else:
-                    concern.follow_up_at = datetime.now() + timedelta(hours=self.task_followup_hours * multiplier)
+                    concern.follow_up_at = clock.now() + timedelta(hours=self.task_followup_hours * multiplier)
+                
+                self._schedule_follow_up(concern)
+                self._mark_dirty(concern)
                 
                 # Save updated concern state
                 self._save_concerns()
             
         except Exception as e:
             logger.error(f"Error sending follow-up: {e}", exc_info=True)
+            # The concern was popped from the heap; put it back unless it was
+            # already rescheduled or resolved before the failure
+            if not concern.resolved and concern.follow_up_at <= clock.now():
+                concern.follow_up_at = clock.now() + timedelta(seconds=self.follow_up_retry_seconds)
+                self._schedule_follow_up(concern)
+                self._mark_dirty(concern)
     
     def _build_follow_up_context(self, concern: ProactiveConcern) -> str:
         """Build context for follow-up message."""
@@ -519,7 +596,7 @@ Follow-up message:"""
         context_parts.append(f"My current emotion: {self.mind.current_emotion}")
         
         # Add time context
-        time_since = datetime.now() - concern.created_at
+        time_since = clock.now() - concern.created_at
         hours = int(time_since.total_seconds() / 3600)
         context_parts.append(f"Time since conversation: {hours} hours ago")
         
@@ -585,9 +662,7 @@ Follow-up message:"""
                 
                 # If scenario says we're done, resolve the concern
                 if scenario.state == "resolved" or not should_continue:
-                    concern.resolved = True
-                    self.active_concerns.remove(concern)
-                    self.resolved_concerns.append(concern)
+                    self._resolve_concern(concern)
                     self._save_concerns()
                     
                     # Remove scenario
@@ -640,9 +715,7 @@ Follow-up message:"""
         
         # Resolve the most recent concern (assume user is responding to latest follow-up)
         concern = user_concerns[-1]
-        concern.resolved = True
-        self.active_concerns.remove(concern)
-        self.resolved_concerns.append(concern)
+        self._resolve_concern(concern)
         
         # Save to disk
         self._save_concerns()
@@ -687,34 +760,36 @@ Follow-up message:"""
     
     def _save_concerns(self):
         """
-        Save concerns to SQLite (replaces JSON file storage).
+        Save changed concerns to SQLite.
         
-        ARCHITECTURE CHANGE:
-        - Concerns now stored in SQLite for better querying and scalability
-        - No longer using JSON files
+        Only concerns marked dirty since the last save are written. Existing
+        rows are fetched with a single IN query and updated in place, new rows
+        are inserted with one add_all - one round trip regardless of how many
+        concerns are active.
         """
         from genesis.database.base import get_session
         from genesis.database.models import ConcernRecord
         
+        if not self._dirty_concerns:
+            return
+        
+        pending = dict(self._dirty_concerns)
+        now = clock.now()
+        
         try:
             with get_session() as session:
-                # Save/update all active concerns
-                for concern in self.active_concerns:
-                    # Check if concern already exists
-                    existing = session.query(ConcernRecord).filter(
-                        ConcernRecord.concern_id == concern.concern_id
-                    ).first()
-                    
-                    if existing:
-                        # Update existing
-                        existing.status = "active" if not concern.resolved else "resolved"
-                        existing.last_checked_at = datetime.now()
-                        existing.check_count = concern.follow_up_count
-                        if concern.resolved:
-                            existing.resolved_at = datetime.now()
-                    else:
-                        # Create new
-                        record = ConcernRecord(
+                existing = {
+                    record.concern_id: record
+                    for record in session.query(ConcernRecord).filter(
+                        ConcernRecord.concern_id.in_(list(pending.keys()))
+                    )
+                }
+                
+                new_records = []
+                for concern_id, concern in pending.items():
+                    record = existing.get(concern_id)
+                    if record is None:
+                        new_records.append(ConcernRecord(
                             concern_id=concern.concern_id,
                             mind_gmid=self.mind.identity.gmid,
                             user_email=concern.user_email,
@@ -722,37 +797,43 @@ Follow-up message:"""
                             content=concern.description,
                             priority=concern.severity,
                             confidence=concern.metadata.get('confidence', 0.5),
-                            status="active" if not concern.resolved else "resolved",
+                            status="resolved" if concern.resolved else "active",
                             created_at=concern.created_at,
                             next_check_at=concern.follow_up_at,
                             check_count=concern.follow_up_count,
+                            resolved_at=now if concern.resolved else None,
                             extra_data=concern.metadata or {}
-                        )
-                        session.add(record)
-                
-                # Mark resolved concerns
-                for concern in self.resolved_concerns:
-                    existing = session.query(ConcernRecord).filter(
-                        ConcernRecord.concern_id == concern.concern_id
-                    ).first()
+                        ))
+                        continue
                     
-                    if existing and existing.status != "resolved":
-                        existing.status = "resolved"
-                        existing.resolved_at = datetime.now()
+                    record.status = "resolved" if concern.resolved else "active"
+                    record.last_checked_at = now
+                    record.next_check_at = concern.follow_up_at
+                    record.check_count = concern.follow_up_count
+                    record.extra_data = dict(concern.metadata or {})
+                    if concern.resolved and record.resolved_at is None:
+                        record.resolved_at = now
+                
+                if new_records:
+                    session.add_all(new_records)
                 
                 session.commit()
             
-            logger.debug(f"[PROACTIVE] Saved {len(self.active_concerns)} concerns to SQLite")
+            # Only forget what was written; concerns dirtied meanwhile stay queued
+            for concern_id, concern in pending.items():
+                if self._dirty_concerns.get(concern_id) is concern:
+                    del self._dirty_concerns[concern_id]
+            
+            logger.debug(f"[PROACTIVE] Saved {len(pending)} changed concerns to SQLite")
         except Exception as e:
             logger.error(f"[PROACTIVE] Error saving concerns to SQLite: {e}")
     
     def _load_concerns(self):
         """
-        Load concerns from SQLite (replaces JSON file storage).
+        Load concerns from SQLite and rebuild the follow-up schedule.
         
-        ARCHITECTURE CHANGE:
-        - Concerns loaded from SQLite instead of JSON files
-        - Better querying and scalability
+        Active concerns are read in next_check_at order (served by the
+        ix_concerns_next_check index), so the list is already a valid heap.
         """
         from genesis.database.base import get_session
         from genesis.database.models import ConcernRecord
@@ -763,22 +844,10 @@ Follow-up message:"""
                 active_records = session.query(ConcernRecord).filter(
                     ConcernRecord.mind_gmid == self.mind.identity.gmid,
                     ConcernRecord.status == "active"
-                ).all()
+                ).order_by(ConcernRecord.next_check_at).all()
                 
                 self.active_concerns = [
-                    ProactiveConcern(
-                        concern_id=record.concern_id,
-                        concern_type=record.concern_type,
-                        user_email=record.user_email,
-                        description=record.content,
-                        severity=record.priority,
-                        created_at=record.created_at,
-                        follow_up_at=record.next_check_at or datetime.now(),
-                        memory_id=record.extra_data.get('memory_id'),
-                        resolved=False,
-                        follow_up_count=record.check_count,
-                        metadata=record.extra_data or {}
-                    )
+                    self._concern_from_record(record, resolved=False)
                     for record in active_records
                 ]
                 
@@ -789,19 +858,7 @@ Follow-up message:"""
                 ).order_by(ConcernRecord.resolved_at.desc()).limit(100).all()
                 
                 self.resolved_concerns = [
-                    ProactiveConcern(
-                        concern_id=record.concern_id,
-                        concern_type=record.concern_type,
-                        user_email=record.user_email,
-                        description=record.content,
-                        severity=record.priority,
-                        created_at=record.created_at,
-                        follow_up_at=record.next_check_at or datetime.now(),
-                        memory_id=record.extra_data.get('memory_id'),
-                        resolved=True,
-                        follow_up_count=record.check_count,
-                        metadata=record.extra_data or {}
-                    )
+                    self._concern_from_record(record, resolved=True)
                     for record in resolved_records
                 ]
             
@@ -811,6 +868,28 @@ Follow-up message:"""
             # Initialize empty if database isn't ready
             self.active_concerns = []
             self.resolved_concerns = []
+        
+        self._concerns_by_id = {c.concern_id: c for c in self.active_concerns}
+        self._follow_up_heap = [(c.follow_up_at, c.concern_id) for c in self.active_concerns]
+        heapq.heapify(self._follow_up_heap)
+    
+    @staticmethod
+    def _concern_from_record(record, resolved: bool) -> ProactiveConcern:
+        """Build a ProactiveConcern from a ConcernRecord row."""
+        extra_data = record.extra_data or {}
+        return ProactiveConcern(
+            concern_id=record.concern_id,
+            concern_type=record.concern_type,
+            user_email=record.user_email,
+            description=record.content,
+            severity=record.priority,
+            created_at=record.created_at,
+            follow_up_at=record.next_check_at or clock.now(),
+            memory_id=extra_data.get('memory_id'),
+            resolved=resolved,
+            follow_up_count=record.check_count,
+            metadata=extra_data
+        )
     
     def get_all_concerns(self) -> Dict[str, List[Dict[str, Any]]]:
         """Get all concerns (for API/debugging)."""
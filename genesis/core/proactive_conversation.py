@@ -25,8 +25,6 @@ from enum import Enum
 import uuid
 import json
 
-from genesis.storage.memory import MemoryType
-
 if TYPE_CHECKING:
     from genesis.core.mind import Mind
 
@@ -188,10 +186,11 @@ class ProactiveConversationManager:
         self.mind = mind
         self.active_contexts: Dict[str, ConversationContext] = {}
         self.user_contexts: Dict[str, List[str]] = {}  # user_email -> [context_ids]
+        self._loaded = False
         self._running = False
-        self._check_task: Optional[asyncio.Task] = None
+        self._check_job = None  # Job on the shared MindScheduler
         
-        # Load existing contexts from memory (only if event loop is running)
+        # Load existing contexts from SQLite (only if event loop is running)
         try:
             loop = asyncio.get_running_loop()
             asyncio.create_task(self._load_contexts())
@@ -200,111 +199,210 @@ class ProactiveConversationManager:
             logger.debug("No event loop running, deferring context loading")
     
     async def _load_contexts(self):
-        """Load conversation contexts from memory."""
+        """Bulk load this Mind's conversation contexts from SQLite.
+        
+        Open contexts are all loaded; resolved ones are kept to the most
+        recent 100 for history. Contexts saved by older versions in vector
+        memory metadata are imported once, the first time the table is empty.
+        """
+        from genesis.database.base import get_session
+        from genesis.database.models import ConversationContextRecord
+        
+        self._loaded = True
         try:
-            # Search for conversation contexts in memory
-            memories = self.mind.memory.search_memories(
-                query="conversation_context",
-                limit=100
-            )
+            with get_session() as session:
+                base = session.query(ConversationContextRecord).filter(
+                    ConversationContextRecord.mind_gmid == self.mind.identity.gmid
+                )
+                records = base.filter(
+                    ConversationContextRecord.resolved == False  # noqa: E712
+                ).order_by(ConversationContextRecord.follow_up_scheduled).all()
+                records += base.filter(
+                    ConversationContextRecord.resolved == True  # noqa: E712
+                ).order_by(ConversationContextRecord.resolved_at.desc()).limit(100).all()
+                
+                for record in records:
+                    self._index_context(self._context_from_record(record))
             
-            for memory in memories:
-                if memory.metadata.get("type") == "conversation_context":
-                    # Try to get context from JSON string first (new format)
-                    context_json = memory.metadata.get("context_json")
-                    if context_json:
-                        try:
-                            context_data = json.loads(context_json)
-                            context = ConversationContext.from_dict(context_data)
-                            self.active_contexts[context.context_id] = context
-                            
-                            # Index by user
-                            if context.user_email not in self.user_contexts:
-                                self.user_contexts[context.user_email] = []
-                            self.user_contexts[context.user_email].append(context.context_id)
-                            
-                        except Exception as e:
-                            logger.error(f"Error loading context from memory: {e}")
-                    else:
-                        # Fallback to old format (context_data)
-                        context_data = memory.metadata.get("context_data")
-                        if context_data:
-                            try:
-                                context = ConversationContext.from_dict(context_data)
-                                self.active_contexts[context.context_id] = context
-                                
-                                # Index by user
-                                if context.user_email not in self.user_contexts:
-                                    self.user_contexts[context.user_email] = []
-                                self.user_contexts[context.user_email].append(context.context_id)
-                                
-                            except Exception as e:
-                                logger.error(f"Error loading context from memory: {e}")
+            if not records:
+                await self._import_legacy_contexts()
             
             logger.info(f"Loaded {len(self.active_contexts)} conversation contexts")
             
         except Exception as e:
             logger.error(f"Error loading conversation contexts: {e}")
     
+    async def _import_legacy_contexts(self):
+        """Move contexts stored in vector memory metadata into SQLite."""
+        memory = getattr(self.mind, 'memory', None)
+        if memory is None:
+            return
+        
+        memories = memory.search_memories(query="conversation_context", limit=100)
+        imported = []
+        for memory_item in memories:
+            if memory_item.metadata.get("type") != "conversation_context":
+                continue
+            try:
+                context_json = memory_item.metadata.get("context_json")
+                context_data = json.loads(context_json) if context_json else memory_item.metadata.get("context_data")
+                if not context_data:
+                    continue
+                if isinstance(context_data.get("metadata"), str):
+                    context_data["metadata"] = json.loads(context_data["metadata"] or "{}")
+                context = ConversationContext.from_dict(context_data)
+            except Exception as e:
+                logger.error(f"Error importing context from memory: {e}")
+                continue
+            if context.context_id not in self.active_contexts:
+                self._index_context(context)
+                imported.append(context)
+        
+        if imported:
+            self._save_contexts(imported)
+            logger.info(f"Imported {len(imported)} conversation contexts from memory")
+    
     async def _ensure_loaded(self):
         """Ensure contexts are loaded (call this before first use in async context)."""
-        if not self.active_contexts and hasattr(self.mind, 'memory'):
+        if not self._loaded:
             await self._load_contexts()
     
-    async def _save_context(self, context: ConversationContext):
-        """Save conversation context to memory."""
-        try:
-            # Clean context data - remove None values for ChromaDB compatibility
-            context_dict = context.to_dict()
-            cleaned_context = {}
-            for key, value in context_dict.items():
-                if value is not None:
-                    # Convert to JSON-serializable types
-                    if isinstance(value, (str, int, float, bool)):
-                        cleaned_context[key] = value
-                    else:
-                        # Convert complex types to JSON string
-                        cleaned_context[key] = json.dumps(value) if value else ""
-            
-            # Build metadata with ONLY non-None string values
-            metadata = {
-                "type": "conversation_context",
-                "context_id": str(context.context_id),
-                "topic": str(context.topic.value),
-                "subject": str(context.subject)[:100],  # Limit length
-                "resolved": "true" if context.resolved else "false",
-                "follow_up_sent": "true" if context.follow_up_sent else "false",
-                "context_json": json.dumps(cleaned_context)
-            }
-            
-            # Prepare tags - ensure all are strings
-            tags = [
-                "conversation_context",
-                str(context.topic.value),
-                str(context.subject)[:50]  # Limit tag length
-            ]
-            
-            # Prepare add_memory kwargs
-            memory_kwargs = {
-                "content": f"Conversation context: {context.subject[:100]} with {context.user_email}",
-                "memory_type": MemoryType.SEMANTIC,
-                "importance": float(context.importance),
-                "tags": tags,
-                "metadata": metadata
+    def _index_context(self, context: ConversationContext):
+        """Add a context to the in-memory lookups."""
+        self.active_contexts[context.context_id] = context
+        user_context_ids = self.user_contexts.setdefault(context.user_email, [])
+        if context.context_id not in user_context_ids:
+            user_context_ids.append(context.context_id)
+    
+    @staticmethod
+    def _context_from_record(record) -> ConversationContext:
+        """Build a ConversationContext from a ConversationContextRecord row."""
+        return ConversationContext(
+            context_id=record.context_id,
+            topic=ConversationTopic(record.topic),
+            subject=record.subject or "",
+            initial_message=record.initial_message or "",
+            user_email=record.user_email or "",
+            environment_id=record.environment_id,
+            follow_up_question=record.follow_up_question,
+            follow_up_scheduled=record.follow_up_scheduled,
+            follow_up_sent=bool(record.follow_up_sent),
+            follow_up_status=FollowUpStatus(record.follow_up_status),
+            resolved=bool(record.resolved),
+            resolved_at=record.resolved_at,
+            resolution_note=record.resolution_note,
+            created_at=record.created_at,
+            last_updated=record.last_updated,
+            importance=record.importance,
+            urgency=record.urgency,
+            metadata=dict(record.extra_data or {}),
+            interaction_count=record.interaction_count or 0,
+            last_mention=record.last_mention,
+        )
+    
+    def _save_contexts(self, contexts: List[ConversationContext]):
+        """Upsert contexts: one IN query for existing rows, then add_all."""
+        from genesis.database.base import get_session
+        from genesis.database.models import ConversationContextRecord
+        
+        with get_session() as session:
+            existing = {
+                record.context_id: record
+                for record in session.query(ConversationContextRecord).filter(
+                    ConversationContextRecord.context_id.in_([c.context_id for c in contexts])
+                )
             }
             
-            # Only add optional fields if they're not None and not empty
-            if context.user_email and context.user_email.strip():
-                memory_kwargs["user_email"] = str(context.user_email)
-            if context.environment_id and context.environment_id.strip():
-                memory_kwargs["environment_id"] = str(context.environment_id)
+            new_records = []
+            for context in contexts:
+                record = existing.get(context.context_id)
+                if record is None:
+                    record = ConversationContextRecord(
+                        context_id=context.context_id,
+                        mind_gmid=self.mind.identity.gmid,
+                    )
+                    new_records.append(record)
+                
+                record.user_email = context.user_email
+                record.environment_id = context.environment_id
+                record.topic = context.topic.value
+                record.subject = context.subject[:255]
+                record.initial_message = context.initial_message
+                record.follow_up_question = context.follow_up_question
+                record.follow_up_scheduled = context.follow_up_scheduled
+                record.follow_up_sent = context.follow_up_sent
+                record.follow_up_status = context.follow_up_status.value
+                record.resolved = context.resolved
+                record.resolved_at = context.resolved_at
+                record.resolution_note = context.resolution_note
+                record.created_at = context.created_at
+                record.last_updated = context.last_updated
+                record.importance = float(context.importance)
+                record.urgency = float(context.urgency)
+                record.interaction_count = context.interaction_count
+                record.last_mention = context.last_mention
+                record.extra_data = dict(context.metadata or {})
             
-            self.mind.memory.add_memory(**memory_kwargs)
-            logger.debug(f"Saved context to memory: {context.context_id}")
+            if new_records:
+                session.add_all(new_records)
+    
+    async def _save_context(self, context: ConversationContext):
+        """Save conversation context to SQLite."""
+        try:
+            self._save_contexts([context])
+            logger.debug(f"Saved conversation context: {context.context_id}")
+        except Exception as e:
+            logger.error(f"Error saving conversation context: {e}")
+    
+    def get_context(self, context_id: str) -> Optional[ConversationContext]:
+        """Look up a context by ID, falling back to SQLite if not loaded."""
+        context = self.active_contexts.get(context_id)
+        if context is not None:
+            return context
+        
+        from genesis.database.base import get_session
+        from genesis.database.models import ConversationContextRecord
+        
+        try:
+            with get_session() as session:
+                record = session.query(ConversationContextRecord).filter_by(
+                    context_id=context_id,
+                    mind_gmid=self.mind.identity.gmid,
+                ).first()
+                if record is None:
+                    return None
+                context = self._context_from_record(record)
         except Exception as e:
-            logger.error(f"Error saving context to memory: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.error(f"Error loading conversation context {context_id}: {e}")
+            return None
+        
+        self._index_context(context)
+        return context
+    
+    def delete_context(self, context_id: str) -> Optional[ConversationContext]:
+        """Delete a context from memory and SQLite.
+        
+        Returns:
+            The deleted context, or None if it did not exist
+        """
+        context = self.get_context(context_id)
+        if context is None:
+            return None
+        
+        self.active_contexts.pop(context_id, None)
+        user_context_ids = self.user_contexts.get(context.user_email, [])
+        if context_id in user_context_ids:
+            user_context_ids.remove(context_id)
+        
+        from genesis.database.base import get_session
+        from genesis.database.models import ConversationContextRecord
+        
+        try:
+            with get_session() as session:
+                session.query(ConversationContextRecord).filter_by(context_id=context_id).delete()
+        except Exception as e:
+            logger.error(f"Error deleting conversation context {context_id}: {e}")
+        return context
     
     def _calculate_intelligent_timing(
         self,
@@ -444,6 +542,8 @@ Respond ONLY with JSON:
             try:
                 # Use orchestrator directly to avoid interfering with main conversation
                 response = await self.mind.orchestrator.generate(
+                    purpose="follow_up_analysis",
+                    mind_id=self.mind.identity.gmid,
                     messages=[{"role": "user", "content": analysis_prompt}],
                     model=self.mind.intelligence.fast_model,
                     temperature=0.3,
@@ -516,14 +616,7 @@ Respond ONLY with JSON:
                 )
                 
                 # Store context
-                self.active_contexts[context.context_id] = context
-                
-                # Index by user
-                if user_email not in self.user_contexts:
-                    self.user_contexts[user_email] = []
-                self.user_contexts[user_email].append(context.context_id)
-                
-                # Save to memory
+                self._index_context(context)
                 await self._save_context(context)
                 
                 # Enhanced logging with timing details
@@ -640,6 +733,8 @@ If nothing resolved: {{"resolved": [], "reasoning": {{}}}}"""
             # Use orchestrator directly to avoid interfering with main conversation
             try:
                 response = await self.mind.orchestrator.generate(
+                    purpose="follow_up_resolution",
+                    mind_id=self.mind.identity.gmid,
                     messages=[{"role": "user", "content": check_prompt}],
                     model=self.mind.intelligence.fast_model,
                     temperature=0.3,
@@ -679,30 +774,48 @@ If nothing resolved: {{"resolved": [], "reasoning": {{}}}}"""
     ) -> List[ConversationContext]:
         """Get all pending follow-ups ready to be sent.
         
+        Due contexts come from an indexed query on follow-up status and
+        scheduled time rather than a scan of every active context.
+        
         Args:
             user_email: Filter by user (optional)
             
         Returns:
-            List of contexts ready for follow-up
+            List of contexts ready for follow-up, earliest first
         """
-        pending = []
+        from genesis.database.base import get_session
+        from genesis.database.models import ConversationContextRecord
         
-        contexts_to_check = []
-        if user_email:
-            user_context_ids = self.user_contexts.get(user_email, [])
-            contexts_to_check = [
-                self.active_contexts[cid]
-                for cid in user_context_ids
-                if cid in self.active_contexts
-            ]
-        else:
-            contexts_to_check = list(self.active_contexts.values())
+        await self._ensure_loaded()
         
-        for context in contexts_to_check:
-            if context.should_follow_up():
-                pending.append(context)
+        try:
+            with get_session() as session:
+                query = session.query(ConversationContextRecord).filter(
+                    ConversationContextRecord.mind_gmid == self.mind.identity.gmid,
+                    ConversationContextRecord.follow_up_status == FollowUpStatus.PENDING.value,
+                    ConversationContextRecord.follow_up_scheduled <= datetime.now(),
+                )
+                if user_email:
+                    query = query.filter(ConversationContextRecord.user_email == user_email)
+                records = query.order_by(ConversationContextRecord.follow_up_scheduled).all()
+                
+                due = []
+                for record in records:
+                    if record.context_id not in self.active_contexts:
+                        self._index_context(self._context_from_record(record))
+                    due.append(self.active_contexts[record.context_id])
+        except Exception as e:
+            logger.error(f"Error querying due follow-ups: {e}")
+            if user_email:
+                due = [
+                    self.active_contexts[cid]
+                    for cid in self.user_contexts.get(user_email, [])
+                    if cid in self.active_contexts
+                ]
+            else:
+                due = list(self.active_contexts.values())
         
-        return pending
+        return [context for context in due if context.should_follow_up()]
     
     async def send_follow_up(
         self,
@@ -762,40 +875,35 @@ If nothing resolved: {{"resolved": [], "reasoning": {{}}}}"""
         # Ensure contexts are loaded
         await self._ensure_loaded()
         
+        from genesis.core.mind_scheduler import get_mind_scheduler
+        
         self._running = True
-        self._check_task = asyncio.create_task(self._monitor_loop(check_interval))
+        self._check_job = get_mind_scheduler().schedule(
+            self._monitor_tick,
+            interval=check_interval,
+            owner=self.mind.identity.gmid,
+            name="proactive_conversation",
+            delay=0,
+            jitter=0.1,
+            error_backoff=check_interval,
+        )
         logger.info("Started proactive conversation monitoring")
     
     async def stop_monitoring(self):
         """Stop background monitoring."""
         self._running = False
-        if self._check_task:
-            self._check_task.cancel()
-            try:
-                await self._check_task
-            except asyncio.CancelledError:
-                pass
+        if self._check_job:
+            self._check_job.cancel()
+            self._check_job = None
         logger.info("Stopped proactive conversation monitoring")
     
-    async def _monitor_loop(self, check_interval: int):
-        """Background loop to check for pending follow-ups."""
-        while self._running:
-            try:
-                # Check for pending follow-ups
-                pending = await self.get_pending_follow_ups()
-                
-                for context in pending:
-                    # Send follow-up (will be handled by daemon's notification system)
-                    await self.send_follow_up(context)
-                
-                # Wait before next check
-                await asyncio.sleep(check_interval)
-                
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.error(f"Error in conversation monitoring loop: {e}")
-                await asyncio.sleep(check_interval)
+    async def _monitor_tick(self):
+        """Check for pending follow-ups, run by the shared MindScheduler."""
+        pending = await self.get_pending_follow_ups()
+        
+        for context in pending:
+            # Send follow-up (will be handled by daemon's notification system)
+            await self.send_follow_up(context)
     
     def get_user_contexts(
         self,
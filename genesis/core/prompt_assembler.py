@@ -0,0 +1,191 @@
+"""
+Token-budgeted system prompt assembly with cached sections.
+
+A system prompt is a list of PromptSections. Each section may carry a
+version function returning a cheap stamp of the state it renders; the
+rendered text is reused until the stamp changes, so unchanged sections
+(identity, core memory, plugin context) are not rebuilt every turn.
+
+Static sections are emitted first, in a stable order, so the prompt
+starts with a prefix that rarely changes and providers can cache it.
+When the prompt exceeds the model's budget, the lowest-priority sections
+are dropped first; required sections are truncated only as a last resort.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+# Context windows by model-name fragment, first match wins
+MODEL_CONTEXT_WINDOWS: List[Tuple[str, int]] = [
+    ("gemini-1.5-pro", 2_000_000),
+    ("gemini", 1_000_000),
+    ("claude", 200_000),
+    ("gpt-4o", 128_000),
+    ("gpt-4-turbo", 128_000),
+    ("gpt-4.1", 1_000_000),
+    ("gpt-4", 8_192),
+    ("gpt-3.5", 16_385),
+    ("llama-3.3", 128_000),
+    ("llama-3.1", 128_000),
+    ("llama3.1", 128_000),
+    ("mixtral", 32_768),
+    ("qwen", 32_768),
+    ("deepseek", 64_000),
+]
+DEFAULT_CONTEXT_WINDOW = 8_192
+
+# Rough characters per token for budgeting (no tokenizer dependency)
+CHARS_PER_TOKEN = 4
+
+
+def context_window(model: Optional[str]) -> int:
+    """Context window (tokens) for a model name, e.g. 'openrouter/meta-llama/llama-3.3-70b-instruct'."""
+    name = (model or "").lower()
+    for fragment, window in MODEL_CONTEXT_WINDOWS:
+        if fragment in name:
+            return window
+    return DEFAULT_CONTEXT_WINDOW
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of a text."""
+    return len(text) // CHARS_PER_TOKEN + 1 if text else 0
+
+
+def estimate_messages_tokens(messages: List[Dict[str, Any]]) -> int:
+    """Estimate the token count of chat messages (content plus per-message overhead)."""
+    return sum(estimate_tokens(str(m.get("content") or "")) + 4 for m in messages)
+
+
+@dataclass
+class PromptSection:
+    """One part of a system prompt."""
+
+    name: str
+    build: Callable[[], str]
+    # Stamp of the state the section renders; None = rebuilt on every assemble
+    version: Optional[Callable[[], Hashable]] = None
+    # Higher priority sections survive budget pressure longer
+    priority: int = 50
+    # Static sections form the cacheable prefix
+    static: bool = False
+    # Required sections are never dropped, only truncated
+    required: bool = False
+
+
+@dataclass
+class AssembledPrompt:
+    """Result of assembling a system prompt."""
+
+    static_text: str
+    dynamic_text: str
+    tokens: int
+    budget: Optional[int] = None
+    dropped: List[str] = field(default_factory=list)
+    truncated: List[str] = field(default_factory=list)
+
+    @property
+    def text(self) -> str:
+        """Full system prompt (static prefix, then dynamic suffix)."""
+        if self.static_text and self.dynamic_text:
+            return f"{self.static_text}\n\n{self.dynamic_text}"
+        return self.static_text or self.dynamic_text
+
+
+class PromptAssembler:
+    """Builds system prompts from versioned, cached sections."""
+
+    def __init__(self):
+        self._cache: Dict[str, Tuple[Hashable, str]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, section: PromptSection) -> str:
+        """Render a section, reusing the cached text while its version is unchanged."""
+        if section.version is None:
+            return section.build() or ""
+
+        stamp = section.version()
+        cached = self._cache.get(section.name)
+        if cached is not None and cached[0] == stamp:
+            self.hits += 1
+            return cached[1]
+
+        self.misses += 1
+        content = section.build() or ""
+        self._cache[section.name] = (stamp, content)
+        return content
+
+    def assemble(self, sections: List[PromptSection], budget_tokens: Optional[int] = None) -> AssembledPrompt:
+        """
+        Assemble sections into a prompt that fits the token budget.
+
+        Empty sections and exact duplicates of earlier sections are skipped;
+        the rest are separated by a blank line.
+
+        Args:
+            sections: Sections in their preferred order
+            budget_tokens: Maximum prompt tokens (None = unlimited)
+
+        Returns:
+            AssembledPrompt with the static prefix and dynamic suffix
+        """
+        # [position, section, content] so entries stay distinct while sorting
+        rendered, seen = [], set()
+        for position, section in enumerate(sections):
+            content = self.render(section).strip("\n")
+            if content.strip() and content not in seen:
+                rendered.append([position, section, content])
+                seen.add(content)
+
+        dropped, truncated = [], []
+        total = sum(estimate_tokens(content) for _, _, content in rendered)
+        if budget_tokens is not None and total > budget_tokens:
+            # Drop optional sections, lowest priority first (later sections first on ties)
+            for entry in sorted(
+                (e for e in rendered if not e[1].required),
+                key=lambda e: (e[1].priority, -e[0])
+            ):
+                if total <= budget_tokens:
+                    break
+                rendered.remove(entry)
+                dropped.append(entry[1].name)
+                total -= estimate_tokens(entry[2])
+
+            # Still over: truncate required sections, lowest priority first
+            for entry in sorted(rendered, key=lambda e: e[1].priority):
+                if total <= budget_tokens:
+                    break
+                tokens = estimate_tokens(entry[2])
+                keep_tokens = max(tokens - (total - budget_tokens), 0)
+                entry[2] = entry[2][:max(keep_tokens - 1, 0) * CHARS_PER_TOKEN]
+                truncated.append(entry[1].name)
+                total -= tokens - estimate_tokens(entry[2])
+
+        static = [content for _, section, content in rendered if section.static and content]
+        dynamic = [content for _, section, content in rendered if not section.static and content]
+        return AssembledPrompt(
+            static_text="\n\n".join(static),
+            dynamic_text="\n\n".join(dynamic),
+            tokens=total,
+            budget=budget_tokens,
+            dropped=dropped,
+            truncated=truncated,
+        )
+
+    def invalidate(self, name: Optional[str] = None) -> None:
+        """Forget one cached section (or all of them)."""
+        if name is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(name, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Cache statistics."""
+        lookups = self.hits + self.misses
+        return {
+            "sections_cached": len(self._cache),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
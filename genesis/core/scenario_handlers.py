@@ -153,6 +153,8 @@ Provide JSON response:
         
         try:
             response = await self.mind.orchestrator.generate(
+                purpose="scenario_extraction",
+                mind_id=self.mind.identity.gmid,
                 messages=[{"role": "user", "content": prompt}],
                 model=self.mind.intelligence.fast_model,
                 temperature=0.3,
@@ -201,6 +203,8 @@ Keep it conversational, caring, and concise (3-4 sentences max).
 Response:"""
         
         response = await self.mind.orchestrator.generate(
+            purpose="scenario_response",
+            mind_id=self.mind.identity.gmid,
             messages=[{"role": "user", "content": prompt}],
             model=self.mind.intelligence.reasoning_model,
             temperature=0.8,
@@ -264,6 +268,8 @@ Keep it brief (1-2 sentences).
 Message:"""
         
         response = await self.mind.orchestrator.generate(
+            purpose="scenario_followup",
+            mind_id=self.mind.identity.gmid,
             messages=[{"role": "user", "content": prompt}],
             model=self.mind.intelligence.fast_model,
             temperature=0.8,
@@ -367,6 +373,8 @@ Provide JSON:
         
         try:
             response = await self.mind.orchestrator.generate(
+                purpose="scenario_extraction",
+                mind_id=self.mind.identity.gmid,
                 messages=[{"role": "user", "content": prompt}],
                 model=self.mind.intelligence.fast_model,
                 temperature=0.3,
@@ -410,6 +418,8 @@ Keep it friendly and encouraging.
 Response:"""
         
         response = await self.mind.orchestrator.generate(
+            purpose="scenario_response",
+            mind_id=self.mind.identity.gmid,
             messages=[{"role": "user", "content": prompt}],
             model=self.mind.intelligence.reasoning_model,
             temperature=0.8,
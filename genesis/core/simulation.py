@@ -0,0 +1,336 @@
+"""
+Mind Simulation - run Minds through simulated days at maximum speed.
+
+The standing performance benchmark for autonomous life. N LivingMinds
+(consciousness, activities, LLM gateway) run on a virtual-time event loop
+(see genesis.core.clock) against a deterministic fake ModelOrchestrator,
+with user messages arriving at seeded random times. A simulated day takes
+seconds and the report covers:
+
+- LLM calls per Mind-day (total and by purpose), and requests per hour
+  before/after the LLM gateway's batching
+- Tick CPU (process CPU time per scheduler tick)
+- Memory growth (tracemalloc, from start of simulation to end)
+- Database writes (INSERT/UPDATE/DELETE statements)
+
+Usage:
+    report = MindSimulation(minds=10, days=1).run()
+    print(report.to_dict())
+
+    python -m genesis.core.simulation --minds 10 --days 1
+"""
+
+import asyncio
+import json
+import logging
+import random
+import time as time_module
+import tracemalloc
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from genesis.core import clock
+from genesis.models.base import ModelResponse
+
+logger = logging.getLogger(__name__)
+
+# A Monday, 6:00 - shortly before the default wake time
+DEFAULT_START = datetime(2026, 1, 5, 6, 0)
+
+
+class FakeOrchestrator:
+    """Deterministic stand-in for ModelOrchestrator that counts calls."""
+
+    def __init__(self, reply: str = "I'll keep going with what I was doing."):
+        self.reply = reply
+        self.calls: Counter = Counter()        # (mind_id, purpose) -> calls
+        self.prompt_chars = 0
+
+    @property
+    def total_calls(self) -> int:
+        return sum(self.calls.values())
+
+    async def generate(
+        self,
+        messages: List[Dict[str, Any]],
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 1000,
+        **kwargs: Any,
+    ) -> ModelResponse:
+        from genesis.core.living_mind import BATCH_ITEM_PATTERN
+
+        self.calls[(kwargs.get("mind_id"), kwargs.get("purpose") or "unspecified")] += 1
+        prompt_chars = sum(len(str(m.get("content") or "")) for m in messages)
+        self.prompt_chars += prompt_chars
+
+        # Answer packed prompts the way they ask: one JSON entry per item
+        items = BATCH_ITEM_PATTERN.findall(str(messages[-1].get("content") or "")) if messages else []
+        reply = json.dumps({item: self.reply for item in items}) if len(items) > 1 else self.reply
+
+        return ModelResponse(
+            content=reply,
+            model=model or "fake",
+            provider="fake",
+            tokens_used=prompt_chars // 4 + len(reply) // 4,
+            latency_ms=0.0,
+            usage={
+                "input_tokens": prompt_chars // 4,
+                "output_tokens": len(reply) // 4,
+                "cached_tokens": 0,
+                "cache_write_tokens": 0,
+            },
+        )
+
+    async def stream_generate(self, messages: List[Dict[str, Any]], model: Optional[str] = None, **kwargs: Any):
+        response = await self.generate(messages, model=model, **kwargs)
+        for word in response.content.split(" "):
+            yield word + " "
+
+    def get_available_providers(self) -> List[str]:
+        return ["fake"]
+
+
+@dataclass
+class SimulationReport:
+    """Results of a simulation run."""
+
+    minds: int
+    days: float
+    seed: int
+    wall_seconds: float
+    cpu_seconds: float
+    ticks: int
+    llm_calls: int
+    llm_calls_per_mind_day: float
+    llm_calls_by_purpose: Dict[str, int] = field(default_factory=dict)
+    llm_requests: int = 0                       # Made to the gateways (before batching)
+    llm_requests_per_hour: float = 0.0          # Per Mind, before batching
+    llm_calls_per_hour: float = 0.0             # Per Mind, provider calls after batching
+    cpu_ms_per_tick: float = 0.0
+    memory_growth_bytes: Optional[int] = None
+    memory_peak_bytes: Optional[int] = None
+    db_writes: int = 0
+    db_writes_per_mind_day: float = 0.0
+    messages_sent: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class _WriteCounter:
+    """Counts INSERT/UPDATE/DELETE statements on the database engine."""
+
+    WRITE_VERBS = ("INSERT", "UPDATE", "DELETE", "REPLACE")
+
+    def __init__(self):
+        self.writes = 0
+        self._engine = None
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        if statement.lstrip()[:7].upper().startswith(self.WRITE_VERBS):
+            self.writes += len(parameters) if executemany and parameters else 1
+
+    def __enter__(self) -> "_WriteCounter":
+        try:
+            from sqlalchemy import event
+            from genesis.database.base import get_engine
+
+            self._engine = get_engine()
+            event.listen(self._engine, "before_cursor_execute", self._on_execute)
+        except Exception as e:
+            logger.warning(f"[SIM] Database writes not counted: {e}")
+        return self
+
+    def __exit__(self, *exc) -> None:
+        if self._engine is not None:
+            from sqlalchemy import event
+
+            event.remove(self._engine, "before_cursor_execute", self._on_execute)
+
+
+class MindSimulation:
+    """Runs LivingMinds through simulated days in virtual time."""
+
+    def __init__(
+        self,
+        minds: int = 10,
+        days: float = 1.0,
+        messages_per_day: int = 20,
+        seed: int = 0,
+        start: datetime = DEFAULT_START,
+        trace_memory: bool = True,
+        orchestrator: Optional[FakeOrchestrator] = None,
+    ):
+        """
+        Configure a simulation.
+
+        Args:
+            minds: Number of Minds
+            days: Simulated days
+            messages_per_day: User messages per Mind per simulated day
+            seed: Seed for message timing and the Minds' random choices
+            start: Simulated start time
+            trace_memory: Measure memory growth with tracemalloc (slower)
+            orchestrator: LLM stand-in (default: FakeOrchestrator)
+        """
+        self.minds = minds
+        self.days = days
+        self.messages_per_day = messages_per_day
+        self.seed = seed
+        self.start = start
+        self.trace_memory = trace_memory
+        self.orchestrator = orchestrator or FakeOrchestrator()
+        self.living_minds = []
+        self.messages_sent = 0
+
+    def run(self) -> SimulationReport:
+        """Run the simulation and return its report."""
+        random_state = random.getstate()
+        random.seed(self.seed)
+        if self.trace_memory:
+            tracemalloc.start()
+        try:
+            with _WriteCounter() as writes:
+                wall_started = time_module.perf_counter()
+                cpu_started = time_module.process_time()
+                ticks, memory = clock.run_virtual(self._simulate(), start=self.start)
+                cpu_seconds = time_module.process_time() - cpu_started
+                wall_seconds = time_module.perf_counter() - wall_started
+        finally:
+            if self.trace_memory:
+                tracemalloc.stop()
+            random.setstate(random_state)
+
+        mind_days = max(self.minds * self.days, 1e-9)
+        llm_requests = sum(mind.llm_gateway.requests_submitted for mind in self.living_minds)
+        by_purpose: Counter = Counter()
+        for (_, purpose), calls in self.orchestrator.calls.items():
+            by_purpose[purpose] += calls
+
+        return SimulationReport(
+            minds=self.minds,
+            days=self.days,
+            seed=self.seed,
+            wall_seconds=round(wall_seconds, 3),
+            cpu_seconds=round(cpu_seconds, 3),
+            ticks=ticks,
+            llm_calls=self.orchestrator.total_calls,
+            llm_calls_per_mind_day=round(self.orchestrator.total_calls / mind_days, 2),
+            llm_calls_by_purpose=dict(by_purpose),
+            llm_requests=llm_requests,
+            llm_requests_per_hour=round(llm_requests / (mind_days * 24), 2),
+            llm_calls_per_hour=round(self.orchestrator.total_calls / (mind_days * 24), 2),
+            cpu_ms_per_tick=round(cpu_seconds / ticks * 1000, 4) if ticks else 0.0,
+            memory_growth_bytes=memory[0] if memory else None,
+            memory_peak_bytes=memory[1] if memory else None,
+            db_writes=writes.writes,
+            db_writes_per_mind_day=round(writes.writes / mind_days, 2),
+            messages_sent=self.messages_sent,
+        )
+
+    async def _simulate(self):
+        """Create, run and stop the Minds. Returns (ticks, (memory growth, peak))."""
+        from genesis.core.living_mind import LivingMind
+        from genesis.core.mind_scheduler import get_mind_scheduler
+
+        rng = random.Random(self.seed)
+        self.living_minds = [
+            LivingMind(
+                mind_id=f"SIM-{index:05d}",
+                mind_name=f"Sim {index}",
+                orchestrator=self.orchestrator,
+                reasoning_model="fake/reasoning",
+                fast_model="fake/fast",
+            )
+            for index in range(self.minds)
+        ]
+        self._reset_llm_budgets()
+        for mind in self.living_minds:
+            await mind.start_living()
+
+        memory_start = tracemalloc.get_traced_memory()[0] if self.trace_memory else 0
+        duration = self.days * 86400
+        senders = [
+            asyncio.create_task(self._send_messages(mind, rng.random(), duration))
+            for mind in self.living_minds
+        ]
+
+        await asyncio.sleep(duration)
+
+        mind_ids = {mind.mind_id for mind in self.living_minds}
+        ticks = sum(job.runs for job in get_mind_scheduler().get_jobs() if job.owner in mind_ids)
+        for task in senders:
+            task.cancel()
+        for mind in self.living_minds:
+            await mind.stop_living()
+
+        memory = None
+        if self.trace_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            memory = (current - memory_start, peak)
+        return ticks, memory
+
+    def _reset_llm_budgets(self) -> None:
+        """Start every simulated Mind with an unused daily LLM budget."""
+        try:
+            from genesis.database.base import get_session
+            from genesis.database.models import LLMUsageRecord
+
+            with get_session() as session:
+                session.query(LLMUsageRecord).filter(
+                    LLMUsageRecord.mind_id.in_([mind.mind_id for mind in self.living_minds])
+                ).delete(synchronize_session=False)
+        except Exception as e:
+            logger.warning(f"[SIM] LLM budgets not reset: {e}")
+
+    async def _send_messages(self, mind, offset: float, duration: float) -> None:
+        """Deliver this Mind's messages at seeded times."""
+        count = round(self.messages_per_day * self.days)
+        if not count:
+            return
+        rng = random.Random(f"{self.seed}:{mind.mind_id}")
+        times = sorted(rng.uniform(0, duration) for _ in range(count))
+        elapsed = 0.0
+        for index, at in enumerate(times):
+            await asyncio.sleep(at - elapsed)
+            elapsed = at
+            mind.receive_message(f"Message {index} - how is it going?", source="sim-user")
+            self.messages_sent += 1
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command-line entry point."""
+    import argparse
+    import json
+    import os
+    import tempfile
+
+    parser = argparse.ArgumentParser(description="Run Minds through simulated days in virtual time.")
+    parser.add_argument("--minds", type=int, default=10)
+    parser.add_argument("--days", type=float, default=1.0)
+    parser.add_argument("--messages", type=int, default=20, help="User messages per Mind per day")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-memory", action="store_true", help="Skip tracemalloc (faster)")
+    parser.add_argument("--home", help="GENESIS_HOME for the database (default: a temporary directory)")
+    args = parser.parse_args(argv)
+
+    # Keep simulated thoughts out of the real database
+    os.environ["GENESIS_HOME"] = args.home or tempfile.mkdtemp(prefix="genesis-sim-")
+    from genesis.database.base import init_db
+
+    init_db()
+    report = MindSimulation(
+        minds=args.minds,
+        days=args.days,
+        messages_per_day=args.messages,
+        seed=args.seed,
+        trace_memory=not args.no_memory,
+    ).run()
+    print(json.dumps(report.to_dict(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
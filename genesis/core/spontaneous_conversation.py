@@ -14,6 +14,7 @@ This is what makes Genesis feel ALIVE - not just reactive, but actively engaged.
 
 import asyncio
 import logging
+import time
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any, List, Callable
 from dataclasses import dataclass
@@ -33,6 +34,46 @@ class ConversationMoment:
     should_send_immediately: bool
 
 
+@dataclass
+class InterjectionCheck:
+    """An interjection check and the best moment it could produce.
+    
+    The best case (priority, immediacy, max confidence) lets the engine skip
+    a check before running it when even that moment would not be sent.
+    """
+    name: str
+    run: Callable[[str, str, str], Any]  # (user_message, user_email, assistant_response) -> awaitable moment
+    priority: int
+    should_send_immediately: bool
+    max_confidence: float
+    prior: Optional[Callable[[str, str], bool]] = None  # Cheap (user_message, user_email) pre-check
+
+
+EMOTIONAL_KEYWORDS = {
+    "positive": ["happy", "excited", "great", "wonderful", "amazing", "love", "thank"],
+    "negative": ["sad", "worried", "stressed", "anxious", "upset", "frustrated", "tired"],
+    "achievement": ["passed", "won", "succeeded", "completed", "finished", "achieved"],
+    "struggle": ["difficult", "hard", "struggling", "can't", "unable", "failing"]
+}
+
+EDUCATIONAL_KEYWORDS = ["what is", "how does", "explain", "tell me about", "learn", "understand"]
+
+
+def detect_emotion(user_message: str) -> Optional[str]:
+    """Return the first emotion type whose keywords appear in the message."""
+    user_lower = user_message.lower()
+    for emotion, keywords in EMOTIONAL_KEYWORDS.items():
+        if any(keyword in user_lower for keyword in keywords):
+            return emotion
+    return None
+
+
+def is_educational(user_message: str) -> bool:
+    """Check if the message asks to learn or understand something."""
+    user_lower = user_message.lower()
+    return any(keyword in user_lower for keyword in EDUCATIONAL_KEYWORDS)
+
+
 class SpontaneousConversationEngine:
     """
     Enables Genesis to spontaneously participate in conversations like a human.
@@ -59,6 +100,106 @@ class SpontaneousConversationEngine:
         self.max_interjections_per_conversation = 3
         self.min_seconds_between_interjections = 30
         self.last_interjection_time: Dict[str, datetime] = {}
+        
+        # Checks in priority order, with per-check cost and hit-rate stats
+        self.checks: List[InterjectionCheck] = [
+            InterjectionCheck(
+                name="memory_association",
+                run=lambda msg, email, resp: self._check_memory_associations(msg, email),
+                priority=3, should_send_immediately=False, max_confidence=0.75,
+                prior=lambda msg, email: getattr(self.mind, 'memory', None) is not None,
+            ),
+            InterjectionCheck(
+                name="clarification_needed",
+                run=self._check_clarification_needed,
+                priority=4, should_send_immediately=True, max_confidence=1.0,
+            ),
+            InterjectionCheck(
+                name="insight",
+                run=self._check_for_insights,
+                priority=2, should_send_immediately=False, max_confidence=1.0,
+            ),
+            InterjectionCheck(
+                name="emotional_response",
+                run=lambda msg, email, resp: self._check_emotional_response(msg, email),
+                priority=5, should_send_immediately=True, max_confidence=0.8,
+                prior=lambda msg, email: detect_emotion(msg) is not None,
+            ),
+            InterjectionCheck(
+                name="knowledge_share",
+                run=self._check_knowledge_expansion,
+                priority=3, should_send_immediately=False, max_confidence=1.0,
+                prior=lambda msg, email: is_educational(msg),
+            ),
+        ]
+        self.check_stats: Dict[str, Dict[str, float]] = {
+            check.name: {"runs": 0, "skipped": 0, "hits": 0, "errors": 0, "total_seconds": 0.0}
+            for check in self.checks
+        }
+    
+    @property
+    def _mind_id(self) -> Optional[str]:
+        """Mind ID for LLM call telemetry."""
+        identity = getattr(self.mind, "identity", None)
+        return identity.gmid if identity else None
+
+    def _check_can_interject(self, check: InterjectionCheck, user_message: str, user_email: str) -> bool:
+        """Cheap pre-gate: could this check's best-case moment be sent this turn?
+        
+        Applies the confidence floor, the rate limits and send rules of
+        should_send_interjection, and the check's own prior (e.g. keywords).
+        """
+        if check.max_confidence < self.min_confidence_for_interjection:
+            return False
+        
+        best_case = ConversationMoment(
+            trigger_type=check.name,
+            confidence=check.max_confidence,
+            context={},
+            suggested_message="",
+            priority=check.priority,
+            should_send_immediately=check.should_send_immediately
+        )
+        if not self.should_send_interjection(user_email, best_case):
+            return False
+        
+        return check.prior is None or check.prior(user_message, user_email)
+    
+    async def _run_check(
+        self,
+        check: InterjectionCheck,
+        user_message: str,
+        user_email: str,
+        assistant_response: str
+    ) -> Optional[ConversationMoment]:
+        """Run one check and record its cost and outcome."""
+        stats = self.check_stats[check.name]
+        stats["runs"] += 1
+        started = time.perf_counter()
+        try:
+            moment = await check.run(user_message, user_email, assistant_response)
+        except Exception as e:
+            stats["errors"] += 1
+            logger.debug(f"Error in {check.name} check: {e}")
+            moment = None
+        finally:
+            stats["total_seconds"] += time.perf_counter() - started
+        
+        if moment is not None:
+            stats["hits"] += 1
+        return moment
+    
+    def get_check_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-check run counts, cost and hit rate."""
+        result = {}
+        for name, stats in self.check_stats.items():
+            runs = stats["runs"]
+            result[name] = {
+                **stats,
+                "avg_ms": round(stats["total_seconds"] / runs * 1000, 2) if runs else 0.0,
+                "hit_rate": round(stats["hits"] / runs, 3) if runs else 0.0,
+            }
+        return result
     
     async def analyze_conversation_for_interjections(
         self,
@@ -71,7 +212,8 @@ class SpontaneousConversationEngine:
         Analyze conversation to find moments for spontaneous interjections.
         
         This happens AFTER the assistant responds, to see if there's anything
-        additional to say spontaneously.
+        additional to say spontaneously. Only checks whose best possible
+        moment could be sent this turn are run, and they run concurrently.
         
         Args:
             user_message: What user just said
@@ -96,33 +238,22 @@ class SpontaneousConversationEngine:
         # Mark conversation as active
         self.conversation_active[user_email] = datetime.now()
         
-        # Analyze for interjection opportunities
-        moments = []
-        
-        # 1. Memory associations
-        memory_moment = await self._check_memory_associations(user_message, user_email)
-        if memory_moment:
-            moments.append(memory_moment)
-        
-        # 2. Clarification opportunities
-        clarification_moment = await self._check_clarification_needed(user_message, user_email, assistant_response)
-        if clarification_moment:
-            moments.append(clarification_moment)
+        # Gate checks cheaply, then run the survivors concurrently
+        eligible = []
+        for check in self.checks:
+            if self._check_can_interject(check, user_message, user_email):
+                eligible.append(check)
+            else:
+                self.check_stats[check.name]["skipped"] += 1
         
-        # 3. Additional insights
-        insight_moment = await self._check_for_insights(user_message, user_email, assistant_response)
-        if insight_moment:
-            moments.append(insight_moment)
+        if not eligible:
+            return []
         
-        # 4. Emotional responses
-        emotional_moment = await self._check_emotional_response(user_message, user_email)
-        if emotional_moment:
-            moments.append(emotional_moment)
-        
-        # 5. Knowledge expansion
-        knowledge_moment = await self._check_knowledge_expansion(user_message, user_email, assistant_response)
-        if knowledge_moment:
-            moments.append(knowledge_moment)
+        results = await asyncio.gather(*[
+            self._run_check(check, user_message, user_email, assistant_response)
+            for check in eligible
+        ])
+        moments = [moment for moment in results if moment]
         
         # Filter and prioritize
         moments = [m for m in moments if m.confidence >= self.min_confidence_for_interjection]
@@ -135,7 +266,7 @@ class SpontaneousConversationEngine:
         
         # Search for relevant memories
         try:
-            related_memories = self.mind.memory.search_memories(
+            related_memories = await self.mind.memory.search_memories_async(
                 query=user_message,
                 user_email=user_email,
                 limit=3
@@ -170,6 +301,8 @@ Make it conversational and natural, as if you just remembered something.
 Interjection:"""
             
             response = await self.mind.orchestrator.generate(
+                purpose="spontaneous_memory",
+                mind_id=self._mind_id,
                 messages=[{"role": "user", "content": prompt}],
                 model=self.mind.intelligence.fast_model,
                 temperature=0.9,
@@ -220,6 +353,8 @@ Response:"""
         
         try:
             response = await self.mind.orchestrator.generate(
+                purpose="spontaneous_clarification",
+                mind_id=self._mind_id,
                 messages=[{"role": "user", "content": prompt}],
                 model=self.mind.intelligence.fast_model,
                 temperature=0.4,
@@ -282,6 +417,8 @@ Response:"""
         
         try:
             response = await self.mind.orchestrator.generate(
+                purpose="spontaneous_insight",
+                mind_id=self._mind_id,
                 messages=[{"role": "user", "content": prompt}],
                 model=self.mind.intelligence.fast_model,
                 temperature=0.7,
@@ -321,21 +458,7 @@ Response:"""
         """Check if an emotional/empathetic response is warranted"""
         
         # Detect emotional content
-        emotional_keywords = {
-            "positive": ["happy", "excited", "great", "wonderful", "amazing", "love", "thank"],
-            "negative": ["sad", "worried", "stressed", "anxious", "upset", "frustrated", "tired"],
-            "achievement": ["passed", "won", "succeeded", "completed", "finished", "achieved"],
-            "struggle": ["difficult", "hard", "struggling", "can't", "unable", "failing"]
-        }
-        
-        user_lower = user_message.lower()
-        emotion_type = None
-        
-        for emotion, keywords in emotional_keywords.items():
-            if any(keyword in user_lower for keyword in keywords):
-                emotion_type = emotion
-                break
-        
+        emotion_type = detect_emotion(user_message)
         if not emotion_type:
             return None
         
@@ -355,6 +478,8 @@ Response:"""
         
         try:
             response = await self.mind.orchestrator.generate(
+                purpose="spontaneous_emotion",
+                mind_id=self._mind_id,
                 messages=[{"role": "user", "content": prompt}],
                 model=self.mind.intelligence.fast_model,
                 temperature=0.9,
@@ -384,12 +509,7 @@ Response:"""
         """Check if there's related knowledge worth sharing"""
         
         # For educational topics, check if follow-up question would deepen conversation
-        educational_keywords = ["what is", "how does", "explain", "tell me about", "learn", "understand"]
-        
-        user_lower = user_message.lower()
-        is_educational = any(keyword in user_lower for keyword in educational_keywords)
-        
-        if not is_educational:
+        if not is_educational(user_message):
             return None
         
         prompt = f"""The user asked: "{user_message}"
@@ -409,6 +529,8 @@ Response:"""
         
         try:
             response = await self.mind.orchestrator.generate(
+                purpose="spontaneous_knowledge",
+                mind_id=self._mind_id,
                 messages=[{"role": "user", "content": prompt}],
                 model=self.mind.intelligence.fast_model,
                 temperature=0.7,
@@ -0,0 +1,416 @@
+"""
+Vital State Store - biological and needs state of every Mind in one set of arrays.
+
+Each ConsciousnessEngineV2 used to update its own BiologicalState and
+NeedsState field by field on its own tick. With thousands of mostly idle
+Minds in one host process, that per-Mind Python overhead dominates.
+
+The store keeps the numeric state of all Minds as struct-of-arrays NumPy
+columns (one row per Mind) and applies the update rules to every row that
+needs it in one vectorized step:
+- Engines get row views (BiologicalStateView / NeedsStateView) with the
+  same attributes as the dataclasses, so existing code reads and writes
+  them unchanged
+- After each consciousness tick an engine marks its row pending with its
+  awareness level and domain; one shared scheduler job steps all pending
+  rows at once (one biological update per engine tick, as before)
+- Urges and domain suggestions are available as batched argmax queries
+
+Usage:
+    store = get_vital_state_store()
+    row = store.allocate(timezone_offset=2)
+    bio = store.biological(row)          # bio.energy, bio.to_dict(), ...
+    store.mark_pending(row, AwarenessLevel.FOCUSED, resting=False)
+    store.step()                          # Usually run by the scheduler job
+
+Benchmark:
+    python -m genesis.core.vital_state 10000
+"""
+
+import asyncio
+import logging
+import time as time_module
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from genesis.core import clock
+from genesis.core.consciousness_v2 import (
+    AwarenessLevel,
+    BiologicalState,
+    CircadianClock,
+    LifeDomain,
+    NeedsState,
+    NeedsSystem,
+)
+
+logger = logging.getLogger(__name__)
+
+BIO_FIELDS: Tuple[str, ...] = ("energy", "alertness", "fatigue", "stress")
+NEED_FIELDS: Tuple[str, ...] = ("social", "curiosity", "achievement", "purpose", "creativity", "autonomy")
+
+NEED_DOMAINS = {
+    "social": LifeDomain.SOCIAL,
+    "curiosity": LifeDomain.LEARNING,
+    "achievement": LifeDomain.WORK,
+    "purpose": LifeDomain.PERSONAL,
+    "creativity": LifeDomain.PLAY,
+    "autonomy": LifeDomain.PERSONAL,
+}
+
+# Energy spent per tick by awareness level (index = AwarenessLevel value)
+ENERGY_DEPLETION = {
+    AwarenessLevel.DORMANT: 0,
+    AwarenessLevel.PASSIVE: 0.5,
+    AwarenessLevel.ALERT: 1,
+    AwarenessLevel.FOCUSED: 2,
+    AwarenessLevel.DEEP: 3,
+}
+
+# Rows marked pending are stepped together this many seconds later
+STEP_DELAY = 1.0
+# Step interval while nothing wakes the job
+IDLE_STEP_INTERVAL = 3600.0
+
+
+def _field(column: str, index: int) -> property:
+    """Property reading/writing one cell of a store column."""
+
+    def fget(self) -> float:
+        return float(getattr(self._store, column)[self._row, index])
+
+    def fset(self, value: float) -> None:
+        getattr(self._store, column)[self._row, index] = value
+
+    return property(fget, fset)
+
+
+class BiologicalStateView(BiologicalState):
+    """BiologicalState backed by a row of the VitalStateStore."""
+
+    def __init__(self, store: "VitalStateStore", row: int):
+        self._store = store
+        self._row = row
+
+
+class NeedsStateView(NeedsState):
+    """NeedsState backed by a row of the VitalStateStore."""
+
+    def __init__(self, store: "VitalStateStore", row: int):
+        self._store = store
+        self._row = row
+
+
+for _index, _name in enumerate(BIO_FIELDS):
+    setattr(BiologicalStateView, _name, _field("bio", _index))
+for _index, _name in enumerate(NEED_FIELDS):
+    setattr(NeedsStateView, _name, _field("needs", _index))
+
+
+class VitalNeedsSystem(NeedsSystem):
+    """NeedsSystem whose state lives in the VitalStateStore."""
+
+    def __init__(self, store: "VitalStateStore", row: int):
+        self.store = store
+        self.row = row
+        self.state = NeedsStateView(store, row)
+
+    @property
+    def last_update(self) -> datetime:
+        return datetime.fromtimestamp(self.store.last_update[self.row])
+
+    def update(self) -> Dict[str, float]:
+        """Grow this row's needs now (the store normally does it in batch)."""
+        before = self.store.needs[self.row].copy()
+        self.store.step(rows=np.array([self.row]), biological=False)
+        return dict(zip(NEED_FIELDS, (self.store.needs[self.row] - before).tolist()))
+
+    def get_urges(self, threshold: float = 70.0) -> List[Tuple[str, float]]:
+        """Get needs that have become urges (above threshold)."""
+        return self.store.urges(threshold, rows=[self.row]).get(self.row, [])
+
+    def suggest_domain(self) -> LifeDomain:
+        """Suggest a life domain based on strongest need."""
+        return self.store.suggest_domains(rows=[self.row])[self.row]
+
+
+class VitalStateStore:
+    """Struct-of-arrays store for the numeric state of many Minds."""
+
+    def __init__(self, capacity: int = 1024):
+        self._capacity = 0
+        self._size = 0  # High-water mark of allocated rows
+        self._free: List[int] = []
+        self._job = None
+        self._job_loop = None
+
+        self.bio = np.zeros((0, len(BIO_FIELDS)))
+        self.needs = np.zeros((0, len(NEED_FIELDS)))
+        self.last_update = np.zeros(0)                # Epoch seconds of the last needs update
+        self.timezone_offset = np.zeros(0, dtype=np.int16)
+        self.awareness = np.zeros(0, dtype=np.int8)
+        self.resting = np.zeros(0, dtype=bool)
+        self.pending = np.zeros(0, dtype=bool)        # Row waits for its next step
+        self.allocated = np.zeros(0, dtype=bool)
+        self._grow(capacity)
+
+        self._bio_defaults = np.array([getattr(BiologicalState(), f) for f in BIO_FIELDS])
+        self._need_defaults = np.array([getattr(NeedsState(), f) for f in NEED_FIELDS])
+        self._growth_per_hour = np.array([NeedsSystem.NEED_GROWTH_RATES[f] for f in NEED_FIELDS])
+        self._depletion = np.array([ENERGY_DEPLETION[level] for level in sorted(ENERGY_DEPLETION)])
+        self._alertness_by_hour = np.array([
+            CircadianClock.PHASE_ALERTNESS[CircadianClock.phase_for_hour(hour)] for hour in range(24)
+        ])
+        self._need_domains = [NEED_DOMAINS[f] for f in NEED_FIELDS]
+
+        self.steps = 0
+        self.rows_stepped = 0
+
+    def __len__(self) -> int:
+        return int(self.allocated[:self._size].sum())
+
+    def _grow(self, capacity: int) -> None:
+        """Grow every column to ``capacity`` rows (views index rows, so they stay valid)."""
+        extra = capacity - self._capacity
+        if extra <= 0:
+            return
+        self.bio = np.vstack([self.bio, np.zeros((extra, self.bio.shape[1]))])
+        self.needs = np.vstack([self.needs, np.zeros((extra, self.needs.shape[1]))])
+        self.last_update = np.concatenate([self.last_update, np.zeros(extra)])
+        self.timezone_offset = np.concatenate([self.timezone_offset, np.zeros(extra, dtype=np.int16)])
+        self.awareness = np.concatenate([self.awareness, np.zeros(extra, dtype=np.int8)])
+        self.resting = np.concatenate([self.resting, np.zeros(extra, dtype=bool)])
+        self.pending = np.concatenate([self.pending, np.zeros(extra, dtype=bool)])
+        self.allocated = np.concatenate([self.allocated, np.zeros(extra, dtype=bool)])
+        self._capacity = capacity
+
+    # ------------------------------------------------------------------
+    # Rows
+    # ------------------------------------------------------------------
+
+    def allocate(self, timezone_offset: int = 0, now: Optional[datetime] = None) -> int:
+        """Allocate a row with default state and return its index."""
+        if self._free:
+            row = self._free.pop()
+        else:
+            if self._size == self._capacity:
+                self._grow(max(self._capacity * 2, 16))
+            row = self._size
+            self._size += 1
+
+        self.bio[row] = self._bio_defaults
+        self.needs[row] = self._need_defaults
+        self.last_update[row] = (now or clock.now()).timestamp()
+        self.timezone_offset[row] = timezone_offset
+        self.awareness[row] = AwarenessLevel.PASSIVE
+        self.resting[row] = False
+        self.pending[row] = False
+        self.allocated[row] = True
+        return row
+
+    def release(self, row: int) -> None:
+        """Free a row for reuse."""
+        if 0 <= row < self._size and self.allocated[row]:
+            self.allocated[row] = False
+            self.pending[row] = False
+            self._free.append(row)
+
+    def biological(self, row: int) -> BiologicalStateView:
+        """Biological state view of a row."""
+        return BiologicalStateView(self, row)
+
+    def needs_system(self, row: int) -> VitalNeedsSystem:
+        """NeedsSystem view of a row."""
+        return VitalNeedsSystem(self, row)
+
+    def mark_pending(self, row: int, awareness: AwarenessLevel, resting: bool) -> None:
+        """Queue a row for the next step with the awareness/domain of its last tick."""
+        self.awareness[row] = int(awareness)
+        self.resting[row] = resting
+        self.pending[row] = True
+        if self._job is not None:
+            # Batches every row marked within the delay into one step
+            self._job.wake(STEP_DELAY)
+
+    # ------------------------------------------------------------------
+    # Vectorized update
+    # ------------------------------------------------------------------
+
+    def step(
+        self,
+        now: Optional[datetime] = None,
+        rows: Optional[np.ndarray] = None,
+        biological: bool = True
+    ) -> int:
+        """
+        Update pending rows (or the given rows) in one vectorized pass.
+
+        Applies the same rules as a single engine tick: needs grow with the
+        time since their last update; alertness follows the circadian curve
+        damped by fatigue; energy and fatigue recover while resting and
+        deplete by awareness level otherwise.
+
+        Args:
+            now: Current time (default: clock.now())
+            rows: Rows to update (default: every pending row)
+            biological: Also apply the per-tick biological update
+
+        Returns:
+            Number of rows updated
+        """
+        if rows is None:
+            rows = np.flatnonzero(self.pending[:self._size])
+        if rows.size == 0:
+            return 0
+        now = now or clock.now()
+
+        # Needs grow with elapsed time
+        hours = (now.timestamp() - self.last_update[rows]) / 3600
+        needs = self.needs[rows] + hours[:, None] * self._growth_per_hour
+        np.minimum(needs, 100.0, out=needs)
+        self.needs[rows] = needs
+        self.last_update[rows] = now.timestamp()
+
+        if biological:
+            bio = self.bio[rows]
+            energy, fatigue = bio[:, 0], bio[:, 2]
+
+            local_hour = (now.hour + self.timezone_offset[rows]) % 24
+            bio[:, 1] = 70 * self._alertness_by_hour[local_hour] * (1 - fatigue / 200)
+
+            resting = self.resting[rows]
+            depletion = self._depletion[self.awareness[rows]]
+            bio[:, 0] = np.where(resting, np.minimum(100, energy + 5), np.maximum(0, energy - depletion))
+            bio[:, 2] = np.where(resting, np.maximum(0, fatigue - 10), np.minimum(100, fatigue + depletion * 0.5))
+            self.bio[rows] = bio
+            self.pending[rows] = False
+
+        self.steps += 1
+        self.rows_stepped += int(rows.size)
+        return int(rows.size)
+
+    # ------------------------------------------------------------------
+    # Batched queries
+    # ------------------------------------------------------------------
+
+    def _rows(self, rows: Optional[Sequence[int]]) -> np.ndarray:
+        if rows is None:
+            return np.flatnonzero(self.allocated[:self._size])
+        return np.asarray(rows, dtype=np.intp)
+
+    def strongest_needs(self, rows: Optional[Sequence[int]] = None) -> Dict[int, Tuple[str, float]]:
+        """Most pressing need per row (argmax over the needs columns)."""
+        rows = self._rows(rows)
+        needs = self.needs[rows]
+        best = needs.argmax(axis=1)
+        values = needs[np.arange(rows.size), best]
+        return {
+            int(row): (NEED_FIELDS[i], float(value))
+            for row, i, value in zip(rows, best, values)
+        }
+
+    def suggest_domains(self, rows: Optional[Sequence[int]] = None) -> Dict[int, LifeDomain]:
+        """Suggested life domain per row, from its strongest need."""
+        rows = self._rows(rows)
+        best = self.needs[rows].argmax(axis=1)
+        return {int(row): self._need_domains[i] for row, i in zip(rows, best)}
+
+    def urges(self, threshold: float = 70.0, rows: Optional[Sequence[int]] = None) -> Dict[int, List[Tuple[str, float]]]:
+        """Needs at or above threshold per row, strongest first (rows without urges omitted)."""
+        rows = self._rows(rows)
+        needs = self.needs[rows]
+        mask = needs >= threshold
+        result = {}
+        for position in np.flatnonzero(mask.any(axis=1)):
+            values = needs[position]
+            indices = np.flatnonzero(mask[position])
+            ordered = indices[np.argsort(-values[indices], kind="stable")]
+            result[int(rows[position])] = [(NEED_FIELDS[i], float(values[i])) for i in ordered]
+        return result
+
+    # ------------------------------------------------------------------
+    # Scheduling
+    # ------------------------------------------------------------------
+
+    def ensure_scheduled(self) -> None:
+        """
+        Run ``step`` on the shared MindScheduler (once per event loop).
+
+        The job sleeps while no row is pending; ``mark_pending`` wakes it.
+        """
+        loop = asyncio.get_running_loop()
+        if self._job is not None and not self._job.cancelled and self._job_loop is loop:
+            return
+
+        from genesis.core.mind_scheduler import get_mind_scheduler
+
+        async def step_job() -> None:
+            self.step()
+
+        self._job = get_mind_scheduler().schedule(
+            step_job,
+            interval=IDLE_STEP_INTERVAL,
+            owner="vital_state",
+            name="vital_state_step",
+        )
+        self._job_loop = loop
+
+    def get_stats(self) -> Dict[str, int]:
+        """Store statistics."""
+        return {
+            "rows": len(self),
+            "capacity": self._capacity,
+            "pending": int(self.pending[:self._size].sum()),
+            "steps": self.steps,
+            "rows_stepped": self.rows_stepped,
+        }
+
+
+_vital_state_store: Optional[VitalStateStore] = None
+
+
+def get_vital_state_store() -> VitalStateStore:
+    """Get the process-wide vital state store."""
+    global _vital_state_store
+    if _vital_state_store is None:
+        _vital_state_store = VitalStateStore()
+    return _vital_state_store
+
+
+def benchmark(minds: int = 10000, ticks: int = 200) -> Dict[str, float]:
+    """Time one vectorized step over ``minds`` pending rows."""
+    store = VitalStateStore(capacity=minds)
+    rows = [store.allocate(timezone_offset=i % 24 - 12) for i in range(minds)]
+    levels = list(AwarenessLevel)
+
+    elapsed = 0.0
+    for tick in range(ticks):
+        for row in rows:
+            store.mark_pending(row, levels[(row + tick) % len(levels)], resting=row % 7 == 0)
+        started = time_module.perf_counter()
+        store.step()
+        elapsed += time_module.perf_counter() - started
+
+    started = time_module.perf_counter()
+    store.suggest_domains()
+    suggest_ms = (time_module.perf_counter() - started) * 1000
+
+    return {
+        "minds": minds,
+        "ticks": ticks,
+        "step_ms": elapsed / ticks * 1000,
+        "step_us_per_mind": elapsed / ticks / minds * 1e6,
+        "suggest_domains_ms": suggest_ms,
+    }
+
+
+if __name__ == "__main__":
+    import sys
+
+    result = benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
+    print(
+        f"{result['minds']} Minds: {result['step_ms']:.3f} ms per step "
+        f"({result['step_us_per_mind']:.3f} us/Mind), "
+        f"suggest_domains {result['suggest_domains_ms']:.3f} ms"
+    )
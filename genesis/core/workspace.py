@@ -1,11 +1,17 @@
 ﻿"""Workspace file management for Genesis Minds."""
 
+import asyncio
+import json
+import os
 import secrets
+import shutil
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, List
+from typing import Any, AsyncIterator, Optional, List, Union
 from pydantic import BaseModel, Field
 
+from genesis.storage.blob_store import get_blob_store
+
 
 class MindFile(BaseModel):
     """A file owned by a Mind in their workspace."""
@@ -18,6 +24,7 @@ class MindFile(BaseModel):
     filepath: str  # Relative to Mind's workspace
     file_type: str  # text, code, data, image, etc.
     size_bytes: int = 0
+    content_hash: Optional[str] = None  # SHA-256 of the content blob (None for legacy files)
 
     # Access control
     is_private: bool = True
@@ -57,6 +64,17 @@ class WorkspaceManager:
 
     Each Mind has a workspace directory where they can store files,
     data, and creations. This provides persistence between sessions.
+
+    File content lives in a content-addressed BlobStore shared by all
+    workspaces (``<workspace_root>/.blobs``), so identical files across
+    Minds are stored once. The file under the Mind's workspace directory is
+    a hard link to its blob (a copy where links are unsupported) - it is
+    replaced, never written in place, when the file is updated.
+
+    The file registry holds the blob references, so it is written to
+    ``<workspace>/.files.json`` on every change rather than only with the
+    Mind's state - otherwise a restart before the next save would leave
+    blob reference counts that no file accounts for.
     """
 
     def __init__(self, mind_gmid: str, workspace_root: Optional[Path] = None):
@@ -79,9 +97,84 @@ class WorkspaceManager:
 
         # File registry
         self.files: dict[str, MindFile] = {}
+        self.registry_path = self.workspace_path / ".files.json"
+
+        # Shared content store
+        self.blobs = get_blob_store(self.workspace_root / ".blobs")
 
         # Create workspace directory
         self.workspace_path.mkdir(parents=True, exist_ok=True)
+        self._load_registry()
+
+    def _load_registry(self) -> None:
+        """Load the file registry persisted by _save_registry."""
+        if self.registry_path.exists():
+            data = json.loads(self.registry_path.read_text(encoding="utf-8"))
+            self.files = {file_id: MindFile(**file_data) for file_id, file_data in data.items()}
+
+    def _save_registry(self) -> None:
+        """Persist the file registry (atomic replace)."""
+        data = {file_id: file.model_dump(mode="json") for file_id, file in self.files.items()}
+        tmp_path = self.registry_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(data), encoding="utf-8")
+        os.replace(tmp_path, self.registry_path)
+
+    def _new_file(
+        self,
+        filename: str,
+        content_hash: str,
+        size_bytes: int,
+        file_type: str,
+        description: Optional[str],
+        tags: Optional[List[str]],
+        is_private: bool,
+    ) -> MindFile:
+        """Register a file record for stored content."""
+        filepath = self.workspace_path / filename
+        mind_file = MindFile(
+            owner_gmid=self.mind_gmid,
+            filename=filename,
+            filepath=str(filepath.relative_to(self.workspace_path)),
+            file_type=file_type,
+            size_bytes=size_bytes,
+            content_hash=content_hash,
+            is_private=is_private,
+            description=description,
+            tags=tags or []
+        )
+        self.files[mind_file.file_id] = mind_file
+        self._save_registry()
+        return mind_file
+
+    def _link_view(self, mind_file: MindFile) -> None:
+        """Point the workspace path of a file at its blob."""
+        view = self.workspace_path / mind_file.filepath
+        view.parent.mkdir(parents=True, exist_ok=True)
+        if view.exists() or view.is_symlink():
+            view.unlink()
+        try:
+            os.link(self.blobs.path(mind_file.content_hash), view)
+        except OSError:
+            shutil.copyfile(self.blobs.path(mind_file.content_hash), view)
+
+    def get_file(self, file_id: str, requesting_gmid: Optional[str] = None) -> MindFile:
+        """Look up a file and check access."""
+        mind_file = self.files.get(file_id)
+        if not mind_file:
+            raise ValueError(f"File {file_id} not found")
+
+        # Check access
+        if requesting_gmid and not mind_file.can_access(requesting_gmid):
+            raise ValueError(f"Access denied to file {file_id}")
+
+        return mind_file
+
+    def get_file_path(self, file_id: str) -> Path:
+        """Path to a file's content on disk (the blob for stored files)."""
+        mind_file = self.get_file(file_id)
+        if mind_file.content_hash:
+            return self.blobs.path(mind_file.content_hash)
+        return self.workspace_path / mind_file.filepath
 
     def create_file(
         self,
@@ -106,25 +199,51 @@ class WorkspaceManager:
         Returns:
             The created MindFile record
         """
-        filepath = self.workspace_path / filename
-
-        # Write content to file
-        filepath.write_text(content)
-        size_bytes = len(content.encode('utf-8'))
+        content_hash, size_bytes = self.blobs.put_bytes(content.encode('utf-8'))
 
-        # Create file record
-        mind_file = MindFile(
-            owner_gmid=self.mind_gmid,
-            filename=filename,
-            filepath=str(filepath.relative_to(self.workspace_path)),
-            file_type=file_type,
-            size_bytes=size_bytes,
-            is_private=is_private,
-            description=description,
-            tags=tags or []
+        mind_file = self._new_file(
+            filename, content_hash, size_bytes, file_type, description, tags, is_private
         )
+        self._link_view(mind_file)
+        return mind_file
 
-        self.files[mind_file.file_id] = mind_file
+    async def create_file_async(
+        self,
+        filename: str,
+        content: Union[str, bytes, Any] = b"",
+        file_type: str = "text",
+        description: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        is_private: bool = True
+    ) -> MindFile:
+        """
+        Create a new file without blocking the event loop.
+
+        Args:
+            filename: Name of the file
+            content: Text, bytes, an async iterator of byte chunks, or an
+                object with async ``read(size)`` (e.g. an UploadFile) -
+                streams are written in chunks, never fully buffered
+            file_type: Type of file
+            description: Description of the file
+            tags: Tags for categorization
+            is_private: Whether file is private
+
+        Returns:
+            The created MindFile record
+        """
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+
+        if isinstance(content, bytes):
+            content_hash, size_bytes = await self.blobs.put_bytes_async(content)
+        else:
+            content_hash, size_bytes = await self.blobs.put_stream_async(content)
+
+        mind_file = self._new_file(
+            filename, content_hash, size_bytes, file_type, description, tags, is_private
+        )
+        await asyncio.to_thread(self._link_view, mind_file)
         return mind_file
 
     def read_file(self, file_id: str, requesting_gmid: Optional[str] = None) -> str:
@@ -141,48 +260,112 @@ class WorkspaceManager:
         Raises:
             ValueError: If file not found or access denied
         """
-        mind_file = self.files.get(file_id)
-        if not mind_file:
-            raise ValueError(f"File {file_id} not found")
-
-        # Check access
-        if requesting_gmid and not mind_file.can_access(requesting_gmid):
-            raise ValueError(f"Access denied to file {file_id}")
+        mind_file = self.get_file(file_id, requesting_gmid)
 
         # Read content
-        filepath = self.workspace_path / mind_file.filepath
-        content = filepath.read_text()
+        if mind_file.content_hash:
+            content = self.blobs.read_bytes(mind_file.content_hash).decode('utf-8')
+        else:
+            content = (self.workspace_path / mind_file.filepath).read_text()
 
         # Update access count
         mind_file.access_count += 1
 
         return content
 
+    async def read_file_async(self, file_id: str, requesting_gmid: Optional[str] = None) -> str:
+        """Read a file's text content without blocking the event loop."""
+        return (await self.read_bytes_async(file_id, requesting_gmid)).decode('utf-8')
+
+    async def read_bytes_async(
+        self,
+        file_id: str,
+        requesting_gmid: Optional[str] = None,
+        start: int = 0,
+        end: Optional[int] = None,
+    ) -> bytes:
+        """
+        Read a file's raw content, or a byte range of it.
+
+        Args:
+            file_id: File ID
+            requesting_gmid: GMID of the Mind requesting access
+            start: First byte (inclusive)
+            end: Last byte (exclusive); None reads to the end
+
+        Returns:
+            File content bytes
+        """
+        chunks = [
+            chunk async for chunk in self.iter_range_async(file_id, start, end, requesting_gmid)
+        ]
+        return b"".join(chunks)
+
+    async def iter_range_async(
+        self,
+        file_id: str,
+        start: int = 0,
+        end: Optional[int] = None,
+        requesting_gmid: Optional[str] = None,
+    ) -> AsyncIterator[bytes]:
+        """Stream a byte range of a file in chunks (for large files)."""
+        mind_file = self.get_file(file_id, requesting_gmid)
+        mind_file.access_count += 1
+
+        if mind_file.content_hash:
+            async for chunk in self.blobs.iter_range_async(mind_file.content_hash, start, end):
+                yield chunk
+        else:
+            data = (self.workspace_path / mind_file.filepath).read_bytes()
+            yield data[start:end]
+
     def update_file(self, file_id: str, content: str) -> MindFile:
         """Update a file's content."""
-        mind_file = self.files.get(file_id)
-        if not mind_file:
-            raise ValueError(f"File {file_id} not found")
+        mind_file = self.get_file(file_id)
 
-        filepath = self.workspace_path / mind_file.filepath
-        filepath.write_text(content)
+        content_hash, size_bytes = self.blobs.put_bytes(content.encode('utf-8'))
+        self._replace_content(mind_file, content_hash, size_bytes)
+        self._link_view(mind_file)
+        return mind_file
 
-        mind_file.size_bytes = len(content.encode('utf-8'))
-        mind_file.modified_at = datetime.now()
+    async def update_file_async(self, file_id: str, content: Union[str, bytes, Any]) -> MindFile:
+        """Update a file's content without blocking the event loop."""
+        mind_file = self.get_file(file_id)
 
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+        if isinstance(content, bytes):
+            content_hash, size_bytes = await self.blobs.put_bytes_async(content)
+        else:
+            content_hash, size_bytes = await self.blobs.put_stream_async(content)
+
+        self._replace_content(mind_file, content_hash, size_bytes)
+        await asyncio.to_thread(self._link_view, mind_file)
         return mind_file
 
+    def _replace_content(self, mind_file: MindFile, content_hash: str, size_bytes: int) -> None:
+        """Point a file at new content, releasing the old blob."""
+        old_hash = mind_file.content_hash
+        mind_file.content_hash = content_hash
+        mind_file.size_bytes = size_bytes
+        mind_file.modified_at = datetime.now()
+        self._save_registry()
+        if old_hash:
+            self.blobs.decref(old_hash)
+
     def delete_file(self, file_id: str) -> None:
         """Delete a file."""
-        mind_file = self.files.get(file_id)
-        if not mind_file:
-            raise ValueError(f"File {file_id} not found")
+        mind_file = self.get_file(file_id)
 
         filepath = self.workspace_path / mind_file.filepath
         if filepath.exists():
             filepath.unlink()
 
         del self.files[file_id]
+        self._save_registry()
+
+        if mind_file.content_hash:
+            self.blobs.decref(mind_file.content_hash)
 
     def list_files(
         self,
@@ -207,10 +390,24 @@ class WorkspaceManager:
         for f in self.files.values():
             file_types[f.file_type] = file_types.get(f.file_type, 0) + 1
 
+        # Identical files within this workspace share one blob
+        unique_blobs = {f.content_hash: f.size_bytes for f in self.files.values() if f.content_hash}
+        legacy_size = sum(f.size_bytes for f in self.files.values() if not f.content_hash)
+        unique_size = sum(unique_blobs.values()) + legacy_size
+
+        try:
+            store_stats = self.blobs.get_stats()
+        except Exception:
+            store_stats = {}
+
         return {
             "total_files": len(self.files),
             "total_size_bytes": total_size,
             "total_size_mb": round(total_size / (1024 * 1024), 2),
+            "unique_size_bytes": unique_size,
+            "dedup_saved_bytes": total_size - unique_size,
+            "store_dedup_saved_bytes": store_stats.get("dedup_saved_bytes", 0),
+            "store_physical_bytes": store_stats.get("physical_bytes", 0),
             "file_types": file_types,
             "private_files": len([f for f in self.files.values() if f.is_private]),
             "shared_files": len([f for f in self.files.values() if not f.is_private]),
@@ -224,6 +421,7 @@ class WorkspaceManager:
             raise ValueError(f"File {file_id} not found")
 
         mind_file.share_with(with_gmid)
+        self._save_registry()
         return mind_file
 
     def to_dict(self) -> dict:
@@ -245,9 +443,12 @@ class WorkspaceManager:
             workspace_root=workspace_root
         )
 
-        manager.files = {
-            file_id: MindFile(**file_data)
-            for file_id, file_data in data.get("files", {}).items()
-        }
+        # The persisted registry is at least as new as the Mind's saved state
+        if not manager.registry_path.exists():
+            manager.files = {
+                file_id: MindFile(**file_data)
+                for file_id, file_data in data.get("files", {}).items()
+            }
+            manager._save_registry()
 
         return manager
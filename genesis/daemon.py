@@ -31,7 +31,7 @@ import signal
 import sys
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Dict, Any
 from datetime import datetime
 
 # Configure logging with UTF-8 encoding to handle Unicode characters
@@ -52,6 +52,37 @@ if sys.stdout.encoding != 'utf-8':
 logger = logging.getLogger('genesis.daemon')
 
 
+def find_mind_file(mind_id: str, minds_dir: Path) -> Optional[Path]:
+    """Find a Mind's save file by GMID.
+
+    Minds are saved as ``minds_dir/<GMID>.json``, so that path is tried
+    first; other JSON files are only parsed as a fallback for legacy names.
+
+    Args:
+        mind_id: Genesis Mind ID (GMID)
+        minds_dir: Directory containing Mind save files
+
+    Returns:
+        Path to the Mind file, or None if not found
+    """
+    import json
+
+    direct = minds_dir / f"{mind_id}.json"
+    if direct.exists():
+        return direct
+
+    for path in minds_dir.glob("*.json"):
+        try:
+            with open(path) as f:
+                data = json.load(f)
+                if data["identity"]["gmid"] == mind_id:
+                    return path
+        except Exception as e:
+            logger.debug(f"Error reading {path}: {e}")
+            continue
+    return None
+
+
 class MindDaemon:
     """Run a Mind as a 24/7 background daemon."""
 
@@ -66,7 +97,13 @@ class MindDaemon:
         self.mind: Optional['Mind'] = None
         self.is_running = False
         self.save_interval = 300  # Save every 5 minutes
+        self.health_interval = 60  # Health check every minute
+        self.autonomous_interval = 300  # Autonomous decision every 5 minutes
+        self.proactive_conversation_interval = 60  # Follow-up check every minute
         self._shutdown_event = asyncio.Event()
+        self._health_check_count = 0
+        self._ai_engine = None
+        self._retention = None
         
         # Setup file logging if path provided
         if log_file:
@@ -78,147 +115,18 @@ class MindDaemon:
             logger.addHandler(file_handler)
 
     async def start(self):
-        """Start the Mind daemon."""
+        """Start the Mind daemon and run until a shutdown signal."""
         try:
-            # Import here to avoid circular dependencies
-            from genesis.core.mind import Mind
-            from genesis.config import get_settings
-            import json
-
-            # Find Mind file by GMID
-            logger.info(f"Loading Mind {self.mind_id}...")
-            settings = get_settings()
-            mind_path = None
-            
-            for path in settings.minds_dir.glob("*.json"):
-                try:
-                    with open(path) as f:
-                        data = json.load(f)
-                        if data["identity"]["gmid"] == self.mind_id:
-                            mind_path = path
-                            break
-                except Exception as e:
-                    logger.debug(f"Error reading {path}: {e}")
-                    continue
-            
-            if not mind_path:
-                raise RuntimeError(f"Mind file not found for GMID {self.mind_id}")
-            
-            logger.info(f"Found Mind file: {mind_path}")
-            
-            # Load Mind with detailed error reporting
-            try:
-                self.mind = Mind.load(mind_path)
-            except Exception as load_error:
-                logger.error(f"[ERROR] Failed to load Mind from {mind_path}", exc_info=True)
-                logger.error(f"Error details: {load_error}")
-                raise
-
-            # Verify Mind loaded
-            if not self.mind:
-                raise RuntimeError(f"Failed to load Mind {self.mind_id}")
-
-            logger.info(f"[OK] Mind {self.mind.identity.name} ({self.mind_id}) loaded")
-            
-            # Log Mind configuration
-            logger.info(f"   Configuration:")
-            logger.info(f"   - Consciousness: 24/7 Active")
-            logger.info(f"   - Proactive Consciousness: {'Enabled' if hasattr(self.mind, 'proactive_consciousness') else 'Disabled'}")
-            logger.info(f"   - Notification Manager: {'Enabled' if hasattr(self.mind, 'notification_manager') else 'Disabled'}")
-            logger.info(f"   - Plugins: {len(self.mind.plugins)} loaded")
-
-            # Start consciousness engine (with comprehensive error handling)
-            logger.info("Starting consciousness engine...")
-            try:
-                await self.mind.start_living()
-                logger.info("[OK] Consciousness engine started")
-            except Exception as e:
-                logger.error(f"[ERROR] Failed to start consciousness: {e}", exc_info=True)
-                raise
-
-            # Start action scheduler for autonomous actions
-            logger.info("Starting action scheduler...")
-            if hasattr(self.mind, 'action_scheduler'):
-                try:
-                    await self.mind.action_scheduler.start()
-                    logger.info("[OK] Action scheduler active")
-                except Exception as e:
-                    logger.error(f"[WARN] Action scheduler failed: {e}")
-                    # Don't fail daemon if scheduler fails
-            else:
-                logger.warning("[WARN] No action scheduler found")
-            
-            # Start notification manager for proactive messaging
-            logger.info("Starting notification manager...")
-            if hasattr(self.mind, 'notification_manager'):
-                try:
-                    await self.mind.notification_manager.start()
-                    logger.info("[OK] Notification manager active")
-                except Exception as e:
-                    logger.error(f"[WARN] Notification manager failed: {e}")
-            else:
-                logger.warning("[WARN] No notification manager found")
+            await self.launch()
 
             # Register signal handlers for graceful shutdown
             self._register_signal_handlers()
 
-            # Start periodic save task
-            save_task = asyncio.create_task(self._periodic_save())
-
-            # Start health monitoring
-            health_task = asyncio.create_task(self._health_monitor())
-            
-            # Start autonomous decision making loop
-            autonomous_task = asyncio.create_task(self._autonomous_loop())
-            
-            # Start proactive conversation monitoring
-            proactive_task = None
-            if hasattr(self.mind, 'proactive_conversation'):
-                try:
-                    await self.mind.proactive_conversation.start_monitoring(check_interval=60)
-                    proactive_task = asyncio.create_task(self._proactive_conversation_loop())
-                    logger.info("[OK] Proactive conversation monitoring started")
-                except Exception as e:
-                    logger.error(f"[WARN] Failed to start proactive conversation monitoring: {e}")
-
-            self.is_running = True
-            logger.info(f"[ACTIVE] Mind {self.mind.identity.name} is now living 24/7")
-            logger.info(f"   - Consciousness: Active")
-            logger.info(f"   - Actions: Autonomous")
-            logger.info(f"   - Proactive: {'Yes' if hasattr(self.mind, 'proactive_consciousness') else 'No'}")
             logger.info(f"   Press Ctrl+C to stop gracefully")
 
             # Wait for shutdown signal
             await self._shutdown_event.wait()
 
-            # Cleanup
-            save_task.cancel()
-            health_task.cancel()
-            autonomous_task.cancel()
-            if proactive_task:
-                proactive_task.cancel()
-            
-            try:
-                await save_task
-            except asyncio.CancelledError:
-                pass
-            
-            try:
-                await health_task
-            except asyncio.CancelledError:
-                pass
-            
-            try:
-                await autonomous_task
-            except asyncio.CancelledError:
-                pass
-            
-            if proactive_task:
-                try:
-                    await proactive_task
-                except asyncio.CancelledError:
-                    pass
-
         except KeyboardInterrupt:
             logger.info("Received keyboard interrupt")
         except Exception as e:
@@ -227,6 +135,146 @@ class MindDaemon:
         finally:
             await self.stop()
 
+    async def launch(self):
+        """Load the Mind and start all of its subsystems and daemon jobs.
+
+        Returns once everything is running; used directly by MindHost to run
+        many Minds in one process.
+        """
+        # Import here to avoid circular dependencies
+        from genesis.core.mind import Mind
+        from genesis.config import get_settings
+
+        # Find Mind file by GMID
+        logger.info(f"Loading Mind {self.mind_id}...")
+        settings = get_settings()
+        mind_path = find_mind_file(self.mind_id, settings.minds_dir)
+        
+        if not mind_path:
+            raise RuntimeError(f"Mind file not found for GMID {self.mind_id}")
+        
+        logger.info(f"Found Mind file: {mind_path}")
+        
+        # Load Mind with detailed error reporting
+        try:
+            self.mind = Mind.load(mind_path)
+        except Exception as load_error:
+            logger.error(f"[ERROR] Failed to load Mind from {mind_path}", exc_info=True)
+            logger.error(f"Error details: {load_error}")
+            raise
+
+        # Verify Mind loaded
+        if not self.mind:
+            raise RuntimeError(f"Failed to load Mind {self.mind_id}")
+
+        logger.info(f"[OK] Mind {self.mind.identity.name} ({self.mind_id}) loaded")
+        
+        # Log Mind configuration
+        logger.info(f"   Configuration:")
+        logger.info(f"   - Consciousness: 24/7 Active")
+        logger.info(f"   - Proactive Consciousness: {'Enabled' if hasattr(self.mind, 'proactive_consciousness') else 'Disabled'}")
+        logger.info(f"   - Notification Manager: {'Enabled' if hasattr(self.mind, 'notification_manager') else 'Disabled'}")
+        logger.info(f"   - Plugins: {len(self.mind.plugins)} loaded")
+
+        # Start consciousness engine (with comprehensive error handling)
+        logger.info("Starting consciousness engine...")
+        try:
+            await self.mind.start_living()
+            logger.info("[OK] Consciousness engine started")
+        except Exception as e:
+            logger.error(f"[ERROR] Failed to start consciousness: {e}", exc_info=True)
+            raise
+
+        # Start action scheduler for autonomous actions
+        logger.info("Starting action scheduler...")
+        if hasattr(self.mind, 'action_scheduler'):
+            try:
+                await self.mind.action_scheduler.start()
+                logger.info("[OK] Action scheduler active")
+            except Exception as e:
+                logger.error(f"[WARN] Action scheduler failed: {e}")
+                # Don't fail daemon if scheduler fails
+        else:
+            logger.warning("[WARN] No action scheduler found")
+        
+        # Start notification manager for proactive messaging
+        logger.info("Starting notification manager...")
+        if hasattr(self.mind, 'notification_manager'):
+            try:
+                await self.mind.notification_manager.start()
+                logger.info("[OK] Notification manager active")
+            except Exception as e:
+                logger.error(f"[WARN] Notification manager failed: {e}")
+        else:
+            logger.warning("[WARN] No notification manager found")
+
+        # Periodic daemon work runs as jobs on the shared MindScheduler
+        # instead of one sleeping task per loop
+        from genesis.core.mind_scheduler import get_mind_scheduler
+        scheduler = get_mind_scheduler()
+
+        # Periodic save
+        scheduler.schedule(
+            self._periodic_save, interval=self.save_interval,
+            owner=self.mind_id, name="daemon_save", jitter=0.1,
+        )
+
+        # Health monitoring
+        scheduler.schedule(
+            self._health_monitor, interval=self.health_interval,
+            owner=self.mind_id, name="daemon_health", jitter=0.1,
+        )
+        
+        # Conversation retention (compact old history into summaries + archives)
+        from genesis.storage.conversation_retention import ConversationRetention, fast_model_summarizer
+        self._retention = ConversationRetention(
+            self.mind_id,
+            archive_dir=settings.data_dir / "conversation_archive",
+            summarize=fast_model_summarizer(self.mind),
+            hot_days=settings.conversation_hot_days,
+            hot_messages=settings.conversation_hot_messages,
+            span_size=settings.conversation_summary_span,
+        )
+        scheduler.schedule(
+            self._conversation_retention, interval=settings.conversation_retention_interval,
+            owner=self.mind_id, name="daemon_conversation_retention", jitter=0.1,
+        )
+
+        # Memory tiers (demote least relevant memories, archive the coldest)
+        if settings.memory_tiering_enabled:
+            scheduler.schedule(
+                self._memory_tiering, interval=settings.memory_tiering_interval,
+                owner=self.mind_id, name="daemon_memory_tiering", jitter=0.1,
+            )
+        
+        # Autonomous decision making
+        self._start_autonomous_engine()
+        scheduler.schedule(
+            self._autonomous_loop, interval=self.autonomous_interval,
+            owner=self.mind_id, name="daemon_autonomous", jitter=0.1,
+        )
+        
+        # Proactive conversation monitoring
+        if hasattr(self.mind, 'proactive_conversation'):
+            try:
+                await self.mind.proactive_conversation.start_monitoring(
+                    check_interval=self.proactive_conversation_interval
+                )
+                scheduler.schedule(
+                    self._proactive_conversation_loop,
+                    interval=self.proactive_conversation_interval,
+                    owner=self.mind_id, name="daemon_proactive_conversation", jitter=0.1,
+                )
+                logger.info("[OK] Proactive conversation monitoring started")
+            except Exception as e:
+                logger.error(f"[WARN] Failed to start proactive conversation monitoring: {e}")
+
+        self.is_running = True
+        logger.info(f"[ACTIVE] Mind {self.mind.identity.name} is now living 24/7")
+        logger.info(f"   - Consciousness: Active")
+        logger.info(f"   - Actions: Autonomous")
+        logger.info(f"   - Proactive: {'Yes' if hasattr(self.mind, 'proactive_consciousness') else 'No'}")
+
     async def stop(self):
         """Gracefully stop the daemon."""
         if not self.is_running:
@@ -236,6 +284,12 @@ class MindDaemon:
 
         self.is_running = False
 
+        # Cancel this Mind's daemon jobs on the shared scheduler
+        from genesis.core.mind_scheduler import get_mind_scheduler
+        for job in get_mind_scheduler().get_jobs(owner=self.mind_id):
+            if job.name.startswith("daemon_"):
+                job.cancel()
+
         if self.mind:
             # Stop consciousness
             if hasattr(self.mind, 'consciousness'):
@@ -249,6 +303,13 @@ class MindDaemon:
             if hasattr(self.mind, 'proactive_conversation'):
                 await self.mind.proactive_conversation.stop_monitoring()
 
+            # Stop the LivingMind heartbeat, notification delivery and proactive consciousness
+            if hasattr(self.mind, 'stop_living'):
+                try:
+                    await self.mind.stop_living()
+                except Exception as e:
+                    logger.error(f"Failed to stop living systems: {e}")
+
             # Save final state
             logger.info("Saving final state...")
             try:
@@ -257,293 +318,290 @@ class MindDaemon:
             except Exception as e:
                 logger.error(f"Failed to save final state: {e}")
 
+        # Drop anything else this Mind left on the shared scheduler (e.g. the LLM batch flush)
+        get_mind_scheduler().cancel_owner(self.mind_id)
+
         logger.info(f"[OK] Mind {self.mind.identity.name if self.mind else self.mind_id} stopped gracefully")
 
     async def _periodic_save(self):
-        """Periodically save Mind state."""
-        while self.is_running:
+        """Periodically save Mind state (scheduler job)."""
+        if self.mind and self.is_running:
             try:
-                await asyncio.sleep(self.save_interval)
-
-                if self.mind and self.is_running:
-                    logger.debug("Saving Mind state...")
-                    self.mind.save()
-                    logger.debug("[SAVED] State saved")
-            except asyncio.CancelledError:
-                break
+                logger.debug("Saving Mind state...")
+                self.mind.save()
+                logger.debug("[SAVED] State saved")
             except Exception as e:
                 logger.error(f"Failed to save state: {e}")
 
-    async def _health_monitor(self):
-        """Monitor Mind health and restart if needed."""
-        health_check_count = 0
-        while self.is_running:
+    async def _conversation_retention(self):
+        """Compact conversation history outside the hot window (scheduler job)."""
+        if self.mind and self.is_running:
             try:
-                await asyncio.sleep(60)  # Check every minute
-                health_check_count += 1
+                stats = await self._retention.run()
+                logger.debug(f"[RETENTION] {stats}")
+            except Exception as e:
+                logger.error(f"Conversation retention failed: {e}")
 
-                if self.mind and self.is_running:
-                    # Check consciousness is active
-                    if hasattr(self.mind, 'consciousness'):
-                        try:
-                            if hasattr(self.mind.consciousness, 'is_running'):
-                                is_active = self.mind.consciousness.is_running
+    async def _memory_tiering(self):
+        """Rebalance the Mind's hot/warm/cold memory tiers (scheduler job)."""
+        if self.mind and self.is_running and self.mind.memory.tiering:
+            try:
+                stats = await self.mind.memory.tiering.rebalance_async()
+                logger.debug(f"[MEMORY_TIERS] {stats}")
+            except Exception as e:
+                logger.error(f"Memory tiering failed: {e}")
+
+    async def _health_monitor(self):
+        """Monitor Mind health and restart if needed (scheduler job)."""
+        try:
+            self._health_check_count += 1
+            health_check_count = self._health_check_count
+
+            if self.mind and self.is_running:
+                # Check consciousness is active
+                if hasattr(self.mind, 'consciousness'):
+                    try:
+                        if hasattr(self.mind.consciousness, 'is_running'):
+                            is_active = self.mind.consciousness.is_running
+                        else:
+                            is_active = self.mind.consciousness.is_active
+                    
+                        if not is_active:
+                            logger.warning("[WARN] Consciousness inactive, restarting...")
+                            await self.mind.start_living()
+                        else:
+                            # Log basic consciousness status
+                            if hasattr(self.mind.consciousness, 'thought_count'):
+                                thought_count = self.mind.consciousness.thought_count
+                                logger.info(f"[OK] Consciousness active - {thought_count} thoughts generated")
                             else:
-                                is_active = self.mind.consciousness.is_active
-                            
-                            if not is_active:
-                                logger.warning("[WARN] Consciousness inactive, restarting...")
-                                await self.mind.start_living()
+                                logger.info(f"[OK] Consciousness active")
+                    except Exception as e:
+                        logger.error(f"Error checking consciousness: {e}")
+
+                # Log detailed health stats every 5 minutes
+                if health_check_count % 5 == 0:
+                    logger.info("\n" + "="*60)
+                    logger.info("[HEALTH] DETAILED HEALTH REPORT")
+                    logger.info("="*60)
+                
+                    # Memory stats
+                    if hasattr(self.mind, 'memory'):
+                        try:
+                            stats = self.mind.memory.get_memory_stats()
+                            recent_memories = self.mind.memory.get_recent_memories(limit=3)
+                            memory_count = stats.get('total_memories', 0)
+                            logger.info(f"[MEMORY] Memory: {memory_count} total memories")
+                            logger.info(f"   Status: {self.mind.state.status}")
+                            if recent_memories:
+                                logger.info(f"   Recent memories:")
+                                for i, mem in enumerate(recent_memories[:3], 1):
+                                    content_preview = mem.content[:80] if hasattr(mem, 'content') else str(mem)[:80]
+                                    logger.info(f"     {i}. {content_preview}...")
                             else:
-                                # Log basic consciousness status
-                                if hasattr(self.mind.consciousness, 'thought_count'):
-                                    thought_count = self.mind.consciousness.thought_count
-                                    logger.info(f"[OK] Consciousness active - {thought_count} thoughts generated")
-                                else:
-                                    logger.info(f"[OK] Consciousness active")
+                                logger.info(f"   No recent memories found")
                         except Exception as e:
-                            logger.error(f"Error checking consciousness: {e}")
-
-                    # Log detailed health stats every 5 minutes
-                    if health_check_count % 5 == 0:
-                        logger.info("\n" + "="*60)
-                        logger.info("[HEALTH] DETAILED HEALTH REPORT")
-                        logger.info("="*60)
-                        
-                        # Memory stats
-                        if hasattr(self.mind, 'memory'):
-                            try:
-                                stats = self.mind.memory.get_memory_stats()
-                                recent_memories = self.mind.memory.get_recent_memories(limit=3)
-                                memory_count = stats.get('total_memories', 0)
-                                logger.info(f"[MEMORY] Memory: {memory_count} total memories")
-                                logger.info(f"   Status: {self.mind.state.status}")
-                                if recent_memories:
-                                    logger.info(f"   Recent memories:")
-                                    for i, mem in enumerate(recent_memories[:3], 1):
-                                        content_preview = mem.content[:80] if hasattr(mem, 'content') else str(mem)[:80]
-                                        logger.info(f"     {i}. {content_preview}...")
-                                else:
-                                    logger.info(f"   No recent memories found")
-                            except Exception as e:
-                                logger.error(f"Error getting memory stats: {e}")
-                        
-                        # Consciousness stats (V2)
-                        if hasattr(self.mind, 'consciousness') and hasattr(self.mind.consciousness, 'get_state'):
-                            try:
-                                state = self.mind.consciousness.get_state()
-                                logger.info(f"[CONSCIOUSNESS] Consciousness V2:")
-                                logger.info(f"   Awareness: {state.get('awareness_level', 'unknown')}")
-                                logger.info(f"   Domain: {state.get('current_domain', 'unknown')}")
-                                logger.info(f"   Energy: {state.get('biological', {}).get('energy', 'N/A')}")
-                                logger.info(f"   LLM calls today: {state.get('llm_calls_today', 0)}")
-                            except Exception as e:
-                                logger.error(f"Error getting consciousness state: {e}")
-                        
-                        # Proactive consciousness stats
-                        if hasattr(self.mind, 'proactive_consciousness'):
-                            try:
-                                proactive_stats = self.mind.proactive_consciousness.get_stats()
-                                logger.info(f"[PROACTIVE] Proactive Consciousness:")
-                                logger.info(f"   Active concerns: {proactive_stats.get('active_concerns', 0)}")
-                                logger.info(f"   Resolved concerns: {proactive_stats.get('resolved_concerns', 0)}")
-                                concerns_by_type = proactive_stats.get('concerns_by_type', {})
-                                if concerns_by_type:
-                                    logger.info(f"   By type: Health={concerns_by_type.get('health', 0)}, Emotion={concerns_by_type.get('emotion', 0)}, Task={concerns_by_type.get('task', 0)}")
-                            except Exception as e:
-                                logger.error(f"Error getting proactive stats: {e}")
-                        
-                        # Notification stats
-                        if hasattr(self.mind, 'notification_manager'):
-                            try:
-                                notif_stats = self.mind.notification_manager.get_stats()
-                                logger.info(f"📬 Notifications:")
-                                logger.info(f"   Pending: {notif_stats.get('pending', 0)}")
-                                logger.info(f"   Delivered today: {notif_stats.get('delivered_today', 0)}")
-                                logger.info(f"   Active websockets: {notif_stats.get('active_websockets', 0)}")
-                            except Exception as e:
-                                logger.error(f"Error getting notification stats: {e}")
-                        
-                        # Activity logs
-                        if hasattr(self.mind, 'logger'):
-                            try:
-                                log_stats = self.mind.logger.get_stats()
-                                recent_logs = self.mind.logger.get_recent_logs(limit=5)
-                                logger.info(f"[LOGS] Activity: {log_stats.get('total_logs', 0)} total log entries")
-                                if recent_logs:
-                                    logger.info(f"   Recent activities:")
-                                    for i, log_entry in enumerate(recent_logs[-5:], 1):
-                                        msg = log_entry.get('message', '')[:80]
-                                        level = log_entry.get('level', 'info')
-                                        logger.info(f"     {i}. [{level.upper()}] {msg}...")
-                            except Exception as e:
-                                logger.error(f"Error getting log stats: {e}")
-                        
-                        # Dreams
-                        if hasattr(self.mind, 'dreams') and self.mind.dreams:
-                            logger.info(f"💤 Dreams: {len(self.mind.dreams)} total")
-                            if self.mind.dreams:
-                                latest_dream = self.mind.dreams[-1]
-                                narrative = latest_dream.get('narrative', '')[:100] if isinstance(latest_dream, dict) else str(latest_dream)[:100]
-                                logger.info(f"   Latest dream: {narrative}...")
-                        
-                        logger.info("="*60 + "\n")
-
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.error(f"Health check failed: {e}", exc_info=True)
-                # Don't let health check failure stop the daemon
-                continue
+                            logger.error(f"Error getting memory stats: {e}")
+                
+                    # Consciousness stats (V2)
+                    if hasattr(self.mind, 'consciousness') and hasattr(self.mind.consciousness, 'get_state'):
+                        try:
+                            state = self.mind.consciousness.get_state()
+                            logger.info(f"[CONSCIOUSNESS] Consciousness V2:")
+                            logger.info(f"   Awareness: {state.get('awareness_level', 'unknown')}")
+                            logger.info(f"   Domain: {state.get('current_domain', 'unknown')}")
+                            logger.info(f"   Energy: {state.get('biological', {}).get('energy', 'N/A')}")
+                            logger.info(f"   LLM calls today: {state.get('llm_calls_today', 0)}")
+                        except Exception as e:
+                            logger.error(f"Error getting consciousness state: {e}")
+                
+                    # Proactive consciousness stats
+                    if hasattr(self.mind, 'proactive_consciousness'):
+                        try:
+                            proactive_stats = self.mind.proactive_consciousness.get_stats()
+                            logger.info(f"[PROACTIVE] Proactive Consciousness:")
+                            logger.info(f"   Active concerns: {proactive_stats.get('active_concerns', 0)}")
+                            logger.info(f"   Resolved concerns: {proactive_stats.get('resolved_concerns', 0)}")
+                            concerns_by_type = proactive_stats.get('concerns_by_type', {})
+                            if concerns_by_type:
+                                logger.info(f"   By type: Health={concerns_by_type.get('health', 0)}, Emotion={concerns_by_type.get('emotion', 0)}, Task={concerns_by_type.get('task', 0)}")
+                        except Exception as e:
+                            logger.error(f"Error getting proactive stats: {e}")
+                
+                    # Notification stats
+                    if hasattr(self.mind, 'notification_manager'):
+                        try:
+                            notif_stats = self.mind.notification_manager.get_stats()
+                            logger.info(f"📬 Notifications:")
+                            logger.info(f"   Pending: {notif_stats.get('pending', 0)}")
+                            logger.info(f"   Delivered today: {notif_stats.get('delivered_today', 0)}")
+                            logger.info(f"   Active websockets: {notif_stats.get('active_websockets', 0)}")
+                        except Exception as e:
+                            logger.error(f"Error getting notification stats: {e}")
+                
+                    # Activity logs
+                    if hasattr(self.mind, 'logger'):
+                        try:
+                            log_stats = self.mind.logger.get_stats()
+                            recent_logs = self.mind.logger.get_recent_logs(limit=5)
+                            logger.info(f"[LOGS] Activity: {log_stats.get('total_logs', 0)} total log entries")
+                            if recent_logs:
+                                logger.info(f"   Recent activities:")
+                                for i, log_entry in enumerate(recent_logs[-5:], 1):
+                                    msg = log_entry.get('message', '')[:80]
+                                    level = log_entry.get('level', 'info')
+                                    logger.info(f"     {i}. [{level.upper()}] {msg}...")
+                        except Exception as e:
+                            logger.error(f"Error getting log stats: {e}")
+                
+                    # Dreams
+                    if hasattr(self.mind, 'dreams') and self.mind.dreams:
+                        logger.info(f"💤 Dreams: {len(self.mind.dreams)} total")
+                        if self.mind.dreams:
+                            latest_dream = self.mind.dreams[-1]
+                            narrative = latest_dream.get('narrative', '')[:100] if isinstance(latest_dream, dict) else str(latest_dream)[:100]
+                            logger.info(f"   Latest dream: {narrative}...")
+                
+                    logger.info("="*60 + "\n")
+
+        except Exception as e:
+            logger.error(f"Health check failed: {e}", exc_info=True)
+            # Don't let health check failure stop the daemon
+
+    def _start_autonomous_engine(self):
+        """Initialize the autonomous intelligence engine."""
+        from genesis.core.autonomous_intelligence import AutonomousIntelligence
+        
+        self._ai_engine = AutonomousIntelligence(self.mind)
+        
+        logger.info("\n" + "🧠 AUTONOMOUS INTELLIGENCE ENGINE ACTIVATED")
+        logger.info("   This Mind will now think and act independently")
+        logger.info(f"   Decision cycle: Every {self.autonomous_interval/60:.0f} minutes\n")
 
     async def _autonomous_loop(self):
         """
-        Autonomous decision making and action execution loop.
+        Autonomous decision making and action execution (scheduler job).
         
         This is the BRAIN of the daemon - makes intelligent decisions about
         what to do next based on context, goals, memory, and learned patterns.
         
         This makes Genesis truly autonomous - not just reactive, but proactive.
         """
-        # Initialize autonomous intelligence engine
-        from genesis.core.autonomous_intelligence import AutonomousIntelligence
-        
-        ai_engine = AutonomousIntelligence(self.mind)
-        check_interval = 300  # Check every 5 minutes
-        
-        logger.info("\n" + "🧠 AUTONOMOUS INTELLIGENCE ENGINE ACTIVATED")
-        logger.info("   This Mind will now think and act independently")
-        logger.info(f"   Decision cycle: Every {check_interval/60:.0f} minutes\n")
+        ai_engine = self._ai_engine
+        if not ai_engine or not self.mind or not self.is_running:
+            return
         
-        while self.is_running:
-            try:
-                await asyncio.sleep(check_interval)
-                
-                if not self.mind or not self.is_running:
-                    continue
-                
-                # Check if Mind should take autonomous actions
-                if not self.mind.autonomy.proactive_actions:
-                    logger.debug("   Autonomous actions disabled, skipping cycle")
-                    continue
-                
-                from genesis.core.autonomy import InitiativeLevel
-                
-                # Only take autonomous actions if initiative level allows it
-                if self.mind.autonomy.initiative_level in [InitiativeLevel.LOW, InitiativeLevel.NONE]:
-                    logger.debug(f"   Initiative level too low ({self.mind.autonomy.initiative_level.value}), skipping")
-                    continue
-                
-                # Check if enough time has passed
-                if not await ai_engine.should_make_decision():
-                    logger.debug("   Decision cooldown active, waiting...")
-                    continue
+        try:
+            # Check if Mind should take autonomous actions
+            if not self.mind.autonomy.proactive_actions:
+                logger.debug("   Autonomous actions disabled, skipping cycle")
+                return
+            
+            from genesis.core.autonomy import InitiativeLevel
+            
+            # Only take autonomous actions if initiative level allows it
+            if self.mind.autonomy.initiative_level in [InitiativeLevel.LOW, InitiativeLevel.NONE]:
+                logger.debug(f"   Initiative level too low ({self.mind.autonomy.initiative_level.value}), skipping")
+                return
+            
+            # Check if enough time has passed
+            if not await ai_engine.should_make_decision():
+                logger.debug("   Decision cooldown active, waiting...")
+                return
+            
+            # Make intelligent autonomous decision
+            decision = await ai_engine.make_autonomous_decision()
+            
+            if decision:
+                # Execute the decision
+                result = await ai_engine.execute_decision(decision)
                 
-                # Make intelligent autonomous decision
-                decision = await ai_engine.make_autonomous_decision()
+                # Learn from outcome
+                from genesis.core.autonomous_intelligence import DecisionCategory
+                category = DecisionCategory(decision["category"])
+                success_score = 1.0 if result.get("success") else 0.0
+                ai_engine.record_outcome(category, success_score)
                 
-                if decision:
-                    # Execute the decision
-                    result = await ai_engine.execute_decision(decision)
-                    
-                    # Learn from outcome
-                    from genesis.core.autonomous_intelligence import DecisionCategory
-                    category = DecisionCategory(decision["category"])
-                    success_score = 1.0 if result.get("success") else 0.0
-                    ai_engine.record_outcome(category, success_score)
-                    
-                    # Save state after decision execution
-                    try:
-                        self.mind.save()
-                        logger.debug("   [SAVED] State persisted after autonomous action")
-                    except Exception as e:
-                        logger.error(f"   Failed to save state: {e}")
-                else:
-                    logger.warning("   ⚠️ Failed to make decision, will retry next cycle")
-                
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.error(f"❌ Autonomous loop error: {e}", exc_info=True)
-                # Don't crash - continue running
-                continue
+                # Save state after decision execution
+                try:
+                    self.mind.save()
+                    logger.debug("   [SAVED] State persisted after autonomous action")
+                except Exception as e:
+                    logger.error(f"   Failed to save state: {e}")
+            else:
+                logger.warning("   ⚠️ Failed to make decision, will retry next cycle")
+            
+        except Exception as e:
+            logger.error(f"❌ Autonomous loop error: {e}", exc_info=True)
+            # Don't crash - continue on the next cycle
     
     async def _proactive_conversation_loop(self):
-        """Monitor and send proactive conversation follow-ups.
+        """Send pending proactive conversation follow-ups (scheduler job).
         
         This makes the Mind feel like a caring friend who checks in naturally.
         """
-        check_interval = 60  # Check every minute
+        if not self.mind or not self.is_running:
+            return
         
-        while self.is_running:
-            try:
-                await asyncio.sleep(check_interval)
-                
-                if not self.mind or not self.is_running:
-                    continue
-                
-                if not hasattr(self.mind, 'proactive_conversation'):
-                    continue
-                
-                # Get pending follow-ups
-                pending = await self.mind.proactive_conversation.get_pending_follow_ups()
-                
-                # Log check even if no pending (helps debug)
-                active_count = len(self.mind.proactive_conversation.active_contexts)
-                if pending:
-                    logger.info(f"\n💬 PROACTIVE CONVERSATION CHECK")
-                    logger.info(f"   Found {len(pending)} pending follow-ups (out of {active_count} total contexts)")
-                elif active_count > 0:
-                    logger.debug(f"[PROACTIVE] Check: {active_count} active contexts, none ready for follow-up yet")
+        if not hasattr(self.mind, 'proactive_conversation'):
+            return
+        
+        try:
+            # Get pending follow-ups
+            pending = await self.mind.proactive_conversation.get_pending_follow_ups()
+            
+            # Log check even if no pending (helps debug)
+            active_count = len(self.mind.proactive_conversation.active_contexts)
+            if pending:
+                logger.info(f"\n💬 PROACTIVE CONVERSATION CHECK")
+                logger.info(f"   Found {len(pending)} pending follow-ups (out of {active_count} total contexts)")
+            elif active_count > 0:
+                logger.debug(f"[PROACTIVE] Check: {active_count} active contexts, none ready for follow-up yet")
+            
+            # Create notification callback
+            async def send_notification(
+                user_email: str,
+                title: str,
+                message: str,
+                priority: str,
+                metadata: Dict[str, Any]
+            ):
+                if hasattr(self.mind, 'notification_manager'):
+                    from genesis.core.notification_manager import NotificationPriority
+                    # Convert priority string to enum
+                    priority_map = {
+                        "low": NotificationPriority.LOW,
+                        "normal": NotificationPriority.NORMAL,
+                        "medium": NotificationPriority.NORMAL,
+                        "high": NotificationPriority.HIGH,
+                        "urgent": NotificationPriority.URGENT
+                    }
+                    priority_enum = priority_map.get(priority.lower(), NotificationPriority.NORMAL)
                     
-                    # Send each follow-up via notification system
-                    for context in pending:
-                        try:
-                            # Create notification callback
-                            async def send_notification(
-                                user_email: str,
-                                title: str,
-                                message: str,
-                                priority: str,
-                                metadata: Dict[str, Any]
-                            ):
-                                if hasattr(self.mind, 'notification_manager'):
-                                    from genesis.core.notification_manager import NotificationPriority
-                                    # Convert priority string to enum
-                                    priority_map = {
-                                        "low": NotificationPriority.LOW,
-                                        "normal": NotificationPriority.NORMAL,
-                                        "medium": NotificationPriority.NORMAL,
-                                        "high": NotificationPriority.HIGH,
-                                        "urgent": NotificationPriority.URGENT
-                                    }
-                                    priority_enum = priority_map.get(priority.lower(), NotificationPriority.NORMAL)
-                                    
-                                    await self.mind.notification_manager.send_notification(
-                                        recipient=user_email,
-                                        title=title,
-                                        message=message,
-                                        priority=priority_enum,
-                                        metadata=metadata
-                                    )
-                            
-                            # Send the follow-up
-                            success = await self.mind.proactive_conversation.send_follow_up(
-                                context,
-                                notification_callback=send_notification
-                            )
-                            
-                            if success:
-                                logger.info(f"   ✓ Sent: {context.subject} to {context.user_email}")
-                            
-                        except Exception as e:
-                            logger.error(f"   ✗ Failed to send follow-up for {context.subject}: {e}")
+                    await self.mind.notification_manager.send_notification(
+                        recipient=user_email,
+                        title=title,
+                        message=message,
+                        priority=priority_enum,
+                        metadata=metadata
+                    )
+            
+            # Send each follow-up via notification system
+            for context in pending:
+                try:
+                    success = await self.mind.proactive_conversation.send_follow_up(
+                        context,
+                        notification_callback=send_notification
+                    )
                     
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.error(f"Proactive conversation loop error: {e}")
-                continue
+                    if success:
+                        logger.info(f"   ✓ Sent: {context.subject} to {context.user_email}")
+                    
+                except Exception as e:
+                    logger.error(f"   ✗ Failed to send follow-up for {context.subject}: {e}")
+                
+        except Exception as e:
+            logger.error(f"Proactive conversation loop error: {e}")
 
     def _register_signal_handlers(self):
         """Register handlers for graceful shutdown."""
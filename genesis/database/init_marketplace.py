@@ -2,9 +2,11 @@
 Initialize marketplace database tables.
 """
 
-from genesis.database.base import Base, get_engine
+from genesis.database.base import Base, get_engine, get_session
 from genesis.database.marketplace_models import (
     MarketplaceListing,
+    MarketplaceListingTag,
+    MarketplaceSearchDoc,
     MarketplaceTransaction,
     MarketplaceReview,
     MarketplaceFavorite,
@@ -22,12 +24,26 @@ def init_marketplace_tables():
         engine,
         tables=[
             MarketplaceListing.__table__,
+            MarketplaceListingTag.__table__,
+            MarketplaceSearchDoc.__table__,
             MarketplaceTransaction.__table__,
             MarketplaceReview.__table__,
             MarketplaceFavorite.__table__,
         ]
     )
 
+    # Indexes added after the listings table was first created
+    for index in MarketplaceListing.__table__.indexes:
+        index.create(engine, checkfirst=True)
+
+    # Full-text index (and backfill for existing listings)
+    from genesis.marketplace.search import ensure_search_index
+
+    with get_session() as session:
+        backfilled = ensure_search_index(session)
+    if backfilled:
+        print(f"Indexed {backfilled} existing listings for search")
+
     print("[Done] Marketplace tables created successfully!")
 
 
@@ -4,7 +4,7 @@ from datetime import datetime, timedelta, timezone
 from typing import List, Optional, Dict, Any
 from pathlib import Path
 
-from sqlalchemy import and_, or_, func, desc
+from sqlalchemy import and_, or_, func, desc, update
 from sqlalchemy.orm import Session
 
 from genesis.database.base import get_session, init_db
@@ -20,6 +20,21 @@ from genesis.database.models import (
 )
 
 
+def adjust_metaverse_stats(session: Session, **deltas: int) -> None:
+    """Atomically add deltas to the materialized metaverse counters.
+
+    Runs in the caller's transaction, so the counter moves together with the
+    row it counts. Example: adjust_metaverse_stats(session, total_minds=1)
+    """
+    values = {
+        getattr(MetaverseState, column): getattr(MetaverseState, column) + delta
+        for column, delta in deltas.items()
+        if delta
+    }
+    if values:
+        session.execute(update(MetaverseState).where(MetaverseState.id == 1).values(values))
+
+
 class MetaverseDB:
     """
     Central manager for metaverse database operations.
@@ -81,11 +96,12 @@ class MetaverseDB:
                 status="active",
             )
             session.add(mind)
+            adjust_metaverse_stats(session, total_minds=1, active_minds=1)
+            session.query(MetaverseState).filter_by(id=1).update(
+                {MetaverseState.last_mind_birth: mind.birth_date}
+            )
             session.commit()
 
-            # Update metaverse state
-            self._update_metaverse_stats(session)
-
             session.refresh(mind)
             session.expunge(mind)
             return mind
@@ -303,6 +319,7 @@ class MetaverseDB:
                 created_at=datetime.now(timezone.utc),
             )
             session.add(env)
+            adjust_metaverse_stats(session, total_environments=1)
             session.commit()
             session.refresh(env)
             return env
@@ -351,6 +368,11 @@ class MetaverseDB:
         with get_session() as session:
             env = session.query(EnvironmentRecord).filter_by(env_id=env_id).first()
             if env:
+                was_occupied = bool(env.current_inhabitants)
+                adjust_metaverse_stats(
+                    session,
+                    occupied_environments=bool(current_inhabitants) - was_occupied,
+                )
                 env.current_inhabitants = current_inhabitants
                 env.last_accessed = datetime.now(timezone.utc)
                 if invited_minds is not None:
@@ -563,6 +585,7 @@ class MetaverseDB:
             if env:
                 env.access_count += 1
 
+            adjust_metaverse_stats(session, total_visits=1)
             session.commit()
             session.refresh(visit)
             return visit
@@ -651,6 +674,7 @@ class MetaverseDB:
                 started_at=datetime.now(timezone.utc),
             )
             session.add(rel)
+            adjust_metaverse_stats(session, total_relationships=1)
             session.commit()
             session.refresh(rel)
             return rel
@@ -780,43 +804,27 @@ class MetaverseDB:
     # =========================================================================
 
     def get_metaverse_stats(self) -> Dict[str, Any]:
-        """Get overall metaverse statistics."""
+        """Get overall metaverse statistics.
+
+        Reads the materialized counters on the metaverse_state row - a
+        single primary key lookup. ``online_now`` is as of the last
+        reconciliation (see reconcile_metaverse_stats).
+        """
         with get_session() as session:
             state = session.query(MetaverseState).filter_by(id=1).first()
-
-            # Real-time stats
-            total_minds = session.query(MindRecord).count()
-            active_minds = (
-                session.query(MindRecord).filter_by(status="active").count()
-            )
-            total_envs = session.query(EnvironmentRecord).count()
-            total_rels = session.query(RelationshipRecord).count()
-            total_visits = session.query(EnvironmentVisit).count()
-
-            # Currently online (active in last hour)
-            one_hour_ago = datetime.now(timezone.utc) - timedelta(hours=1)
-            online_now = (
-                session.query(MindRecord)
-                .filter(MindRecord.last_active >= one_hour_ago)
-                .count()
-            )
-
-            # Currently in environments
-            occupied_envs = (
-                session.query(EnvironmentRecord)
-                .filter(EnvironmentRecord.current_inhabitants != [])
-                .count()
-            )
+            if not state:
+                return {}
 
             return {
-                "total_minds": total_minds,
-                "active_minds": active_minds,
-                "online_now": online_now,
-                "total_environments": total_envs,
-                "occupied_environments": occupied_envs,
-                "total_relationships": total_rels,
-                "total_visits": total_visits,
-                "last_updated": state.updated_at if state else None,
+                "total_minds": state.total_minds or 0,
+                "active_minds": state.active_minds or 0,
+                "online_now": state.online_now or 0,
+                "total_environments": state.total_environments or 0,
+                "occupied_environments": state.occupied_environments or 0,
+                "total_relationships": state.total_relationships or 0,
+                "total_visits": state.total_visits or 0,
+                "last_updated": state.updated_at,
+                "reconciled_at": state.stats_reconciled_at,
             }
 
     def get_recent_activity(self, limit: int = 20) -> Dict[str, List[Any]]:
@@ -849,18 +857,46 @@ class MetaverseDB:
                 "recent_events": recent_events,
             }
 
-    def _update_metaverse_stats(self, session: Session) -> None:
-        """Update metaverse state statistics."""
-        state = session.query(MetaverseState).filter_by(id=1).first()
-        if state:
+    def reconcile_metaverse_stats(self) -> Dict[str, Any]:
+        """Recount the materialized counters from the real tables.
+
+        Corrects drift from writes that bypass MetaverseDB and refreshes
+        ``online_now``, which depends on the clock. Run periodically by the
+        API server (see metaverse_stats_reconcile_interval).
+
+        Returns:
+            The reconciled statistics
+        """
+        with get_session() as session:
+            state = session.query(MetaverseState).filter_by(id=1).first()
+            if not state:
+                return {}
+
+            one_hour_ago = datetime.now(timezone.utc) - timedelta(hours=1)
             state.total_minds = session.query(MindRecord).count()
             state.active_minds = (
                 session.query(MindRecord).filter_by(status="active").count()
             )
+            state.online_now = (
+                session.query(MindRecord)
+                .filter(MindRecord.last_active >= one_hour_ago)
+                .count()
+            )
             state.total_environments = session.query(EnvironmentRecord).count()
             state.total_relationships = session.query(RelationshipRecord).count()
+            state.total_visits = session.query(EnvironmentVisit).count()
+
+            # JSON emptiness checks are not portable in SQL - count in Python
+            state.occupied_environments = sum(
+                1
+                for (inhabitants,) in session.query(EnvironmentRecord.current_inhabitants)
+                if inhabitants
+            )
+
+            state.stats_reconciled_at = datetime.now(timezone.utc)
             state.updated_at = datetime.now(timezone.utc)
-            session.commit()
+
+        return self.get_metaverse_stats()
 
     # =========================================================================
     # CONSCIOUSNESS THOUGHT STORAGE (Scalable 24/7 operation)
@@ -1122,3 +1158,15 @@ class MetaverseDB:
                 if current_mood is not None:
                     mind.current_mood = current_mood
                 session.commit()
+
+
+# Shared instance for hot read paths (MetaverseDB() runs init_db on construction)
+_metaverse_db: Optional[MetaverseDB] = None
+
+
+def get_metaverse_db() -> MetaverseDB:
+    """Get the shared MetaverseDB instance."""
+    global _metaverse_db
+    if _metaverse_db is None:
+        _metaverse_db = MetaverseDB()
+    return _metaverse_db
@@ -7,7 +7,7 @@ Enables buying/selling of Minds, Environments, Skills, and Memory Packs.
 from datetime import datetime
 from typing import Optional, Dict, Any, List
 from enum import Enum
-from sqlalchemy import Column, String, Float, Integer, Text, DateTime, JSON, ForeignKey, Index
+from sqlalchemy import Column, String, Float, Integer, Text, DateTime, JSON, ForeignKey, Index, DDL, event
 from sqlalchemy.dialects.postgresql import UUID, ARRAY
 import uuid
 
@@ -79,9 +79,71 @@ class MarketplaceListing(Base):
         Index('idx_featured', 'featured', 'active'),
         Index('idx_sales', 'sales_count'),
         Index('idx_rating', 'rating'),
+        # Keyset pagination: (active, sort column, id)
+        Index('idx_active_created_id', 'active', 'created_at', 'id'),
+        Index('idx_active_price_id', 'active', 'price', 'id'),
+        Index('idx_active_rating_id', 'active', 'rating', 'id'),
+        Index('idx_active_sales_id', 'active', 'sales_count', 'id'),
     )
 
 
+class MarketplaceListingTag(Base):
+    """Normalized listing tags (one row per listing/tag) for indexed tag filters."""
+
+    __tablename__ = "marketplace_listing_tags"
+
+    listing_id = Column(String, ForeignKey('marketplace_listings.id', ondelete="CASCADE"), primary_key=True)
+    tag = Column(String(100), primary_key=True)  # Lowercased
+
+    # Indexes
+    __table_args__ = (
+        Index('idx_tag_listing', 'tag', 'listing_id'),
+    )
+
+
+class MarketplaceSearchDoc(Base):
+    """Stable integer document ID of a listing in the full-text index.
+
+    Listing IDs are UUID strings, so the SQLite FTS5 table is keyed by
+    doc_id (its rowid) and joined back to the listing through this table.
+    """
+
+    __tablename__ = "marketplace_search_docs"
+
+    doc_id = Column(Integer, primary_key=True, autoincrement=True)
+    listing_id = Column(
+        String, ForeignKey('marketplace_listings.id', ondelete="CASCADE"), nullable=False, unique=True
+    )
+
+
+# Full-text index DDL, created and dropped together with the listings table.
+# SQLite: FTS5 table ranked with bm25(); Postgres: GIN index on a tsvector.
+SQLITE_FTS_TABLE = "marketplace_listings_fts"
+PG_SEARCH_DOCUMENT = "to_tsvector('english', coalesce(title, '') || ' ' || coalesce(description, ''))"
+
+event.listen(
+    MarketplaceListing.__table__,
+    "after_create",
+    DDL(
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {SQLITE_FTS_TABLE} "
+        "USING fts5(title, description, tags, tokenize = 'porter unicode61')"
+    ).execute_if(dialect="sqlite"),
+)
+event.listen(
+    MarketplaceListing.__table__,
+    "after_drop",
+    DDL(f"DROP TABLE IF EXISTS {SQLITE_FTS_TABLE}").execute_if(dialect="sqlite"),
+)
+event.listen(
+    MarketplaceListing.__table__,
+    "after_create",
+    DDL(
+        "CREATE INDEX IF NOT EXISTS idx_listings_search "
+        f"ON marketplace_listings USING GIN ({PG_SEARCH_DOCUMENT})"
+    ).execute_if(dialect="postgresql"),
+)
+
+
 class MarketplaceTransaction(Base):
     """Record of marketplace purchases."""
 
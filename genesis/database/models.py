@@ -315,7 +315,9 @@ class MetaverseState(Base):
     """
     Global metaverse state and statistics.
 
-    Tracks overall metaverse health, activity, and metadata.
+    Tracks overall metaverse health, activity, and metadata. Counters are
+    adjusted incrementally by MetaverseDB writes and periodically
+    reconciled against the real tables.
     """
 
     __tablename__ = "metaverse_state"
@@ -328,6 +330,10 @@ class MetaverseState(Base):
     active_minds = Column(Integer, default=0)
     total_environments = Column(Integer, default=0)
     total_relationships = Column(Integer, default=0)
+    total_visits = Column(Integer, default=0)
+    occupied_environments = Column(Integer, default=0)
+    online_now = Column(Integer, default=0)  # Active in the last hour, as of the last reconciliation
+    stats_reconciled_at = Column(DateTime, nullable=True)
 
     # Activity
     last_mind_birth = Column(DateTime, nullable=True)
@@ -610,6 +616,75 @@ class ConversationMessage(Base):
         Index("ix_conv_mind_time", "mind_gmid", "timestamp"),
         Index("ix_conv_user_time", "user_email", "timestamp"),
         Index("ix_conv_env_time", "environment_id", "timestamp"),
+        Index("ix_conv_thread_time", "mind_gmid", "user_email", "environment_id", "timestamp", "id"),
+    )
+
+
+class ConversationThread(Base):
+    """
+    Maintained summary of one conversation thread (mind, user, environment).
+
+    Updated with every message so the threads list reads one row per
+    thread instead of aggregating the whole message history.
+    """
+    __tablename__ = "conversation_threads"
+
+    # Primary key
+    id = Column(Integer, primary_key=True, autoincrement=True)
+
+    # Thread key - '' stands for "no user" / "no environment" so the unique
+    # index also covers them (NULLs never collide in a unique index)
+    mind_gmid = Column(String(50), ForeignKey("minds.gmid"), nullable=False)
+    user_email = Column(String(255), nullable=False, default="")
+    environment_id = Column(String(100), nullable=False, default="")
+
+    # Summary
+    message_count = Column(Integer, nullable=False, default=0)
+    last_message_id = Column(Integer, nullable=True)
+    last_message_time = Column(DateTime, nullable=True)
+    last_message_preview = Column(String(100), nullable=True)
+    last_message_role = Column(String(20), nullable=True)
+
+    # Indexes
+    __table_args__ = (
+        Index("ix_threads_key", "mind_gmid", "user_email", "environment_id", unique=True),
+        Index("ix_threads_mind_time", "mind_gmid", "last_message_time", "id"),
+        Index("ix_threads_user_time", "mind_gmid", "user_email", "last_message_time", "id"),
+    )
+
+
+class ConversationSummary(Base):
+    """
+    Compacted span of older conversation messages.
+
+    Written by conversation retention: the raw messages are archived to a
+    compressed cold file and replaced by this summary.
+    """
+    __tablename__ = "conversation_summaries"
+
+    # Primary key
+    id = Column(Integer, primary_key=True, autoincrement=True)
+
+    # Thread
+    mind_gmid = Column(String(50), ForeignKey("minds.gmid"), nullable=False)
+    user_email = Column(String(255), nullable=True)
+    environment_id = Column(String(100), nullable=True)
+
+    # Span covered
+    start_time = Column(DateTime, nullable=False)
+    end_time = Column(DateTime, nullable=False)
+    first_message_id = Column(Integer, nullable=False)
+    last_message_id = Column(Integer, nullable=False)
+    message_count = Column(Integer, nullable=False)
+
+    # Summary and where the raw messages went
+    content = Column(Text, nullable=False)
+    archive_path = Column(String(500), nullable=True)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    # Indexes
+    __table_args__ = (
+        Index("ix_conv_summaries_thread", "mind_gmid", "user_email", "environment_id", "end_time"),
     )
 
 
@@ -660,6 +735,55 @@ class ConcernRecord(Base):
     )
 
 
+class ConversationContextRecord(Base):
+    """
+    Proactive conversation context awaiting (or past) a follow-up.
+
+    Replaces storing contexts as JSON in vector memory metadata, which could
+    only be found again through a semantic search.
+    """
+    __tablename__ = "conversation_contexts"
+
+    # Primary key
+    context_id = Column(String(100), primary_key=True)
+
+    # Association
+    mind_gmid = Column(String(50), ForeignKey("minds.gmid"), nullable=False, index=True)
+    user_email = Column(String(255), nullable=True)
+    environment_id = Column(String(100), nullable=True)
+
+    # Topic
+    topic = Column(String(50), nullable=False, default="general")
+    subject = Column(String(255), nullable=False, default="")
+    initial_message = Column(Text, nullable=True)
+
+    # Follow-up tracking
+    follow_up_question = Column(Text, nullable=True)
+    follow_up_scheduled = Column(DateTime, nullable=True)
+    follow_up_sent = Column(Boolean, default=False)
+    follow_up_status = Column(String(20), nullable=False, default="pending")  # 'pending', 'sent', 'resolved', 'cancelled'
+
+    # Resolution tracking
+    resolved = Column(Boolean, default=False)
+    resolved_at = Column(DateTime, nullable=True)
+    resolution_note = Column(Text, nullable=True)
+
+    # Metadata
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    last_updated = Column(DateTime, nullable=False, default=datetime.utcnow)
+    importance = Column(Float, default=0.5)
+    urgency = Column(Float, default=0.5)
+    interaction_count = Column(Integer, default=0)
+    last_mention = Column(DateTime, nullable=True)
+    extra_data = Column(JSON, default=dict)
+
+    # Indexes
+    __table_args__ = (
+        Index("ix_conversation_contexts_user", "mind_gmid", "user_email"),
+        Index("ix_conversation_contexts_due", "mind_gmid", "follow_up_status", "follow_up_scheduled"),
+    )
+
+
 class BackgroundTaskRecord(Base):
     """
     Background task execution tracking for persistence across restarts.
@@ -743,3 +867,39 @@ class ThoughtRecord(Base):
         Index("ix_thoughts_type", "thought_type"),
         Index("ix_thoughts_awareness", "awareness_level"),
     )
+
+
+class BlobRecord(Base):
+    """
+    Content-addressed workspace blob with a reference count.
+
+    Workspace files point at blobs by SHA-256, so identical files across
+    Minds are stored once. The blob is deleted when its last reference goes.
+    """
+    __tablename__ = "workspace_blobs"
+
+    # SHA-256 of the content (hex)
+    content_hash = Column(String(64), primary_key=True)
+
+    size_bytes = Column(Integer, nullable=False, default=0)
+    ref_count = Column(Integer, nullable=False, default=0)
+
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+
+class LLMUsageRecord(Base):
+    """
+    Daily LLM usage per Mind, so LivingMind budgets survive restarts.
+
+    One row per Mind per day. ``mind_id`` is not a foreign key: LivingMinds
+    can run without a MindRecord (tests, simulations).
+    """
+    __tablename__ = "llm_usage"
+
+    mind_id = Column(String(50), primary_key=True)
+    day = Column(String(10), primary_key=True)  # ISO date, local to the Mind's clock
+
+    requests = Column(Integer, nullable=False, default=0)  # Provider calls
+    tokens = Column(Integer, nullable=False, default=0)
+
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -5,12 +5,13 @@ Real-time Environment Server - WebSocket-based live environments.
 import asyncio
 import json
 from datetime import datetime
-from typing import Dict, List, Set, Any, Optional
+from typing import Callable, Dict, List, Set, Any, Optional, Tuple
 from dataclasses import dataclass, field, asdict
 from fastapi import WebSocket
 from collections import defaultdict
 
 from genesis.database.manager import MetaverseDB
+from genesis.environments.send_queue import SendQueue
 
 
 @dataclass
@@ -26,10 +27,20 @@ class EnvironmentState:
     objects: Dict[str, Any] = field(default_factory=dict)
     variables: Dict[str, Any] = field(default_factory=dict)
 
+    # Incremented on every change; deltas and snapshots carry it so clients
+    # can discard deltas already covered by a newer snapshot
+    version: int = 0
+
     # Metadata
     created_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
     last_activity: str = field(default_factory=lambda: datetime.utcnow().isoformat())
 
+    def bump(self) -> int:
+        """Record a state change and return the new version."""
+        self.version += 1
+        self.last_activity = datetime.utcnow().isoformat()
+        return self.version
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to JSON-serializable dict."""
         data = asdict(self)
@@ -38,16 +49,42 @@ class EnvironmentState:
 
 
 class ConnectionManager:
-    """Manage WebSocket connections per environment."""
+    """Manage WebSocket connections per environment.
 
-    def __init__(self):
+    Every connection gets a SendQueue drained by its own writer task, so
+    broadcasts never wait on a slow client.
+    """
+
+    def __init__(self, max_queue_size: int = 256, send_timeout: float = 10.0):
         # environment_id -> {mind_id: WebSocket}
         self.active_connections: Dict[str, Dict[str, WebSocket]] = defaultdict(dict)
+        # environment_id -> {mind_id: SendQueue}
+        self.send_queues: Dict[str, Dict[str, SendQueue]] = defaultdict(dict)
+        self.max_queue_size = max_queue_size
+        self.send_timeout = send_timeout
+
+        # environment_id -> serialized snapshot, used to resync lagging clients
+        self.snapshot_provider: Optional[Callable[[str], Optional[str]]] = None
 
     async def connect(self, environment_id: str, mind_id: str, websocket: WebSocket):
         """Add connection to environment."""
         await websocket.accept()
+
+        old_queue = self.send_queues[environment_id].get(mind_id)
+        if old_queue:
+            old_queue.close()
+
+        queue = SendQueue(
+            websocket.send_text,
+            name=mind_id,
+            max_size=self.max_queue_size,
+            send_timeout=self.send_timeout,
+            snapshot=lambda: self.snapshot_provider(environment_id) if self.snapshot_provider else None,
+            on_close=lambda q: self._on_queue_closed(environment_id, mind_id, q),
+        )
         self.active_connections[environment_id][mind_id] = websocket
+        self.send_queues[environment_id][mind_id] = queue
+        queue.start()
 
     def disconnect(self, environment_id: str, mind_id: str):
         """Remove connection from environment."""
@@ -58,40 +95,61 @@ class ConnectionManager:
             if not self.active_connections[environment_id]:
                 del self.active_connections[environment_id]
 
-    async def broadcast(self, environment_id: str, message: Dict[str, Any], exclude_mind: Optional[str] = None):
-        """Broadcast message to all minds in environment."""
-        if environment_id not in self.active_connections:
+        if environment_id in self.send_queues:
+            queue = self.send_queues[environment_id].pop(mind_id, None)
+            if queue:
+                queue.close()
+            if not self.send_queues[environment_id]:
+                del self.send_queues[environment_id]
+
+    def _on_queue_closed(self, environment_id: str, mind_id: str, queue: SendQueue):
+        """Drop a connection whose writer failed (dead or too slow)."""
+        if self.send_queues.get(environment_id, {}).get(mind_id) is queue:
+            print(f"Error broadcasting to {mind_id}: connection closed")
+            self.disconnect(environment_id, mind_id)
+
+    async def broadcast(
+        self,
+        environment_id: str,
+        message: Dict[str, Any],
+        exclude_mind: Optional[str] = None,
+        key: Optional[str] = None,
+        state_change: bool = False,
+    ):
+        """Broadcast message to all minds in environment.
+
+        The message is serialized once and queued for every connection.
+
+        Args:
+            environment_id: Environment to broadcast to
+            message: Message to send
+            exclude_mind: Mind that should not receive the message
+            key: Coalescing key - replaces a still-queued message with the same key
+            state_change: Message is a state delta (see SendQueue)
+        """
+        queues = self.send_queues.get(environment_id)
+        if not queues:
             return
 
         message_json = json.dumps(message)
 
-        for mind_id, websocket in list(self.active_connections[environment_id].items()):
+        for mind_id, queue in list(queues.items()):
             if mind_id == exclude_mind:
                 continue
-
-            try:
-                await websocket.send_text(message_json)
-            except Exception as e:
-                print(f"Error broadcasting to {mind_id}: {e}")
-                # Remove dead connection
-                self.disconnect(environment_id, mind_id)
+            queue.put(message_json, key=key, state_change=state_change)
 
     async def send_to_mind(self, environment_id: str, mind_id: str, message: Dict[str, Any]):
         """Send message to specific mind."""
-        if environment_id not in self.active_connections:
+        queue = self.send_queues.get(environment_id, {}).get(mind_id)
+        if not queue:
             return False
 
-        websocket = self.active_connections[environment_id].get(mind_id)
-        if not websocket:
-            return False
+        return queue.put(json.dumps(message))
 
-        try:
-            await websocket.send_text(json.dumps(message))
-            return True
-        except Exception as e:
-            print(f"Error sending to {mind_id}: {e}")
-            self.disconnect(environment_id, mind_id)
-            return False
+    def request_snapshot(self, environment_id: str):
+        """Have every connection in the environment resync from a full snapshot."""
+        for queue in self.send_queues.get(environment_id, {}).values():
+            queue.request_snapshot()
 
     def get_present_minds(self, environment_id: str) -> List[str]:
         """Get list of minds present in environment."""
@@ -99,14 +157,53 @@ class ConnectionManager:
             return []
         return list(self.active_connections[environment_id].keys())
 
+    def get_queue_stats(self, environment_id: str) -> Dict[str, Dict[str, Any]]:
+        """Per-connection send queue statistics."""
+        return {
+            mind_id: queue.get_stats()
+            for mind_id, queue in self.send_queues.get(environment_id, {}).items()
+        }
+
 
 class EnvironmentServer:
-    """Real-time environment server with WebSocket support."""
+    """Real-time environment server with WebSocket support.
+
+    State changes are broadcast as deltas (``mind_joined``, ``object_updated``,
+    ``variable_set``...) tagged with the state version. Full ``state_update``
+    snapshots go to joining Minds, to lagging connections that dropped a
+    delta, and to everyone every ``snapshot_interval`` versions.
+    """
 
-    def __init__(self):
+    def __init__(self, snapshot_interval: int = 100):
         self.connection_manager = ConnectionManager()
+        self.connection_manager.snapshot_provider = self._snapshot_json
         self.environment_states: Dict[str, EnvironmentState] = {}
         self.db = MetaverseDB()
+        self.snapshot_interval = snapshot_interval
+
+        # environment_id -> (version, serialized snapshot)
+        self._snapshot_cache: Dict[str, Tuple[int, str]] = {}
+
+    def _snapshot_json(self, environment_id: str) -> Optional[str]:
+        """Serialized full-state snapshot, built once per state version."""
+        state = self.environment_states.get(environment_id)
+        if not state:
+            return None
+
+        cached = self._snapshot_cache.get(environment_id)
+        if cached and cached[0] == state.version:
+            return cached[1]
+
+        snapshot = json.dumps({"type": "state_update", "state": state.to_dict()})
+        self._snapshot_cache[environment_id] = (state.version, snapshot)
+        return snapshot
+
+    def _state_changed(self, state: EnvironmentState) -> int:
+        """Bump the state version, scheduling a periodic snapshot."""
+        version = state.bump()
+        if self.snapshot_interval and version % self.snapshot_interval == 0:
+            self.connection_manager.request_snapshot(state.environment_id)
+        return version
 
     def get_or_create_state(self, environment_id: str) -> EnvironmentState:
         """Get or create environment state."""
@@ -143,7 +240,7 @@ class EnvironmentServer:
 
             # Add mind to present list
             state.present_minds.add(mind_id)
-            state.last_activity = datetime.utcnow().isoformat()
+            version = self._state_changed(state)
 
             # Record visit in database
             self.db.record_visit_start(mind_id, environment_id)
@@ -156,10 +253,11 @@ class EnvironmentServer:
                     "mind_id": mind_id,
                     "mind_name": mind_name,
                     "timestamp": datetime.utcnow().isoformat(),
-                    "present_minds": list(state.present_minds),
                     "count": len(state.present_minds),
+                    "version": version,
                 },
-                exclude_mind=mind_id
+                exclude_mind=mind_id,
+                state_change=True,
             )
 
             # Send welcome message to joining mind
@@ -223,6 +321,7 @@ class EnvironmentServer:
 
                 if object_id:
                     state.objects[object_id] = object_data
+                    version = self._state_changed(state)
 
                     # Broadcast update
                     await self.connection_manager.broadcast(
@@ -233,7 +332,10 @@ class EnvironmentServer:
                             "data": object_data,
                             "updated_by": mind_id,
                             "timestamp": datetime.utcnow().isoformat(),
-                        }
+                            "version": version,
+                        },
+                        key=f"object:{object_id}",
+                        state_change=True,
                     )
 
             elif action == "set_variable":
@@ -243,6 +345,7 @@ class EnvironmentServer:
 
                 if var_name:
                     state.variables[var_name] = var_value
+                    version = self._state_changed(state)
 
                     await self.connection_manager.broadcast(
                         environment_id,
@@ -252,7 +355,10 @@ class EnvironmentServer:
                             "value": var_value,
                             "set_by": mind_id,
                             "timestamp": datetime.utcnow().isoformat(),
-                        }
+                            "version": version,
+                        },
+                        key=f"variable:{var_name}",
+                        state_change=True,
                     )
 
         elif message_type == "request_state":
@@ -276,7 +382,8 @@ class EnvironmentServer:
                     "mind_name": mind_name,
                     "is_typing": message.get("is_typing", True),
                 },
-                exclude_mind=mind_id
+                exclude_mind=mind_id,
+                key=f"typing:{mind_id}",
             )
 
     async def handle_disconnect(self, environment_id: str, mind_id: str, mind_name: str):
@@ -286,7 +393,7 @@ class EnvironmentServer:
         if state and mind_id in state.present_minds:
             # Remove from present list
             state.present_minds.remove(mind_id)
-            state.last_activity = datetime.utcnow().isoformat()
+            version = self._state_changed(state)
 
             # Broadcast leave event
             await self.connection_manager.broadcast(
@@ -296,9 +403,10 @@ class EnvironmentServer:
                     "mind_id": mind_id,
                     "mind_name": mind_name,
                     "timestamp": datetime.utcnow().isoformat(),
-                    "present_minds": list(state.present_minds),
                     "count": len(state.present_minds),
-                }
+                    "version": version,
+                },
+                state_change=True,
             )
 
             # Update database (end visit timestamp)
@@ -326,6 +434,7 @@ class EnvironmentServer:
 
             # Remove from memory
             del self.environment_states[environment_id]
+            self._snapshot_cache.pop(environment_id, None)
 
     def get_environment_info(self, environment_id: str) -> Optional[Dict[str, Any]]:
         """Get current environment information."""
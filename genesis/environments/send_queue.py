@@ -0,0 +1,180 @@
+"""Per-connection send queues for environment broadcasts.
+
+Broadcasting used to ``await`` each websocket in turn, so one slow client
+stalled delivery to the whole environment. Each connection now owns a bounded
+queue drained by its own writer task; a broadcast serializes the message once
+and enqueues it for every member without awaiting any socket.
+
+Slow consumer policy:
+- Coalesce: messages with the same key (e.g. the same object, variable or
+  typing indicator) replace the queued copy instead of queueing twice
+- Drop: when the queue is full the oldest message is dropped
+- Resync: if a dropped message changed environment state, the writer sends
+  a fresh state snapshot before anything else so the client can recover.
+  Snapshots and deltas carry the environment's state version, which a
+  client can compare to discard deltas older than its snapshot
+- Timeout: a send that takes longer than ``send_timeout`` closes the
+  connection
+"""
+
+import asyncio
+import logging
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class SendQueue:
+    """Bounded outgoing message queue with a writer task for one connection."""
+
+    def __init__(
+        self,
+        send: Callable[[str], Awaitable[Any]],
+        name: str,
+        max_size: int = 256,
+        send_timeout: float = 10.0,
+        snapshot: Optional[Callable[[], Optional[str]]] = None,
+        on_close: Optional[Callable[['SendQueue'], None]] = None,
+    ):
+        """Initialize send queue.
+
+        Args:
+            send: Coroutine function that writes one text frame
+            name: Connection name for logs (usually the Mind ID)
+            max_size: Max queued messages before dropping the oldest
+            send_timeout: Seconds a single send may take before the
+                connection is considered dead
+            snapshot: Returns a serialized state snapshot for resyncs
+            on_close: Called once when the writer stops because of an error
+        """
+        self._send = send
+        self.name = name
+        self.max_size = max_size
+        self.send_timeout = send_timeout
+        self._snapshot = snapshot
+        self._on_close = on_close
+
+        # Entries are [key, text, is_state_change]
+        self._queue: Deque[List[Any]] = deque()
+        self._keyed: Dict[str, List[Any]] = {}
+        self._ready = asyncio.Event()
+        self._needs_snapshot = False
+        self._task: Optional[asyncio.Task] = None
+        self.closed = False
+
+        # Stats
+        self.sent = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.snapshots = 0
+
+    def start(self) -> None:
+        """Start the writer task."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._writer())
+
+    def put(self, text: str, key: Optional[str] = None, state_change: bool = False) -> bool:
+        """Queue a serialized message without waiting for the socket.
+
+        Args:
+            text: Serialized message
+            key: Coalescing key - a newer message replaces a queued one
+            state_change: True if the message is a state delta (dropping it
+                requires a snapshot resync)
+
+        Returns:
+            False if the connection is closed
+        """
+        if self.closed:
+            return False
+
+        if key is not None:
+            entry = self._keyed.get(key)
+            if entry is not None:
+                entry[1] = text
+                entry[2] = entry[2] or state_change
+                self.coalesced += 1
+                return True
+
+        if len(self._queue) >= self.max_size:
+            oldest = self._queue.popleft()
+            if oldest[0] is not None:
+                self._keyed.pop(oldest[0], None)
+            if oldest[2]:
+                self._needs_snapshot = True
+            self.dropped += 1
+
+        entry = [key, text, state_change]
+        self._queue.append(entry)
+        if key is not None:
+            self._keyed[key] = entry
+        self._ready.set()
+        return True
+
+    def request_snapshot(self) -> None:
+        """Send a full state snapshot before the next queued message."""
+        self._needs_snapshot = True
+        self._ready.set()
+
+    def close(self) -> None:
+        """Stop the writer and discard queued messages."""
+        self.closed = True
+        self._queue.clear()
+        self._keyed.clear()
+        if self._task and not self._task.done() and self._task is not asyncio.current_task():
+            self._task.cancel()
+
+    @property
+    def size(self) -> int:
+        """Number of queued messages."""
+        return len(self._queue)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Queue statistics."""
+        return {
+            "queued": len(self._queue),
+            "sent": self.sent,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+            "snapshots": self.snapshots,
+        }
+
+    def _next_text(self) -> Optional[str]:
+        """Pop the next frame to send (a pending snapshot goes first)."""
+        if self._needs_snapshot and self._snapshot:
+            self._needs_snapshot = False
+            text = self._snapshot()
+            if text is not None:
+                self.snapshots += 1
+                return text
+
+        if not self._queue:
+            return None
+        key, text, _ = self._queue.popleft()
+        if key is not None:
+            self._keyed.pop(key, None)
+        return text
+
+    async def _writer(self) -> None:
+        """Drain the queue into the socket."""
+        try:
+            while not self.closed:
+                text = self._next_text()
+                if text is None:
+                    self._ready.clear()
+                    await self._ready.wait()
+                    continue
+
+                async with asyncio.timeout(self.send_timeout):
+                    await self._send(text)
+                self.sent += 1
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.warning(f"Send queue for {self.name} closed: {e}")
+            self.closed = True
+            self._queue.clear()
+            self._keyed.clear()
+            if self._on_close:
+                self._on_close(self)
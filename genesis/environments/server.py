@@ -12,6 +12,8 @@ from datetime import datetime
 import websockets
 from websockets.server import WebSocketServerProtocol
 
+from genesis.environments.send_queue import SendQueue
+
 logger = logging.getLogger(__name__)
 
 
@@ -23,6 +25,9 @@ class EnvironmentConfig:
     max_connections: int = 1000
     ping_interval: int = 20  # seconds
     ping_timeout: int = 10  # seconds
+    send_queue_size: int = 256  # messages queued per connection before dropping
+    send_timeout: float = 10.0  # seconds before a stuck connection is closed
+    snapshot_interval: int = 100  # state versions between full snapshots
 
 
 class EnvironmentServer:
@@ -40,9 +45,11 @@ class EnvironmentServer:
         """
         self.config = config or EnvironmentConfig()
         self.connections: Dict[str, WebSocketServerProtocol] = {}  # mind_id -> websocket
+        self.send_queues: Dict[str, SendQueue] = {}  # mind_id -> outgoing queue
         self.mind_environments: Dict[str, str] = {}  # mind_id -> environment_id
         self.environment_minds: Dict[str, Set[str]] = {}  # environment_id -> set of mind_ids
         self.environment_state: Dict[str, Dict[str, Any]] = {}  # environment_id -> state
+        self.environment_versions: Dict[str, int] = {}  # environment_id -> state version
         self.server: Optional[websockets.WebSocketServer] = None
         self.running = False
 
@@ -68,6 +75,10 @@ class EnvironmentServer:
         self.running = False
 
         # Close all connections
+        for queue in list(self.send_queues.values()):
+            queue.close()
+        self.send_queues.clear()
+
         for ws in list(self.connections.values()):
             await ws.close()
 
@@ -107,6 +118,9 @@ class EnvironmentServer:
             # Send success
             await websocket.send(json.dumps({"type": "auth_success", "mind_id": mind_id}))
 
+            # Everything after auth goes through the connection's send queue
+            self._open_send_queue(mind_id, websocket)
+
             # Handle messages
             async for message in websocket:
                 await self._handle_message(mind_id, message)
@@ -170,8 +184,10 @@ class EnvironmentServer:
         if environment_id not in self.environment_minds:
             self.environment_minds[environment_id] = set()
             self.environment_state[environment_id] = {}
+            self.environment_versions[environment_id] = 0
 
         self.environment_minds[environment_id].add(mind_id)
+        version = self._bump_version(environment_id)
 
         logger.info(f"Mind {mind_id} joined environment {environment_id}")
 
@@ -180,15 +196,17 @@ class EnvironmentServer:
             "type": "joined",
             "environment_id": environment_id,
             "present_minds": list(self.environment_minds[environment_id]),
-            "state": self.environment_state.get(environment_id, {})
+            "state": self.environment_state.get(environment_id, {}),
+            "version": version,
         })
 
         # Notify other Minds in environment
         await self._broadcast_to_environment(environment_id, {
             "type": "mind_joined",
             "mind_id": mind_id,
-            "timestamp": datetime.now().isoformat()
-        }, exclude=mind_id)
+            "timestamp": datetime.now().isoformat(),
+            "version": version,
+        }, exclude=mind_id, state_change=True)
 
     async def _handle_leave(self, mind_id: str, data: Dict[str, Any]):
         """Handle Mind leaving an environment.
@@ -205,13 +223,16 @@ class EnvironmentServer:
         if mind_id in self.mind_environments:
             del self.mind_environments[mind_id]
 
+        version = None
         if environment_id in self.environment_minds:
             self.environment_minds[environment_id].discard(mind_id)
+            version = self._bump_version(environment_id)
 
             # Clean up empty environments
             if not self.environment_minds[environment_id]:
                 del self.environment_minds[environment_id]
                 del self.environment_state[environment_id]
+                self.environment_versions.pop(environment_id, None)
 
         logger.info(f"Mind {mind_id} left environment {environment_id}")
 
@@ -219,8 +240,9 @@ class EnvironmentServer:
         await self._broadcast_to_environment(environment_id, {
             "type": "mind_left",
             "mind_id": mind_id,
-            "timestamp": datetime.now().isoformat()
-        })
+            "timestamp": datetime.now().isoformat(),
+            "version": version,
+        }, state_change=True)
 
     async def _handle_broadcast(self, mind_id: str, data: Dict[str, Any]):
         """Handle broadcast message to environment.
@@ -268,14 +290,16 @@ class EnvironmentServer:
             self.environment_state[environment_id] = {}
 
         self.environment_state[environment_id].update(updates)
+        version = self._bump_version(environment_id)
 
-        # Broadcast state update to all Minds
+        # Broadcast only the changed keys (a delta) to all Minds
         await self._broadcast_to_environment(environment_id, {
             "type": "state_updated",
             "updates": updates,
             "updated_by": mind_id,
-            "timestamp": datetime.now().isoformat()
-        })
+            "timestamp": datetime.now().isoformat(),
+            "version": version,
+        }, state_change=True)
 
     async def _handle_get_state(self, mind_id: str, data: Dict[str, Any]):
         """Handle request for current environment state.
@@ -288,14 +312,7 @@ class EnvironmentServer:
         if not environment_id:
             return
 
-        state = self.environment_state.get(environment_id, {})
-
-        await self._send_to_mind(mind_id, {
-            "type": "state",
-            "environment_id": environment_id,
-            "state": state,
-            "present_minds": list(self.environment_minds.get(environment_id, set()))
-        })
+        await self._send_to_mind(mind_id, self._snapshot(environment_id))
 
     async def _handle_disconnect(self, mind_id: str):
         """Handle Mind disconnection.
@@ -312,38 +329,120 @@ class EnvironmentServer:
         if mind_id in self.connections:
             del self.connections[mind_id]
 
+        queue = self.send_queues.pop(mind_id, None)
+        if queue:
+            queue.close()
+
+    def _open_send_queue(self, mind_id: str, websocket: WebSocketServerProtocol):
+        """Create and start the outgoing queue for a connection.
+
+        Args:
+            mind_id: Mind ID
+            websocket: WebSocket connection
+        """
+        old_queue = self.send_queues.get(mind_id)
+        if old_queue:
+            old_queue.close()
+
+        def snapshot() -> Optional[str]:
+            environment_id = self.mind_environments.get(mind_id)
+            if not environment_id:
+                return None
+            return json.dumps(self._snapshot(environment_id))
+
+        def on_close(queue: SendQueue):
+            # Writer failed or timed out: drop the connection
+            if self.send_queues.get(mind_id) is queue:
+                asyncio.ensure_future(websocket.close())
+
+        queue = SendQueue(
+            websocket.send,
+            name=mind_id,
+            max_size=self.config.send_queue_size,
+            send_timeout=self.config.send_timeout,
+            snapshot=snapshot,
+            on_close=on_close,
+        )
+        self.send_queues[mind_id] = queue
+        queue.start()
+
+    def _bump_version(self, environment_id: str) -> int:
+        """Record a state change, scheduling a periodic full snapshot.
+
+        Args:
+            environment_id: Environment ID
+
+        Returns:
+            New state version
+        """
+        version = self.environment_versions.get(environment_id, 0) + 1
+        self.environment_versions[environment_id] = version
+
+        interval = self.config.snapshot_interval
+        if interval and version % interval == 0:
+            for mind_id in self.environment_minds.get(environment_id, set()):
+                queue = self.send_queues.get(mind_id)
+                if queue:
+                    queue.request_snapshot()
+        return version
+
+    def _snapshot(self, environment_id: str) -> Dict[str, Any]:
+        """Full state snapshot of an environment.
+
+        Args:
+            environment_id: Environment ID
+
+        Returns:
+            State message
+        """
+        return {
+            "type": "state",
+            "environment_id": environment_id,
+            "state": self.environment_state.get(environment_id, {}),
+            "present_minds": list(self.environment_minds.get(environment_id, set())),
+            "version": self.environment_versions.get(environment_id, 0),
+        }
+
     async def _send_to_mind(self, mind_id: str, message: Dict[str, Any]):
-        """Send message to specific Mind.
+        """Queue message for a specific Mind.
 
         Args:
             mind_id: Target Mind ID
             message: Message to send
         """
-        websocket = self.connections.get(mind_id)
-        if websocket:
-            try:
-                await websocket.send(json.dumps(message))
-            except Exception as e:
-                logger.error(f"Error sending to {mind_id}: {e}")
+        queue = self.send_queues.get(mind_id)
+        if queue:
+            queue.put(json.dumps(message))
 
     async def _broadcast_to_environment(
         self,
         environment_id: str,
         message: Dict[str, Any],
-        exclude: Optional[str] = None
+        exclude: Optional[str] = None,
+        key: Optional[str] = None,
+        state_change: bool = False,
     ):
         """Broadcast message to all Minds in environment.
 
+        The message is serialized once and queued for each Mind, so a slow
+        connection never delays the others.
+
         Args:
             environment_id: Environment ID
             message: Message to broadcast
             exclude: Optional Mind ID to exclude
+            key: Coalescing key for the send queues
+            state_change: Message is a state delta
         """
         minds = self.environment_minds.get(environment_id, set())
+        message_json = json.dumps(message)
 
         for mind_id in minds:
-            if mind_id != exclude:
-                await self._send_to_mind(mind_id, message)
+            if mind_id == exclude:
+                continue
+            queue = self.send_queues.get(mind_id)
+            if queue:
+                queue.put(message_json, key=key, state_change=state_change)
 
     def get_environment_info(self, environment_id: str) -> Dict[str, Any]:
         """Get information about an environment.
@@ -371,6 +470,8 @@ class EnvironmentServer:
             "running": self.running,
             "total_connections": len(self.connections),
             "total_environments": len(self.environment_minds),
+            "messages_dropped": sum(q.dropped for q in self.send_queues.values()),
+            "messages_coalesced": sum(q.coalesced for q in self.send_queues.values()),
             "environments": {
                 env_id: len(minds)
                 for env_id, minds in self.environment_minds.items()
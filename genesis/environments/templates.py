@@ -310,6 +310,7 @@ def create_environment_from_template(
 
     # Create in database using proper session management
     from genesis.database.base import get_session
+    from genesis.database.manager import adjust_metaverse_stats
     from genesis.database.models import EnvironmentRecord
     import uuid
     
@@ -327,6 +328,7 @@ def create_environment_from_template(
             created_at=datetime.utcnow(),
         )
         session.add(env)
+        adjust_metaverse_stats(session, total_environments=1)
         session.commit()
         session.refresh(env)
         
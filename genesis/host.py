@@ -0,0 +1,521 @@
+"""Genesis Mind Host - many Minds in one process.
+
+``genesis.daemon`` runs exactly one Mind per OS process, so hundreds of Minds
+meant hundreds of Python interpreters, each with its own provider clients,
+database pool and ChromaDB/embedding model. The MindHost runs N Minds in one
+event loop instead, sharing:
+- The MindScheduler (one timer heap for every Mind's background jobs)
+- Model orchestrators (one per distinct API key set)
+- The SQLAlchemy engine / connection pool
+- ChromaDB clients and the embedding model
+
+Minds are spread across a small pool of host processes ("shards") by a
+stable hash of their GMID, so every process knows which Minds it owns without
+coordination. Each shard writes a status report (Minds, failures, RSS memory)
+to ``data_dir/hosts/shard-<index>.json`` for the CLI and API.
+
+Fault isolation: a Mind that fails to load or start is recorded and retried
+with backoff without affecting the other Minds in the shard; a failing job
+of a running Mind is contained by the scheduler.
+
+Usage:
+    # One host process running every Mind
+    python -m genesis.host
+
+    # Shard 2 of 4
+    python -m genesis.host --shard-index 2 --shard-count 4
+
+    # Supervisor that spawns and watches 4 shard processes
+    python -m genesis.host --workers 4
+
+    # Or via CLI
+    genesis host start --shards 4
+"""
+
+import asyncio
+import json
+import logging
+import os
+import signal
+import subprocess
+import sys
+import zlib
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from genesis.daemon import MindDaemon
+
+logger = logging.getLogger('genesis.host')
+
+
+def shard_for_gmid(gmid: str, shard_count: int) -> int:
+    """Stable shard assignment for a Mind.
+
+    Args:
+        gmid: Genesis Mind ID
+        shard_count: Total number of shards
+
+    Returns:
+        Shard index in [0, shard_count)
+    """
+    if shard_count <= 1:
+        return 0
+    return zlib.crc32(gmid.encode("utf-8")) % shard_count
+
+
+def list_mind_gmids(minds_dir: Path) -> List[str]:
+    """List the GMIDs of all saved Minds."""
+    return [gmid for gmid in map(read_mind_gmid, sorted(minds_dir.glob("*.json"))) if gmid]
+
+
+def read_mind_gmid(path: Path) -> Optional[str]:
+    """GMID of a saved Mind file (None if it can't be read)."""
+    try:
+        with open(path) as f:
+            return json.load(f)["identity"]["gmid"]
+    except Exception as e:
+        logger.debug(f"Error reading {path}: {e}")
+        return None
+
+
+def get_reports_dir() -> Path:
+    """Directory holding per-shard status reports."""
+    from genesis.config import get_settings
+    reports_dir = get_settings().data_dir / "hosts"
+    reports_dir.mkdir(parents=True, exist_ok=True)
+    return reports_dir
+
+
+def read_shard_reports() -> List[Dict[str, Any]]:
+    """Read the latest status report of every shard (for CLI/API)."""
+    reports = []
+    for path in sorted(get_reports_dir().glob("shard-*.json")):
+        try:
+            with open(path) as f:
+                report = json.load(f)
+        except Exception as e:
+            logger.debug(f"Error reading {path}: {e}")
+            continue
+
+        # A report from a dead process is stale
+        pid = report.get("pid")
+        report["alive"] = _pid_alive(pid) if pid else False
+        reports.append(report)
+    return reports
+
+
+def _pid_alive(pid: int) -> bool:
+    """Check whether a process is still running."""
+    try:
+        import psutil
+        return psutil.pid_exists(pid)
+    except ImportError:
+        try:
+            os.kill(pid, 0)
+            return True
+        except OSError:
+            return False
+
+
+def _rss_bytes() -> Optional[int]:
+    """Resident memory of this process, if psutil is available."""
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except Exception:
+        return None
+
+
+class MindHost:
+    """Run many Minds in a single event loop."""
+
+    def __init__(
+        self,
+        shard_index: int = 0,
+        shard_count: int = 1,
+        mind_ids: Optional[List[str]] = None,
+    ):
+        """Initialize a host for one shard.
+
+        Args:
+            shard_index: Index of this shard
+            shard_count: Total number of shards
+            mind_ids: Explicit Minds to host (default: every Mind whose
+                GMID hashes to this shard)
+        """
+        from genesis.config import get_settings
+
+        self.settings = get_settings()
+        self.shard_index = shard_index
+        self.shard_count = max(1, shard_count)
+        self.explicit_mind_ids = mind_ids
+
+        self.daemons: Dict[str, "MindDaemon"] = {}
+        self.failed: Dict[str, Dict[str, Any]] = {}  # gmid -> {error, attempts, failed_at}
+        self.is_running = False
+        self.started_at: Optional[datetime] = None
+        self._shutdown_event = asyncio.Event()
+        self._jobs = []
+        self._known_files: set = set()  # Mind files already assigned or skipped
+
+    @property
+    def owner(self) -> str:
+        """Scheduler owner key for the host's own jobs."""
+        return f"host-shard-{self.shard_index}"
+
+    def assigned_mind_ids(self) -> List[str]:
+        """GMIDs this shard is responsible for."""
+        if self.explicit_mind_ids:
+            return list(self.explicit_mind_ids)
+        return self._assigned_in(sorted(self.settings.minds_dir.glob("*.json")))
+
+    def _assigned_in(self, paths: List[Path]) -> List[str]:
+        """GMIDs of this shard among Mind files, remembering every file read."""
+        gmids = []
+        for path in paths:
+            gmid = read_mind_gmid(path)
+            if gmid is None:
+                continue  # Retried next time (e.g. still being written)
+            self._known_files.add(path)
+            if shard_for_gmid(gmid, self.shard_count) == self.shard_index:
+                gmids.append(gmid)
+        return gmids
+
+    async def start(self):
+        """Start all assigned Minds and run until a shutdown signal."""
+        try:
+            await self.launch()
+            self._register_signal_handlers()
+            logger.info("   Press Ctrl+C to stop gracefully")
+            await self._shutdown_event.wait()
+        finally:
+            await self.stop()
+
+    async def launch(self):
+        """Start all assigned Minds plus the host's supervision jobs."""
+        from genesis.core.mind_scheduler import get_mind_scheduler
+
+        self.is_running = True
+        self.started_at = datetime.now()
+
+        mind_ids = self.assigned_mind_ids()
+        logger.info(
+            f"[HOST] Shard {self.shard_index}/{self.shard_count} starting {len(mind_ids)} Minds"
+        )
+
+        for gmid in mind_ids:
+            await self.add_mind(gmid)
+
+        scheduler = get_mind_scheduler()
+        self._jobs = [
+            scheduler.schedule(
+                self._retry_failed, interval=self.settings.host_restart_backoff,
+                owner=self.owner, name="host_retry",
+            ),
+            scheduler.schedule(
+                self._write_report, interval=self.settings.host_report_interval,
+                owner=self.owner, name="host_report", delay=0,
+            ),
+        ]
+        if not self.explicit_mind_ids:
+            self._jobs.append(scheduler.schedule(
+                self._discover_minds, interval=self.settings.host_discovery_interval,
+                owner=self.owner, name="host_discover",
+            ))
+
+        logger.info(
+            f"[HOST] Shard {self.shard_index}: {len(self.daemons)} Minds running, "
+            f"{len(self.failed)} failed"
+        )
+
+    async def add_mind(self, gmid: str) -> bool:
+        """Start one Mind in this host. Failures are isolated and recorded.
+
+        Returns:
+            True if the Mind is running
+        """
+        if gmid in self.daemons:
+            return True
+
+        from genesis.daemon import MindDaemon
+
+        daemon = MindDaemon(gmid)
+        try:
+            await daemon.launch()
+        except Exception as e:
+            logger.error(f"[HOST] Mind {gmid} failed to start: {e}", exc_info=True)
+            await self._cleanup_failed(daemon)
+            failure = self.failed.setdefault(gmid, {"attempts": 0})
+            failure["attempts"] += 1
+            failure["error"] = str(e)
+            failure["failed_at"] = datetime.now().isoformat()
+            failure["retry_at"] = (datetime.now() + self._retry_delay(failure["attempts"])).isoformat()
+            return False
+
+        self.daemons[gmid] = daemon
+        self.failed.pop(gmid, None)
+        return True
+
+    async def remove_mind(self, gmid: str) -> bool:
+        """Stop one Mind and remove it from this host."""
+        self.failed.pop(gmid, None)
+        daemon = self.daemons.pop(gmid, None)
+        if not daemon:
+            return False
+        try:
+            await daemon.stop()
+        except Exception as e:
+            logger.error(f"[HOST] Error stopping Mind {gmid}: {e}", exc_info=True)
+        return True
+
+    async def stop(self):
+        """Stop every hosted Mind."""
+        if not self.is_running:
+            return
+        self.is_running = False
+
+        for job in self._jobs:
+            job.cancel()
+        self._jobs = []
+
+        for gmid in list(self.daemons):
+            await self.remove_mind(gmid)
+
+        self._write_report_file()
+        logger.info(f"[HOST] Shard {self.shard_index} stopped")
+
+    async def _cleanup_failed(self, daemon: "MindDaemon"):
+        """Release whatever a partially started Mind left behind."""
+        from genesis.core.mind_scheduler import get_mind_scheduler
+
+        get_mind_scheduler().cancel_owner(daemon.mind_id)
+        if daemon.mind and hasattr(daemon.mind, 'stop_living'):
+            try:
+                await daemon.mind.stop_living()
+            except Exception as e:
+                logger.debug(f"[HOST] Cleanup of {daemon.mind_id} failed: {e}")
+
+    def _retry_delay(self, attempts: int) -> timedelta:
+        """Exponential backoff: host_restart_backoff doubled per failed attempt, capped."""
+        seconds = self.settings.host_restart_backoff * 2 ** (attempts - 1)
+        return timedelta(seconds=min(seconds, self.settings.host_restart_backoff_max))
+
+    async def _retry_failed(self):
+        """Retry Minds that failed to start and whose backoff has elapsed (scheduler job)."""
+        now = datetime.now()
+        for gmid, failure in list(self.failed.items()):
+            if datetime.fromisoformat(failure["retry_at"]) <= now:
+                await self.add_mind(gmid)
+
+    async def _discover_minds(self):
+        """Start Minds saved since launch that belong to this shard (scheduler job)."""
+        new_files = sorted(set(self.settings.minds_dir.glob("*.json")) - self._known_files)
+        for gmid in self._assigned_in(new_files):
+            if gmid not in self.daemons and gmid not in self.failed:
+                logger.info(f"[HOST] Discovered new Mind {gmid}")
+                await self.add_mind(gmid)
+
+    async def _write_report(self):
+        """Write this shard's status report (scheduler job)."""
+        self._write_report_file()
+
+    def get_report(self) -> Dict[str, Any]:
+        """Status of this shard: Minds, failures, memory and scheduler stats."""
+        from genesis.core.mind_scheduler import get_mind_scheduler
+
+        minds = []
+        for gmid, daemon in self.daemons.items():
+            minds.append({
+                "gmid": gmid,
+                "name": daemon.mind.identity.name if daemon.mind else None,
+                "jobs": len(get_mind_scheduler().get_jobs(owner=gmid)),
+            })
+
+        return {
+            "shard_index": self.shard_index,
+            "shard_count": self.shard_count,
+            "pid": os.getpid(),
+            "running": self.is_running,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "updated_at": datetime.now().isoformat(),
+            "rss_bytes": _rss_bytes(),
+            "minds_running": len(self.daemons),
+            "minds_failed": len(self.failed),
+            "minds": minds,
+            "failed": self.failed,
+            "scheduler": get_mind_scheduler().get_stats(),
+        }
+
+    def _write_report_file(self):
+        """Persist the report atomically for readers in other processes."""
+        path = get_reports_dir() / f"shard-{self.shard_index}.json"
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.get_report(), f, indent=2)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.error(f"[HOST] Failed to write shard report: {e}")
+
+    def _register_signal_handlers(self):
+        """Register handlers for graceful shutdown."""
+        def handle_shutdown(signum, frame):
+            logger.info(f"Received signal {signum}, initiating shutdown...")
+            self._shutdown_event.set()
+
+        signal.signal(signal.SIGTERM, handle_shutdown)
+        signal.signal(signal.SIGINT, handle_shutdown)
+
+
+def spawn_shard(
+    shard_index: int,
+    shard_count: int,
+    log_level: str = "INFO",
+    log_file: Optional[Path] = None,
+) -> subprocess.Popen:
+    """Start one shard as a background process."""
+    args = [
+        sys.executable, "-m", "genesis.host",
+        "--shard-index", str(shard_index),
+        "--shard-count", str(shard_count),
+        "--log-level", log_level,
+    ]
+    output = None
+    if log_file:
+        log_file.parent.mkdir(parents=True, exist_ok=True)
+        args += ["--log-file", str(log_file)]
+        output = open(log_file, 'a', encoding='utf-8', buffering=1)  # Line buffered
+
+    return subprocess.Popen(
+        args,
+        stdout=output,
+        stderr=output,
+        creationflags=subprocess.CREATE_NO_WINDOW if hasattr(subprocess, 'CREATE_NO_WINDOW') else 0,
+    )
+
+
+def run_pool(workers: int, log_level: str = "INFO"):
+    """Spawn one process per shard and restart any that exit."""
+    import time
+    from genesis.config import get_settings
+
+    settings = get_settings()
+
+    def log_file_for(index: int) -> Path:
+        return settings.logs_dir / f"host-shard-{index}.log"
+
+    processes = {i: spawn_shard(i, workers, log_level, log_file_for(i)) for i in range(workers)}
+    logger.info(f"[HOST] Started {workers} shard processes")
+
+    stopping = False
+
+    def handle_shutdown(signum, frame):
+        nonlocal stopping
+        stopping = True
+
+    signal.signal(signal.SIGTERM, handle_shutdown)
+    signal.signal(signal.SIGINT, handle_shutdown)
+
+    while not stopping:
+        time.sleep(1)
+        for index, proc in processes.items():
+            if proc.poll() is not None and not stopping:
+                logger.warning(f"[HOST] Shard {index} exited ({proc.returncode}), restarting")
+                processes[index] = spawn_shard(index, workers, log_level, log_file_for(index))
+
+    for proc in processes.values():
+        proc.terminate()
+    for proc in processes.values():
+        try:
+            proc.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+
+
+async def run_host(
+    shard_index: int = 0,
+    shard_count: int = 1,
+    mind_ids: Optional[List[str]] = None,
+    log_level: str = "INFO",
+    log_file: Optional[Path] = None,
+):
+    """Run one host shard (main entry point)."""
+    logging.getLogger().setLevel(getattr(logging, log_level))
+    if log_file:
+        log_file.parent.mkdir(parents=True, exist_ok=True)
+        file_handler = logging.FileHandler(log_file, encoding='utf-8')
+        file_handler.setFormatter(
+            logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        )
+        logging.getLogger().addHandler(file_handler)
+
+    host = MindHost(shard_index=shard_index, shard_count=shard_count, mind_ids=mind_ids)
+    await host.start()
+
+
+def main():
+    """CLI entry point for the Mind host."""
+    import argparse
+    from genesis.config import get_settings
+
+    parser = argparse.ArgumentParser(
+        description='Genesis Mind Host - Run many Minds per process',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Host every Mind in one process
+  python -m genesis.host
+
+  # Run shard 0 of 4
+  python -m genesis.host --shard-index 0 --shard-count 4
+
+  # Supervise 4 shard processes
+  python -m genesis.host --workers 4
+        """
+    )
+    parser.add_argument('--shard-index', type=int, default=0, help='Shard to run (default: 0)')
+    parser.add_argument(
+        '--shard-count', type=int, default=None,
+        help='Total number of shards (default: host_shard_count setting)'
+    )
+    parser.add_argument(
+        '--workers', type=int, default=None,
+        help='Spawn and supervise this many shard processes'
+    )
+    parser.add_argument(
+        '--mind-id', action='append', dest='mind_ids',
+        help='Host only this Mind (repeatable; overrides sharding)'
+    )
+    parser.add_argument(
+        '--log-level', default='INFO', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
+        help='Logging level (default: INFO)'
+    )
+    parser.add_argument('--log-file', type=Path, help='Path to log file (optional)')
+
+    args = parser.parse_args()
+
+    if args.workers and args.workers > 1:
+        run_pool(args.workers, args.log_level)
+        return
+
+    shard_count = args.shard_count or get_settings().host_shard_count
+    try:
+        asyncio.run(run_host(
+            shard_index=args.shard_index,
+            shard_count=shard_count,
+            mind_ids=args.mind_ids,
+            log_level=args.log_level,
+            log_file=args.log_file,
+        ))
+    except KeyboardInterrupt:
+        logger.info("\nHost stopped by user")
+        sys.exit(0)
+    except Exception as e:
+        logger.error(f"Host crashed: {e}", exc_info=True)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,19 +3,21 @@ Marketplace Manager - Handle all marketplace operations.
 """
 
 from datetime import datetime
-from typing import Optional, Dict, Any, List
-from sqlalchemy import desc, and_, or_, func
+from typing import Optional, Dict, Any, List, Tuple
+from sqlalchemy import desc, and_, func
 from sqlalchemy.orm import Session
 
-from genesis.database.base import get_session
+from genesis.database.base import get_session_factory
 from genesis.database.marketplace_models import (
     MarketplaceListing,
+    MarketplaceListingTag,
     MarketplaceTransaction,
     MarketplaceReview,
     MarketplaceFavorite,
     ItemType,
     TransactionStatus,
 )
+from genesis.marketplace import search
 from genesis.core.essence import EssenceManager, TransactionType
 
 
@@ -24,7 +26,7 @@ class MarketplaceManager:
 
     def __init__(self, db_session: Optional[Session] = None):
         """Initialize marketplace manager."""
-        self.session = db_session or get_session()
+        self.session = db_session or get_session_factory()()
 
     # ==================== Listing Management ====================
 
@@ -58,6 +60,8 @@ class MarketplaceManager:
         )
 
         self.session.add(listing)
+        self.session.flush()
+        search.index_listing(self.session, listing)
         self.session.commit()
 
         return listing
@@ -93,6 +97,8 @@ class MarketplaceManager:
                 setattr(listing, key, value)
 
         listing.updated_at = datetime.utcnow()
+        if {"title", "description", "tags", "active"} & updates.keys():
+            search.index_listing(self.session, listing)
         self.session.commit()
 
         return listing
@@ -108,6 +114,7 @@ class MarketplaceManager:
             return False
 
         listing.active = 0
+        search.index_listing(self.session, listing)
         self.session.commit()
 
         return True
@@ -123,23 +130,67 @@ class MarketplaceManager:
         min_price: Optional[float] = None,
         max_price: Optional[float] = None,
         min_rating: Optional[float] = None,
-        sort_by: str = "created_at",  # created_at, price, rating, sales_count
-        order: str = "desc",  # desc or asc
+        sort_by: Optional[str] = None,
+        order: str = "desc",
         limit: int = 20,
         offset: int = 0,
+        cursor: Optional[str] = None,
     ) -> List[MarketplaceListing]:
-        """Search and filter marketplace listings."""
+        """Search and filter marketplace listings (see search_listings_page)."""
+        listings, _ = self.search_listings_page(
+            query=query,
+            item_type=item_type,
+            category=category,
+            tags=tags,
+            min_price=min_price,
+            max_price=max_price,
+            min_rating=min_rating,
+            sort_by=sort_by,
+            order=order,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+        )
+        return listings
+
+    def search_listings_page(
+        self,
+        query: Optional[str] = None,
+        item_type: Optional[ItemType] = None,
+        category: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        min_rating: Optional[float] = None,
+        sort_by: Optional[str] = None,  # relevance, created_at, price, rating, sales_count
+        order: str = "desc",  # desc or asc (relevance is always best first)
+        limit: int = 20,
+        offset: int = 0,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[MarketplaceListing], Optional[str]]:
+        """Search and filter marketplace listings, one keyset page at a time.
+
+        Text queries go through the full-text index and default to relevance
+        order; otherwise listings default to newest first. Pass the returned
+        cursor to get the next page. ``offset`` is only honoured without a
+        cursor, for older clients.
+
+        Returns:
+            (listings, next_cursor) - next_cursor is None on the last page
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
         q = self.session.query(MarketplaceListing).filter_by(active=1)
 
-        # Text search (title or description)
+        # Full-text search, ranked (lower score is better)
+        score = None
         if query:
-            search_pattern = f"%{query}%"
-            q = q.filter(
-                or_(
-                    MarketplaceListing.title.ilike(search_pattern),
-                    MarketplaceListing.description.ilike(search_pattern)
-                )
-            )
+            matches = search.text_match(self.session, query)
+            if matches is None:
+                return [], None
+            q = q.join(matches, matches.c.listing_id == MarketplaceListing.id)
+            score = matches.c.score
 
         # Filters
         if item_type:
@@ -148,10 +199,16 @@ class MarketplaceManager:
         if category:
             q = q.filter_by(category=category)
 
+        tags = search.normalize_tags(tags)
         if tags:
-            # Filter listings that have at least one of the tags
-            for tag in tags:
-                q = q.filter(MarketplaceListing.tags.contains([tag]))
+            # Listings that have all of the tags
+            tagged = (
+                self.session.query(MarketplaceListingTag.listing_id)
+                .filter(MarketplaceListingTag.tag.in_(tags))
+                .group_by(MarketplaceListingTag.listing_id)
+                .having(func.count(MarketplaceListingTag.tag) == len(tags))
+            )
+            q = q.filter(MarketplaceListing.id.in_(tagged))
 
         if min_price is not None:
             q = q.filter(MarketplaceListing.price >= min_price)
@@ -162,17 +219,42 @@ class MarketplaceManager:
         if min_rating is not None:
             q = q.filter(MarketplaceListing.rating >= min_rating)
 
-        # Sorting
-        sort_column = getattr(MarketplaceListing, sort_by, MarketplaceListing.created_at)
-        if order == "desc":
-            q = q.order_by(desc(sort_column))
+        # Sorting: (sort key, id) so every row has a unique position
+        if sort_by is None:
+            sort_by = "relevance" if score is not None else "created_at"
+        if sort_by == "relevance" and score is not None:
+            sort_column, descending = score, False
         else:
-            q = q.order_by(sort_column)
+            sort_by = sort_by if sort_by in search.SORT_COLUMNS else "created_at"
+            sort_column, descending = search.SORT_COLUMNS[sort_by], order == "desc"
+
+        if descending:
+            q = q.order_by(desc(sort_column), desc(MarketplaceListing.id))
+        else:
+            q = q.order_by(sort_column, MarketplaceListing.id)
 
         # Pagination
-        q = q.limit(limit).offset(offset)
+        if cursor:
+            value, last_id = search.decode_cursor(cursor)
+            q = q.filter(search.keyset_after(sort_column, MarketplaceListing.id, value, last_id, descending))
+        elif offset:
+            q = q.offset(offset)
+
+        if score is not None:
+            q = q.add_columns(score)
+            rows = q.limit(limit + 1).all()
+            listings = [listing for listing, _ in rows]
+            sort_values = [row_score if sort_column is score else getattr(listing, sort_by) for listing, row_score in rows]
+        else:
+            listings = q.limit(limit + 1).all()
+            sort_values = [getattr(listing, sort_by) for listing in listings]
 
-        return q.all()
+        next_cursor = None
+        if len(listings) > limit:
+            listings = listings[:limit]
+            next_cursor = search.encode_cursor(sort_values[limit - 1], listings[-1].id)
+
+        return listings, next_cursor
 
     def get_trending_listings(self, item_type: Optional[ItemType] = None, limit: int = 10) -> List[MarketplaceListing]:
         """Get trending items (by recent sales and high ratings)."""
@@ -0,0 +1,224 @@
+"""
+Marketplace search index and keyset pagination helpers.
+
+Listings are searched through the database's full-text engine instead of
+``ILIKE '%query%'`` scans:
+
+- SQLite: an FTS5 table (title, description, tags) ranked with bm25()
+- Postgres: a GIN-indexed tsvector ranked with ts_rank_cd()
+
+Tags live in a normalized join table so tag filters are index lookups.
+Pages are addressed by an opaque cursor holding the last row's sort key,
+so deep pages cost the same as the first one.
+"""
+
+import base64
+import json
+import re
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+
+from sqlalchemy import Float, String, and_, literal, or_, text
+from sqlalchemy.orm import Session
+
+from genesis.database.marketplace_models import (
+    MarketplaceListing,
+    MarketplaceListingTag,
+    MarketplaceSearchDoc,
+    PG_SEARCH_DOCUMENT,
+    SQLITE_FTS_TABLE,
+)
+
+# Column weights for bm25(): title, description, tags
+BM25_WEIGHTS = (10.0, 1.0, 5.0)
+
+SORT_COLUMNS = {
+    "created_at": MarketplaceListing.created_at,
+    "price": MarketplaceListing.price,
+    "rating": MarketplaceListing.rating,
+    "sales_count": MarketplaceListing.sales_count,
+}
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def normalize_tags(tags: Optional[List[str]]) -> List[str]:
+    """Lowercase, strip and de-duplicate tags (order preserved)."""
+    seen = []
+    for tag in tags or []:
+        tag = str(tag).strip().lower()
+        if tag and tag not in seen:
+            seen.append(tag)
+    return seen
+
+
+def to_fts_query(query: str) -> Optional[str]:
+    """Turn free text into a safe FTS5 query: every word, prefix-matched."""
+    tokens = _TOKEN_RE.findall(query or "")
+    if not tokens:
+        return None
+    return " ".join(f'"{token}"*' for token in tokens)
+
+
+# ==================== Index maintenance ====================
+
+def index_listing(session: Session, listing: MarketplaceListing) -> None:
+    """Write a listing's tags and full-text document (call after changes).
+
+    Inactive listings are removed from the full-text index.
+    """
+    tags = normalize_tags(listing.tags)
+    session.query(MarketplaceListingTag).filter_by(listing_id=listing.id).delete()
+    session.add_all(MarketplaceListingTag(listing_id=listing.id, tag=tag) for tag in tags)
+
+    if session.get_bind().dialect.name != "sqlite":
+        return  # Postgres indexes the listing row itself
+
+    doc = session.query(MarketplaceSearchDoc).filter_by(listing_id=listing.id).first()
+    if doc is None:
+        doc = MarketplaceSearchDoc(listing_id=listing.id)
+        session.add(doc)
+        session.flush()
+    else:
+        session.execute(text(f"DELETE FROM {SQLITE_FTS_TABLE} WHERE rowid = :doc_id"), {"doc_id": doc.doc_id})
+
+    if listing.active:
+        session.execute(
+            text(
+                f"INSERT INTO {SQLITE_FTS_TABLE} (rowid, title, description, tags) "
+                "VALUES (:doc_id, :title, :description, :tags)"
+            ),
+            {
+                "doc_id": doc.doc_id,
+                "title": listing.title or "",
+                "description": listing.description or "",
+                "tags": " ".join(tags),
+            },
+        )
+
+
+def ensure_search_index(session: Session) -> int:
+    """Create the search index if missing and backfill unindexed listings.
+
+    Needed for databases whose listings table predates the index.
+
+    Returns:
+        Number of listings backfilled
+    """
+    dialect = session.get_bind().dialect.name
+    if dialect == "sqlite":
+        session.execute(text(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {SQLITE_FTS_TABLE} "
+            "USING fts5(title, description, tags, tokenize = 'porter unicode61')"
+        ))
+        missing = (
+            session.query(MarketplaceListing)
+            .outerjoin(MarketplaceSearchDoc, MarketplaceSearchDoc.listing_id == MarketplaceListing.id)
+            .filter(MarketplaceSearchDoc.doc_id.is_(None))
+        )
+    else:
+        if dialect == "postgresql":
+            session.execute(text(
+                "CREATE INDEX IF NOT EXISTS idx_listings_search "
+                f"ON marketplace_listings USING GIN ({PG_SEARCH_DOCUMENT})"
+            ))
+        missing = (
+            session.query(MarketplaceListing)
+            .outerjoin(MarketplaceListingTag, MarketplaceListingTag.listing_id == MarketplaceListing.id)
+            .filter(MarketplaceListingTag.tag.is_(None))
+        )
+
+    listing_ids = [listing_id for (listing_id,) in missing.with_entities(MarketplaceListing.id)]
+    for start in range(0, len(listing_ids), 500):
+        chunk = listing_ids[start:start + 500]
+        for listing in session.query(MarketplaceListing).filter(MarketplaceListing.id.in_(chunk)).all():
+            index_listing(session, listing)
+        session.flush()
+    session.commit()
+    return len(listing_ids)
+
+
+# ==================== Querying ====================
+
+def text_match(session: Session, query: str):
+    """Build a (listing_id, score) selectable for a text query.
+
+    Lower scores rank higher on every backend.
+
+    Returns:
+        Subquery with ``listing_id`` and ``score`` columns, or None if the
+        query has no searchable words
+    """
+    dialect = session.get_bind().dialect.name
+
+    if dialect == "sqlite":
+        fts_query = to_fts_query(query)
+        if fts_query is None:
+            return None
+        weights = ", ".join(str(w) for w in BM25_WEIGHTS)
+        return (
+            text(
+                f"SELECT d.listing_id AS listing_id, bm25({SQLITE_FTS_TABLE}, {weights}) AS score "
+                f"FROM {SQLITE_FTS_TABLE} JOIN marketplace_search_docs d ON d.doc_id = {SQLITE_FTS_TABLE}.rowid "
+                f"WHERE {SQLITE_FTS_TABLE} MATCH :fts_query"
+            )
+            .bindparams(fts_query=fts_query)
+            .columns(listing_id=String, score=Float)
+            .subquery("search")
+        )
+
+    if dialect == "postgresql":
+        if not _TOKEN_RE.search(query or ""):
+            return None
+        return (
+            text(
+                f"SELECT id AS listing_id, -ts_rank_cd({PG_SEARCH_DOCUMENT}, q) AS score "
+                "FROM marketplace_listings, websearch_to_tsquery('english', :ts_query) AS q "
+                f"WHERE {PG_SEARCH_DOCUMENT} @@ q"
+            )
+            .bindparams(ts_query=query)
+            .columns(listing_id=String, score=Float)
+            .subquery("search")
+        )
+
+    # Other backends: substring match, unranked
+    pattern = f"%{query}%"
+    return (
+        session.query(MarketplaceListing.id.label("listing_id"), literal(0.0).label("score"))
+        .filter(or_(
+            MarketplaceListing.title.ilike(pattern),
+            MarketplaceListing.description.ilike(pattern),
+        ))
+        .subquery("search")
+    )
+
+
+def keyset_after(column, id_column, value: Any, last_id: str, descending: bool):
+    """Filter for rows strictly after (value, last_id) in (column, id) order."""
+    if descending:
+        return or_(column < value, and_(column == value, id_column < last_id))
+    return or_(column > value, and_(column == value, id_column > last_id))
+
+
+def encode_cursor(value: Any, last_id: str) -> str:
+    """Encode the last row's sort key as an opaque cursor."""
+    if isinstance(value, datetime):
+        value = {"dt": value.isoformat()}
+    raw = json.dumps([value, last_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[Any, str]:
+    """Decode a cursor from encode_cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        value, last_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+    if isinstance(value, dict) and "dt" in value:
+        value = datetime.fromisoformat(value["dt"])
+    return value, last_id
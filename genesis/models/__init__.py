@@ -1,6 +1,19 @@
 ﻿"""Model orchestration and LLM backends."""
 
-from genesis.models.orchestrator import ModelOrchestrator
+from typing import TYPE_CHECKING
+
+from genesis._lazy import lazy_exports
 from genesis.models.base import ModelProvider, ModelResponse
 
+# Imported on first access (PEP 562); provider SDKs load only when used
+_LAZY_ATTRS = {
+    "ModelOrchestrator": "genesis.models.orchestrator",
+}
+
+if TYPE_CHECKING:
+    from genesis.models.orchestrator import ModelOrchestrator
+
 __all__ = ["ModelOrchestrator", "ModelProvider", "ModelResponse"]
+
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_ATTRS)
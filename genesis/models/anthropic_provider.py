@@ -3,17 +3,61 @@
 import time
 from typing import Any, Optional
 
-from anthropic import AsyncAnthropic
+from genesis.models.base import CacheHint, ModelProvider, ModelResponse, split_system_prefix
 
-from genesis.models.base import ModelProvider, ModelResponse
+EPHEMERAL = {"type": "ephemeral"}
+
+
+def format_messages(messages: list[dict[str, Any]], cache: Optional[CacheHint] = None) -> tuple[Any, list[dict[str, Any]]]:
+    """
+    Convert chat messages to Anthropic's (system, messages) format.
+
+    With a cache hint, ``cache_control`` breakpoints are placed after the
+    static system prefix and, if ``cache_history``, on the last message
+    before the newest one, so the next turn reads both from the cache.
+    """
+    system_message = None
+    formatted_messages = []
+
+    for msg in messages:
+        if msg["role"] == "system":
+            system_message = msg["content"]
+        else:
+            formatted_messages.append({"role": msg["role"], "content": msg["content"]})
+
+    if cache is None:
+        return system_message, formatted_messages
+
+    split = split_system_prefix(system_message, cache)
+    if split:
+        prefix, rest = split
+        system_message = [{"type": "text", "text": prefix, "cache_control": EPHEMERAL}]
+        if rest.strip():
+            system_message.append({"type": "text", "text": rest})
+
+    if cache.cache_history and len(formatted_messages) >= 2:
+        last_history = formatted_messages[-2]
+        if isinstance(last_history["content"], str) and last_history["content"]:
+            formatted_messages[-2] = {
+                "role": last_history["role"],
+                "content": [{"type": "text", "text": last_history["content"], "cache_control": EPHEMERAL}],
+            }
+
+    return system_message, formatted_messages
 
 
 class AnthropicProvider(ModelProvider):
     """Anthropic (Claude) model provider."""
 
+    supports_prompt_caching = True
+
     def __init__(self, api_key: Optional[str] = None, **kwargs: Any):
         super().__init__(api_key, **kwargs)
-        self.client = AsyncAnthropic(api_key=api_key) if api_key else None
+        if api_key:
+            from anthropic import AsyncAnthropic  # Deferred: the SDK is slow to import
+            self.client = AsyncAnthropic(api_key=api_key)
+        else:
+            self.client = None
 
     def is_available(self) -> bool:
         """Check if Anthropic is available."""
@@ -25,6 +69,7 @@ class AnthropicProvider(ModelProvider):
         model: str = "claude-3-5-sonnet-20241022",
         temperature: float = 0.7,
         max_tokens: int = 1000,
+        cache: Optional[CacheHint] = None,
         **kwargs: Any,
     ) -> ModelResponse:
         """Generate response from Claude."""
@@ -34,14 +79,7 @@ class AnthropicProvider(ModelProvider):
         start_time = time.time()
 
         # Convert messages format for Anthropic
-        system_message = None
-        formatted_messages = []
-
-        for msg in messages:
-            if msg["role"] == "system":
-                system_message = msg["content"]
-            else:
-                formatted_messages.append({"role": msg["role"], "content": msg["content"]})
+        system_message, formatted_messages = format_messages(messages, cache)
 
         response = await self.client.messages.create(
             model=model,
@@ -59,13 +97,23 @@ class AnthropicProvider(ModelProvider):
             if hasattr(block, "text"):
                 content += block.text
 
+        # input_tokens excludes tokens read from or written to the prompt cache
+        cached_tokens = getattr(response.usage, "cache_read_input_tokens", None) or 0
+        cache_write_tokens = getattr(response.usage, "cache_creation_input_tokens", None) or 0
+
         return ModelResponse(
             content=content,
             model=model,
             provider="anthropic",
-            tokens_used=response.usage.input_tokens + response.usage.output_tokens,
+            tokens_used=response.usage.input_tokens + cached_tokens + cache_write_tokens + response.usage.output_tokens,
             latency_ms=latency_ms,
             metadata={"stop_reason": response.stop_reason},
+            usage={
+                "input_tokens": response.usage.input_tokens + cached_tokens + cache_write_tokens,
+                "output_tokens": response.usage.output_tokens,
+                "cached_tokens": cached_tokens,
+                "cache_write_tokens": cache_write_tokens,
+            },
         )
 
     async def stream_generate(
@@ -74,6 +122,7 @@ class AnthropicProvider(ModelProvider):
         model: str = "claude-3-5-sonnet-20241022",
         temperature: float = 0.7,
         max_tokens: int = 1000,
+        cache: Optional[CacheHint] = None,
         **kwargs: Any,
     ):
         """Stream generate from Claude."""
@@ -81,14 +130,7 @@ class AnthropicProvider(ModelProvider):
             raise ValueError("Anthropic API key not configured")
 
         # Convert messages format
-        system_message = None
-        formatted_messages = []
-
-        for msg in messages:
-            if msg["role"] == "system":
-                system_message = msg["content"]
-            else:
-                formatted_messages.append({"role": msg["role"], "content": msg["content"]})
+        system_message, formatted_messages = format_messages(messages, cache)
 
         async with self.client.messages.stream(
             model=model,
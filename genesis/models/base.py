@@ -26,11 +26,59 @@ class ModelResponse:
     cost: Optional[float] = None
     latency_ms: Optional[float] = None
     metadata: Optional[dict[str, Any]] = None
+    # Token breakdown: input_tokens, output_tokens, cached_tokens (read from
+    # the provider's prompt cache) and cache_write_tokens, when reported
+    usage: Optional[dict[str, int]] = None
+
+
+@dataclass
+class CacheHint:
+    """
+    Marks the stable prefix of a request for provider-side prompt caching.
+
+    Passed to ``generate``/``stream_generate`` as ``cache=``. Providers
+    that support prompt caching place cache breakpoints after the prefix
+    (Anthropic) or keep it first and route by ``key`` (OpenAI); others
+    ignore it.
+    """
+
+    # Leading part of the system message that rarely changes
+    system_prefix: str
+    # Groups requests that share the prefix (e.g. the Mind's GMID)
+    key: Optional[str] = None
+    # Also cache the conversation history up to the latest message
+    cache_history: bool = True
+
+
+def split_system_prefix(content: str, hint: Optional[CacheHint]) -> Optional[tuple[str, str]]:
+    """
+    Split a system message into (cached prefix, remainder).
+
+    Returns:
+        The split, or None if there is no hint or the content doesn't
+        start with the hinted prefix
+    """
+    if not hint or not hint.system_prefix or not isinstance(content, str):
+        return None
+    if not content.startswith(hint.system_prefix):
+        return None
+    return hint.system_prefix, content[len(hint.system_prefix):]
+
+
+def system_messages_first(messages: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Order messages so system messages (the stable prefix) lead, keeping relative order."""
+    return (
+        [m for m in messages if m.get("role") == "system"]
+        + [m for m in messages if m.get("role") != "system"]
+    )
 
 
 class ModelProvider(ABC):
     """Abstract base class for model providers."""
 
+    # Whether generate/stream_generate accept a ``cache`` CacheHint
+    supports_prompt_caching: bool = False
+
     def __init__(self, api_key: Optional[str] = None, **kwargs: Any):
         self.api_key = api_key
         self.config = kwargs
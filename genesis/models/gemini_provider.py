@@ -3,12 +3,6 @@
 import time
 from typing import Any, Optional
 
-try:
-    import google.generativeai as genai
-    GEMINI_AVAILABLE = True
-except ImportError:
-    GEMINI_AVAILABLE = False
-
 from genesis.models.base import ModelProvider, ModelResponse
 
 
@@ -18,13 +12,18 @@ class GeminiProvider(ModelProvider):
     def __init__(self, api_key: Optional[str] = None, **kwargs: Any):
         super().__init__(api_key, **kwargs)
         self.client = None
-        if api_key and GEMINI_AVAILABLE:
+        if api_key:
+            # Deferred: the SDK is slow to import and optional
+            try:
+                import google.generativeai as genai
+            except ImportError:
+                return
             genai.configure(api_key=api_key)
             self.client = genai
 
     def is_available(self) -> bool:
         """Check if Gemini is available."""
-        return self.client is not None and GEMINI_AVAILABLE
+        return self.client is not None
 
     def _convert_messages_to_gemini_format(
         self, messages: list[dict[str, str]]
@@ -83,7 +82,7 @@ class GeminiProvider(ModelProvider):
         if system_instruction:
             model_kwargs["system_instruction"] = system_instruction
 
-        gemini_model = genai.GenerativeModel(**model_kwargs)
+        gemini_model = self.client.GenerativeModel(**model_kwargs)
 
         # If we have chat history, use chat mode
         if len(chat_history) > 1:
@@ -102,11 +101,18 @@ class GeminiProvider(ModelProvider):
 
         # Extract token usage if available
         tokens_used = None
+        usage = None
         if hasattr(response, "usage_metadata"):
             tokens_used = (
                 response.usage_metadata.prompt_token_count
                 + response.usage_metadata.candidates_token_count
             )
+            usage = {
+                "input_tokens": response.usage_metadata.prompt_token_count,
+                "output_tokens": response.usage_metadata.candidates_token_count,
+                "cached_tokens": getattr(response.usage_metadata, "cached_content_token_count", 0) or 0,
+                "cache_write_tokens": 0,
+            }
 
         return ModelResponse(
             content=response.text,
@@ -114,6 +120,7 @@ class GeminiProvider(ModelProvider):
             provider="gemini",
             tokens_used=tokens_used,
             latency_ms=latency_ms,
+            usage=usage,
             metadata={
                 "finish_reason": (
                     response.candidates[0].finish_reason.name
@@ -165,7 +172,7 @@ class GeminiProvider(ModelProvider):
         if system_instruction:
             model_kwargs["system_instruction"] = system_instruction
 
-        gemini_model = genai.GenerativeModel(**model_kwargs)
+        gemini_model = self.client.GenerativeModel(**model_kwargs)
 
         # If we have chat history, use chat mode
         if len(chat_history) > 1:
@@ -5,9 +5,9 @@ import time
 from typing import Any, Optional
 
 import httpx
-from groq import AsyncGroq
 
 from genesis.models.base import ModelProvider, ModelResponse
+from genesis.models.openai_provider import usage_breakdown
 
 
 class GroqProvider(ModelProvider):
@@ -16,6 +16,8 @@ class GroqProvider(ModelProvider):
     def __init__(self, api_key: Optional[str] = None, **kwargs: Any):
         super().__init__(api_key, **kwargs)
         if api_key:
+            from groq import AsyncGroq  # Deferred: the SDK is slow to import
+
             # Create HTTP client with SSL context that uses system certificates
             http_client = httpx.AsyncClient(
                 verify=ssl.create_default_context(),
@@ -83,6 +85,7 @@ class GroqProvider(ModelProvider):
             provider="groq",
             tokens_used=response.usage.total_tokens if response.usage else None,
             latency_ms=latency_ms,
+            usage=usage_breakdown(response.usage),
             metadata={"finish_reason": response.choices[0].finish_reason},
         )
         
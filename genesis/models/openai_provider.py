@@ -3,17 +3,47 @@
 import time
 from typing import Any, Optional
 
-from openai import AsyncOpenAI
+from genesis.models.base import CacheHint, ModelProvider, ModelResponse, system_messages_first
 
-from genesis.models.base import ModelProvider, ModelResponse
+
+def usage_breakdown(usage: Any) -> Optional[dict[str, int]]:
+    """Token breakdown from an OpenAI-compatible usage object, including cached prompt tokens."""
+    if not usage:
+        return None
+    details = getattr(usage, "prompt_tokens_details", None)
+    return {
+        "input_tokens": usage.prompt_tokens or 0,
+        "output_tokens": usage.completion_tokens or 0,
+        "cached_tokens": (getattr(details, "cached_tokens", None) or 0) if details else 0,
+        "cache_write_tokens": 0,
+    }
+
+
+def with_prompt_cache_key(kwargs: dict[str, Any], key: str) -> None:
+    """Set ``prompt_cache_key`` in the request's ``extra_body``, keeping a caller-supplied one."""
+    extra_body = dict(kwargs.get("extra_body") or {})
+    extra_body.setdefault("prompt_cache_key", key)
+    kwargs["extra_body"] = extra_body
 
 
 class OpenAIProvider(ModelProvider):
-    """OpenAI model provider."""
+    """OpenAI model provider.
+
+    OpenAI caches prompt prefixes automatically (1024+ tokens). With a cache
+    hint the system messages are kept first and ``prompt_cache_key`` routes
+    requests sharing a prefix to the same cache. It is sent in the request
+    body so SDKs older than the parameter still pass it through.
+    """
+
+    supports_prompt_caching = True
 
     def __init__(self, api_key: Optional[str] = None, **kwargs: Any):
         super().__init__(api_key, **kwargs)
-        self.client = AsyncOpenAI(api_key=api_key) if api_key else None
+        if api_key:
+            from openai import AsyncOpenAI  # Deferred: the SDK is slow to import
+            self.client = AsyncOpenAI(api_key=api_key)
+        else:
+            self.client = None
 
     def is_available(self) -> bool:
         """Check if OpenAI is available."""
@@ -25,6 +55,7 @@ class OpenAIProvider(ModelProvider):
         model: str = "gpt-4-turbo-preview",
         temperature: float = 0.7,
         max_tokens: int = 1000,
+        cache: Optional[CacheHint] = None,
         **kwargs: Any,
     ) -> ModelResponse:
         """Generate response from OpenAI."""
@@ -33,6 +64,11 @@ class OpenAIProvider(ModelProvider):
 
         start_time = time.time()
 
+        if cache:
+            messages = system_messages_first(messages)
+            if cache.key:
+                with_prompt_cache_key(kwargs, cache.key)
+
         response = await self.client.chat.completions.create(
             model=model,
             messages=messages,
@@ -50,6 +86,7 @@ class OpenAIProvider(ModelProvider):
             tokens_used=response.usage.total_tokens if response.usage else None,
             latency_ms=latency_ms,
             metadata={"finish_reason": response.choices[0].finish_reason},
+            usage=usage_breakdown(response.usage),
         )
 
     async def stream_generate(
@@ -58,12 +95,18 @@ class OpenAIProvider(ModelProvider):
         model: str = "gpt-4-turbo-preview",
         temperature: float = 0.7,
         max_tokens: int = 1000,
+        cache: Optional[CacheHint] = None,
         **kwargs: Any,
     ):
         """Stream generate from OpenAI."""
         if not self.is_available():
             raise ValueError("OpenAI API key not configured")
 
+        if cache:
+            messages = system_messages_first(messages)
+            if cache.key:
+                with_prompt_cache_key(kwargs, cache.key)
+
         stream = await self.client.chat.completions.create(
             model=model,
             messages=messages,
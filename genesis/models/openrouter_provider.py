@@ -5,17 +5,53 @@ import time
 from typing import Any, Optional
 
 import httpx
-from openai import AsyncOpenAI
 
-from genesis.models.base import ModelProvider, ModelResponse
+from genesis.models.base import CacheHint, ModelProvider, ModelResponse, system_messages_first
+from genesis.models.anthropic_provider import EPHEMERAL
+from genesis.models.openai_provider import usage_breakdown
+
+# Upstreams that need explicit cache_control breakpoints; the rest
+# (OpenAI, DeepSeek, ...) cache stable prefixes automatically
+BREAKPOINT_CACHING_PREFIXES = ("anthropic/", "google/gemini")
+
+
+def apply_cache_hint(messages: list[dict[str, Any]], model: str, cache: Optional[CacheHint]) -> list[dict[str, Any]]:
+    """Prepare messages for prompt caching on OpenRouter.
+
+    System messages are kept first. For upstreams that need breakpoints,
+    the static system prefix becomes its own content part with
+    ``cache_control``.
+    """
+    if not cache:
+        return messages
+    messages = system_messages_first(messages)
+    if not model.startswith(BREAKPOINT_CACHING_PREFIXES):
+        return messages
+
+    prepared = []
+    for msg in messages:
+        content = msg.get("content")
+        if msg.get("role") == "system" and isinstance(content, str) and cache.system_prefix \
+                and content.startswith(cache.system_prefix):
+            parts = [{"type": "text", "text": cache.system_prefix, "cache_control": EPHEMERAL}]
+            rest = content[len(cache.system_prefix):]
+            if rest.strip():
+                parts.append({"type": "text", "text": rest})
+            msg = {**msg, "content": parts}
+        prepared.append(msg)
+    return prepared
 
 
 class OpenRouterProvider(ModelProvider):
     """OpenRouter model provider - unified access to multiple AI models with many free options."""
 
+    supports_prompt_caching = True
+
     def __init__(self, api_key: Optional[str] = None, **kwargs: Any):
         super().__init__(api_key, **kwargs)
         if api_key:
+            from openai import AsyncOpenAI  # Deferred: the SDK is slow to import
+
             # Create HTTP client with SSL context that uses system certificates
             http_client = httpx.AsyncClient(
                 verify=ssl.create_default_context(),
@@ -40,6 +76,7 @@ class OpenRouterProvider(ModelProvider):
         model: str = "deepseek/deepseek-chat",
         temperature: float = 0.7,
         max_tokens: int = 1000,
+        cache: Optional[CacheHint] = None,
         **kwargs: Any,
     ) -> ModelResponse:
         """Generate response from OpenRouter."""
@@ -47,6 +84,7 @@ class OpenRouterProvider(ModelProvider):
             raise ValueError("OpenRouter API key not configured")
 
         start_time = time.time()
+        messages = apply_cache_hint(messages, model, cache)
 
         # Convert 'functions' to 'tools' format if present
         if 'functions' in kwargs:
@@ -99,6 +137,7 @@ class OpenRouterProvider(ModelProvider):
             tokens_used=response.usage.total_tokens if response.usage else None,
             latency_ms=latency_ms,
             metadata={"finish_reason": response.choices[0].finish_reason},
+            usage=usage_breakdown(response.usage),
         )
         
         # Add function_call if present (convert from tool_calls)
@@ -117,12 +156,15 @@ class OpenRouterProvider(ModelProvider):
         model: str = "deepseek/deepseek-chat",
         temperature: float = 0.7,
         max_tokens: int = 1000,
+        cache: Optional[CacheHint] = None,
         **kwargs: Any,
     ):
         """Stream generate from OpenRouter."""
         if not self.is_available():
             raise ValueError("OpenRouter API key not configured")
 
+        messages = apply_cache_hint(messages, model, cache)
+
         stream = await self.client.chat.completions.create(
             model=model,
             messages=messages,
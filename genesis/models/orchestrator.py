@@ -11,6 +11,7 @@ from genesis.models.ollama_provider import OllamaProvider
 from genesis.models.gemini_provider import GeminiProvider
 from genesis.models.pollinations_provider import PollinationsProvider
 from genesis.models.openrouter_provider import OpenRouterProvider
+from genesis.models.telemetry import LLMSpan, get_llm_metrics
 
 
 class ModelOrchestrator:
@@ -154,7 +155,13 @@ class ModelOrchestrator:
             model: Model string (e.g., 'openai/gpt-4', 'groq/llama-3.1-70b')
             temperature: Sampling temperature
             max_tokens: Maximum tokens to generate
+            cache: Optional CacheHint marking the stable prompt prefix
+                (dropped for providers without prompt caching)
+            purpose: Subsystem making the call, for telemetry (default "unspecified")
+            mind_id: Mind the call is made for, for telemetry
         """
+        purpose = kwargs.pop("purpose", None) or "unspecified"
+        mind_id = kwargs.pop("mind_id", None)
         # CRITICAL: model is REQUIRED - do NOT fall back to settings defaults
         # Always use the Mind's configured models, never global defaults
         if model is None:
@@ -173,13 +180,24 @@ class ModelOrchestrator:
             )
 
         provider = self.providers[provider_name]
-        return await provider.generate(
-            messages=messages,
-            model=model_name,
-            temperature=temperature,
-            max_tokens=max_tokens,
-            **kwargs,
-        )
+        if not provider.supports_prompt_caching:
+            kwargs.pop("cache", None)
+
+        span = LLMSpan(purpose=purpose, provider=provider_name, model=model_name, mind_id=mind_id)
+        span.dispatched()
+        try:
+            response = await provider.generate(
+                messages=messages,
+                model=model_name,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                **kwargs,
+            )
+        except Exception as e:
+            get_llm_metrics().record(span.finish(messages, error=e))
+            raise
+        get_llm_metrics().record(span.finish(messages, response=response))
+        return response
 
     async def stream_generate(
         self,
@@ -189,7 +207,9 @@ class ModelOrchestrator:
         max_tokens: int = 1000,
         **kwargs: Any,
     ):
-        """Stream generate responses."""
+        """Stream generate responses (accepts the same purpose/mind_id tags as generate)."""
+        purpose = kwargs.pop("purpose", None) or "unspecified"
+        mind_id = kwargs.pop("mind_id", None)
         # CRITICAL: model is REQUIRED - do NOT fall back to settings defaults
         if model is None:
             raise ValueError(
@@ -204,14 +224,33 @@ class ModelOrchestrator:
             raise ValueError(f"Provider '{provider_name}' not available")
 
         provider = self.providers[provider_name]
-        async for chunk in provider.stream_generate(
-            messages=messages,
-            model=model_name,
-            temperature=temperature,
-            max_tokens=max_tokens,
-            **kwargs,
-        ):
-            yield chunk
+        if not provider.supports_prompt_caching:
+            kwargs.pop("cache", None)
+
+        span = LLMSpan(
+            purpose=purpose, provider=provider_name, model=model_name, mind_id=mind_id, streamed=True
+        )
+        chunks: list[str] = []
+        span.dispatched()
+        try:
+            async for chunk in provider.stream_generate(
+                messages=messages,
+                model=model_name,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                **kwargs,
+            ):
+                span.first_token()
+                chunks.append(chunk)
+                yield chunk
+        except BaseException as e:
+            # Includes the consumer closing the stream early (GeneratorExit)
+            if isinstance(e, Exception):
+                get_llm_metrics().record(span.finish(messages, error=e))
+            else:
+                get_llm_metrics().record(span.finish(messages, content="".join(chunks)))
+            raise
+        get_llm_metrics().record(span.finish(messages, content="".join(chunks)))
 
     def get_available_providers(self) -> list[str]:
         """Get list of available providers."""
@@ -268,3 +307,27 @@ class ModelOrchestrator:
                 return False, f"SSL/Certificate error: {error_msg}"
             else:
                 return False, f"Connection error: {error_msg}"
+
+
+# Orchestrators shared across Minds, keyed by their API key set.
+# Provider clients hold connection pools, so Minds hosted in one process
+# (see genesis.host) share them instead of building one set per Mind.
+_shared_orchestrators: dict[tuple[tuple[str, str], ...], ModelOrchestrator] = {}
+
+
+def get_shared_orchestrator(api_keys: Optional[dict[str, str]] = None) -> ModelOrchestrator:
+    """
+    Get a process-wide ModelOrchestrator for the given API keys.
+
+    Args:
+        api_keys: Optional dict of API keys by provider name
+
+    Returns:
+        Shared orchestrator (created on first use)
+    """
+    key = tuple(sorted((api_keys or {}).items()))
+    orchestrator = _shared_orchestrators.get(key)
+    if orchestrator is None:
+        orchestrator = ModelOrchestrator(api_keys=dict(api_keys) if api_keys else None)
+        _shared_orchestrators[key] = orchestrator
+    return orchestrator
@@ -0,0 +1,347 @@
+"""
+Per-call LLM telemetry.
+
+ModelOrchestrator records an LLMSpan for every generate/stream_generate
+call: which subsystem made it (``purpose``), for which Mind, the model,
+queue wait, time to first token, total latency, prompt/completion/cached
+tokens and an estimated cost. Spans are aggregated in an in-process
+LLMMetricsRegistry, exposed as JSON and in Prometheus text format.
+
+Callers tag calls through the orchestrator:
+
+    await orchestrator.generate(messages, model=..., purpose="intent_classifier", mind_id=gmid)
+"""
+
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+# USD per 1M tokens (input, cached input, output) by model-name fragment,
+# first match wins. Estimates only - check provider pricing for billing.
+MODEL_PRICES: List[Tuple[str, Tuple[float, float, float]]] = [
+    ("claude-3-opus", (15.00, 1.50, 75.00)),
+    ("claude-opus", (15.00, 1.50, 75.00)),
+    ("haiku", (0.80, 0.08, 4.00)),
+    ("claude", (3.00, 0.30, 15.00)),
+    ("gpt-4o-mini", (0.15, 0.075, 0.60)),
+    ("gpt-4o", (2.50, 1.25, 10.00)),
+    ("gpt-4.1-nano", (0.10, 0.025, 0.40)),
+    ("gpt-4.1-mini", (0.40, 0.10, 1.60)),
+    ("gpt-4.1", (2.00, 0.50, 8.00)),
+    ("gpt-4-turbo", (10.00, 10.00, 30.00)),
+    ("gpt-4", (30.00, 30.00, 60.00)),
+    ("gpt-3.5", (0.50, 0.50, 1.50)),
+    ("gemini-1.5-flash", (0.075, 0.01875, 0.30)),
+    ("gemini-1.5-pro", (1.25, 0.3125, 5.00)),
+    ("gemini", (0.10, 0.025, 0.40)),
+    ("llama-3.3-70b", (0.59, 0.59, 0.79)),
+    ("llama-3.1-8b", (0.05, 0.05, 0.08)),
+    ("deepseek", (0.27, 0.07, 1.10)),
+]
+
+# Providers that don't bill per token
+FREE_PROVIDERS = {"ollama", "pollinations"}
+
+# Histogram buckets (seconds)
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+RECENT_SPANS = 100
+
+
+def estimate_cost(provider: str, model: str, prompt_tokens: int, completion_tokens: int, cached_tokens: int = 0) -> Optional[float]:
+    """
+    Estimate the USD cost of a call.
+
+    Returns:
+        Cost, 0.0 for free models/providers, or None for unknown models
+    """
+    name = (model or "").lower()
+    if provider in FREE_PROVIDERS or name.endswith(":free"):
+        return 0.0
+    for fragment, (input_price, cached_price, output_price) in MODEL_PRICES:
+        if fragment in name:
+            uncached = max(prompt_tokens - cached_tokens, 0)
+            return (
+                uncached * input_price
+                + cached_tokens * cached_price
+                + completion_tokens * output_price
+            ) / 1_000_000
+    return None
+
+
+def _estimate_tokens(text: str) -> int:
+    """Rough token estimate (chars / 4) for calls without reported usage."""
+    return len(text) // 4 + 1 if text else 0
+
+
+@dataclass
+class LLMSpan:
+    """One LLM call."""
+
+    purpose: str
+    provider: str
+    model: str
+    mind_id: Optional[str] = None
+    streamed: bool = False
+    started_at: float = field(default_factory=time.time)
+    queue_wait_ms: float = 0.0
+    ttft_ms: Optional[float] = None
+    latency_ms: float = 0.0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cached_tokens: int = 0
+    tokens_estimated: bool = False
+    cost_usd: Optional[float] = None
+    success: bool = True
+    error: Optional[str] = None
+
+    def __post_init__(self):
+        self._start = time.perf_counter()
+        self._dispatched: Optional[float] = None
+
+    def dispatched(self) -> None:
+        """Mark the hand-off to the provider (ends the queue wait)."""
+        self._dispatched = time.perf_counter()
+        self.queue_wait_ms = (self._dispatched - self._start) * 1000
+
+    def first_token(self) -> None:
+        """Mark the first streamed chunk."""
+        if self.ttft_ms is None:
+            self.ttft_ms = (time.perf_counter() - (self._dispatched or self._start)) * 1000
+
+    def finish(
+        self,
+        messages: List[Dict[str, Any]],
+        response: Any = None,
+        content: Optional[str] = None,
+        error: Optional[BaseException] = None
+    ) -> "LLMSpan":
+        """
+        Close the span with the call's outcome.
+
+        Args:
+            messages: Request messages (for token estimates)
+            response: ModelResponse, for non-streaming calls
+            content: Streamed text, for streaming calls
+            error: Exception, if the call failed
+        """
+        self.latency_ms = (time.perf_counter() - self._start) * 1000
+        if error is not None:
+            self.success = False
+            self.error = f"{type(error).__name__}: {error}"[:200]
+            return self
+
+        usage = getattr(response, "usage", None) if response is not None else None
+        if isinstance(usage, dict) and usage:
+            self.prompt_tokens = usage.get("input_tokens", 0)
+            self.completion_tokens = usage.get("output_tokens", 0)
+            self.cached_tokens = usage.get("cached_tokens", 0)
+        else:
+            text = content if content is not None else getattr(response, "content", "") or ""
+            self.prompt_tokens = sum(_estimate_tokens(str(m.get("content") or "")) for m in messages)
+            self.completion_tokens = _estimate_tokens(text)
+            self.tokens_estimated = True
+
+        self.cost_usd = estimate_cost(
+            self.provider, self.model, self.prompt_tokens, self.completion_tokens, self.cached_tokens
+        )
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the span."""
+        return asdict(self)
+
+
+class _Histogram:
+    """Cumulative-bucket histogram (Prometheus style)."""
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.total += value
+        self.count += 1
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Bucket upper bound containing the q-quantile."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        for bound, count in zip(self.buckets, self.counts):
+            if count >= rank:
+                return bound
+        return float("inf")
+
+
+class _Series:
+    """Aggregates for one (purpose, provider, model)."""
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.cached_tokens = 0
+        self.cost_usd = 0.0
+        self.queue_wait_seconds = 0.0
+        self.latency = _Histogram()
+        self.ttft = _Histogram()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "cached_tokens": self.cached_tokens,
+            "cost_usd": round(self.cost_usd, 6),
+            "avg_latency_ms": round(self.latency.total / self.latency.count * 1000, 1) if self.latency.count else None,
+            "p95_latency_ms": _ms(self.latency.quantile(0.95)),
+            "avg_ttft_ms": round(self.ttft.total / self.ttft.count * 1000, 1) if self.ttft.count else None,
+            "avg_queue_wait_ms": round(self.queue_wait_seconds / self.calls * 1000, 1) if self.calls else None,
+        }
+
+
+def _ms(seconds: Optional[float]) -> Optional[float]:
+    if seconds is None or seconds == float("inf"):
+        return seconds
+    return seconds * 1000
+
+
+def _label(value: Any) -> str:
+    """Escape a Prometheus label value."""
+    return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+class LLMMetricsRegistry:
+    """Thread-safe aggregation of LLM spans."""
+
+    def __init__(self, recent: int = RECENT_SPANS):
+        self._lock = threading.Lock()
+        self._series: Dict[Tuple[str, str, str], _Series] = {}
+        self._by_mind: Dict[str, Dict[str, float]] = {}
+        self._recent: deque = deque(maxlen=recent)
+
+    def record(self, span: LLMSpan) -> None:
+        """Add a finished span."""
+        with self._lock:
+            series = self._series.setdefault((span.purpose, span.provider, span.model), _Series())
+            series.calls += 1
+            series.queue_wait_seconds += span.queue_wait_ms / 1000
+            series.latency.observe(span.latency_ms / 1000)
+            if span.ttft_ms is not None:
+                series.ttft.observe(span.ttft_ms / 1000)
+            if not span.success:
+                series.errors += 1
+            series.prompt_tokens += span.prompt_tokens
+            series.completion_tokens += span.completion_tokens
+            series.cached_tokens += span.cached_tokens
+            series.cost_usd += span.cost_usd or 0.0
+
+            if span.mind_id:
+                mind = self._by_mind.setdefault(span.mind_id, {"calls": 0, "tokens": 0, "cost_usd": 0.0})
+                mind["calls"] += 1
+                mind["tokens"] += span.prompt_tokens + span.completion_tokens
+                mind["cost_usd"] += span.cost_usd or 0.0
+
+            self._recent.append(span)
+
+    def snapshot(self, recent: int = 20) -> Dict[str, Any]:
+        """Aggregated metrics as JSON-serializable data."""
+        with self._lock:
+            series = [
+                {"purpose": purpose, "provider": provider, "model": model, **s.to_dict()}
+                for (purpose, provider, model), s in sorted(self._series.items())
+            ]
+            by_purpose: Dict[str, Dict[str, float]] = {}
+            for row in series:
+                totals = by_purpose.setdefault(row["purpose"], {"calls": 0, "errors": 0, "tokens": 0, "cost_usd": 0.0})
+                totals["calls"] += row["calls"]
+                totals["errors"] += row["errors"]
+                totals["tokens"] += row["prompt_tokens"] + row["completion_tokens"]
+                totals["cost_usd"] = round(totals["cost_usd"] + row["cost_usd"], 6)
+            return {
+                "totals": {
+                    "calls": sum(r["calls"] for r in series),
+                    "errors": sum(r["errors"] for r in series),
+                    "prompt_tokens": sum(r["prompt_tokens"] for r in series),
+                    "completion_tokens": sum(r["completion_tokens"] for r in series),
+                    "cached_tokens": sum(r["cached_tokens"] for r in series),
+                    "cost_usd": round(sum(r["cost_usd"] for r in series), 6),
+                },
+                "by_purpose": by_purpose,
+                "by_mind": {mind: dict(v, cost_usd=round(v["cost_usd"], 6)) for mind, v in self._by_mind.items()},
+                "series": series,
+                "recent": [span.to_dict() for span in list(self._recent)[-recent:]] if recent else [],
+            }
+
+    def to_prometheus(self) -> str:
+        """Metrics in Prometheus text exposition format."""
+        lines: List[str] = []
+
+        def header(name: str, kind: str, help_text: str) -> None:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        with self._lock:
+            items = sorted(self._series.items())
+
+            def labels(key: Tuple[str, str, str], **extra: str) -> str:
+                purpose, provider, model = key
+                pairs = {"purpose": purpose, "provider": provider, "model": model, **extra}
+                return "{" + ",".join(f'{k}="{_label(v)}"' for k, v in pairs.items()) + "}"
+
+            header("genesis_llm_calls_total", "counter", "LLM calls")
+            lines.extend(f"genesis_llm_calls_total{labels(k)} {s.calls}" for k, s in items)
+            header("genesis_llm_errors_total", "counter", "Failed LLM calls")
+            lines.extend(f"genesis_llm_errors_total{labels(k)} {s.errors}" for k, s in items)
+            header("genesis_llm_tokens_total", "counter", "LLM tokens by kind (prompt, completion, cached)")
+            for k, s in items:
+                lines.append(f"genesis_llm_tokens_total{labels(k, kind='prompt')} {s.prompt_tokens}")
+                lines.append(f"genesis_llm_tokens_total{labels(k, kind='completion')} {s.completion_tokens}")
+                lines.append(f"genesis_llm_tokens_total{labels(k, kind='cached')} {s.cached_tokens}")
+            header("genesis_llm_cost_usd_total", "counter", "Estimated LLM cost in USD")
+            lines.extend(f"genesis_llm_cost_usd_total{labels(k)} {s.cost_usd:.6f}" for k, s in items)
+            header("genesis_llm_queue_wait_seconds_total", "counter", "Time LLM calls waited before dispatch")
+            lines.extend(f"genesis_llm_queue_wait_seconds_total{labels(k)} {s.queue_wait_seconds:.6f}" for k, s in items)
+
+            for name, attr, help_text in (
+                ("genesis_llm_latency_seconds", "latency", "Total LLM call latency"),
+                ("genesis_llm_ttft_seconds", "ttft", "Time to first streamed token"),
+            ):
+                header(name, "histogram", help_text)
+                for k, s in items:
+                    histogram = getattr(s, attr)
+                    for bound, count in zip(histogram.buckets, histogram.counts):
+                        lines.append(f"{name}_bucket{labels(k, le=str(bound))} {count}")
+                    lines.append(f"{name}_bucket{labels(k, le='+Inf')} {histogram.count}")
+                    lines.append(f"{name}_sum{labels(k)} {histogram.total:.6f}")
+                    lines.append(f"{name}_count{labels(k)} {histogram.count}")
+
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """Clear all metrics."""
+        with self._lock:
+            self._series.clear()
+            self._by_mind.clear()
+            self._recent.clear()
+
+
+_llm_metrics: Optional[LLMMetricsRegistry] = None
+
+
+def get_llm_metrics() -> LLMMetricsRegistry:
+    """Get the process-wide LLM metrics registry."""
+    global _llm_metrics
+    if _llm_metrics is None:
+        _llm_metrics = LLMMetricsRegistry()
+    return _llm_metrics
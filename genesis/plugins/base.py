@@ -1,7 +1,8 @@
 ﻿"""Base Plugin class for Genesis Mind extensions."""
 
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional, TYPE_CHECKING
+from typing import Any, Dict, Hashable, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from genesis.core.mind import Mind
@@ -32,6 +33,11 @@ class Plugin(ABC):
                 return "You have feature X enabled."
     """
 
+    # The Mind caches extend_system_prompt() output. It is rebuilt when
+    # invalidate_prompt() is called, or at the latest after this many seconds.
+    prompt_cache_ttl: float = 300.0
+    prompt_version: int = 0
+
     def __init__(self, **config):
         """
         Initialize plugin with configuration.
@@ -157,6 +163,29 @@ class Plugin(ABC):
         """
         return ""
 
+    def invalidate_prompt(self) -> None:
+        """
+        Mark this plugin's system prompt section as stale.
+
+        Call this when state shown by extend_system_prompt() changes.
+        """
+        self.prompt_version += 1
+
+    def get_prompt_version(self, mind: "Mind") -> Hashable:
+        """
+        Return a cheap stamp of the state extend_system_prompt() renders.
+
+        The cached section is reused while the stamp is unchanged. Override
+        with an exact fingerprint when one is cheap to compute.
+
+        Args:
+            mind: The Mind instance
+
+        Returns:
+            Hashable version stamp
+        """
+        return (self.prompt_version, int(time.monotonic() // self.prompt_cache_ttl))
+
     def on_save(self, mind: "Mind") -> Dict[str, Any]:
         """
         Serialize plugin state for persistence.
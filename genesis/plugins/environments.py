@@ -1,6 +1,6 @@
 ﻿"""Environments Plugin - Adds metaverse environment support."""
 
-from typing import Dict, Any, TYPE_CHECKING
+from typing import Dict, Any, Hashable, TYPE_CHECKING
 from genesis.plugins.base import Plugin
 from genesis.core.environment import EnvironmentManager
 
@@ -33,6 +33,16 @@ class EnvironmentsPlugin(Plugin):
             return f"ENVIRONMENT:\n{context}"
         return ""
 
+    def get_prompt_version(self, mind: "Mind") -> Hashable:
+        """Stamp the section with the current environment and who is in it."""
+        current = self.environments.get_current_environment() if self.environments else None
+        if not current:
+            return (super().get_prompt_version(mind), None)
+        return (
+            super().get_prompt_version(mind), current.id, current.atmosphere,
+            tuple(current.participants), tuple(current.get_current_minds()),
+        )
+
     def on_save(self, mind: "Mind") -> Dict[str, Any]:
         if not self.environments:
             return {}
@@ -41,4 +51,5 @@ class EnvironmentsPlugin(Plugin):
     def on_load(self, mind: "Mind", data: Dict[str, Any]) -> None:
         if "environments" in data:
             self.environments = EnvironmentManager(**data["environments"])
+            self.invalidate_prompt()
             mind.environments = self.environments
@@ -1,6 +1,6 @@
 ﻿"""Events Plugin - Adds life events tracking."""
 
-from typing import Dict, Any, TYPE_CHECKING
+from typing import Dict, Any, Hashable, TYPE_CHECKING
 from genesis.plugins.base import Plugin
 from genesis.core.events import EventManager
 
@@ -33,6 +33,10 @@ class EventsPlugin(Plugin):
             return f"LIFE JOURNEY:\n{journey[:500]}"  # Truncate if too long
         return ""
 
+    def get_prompt_version(self, mind: "Mind") -> Hashable:
+        """Stamp the section with the number of events it summarizes."""
+        return (super().get_prompt_version(mind), len(self.events.events) if self.events else None)
+
     def on_save(self, mind: "Mind") -> Dict[str, Any]:
         if not self.events:
             return {}
@@ -41,4 +45,5 @@ class EventsPlugin(Plugin):
     def on_load(self, mind: "Mind", data: Dict[str, Any]) -> None:
         if "events" in data:
             self.events = EventManager(**data["events"])
+            self.invalidate_prompt()
             mind.events = self.events
@@ -1,6 +1,6 @@
 ﻿"""GEN Plugin - Adds economy, currency, and motivation system."""
 
-from typing import Dict, Any, TYPE_CHECKING
+from typing import Dict, Any, Hashable, TYPE_CHECKING
 from genesis.plugins.base import Plugin
 from genesis.core.gen import GenManager, TransactionType
 
@@ -130,6 +130,11 @@ class GenPlugin(Plugin):
 
         return "\n".join(sections)
 
+    def get_prompt_version(self, mind: "Mind") -> Hashable:
+        """Stamp the section with the balance it shows."""
+        balance = round(self.gen.balance.current_balance) if self.gen else None
+        return (super().get_prompt_version(mind), balance)
+
     def on_save(self, mind: "Mind") -> Dict[str, Any]:
         """Save GEN plugin configuration only (balance is in database)."""
         # Gen transactions and balance are now stored in SQLite database
@@ -144,6 +149,7 @@ class GenPlugin(Plugin):
         # Legacy support: Load gen data from JSON if it exists
         if "gen" in data:
             self.gen = GenManager.from_dict(data["gen"])
+            self.invalidate_prompt()
             mind.gen = self.gen
         else:
             # Gen balance is now in database, GenManager will load it automatically
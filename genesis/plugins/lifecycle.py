@@ -1,6 +1,7 @@
 ﻿"""Lifecycle Plugin - Adds mortality, urgency, and finite lifespan."""
 
-from typing import Dict, Any, TYPE_CHECKING
+from datetime import datetime
+from typing import Dict, Any, Hashable, TYPE_CHECKING
 from genesis.plugins.base import Plugin
 from genesis.core.lifecycle import LifecycleManager, LifecycleState
 
@@ -97,6 +98,11 @@ class LifecyclePlugin(Plugin):
 
         return "\n".join(sections)
 
+    def get_prompt_version(self, mind: "Mind") -> Hashable:
+        """Stamp the section with the days it shows as remaining."""
+        remaining = (self.lifecycle.death_date - datetime.now()).days if self.lifecycle else None
+        return (super().get_prompt_version(mind), remaining)
+
     def on_save(self, mind: "Mind") -> Dict[str, Any]:
         """Save lifecycle state."""
         if not self.lifecycle:
@@ -111,6 +117,7 @@ class LifecyclePlugin(Plugin):
         """Restore lifecycle state."""
         if "lifecycle" in data:
             self.lifecycle = LifecycleState(**data["lifecycle"])
+            self.invalidate_prompt()
             mind.lifecycle = self.lifecycle
 
         if "lifespan_years" in data:
@@ -1,6 +1,6 @@
 ﻿"""Relationships Plugin - Adds connections with humans and other Minds."""
 
-from typing import Dict, Any, TYPE_CHECKING
+from typing import Dict, Any, Hashable, TYPE_CHECKING
 from genesis.plugins.base import Plugin
 from genesis.core.relationships import RelationshipManager
 
@@ -33,6 +33,10 @@ class RelationshipsPlugin(Plugin):
             return f"RELATIONSHIPS:\n{context}"
         return ""
 
+    def get_prompt_version(self, mind: "Mind") -> Hashable:
+        """Stamp the section with the number of relationships it summarizes."""
+        return (super().get_prompt_version(mind), len(self.relationships.relationships) if self.relationships else None)
+
     def on_save(self, mind: "Mind") -> Dict[str, Any]:
         if not self.relationships:
             return {}
@@ -41,4 +45,5 @@ class RelationshipsPlugin(Plugin):
     def on_load(self, mind: "Mind", data: Dict[str, Any]) -> None:
         if "relationships" in data:
             self.relationships = RelationshipManager(**data["relationships"])
+            self.invalidate_prompt()
             mind.relationships = self.relationships
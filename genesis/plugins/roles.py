@@ -1,6 +1,6 @@
 ﻿"""Roles Plugin - Adds role and purpose management."""
 
-from typing import Dict, Any, TYPE_CHECKING
+from typing import Dict, Any, Hashable, TYPE_CHECKING
 from genesis.plugins.base import Plugin
 from genesis.core.role import RoleManager
 
@@ -33,6 +33,12 @@ class RolesPlugin(Plugin):
             return f"ROLE & PURPOSE:\n{purpose}"
         return ""
 
+    def get_prompt_version(self, mind: "Mind") -> Hashable:
+        """Stamp the section with the roles it describes."""
+        if not self.roles:
+            return (super().get_prompt_version(mind), None)
+        return (super().get_prompt_version(mind), self.roles.primary_role_id, len(self.roles.roles))
+
     def on_save(self, mind: "Mind") -> Dict[str, Any]:
         if not self.roles:
             return {}
@@ -41,4 +47,5 @@ class RolesPlugin(Plugin):
     def on_load(self, mind: "Mind", data: Dict[str, Any]) -> None:
         if "roles" in data:
             self.roles = RoleManager(**data["roles"])
+            self.invalidate_prompt()
             mind.roles = self.roles
@@ -44,7 +44,7 @@ Example:
 
 import asyncio
 import logging
-from typing import Dict, Any, Optional, TYPE_CHECKING
+from typing import Dict, Any, Hashable, Optional, TYPE_CHECKING
 
 from genesis.plugins.base import Plugin
 from genesis.senses import (
@@ -192,6 +192,11 @@ class SensesPlugin(Plugin):
 
         return "\n".join(sections)
 
+    def get_prompt_version(self, mind: "Mind") -> Hashable:
+        """Stamp the section with the senses it lists as active."""
+        active = tuple(self.senses.active_senses) if self.senses else ()
+        return (super().get_prompt_version(mind), active)
+
     def on_save(self, mind: "Mind") -> Dict[str, Any]:
         """Save senses configuration."""
         data = {
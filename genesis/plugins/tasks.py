@@ -1,6 +1,6 @@
 ﻿"""Tasks Plugin - Adds goal-oriented task management with rewards."""
 
-from typing import Dict, Any, TYPE_CHECKING
+from typing import Dict, Any, Hashable, TYPE_CHECKING
 from genesis.plugins.base import Plugin
 from genesis.core.tasks import TaskManager
 
@@ -96,6 +96,11 @@ class TasksPlugin(Plugin):
 
         return "\n".join(sections)
 
+    def get_prompt_version(self, mind: "Mind") -> Hashable:
+        """Stamp the section with the number of active tasks it shows."""
+        active = len(self.tasks.get_active_tasks()) if self.tasks else None
+        return (super().get_prompt_version(mind), active)
+
     def on_save(self, mind: "Mind") -> Dict[str, Any]:
         """Save tasks state."""
         if not self.tasks:
@@ -109,6 +114,7 @@ class TasksPlugin(Plugin):
         """Restore tasks state."""
         if "tasks" in data:
             self.tasks = TaskManager.from_dict(data["tasks"])
+            self.invalidate_prompt()
             mind.tasks = self.tasks
 
     def get_status(self) -> Dict[str, Any]:
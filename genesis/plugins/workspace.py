@@ -1,6 +1,6 @@
 ﻿"""Workspace Plugin - Adds personal file system for Minds."""
 
-from typing import Dict, Any, TYPE_CHECKING
+from typing import Dict, Any, Hashable, TYPE_CHECKING
 from genesis.plugins.base import Plugin
 from genesis.core.workspace import WorkspaceManager
 
@@ -75,6 +75,11 @@ class WorkspacePlugin(Plugin):
 
         return "\n".join(sections)
 
+    def get_prompt_version(self, mind: "Mind") -> Hashable:
+        """Stamp the section with the number of files it shows."""
+        files = len(self.workspace.files) if self.workspace else None
+        return (super().get_prompt_version(mind), files)
+
     def on_save(self, mind: "Mind") -> Dict[str, Any]:
         """Save workspace state."""
         if not self.workspace:
@@ -88,6 +93,7 @@ class WorkspacePlugin(Plugin):
         """Restore workspace state."""
         if "workspace" in data:
             self.workspace = WorkspaceManager.from_dict(data["workspace"])
+            self.invalidate_prompt()
             mind.workspace = self.workspace
 
     def get_status(self) -> Dict[str, Any]:
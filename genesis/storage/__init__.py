@@ -1,6 +1,22 @@
 ﻿"""Memory systems for Genesis Minds."""
 
-from genesis.storage.memory import MemoryManager, Memory, MemoryType
-from genesis.storage.vector_store import VectorStore
+from typing import TYPE_CHECKING
+
+from genesis._lazy import lazy_exports
+
+# Imported on first access (PEP 562) - the vector store loads ChromaDB
+_LAZY_ATTRS = {
+    "MemoryManager": "genesis.storage.memory",
+    "Memory": "genesis.storage.memory",
+    "MemoryType": "genesis.storage.memory",
+    "VectorStore": "genesis.storage.vector_store",
+}
+
+if TYPE_CHECKING:
+    from genesis.storage.memory import MemoryManager, Memory, MemoryType
+    from genesis.storage.vector_store import VectorStore
 
 __all__ = ["MemoryManager", "Memory", "MemoryType", "VectorStore"]
+
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_ATTRS)
@@ -0,0 +1,268 @@
+"""Content-addressed blob storage for Mind workspaces.
+
+Every distinct file content is stored once under its SHA-256 hash:
+
+    <root>/<hash[:2]>/<hash>
+
+with a reference count in the ``workspace_blobs`` table. Workspace files
+reference blobs by hash, so the same upload to many Minds costs one copy
+on disk. Writes stream to a temp file while hashing, then atomically move
+into place; async reads stream in chunks and support byte ranges.
+
+Taking a reference and putting the blob on disk happen in one transaction,
+as do dropping the last reference and deleting the blob. Both start by
+updating the blob's row, so they serialize on its row lock (the database
+write lock in SQLite) - a put can never reference a blob that a
+concurrent decref is deleting, even from another process.
+"""
+
+import hashlib
+import os
+import secrets
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Tuple
+
+import aiofiles
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+
+from genesis.database.base import get_session
+from genesis.database.models import BlobRecord
+
+CHUNK_SIZE = 256 * 1024
+
+
+class BlobStore:
+    """Reference-counted, content-addressed file store."""
+
+    def __init__(self, root: Path):
+        """Initialize blob store.
+
+        Args:
+            root: Directory holding the blobs
+        """
+        self.root = root
+        self.tmp_dir = root / "tmp"
+        self.tmp_dir.mkdir(parents=True, exist_ok=True)
+
+    def path(self, content_hash: str) -> Path:
+        """Path of a blob on disk."""
+        return self.root / content_hash[:2] / content_hash
+
+    def exists(self, content_hash: str) -> bool:
+        """Check whether a blob is on disk."""
+        return self.path(content_hash).exists()
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def put_bytes(self, data: bytes) -> Tuple[str, int]:
+        """Store content and take a reference to it.
+
+        Returns:
+            (content_hash, size_bytes)
+        """
+        content_hash = hashlib.sha256(data).hexdigest()
+
+        def write() -> Path:
+            tmp_path = self._tmp_path()
+            tmp_path.write_bytes(data)
+            return tmp_path
+
+        self._reference(content_hash, len(data), write)
+        return content_hash, len(data)
+
+    async def put_stream_async(self, stream: Any, chunk_size: int = CHUNK_SIZE) -> Tuple[str, int]:
+        """Stream content into the store, hashing as it is written.
+
+        Args:
+            stream: Async iterator of bytes, or an object with an async
+                ``read(size)`` method (e.g. FastAPI's UploadFile)
+            chunk_size: Bytes per read
+
+        Returns:
+            (content_hash, size_bytes)
+        """
+        hasher = hashlib.sha256()
+        size = 0
+        tmp_path = self._tmp_path()
+
+        try:
+            async with aiofiles.open(tmp_path, "wb") as out:
+                async for chunk in _iter_chunks(stream, chunk_size):
+                    hasher.update(chunk)
+                    size += len(chunk)
+                    await out.write(chunk)
+
+            content_hash = hasher.hexdigest()
+            self._reference(content_hash, size, lambda: tmp_path)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()  # Failed, or a duplicate of an existing blob
+
+        return content_hash, size
+
+    async def put_bytes_async(self, data: bytes) -> Tuple[str, int]:
+        """Async variant of put_bytes."""
+        return await self.put_stream_async(_single_chunk(data))
+
+    def _tmp_path(self) -> Path:
+        return self.tmp_dir / f"upload-{secrets.token_hex(8)}"
+
+    def _commit(self, tmp_path: Path, content_hash: str) -> None:
+        """Atomically move a fully written temp file into place."""
+        blob_path = self.path(content_hash)
+        blob_path.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(tmp_path, blob_path)
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def read_bytes(self, content_hash: str) -> bytes:
+        """Read a whole blob."""
+        return self.path(content_hash).read_bytes()
+
+    async def read_async(self, content_hash: str) -> bytes:
+        """Read a whole blob without blocking the event loop."""
+        chunks = [chunk async for chunk in self.iter_range_async(content_hash)]
+        return b"".join(chunks)
+
+    async def iter_range_async(
+        self,
+        content_hash: str,
+        start: int = 0,
+        end: Optional[int] = None,
+        chunk_size: int = CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """Stream a byte range of a blob in chunks.
+
+        Args:
+            content_hash: Blob hash
+            start: First byte (inclusive)
+            end: Last byte (exclusive); None reads to the end
+            chunk_size: Bytes per chunk
+        """
+        async with aiofiles.open(self.path(content_hash), "rb") as f:
+            await f.seek(start)
+            remaining = None if end is None else max(0, end - start)
+            while remaining is None or remaining > 0:
+                size = chunk_size if remaining is None else min(chunk_size, remaining)
+                chunk = await f.read(size)
+                if not chunk:
+                    break
+                if remaining is not None:
+                    remaining -= len(chunk)
+                yield chunk
+
+    # ------------------------------------------------------------------
+    # Reference counting
+    # ------------------------------------------------------------------
+
+    def incref(self, content_hash: str, size_bytes: int) -> None:
+        """Take a reference to a blob that is already on disk."""
+        self._reference(content_hash, size_bytes)
+
+    def _reference(
+        self,
+        content_hash: str,
+        size_bytes: int,
+        materialize: Optional[Callable[[], Path]] = None,
+    ) -> None:
+        """Take a reference and, in the same transaction, make sure the blob is on disk.
+
+        Args:
+            content_hash: Blob hash
+            size_bytes: Blob size
+            materialize: Returns a temp file with the content, moved into
+                place if the blob is missing (only called in that case)
+        """
+        for _ in range(2):
+            try:
+                with get_session() as session:
+                    updated = (
+                        session.query(BlobRecord)
+                        .filter_by(content_hash=content_hash)
+                        .update({BlobRecord.ref_count: BlobRecord.ref_count + 1})
+                    )
+                    if not updated:
+                        session.add(BlobRecord(
+                            content_hash=content_hash,
+                            size_bytes=size_bytes,
+                            ref_count=1,
+                        ))
+                        session.flush()
+                    if materialize is not None and not self.exists(content_hash):
+                        self._commit(materialize(), content_hash)
+                return
+            except IntegrityError:
+                continue  # Another writer inserted the row first - retry the update
+
+    def decref(self, content_hash: str) -> bool:
+        """Drop a reference; the blob is deleted with its last reference.
+
+        Returns:
+            True if the blob was deleted
+        """
+        with get_session() as session:
+            session.query(BlobRecord).filter_by(content_hash=content_hash).update(
+                {BlobRecord.ref_count: BlobRecord.ref_count - 1}
+            )
+            deleted = (
+                session.query(BlobRecord)
+                .filter(BlobRecord.content_hash == content_hash, BlobRecord.ref_count <= 0)
+                .delete()
+            )
+            # Unlink before commit, while the row is still locked
+            if deleted:
+                blob_path = self.path(content_hash)
+                if blob_path.exists():
+                    blob_path.unlink()
+        return bool(deleted)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Store-wide usage: physical bytes vs. bytes referenced by files."""
+        with get_session() as session:
+            blobs, physical, logical = session.query(
+                func.count(BlobRecord.content_hash),
+                func.coalesce(func.sum(BlobRecord.size_bytes), 0),
+                func.coalesce(func.sum(BlobRecord.size_bytes * BlobRecord.ref_count), 0),
+            ).one()
+
+        return {
+            "blobs": blobs,
+            "physical_bytes": physical,
+            "logical_bytes": logical,
+            "dedup_saved_bytes": logical - physical,
+        }
+
+
+async def _iter_chunks(stream: Any, chunk_size: int) -> AsyncIterator[bytes]:
+    """Normalize an UploadFile-like object or async iterator to chunks."""
+    if hasattr(stream, "read"):
+        while True:
+            chunk = await stream.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+    else:
+        async for chunk in stream:
+            if chunk:
+                yield chunk
+
+
+async def _single_chunk(data: bytes) -> AsyncIterator[bytes]:
+    yield data
+
+
+# Blob stores by root directory
+_stores: Dict[str, BlobStore] = {}
+
+
+def get_blob_store(root: Path) -> BlobStore:
+    """Get the shared blob store for a root directory."""
+    key = str(root)
+    if key not in _stores:
+        _stores[key] = BlobStore(root)
+    return _stores[key]
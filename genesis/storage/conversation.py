@@ -3,13 +3,58 @@ Conversation management with SQLite for scalability.
 
 Replaces in-memory conversation_history list with database storage
 for better scalability and querying capabilities.
+
+Pages are addressed by (timestamp, id) keyset cursors, and each
+(user, environment) thread keeps a maintained summary row, so listing
+threads costs O(threads) rather than a scan of the whole history.
 """
 
+import base64
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+
+from sqlalchemy import and_, or_, func, update
+from sqlalchemy.exc import IntegrityError
 
 from genesis.database.base import get_session
-from genesis.database.models import ConversationMessage
+from genesis.database.models import ConversationMessage, ConversationSummary, ConversationThread
+
+
+def encode_cursor(timestamp: datetime, row_id: int) -> str:
+    """Encode a (timestamp, id) sort key as an opaque cursor."""
+    raw = f"{timestamp.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    Decode a cursor from encode_cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        timestamp, row_id = base64.urlsafe_b64decode(padded.encode()).decode().rsplit("|", 1)
+        return datetime.fromisoformat(timestamp), int(row_id)
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+def _before(timestamp_column, id_column, timestamp: datetime, row_id: int):
+    """Filter for rows strictly before (timestamp, row_id)."""
+    return or_(
+        timestamp_column < timestamp,
+        and_(timestamp_column == timestamp, id_column < row_id),
+    )
+
+
+def _after(timestamp_column, id_column, timestamp: datetime, row_id: int):
+    """Filter for rows strictly after (timestamp, row_id)."""
+    return or_(
+        timestamp_column > timestamp,
+        and_(timestamp_column == timestamp, id_column > row_id),
+    )
 
 
 class ConversationManager:
@@ -74,8 +119,11 @@ class ConversationManager:
                     extra_data=metadata or {}
                 )
                 session.add(message)
+                session.flush()
+                self._touch_thread(session, message)
                 session.commit()
                 session.refresh(message)
+                session.expunge(message)
                 return message
         except Exception as e:
             import traceback
@@ -109,16 +157,14 @@ class ConversationManager:
             # Apply filters
             # For user_email: Only include messages FROM that specific user
             # This ensures users only see their own conversation history
-            if user_email:
-                query = query.filter(ConversationMessage.user_email == user_email)
-            if environment_id:
-                query = query.filter(ConversationMessage.environment_id == environment_id)
+            query = self._filter_thread(query, user_email, environment_id)
             if role:
                 query = query.filter(ConversationMessage.role == role)
             
-            # Order by timestamp descending and limit
+            # Order by (timestamp, id) descending and limit
             messages = query.order_by(
-                ConversationMessage.timestamp.desc()
+                ConversationMessage.timestamp.desc(),
+                ConversationMessage.id.desc()
             ).limit(limit).all()
             
             # Convert to dict (reverse to chronological order)
@@ -152,69 +198,119 @@ class ConversationManager:
             if not before_msg:
                 return []
 
-            before_ts = before_msg.timestamp
+            messages, _ = self._page_before(
+                session, before_msg.timestamp, before_id, limit, user_email, environment_id
+            )
+            return messages
 
-            # Build query for messages strictly earlier than the cursor
-            from sqlalchemy import and_, or_
+    def get_messages_page(
+        self,
+        limit: int = 50,
+        user_email: Optional[str] = None,
+        environment_id: Optional[str] = None,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Get one page of a thread, newest page first.
 
-            query = session.query(ConversationMessage).filter(
-                ConversationMessage.mind_gmid == self.mind_gmid,
-                or_(
-                    ConversationMessage.timestamp < before_ts,
-                    and_(
-                        ConversationMessage.timestamp == before_ts,
-                        ConversationMessage.id < before_id
-                    )
-                )
+        Args:
+            limit: Maximum number of messages to return
+            user_email: Filter by specific user
+            environment_id: Filter by environment
+            cursor: next_cursor from the previous (newer) page
+
+        Returns:
+            Tuple of (messages in chronological order, cursor for the next
+            older page or None when there are no older messages)
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        with get_session() as session:
+            if cursor:
+                before_ts, before_id = decode_cursor(cursor)
+                return self._page_before(session, before_ts, before_id, limit, user_email, environment_id)
+            return self._page_before(session, None, None, limit, user_email, environment_id)
+
+    def _page_before(
+        self,
+        session,
+        before_ts: Optional[datetime],
+        before_id: Optional[int],
+        limit: int,
+        user_email: Optional[str],
+        environment_id: Optional[str]
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Fetch up to `limit` messages before a (timestamp, id) key."""
+        query = self._filter_thread(
+            session.query(ConversationMessage).filter(ConversationMessage.mind_gmid == self.mind_gmid),
+            user_email,
+            environment_id
+        )
+        if before_ts is not None:
+            query = query.filter(
+                _before(ConversationMessage.timestamp, ConversationMessage.id, before_ts, before_id)
             )
 
-            # Apply filters
-            if user_email:
-                query = query.filter(ConversationMessage.user_email == user_email)
-            if environment_id:
-                query = query.filter(ConversationMessage.environment_id == environment_id)
+        # Order by newest first (descending); one extra row tells us if there are more
+        rows = query.order_by(
+            ConversationMessage.timestamp.desc(),
+            ConversationMessage.id.desc()
+        ).limit(limit + 1).all()
 
-            # Order by newest first (descending), then reverse to chronological
-            messages = query.order_by(
-                ConversationMessage.timestamp.desc(),
-                ConversationMessage.id.desc()
-            ).limit(limit).all()
+        messages = rows[:limit]
+        next_cursor = None
+        if len(rows) > limit:
+            oldest = messages[-1]
+            next_cursor = encode_cursor(oldest.timestamp, oldest.id)
 
-            return [self._message_to_dict(msg) for msg in reversed(messages)]
+        # Reverse to chronological
+        return [self._message_to_dict(msg) for msg in reversed(messages)], next_cursor
     
     def get_messages_since(
         self,
         since: datetime,
         user_email: Optional[str] = None,
-        environment_id: Optional[str] = None
+        environment_id: Optional[str] = None,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """
         Get messages since a specific time.
         
+        To page forward, pass the last message's timestamp and id as
+        `since` and `after_id`.
+        
         Args:
             since: Get messages after this timestamp
             user_email: Filter by specific user
             environment_id: Filter by environment
+            after_id: Exclude messages at `since` with an id <= this one
+            limit: Maximum number of messages to return
             
         Returns:
             List of message dictionaries (chronological order)
         """
         with get_session() as session:
             query = session.query(ConversationMessage).filter(
-                ConversationMessage.mind_gmid == self.mind_gmid,
-                ConversationMessage.timestamp >= since
+                ConversationMessage.mind_gmid == self.mind_gmid
             )
+            if after_id is not None:
+                query = query.filter(
+                    _after(ConversationMessage.timestamp, ConversationMessage.id, since, after_id)
+                )
+            else:
+                query = query.filter(ConversationMessage.timestamp >= since)
             
             # Apply filters
-            if user_email:
-                query = query.filter(ConversationMessage.user_email == user_email)
-            if environment_id:
-                query = query.filter(ConversationMessage.environment_id == environment_id)
+            query = self._filter_thread(query, user_email, environment_id)
             
             # Order chronologically
-            messages = query.order_by(ConversationMessage.timestamp.asc()).all()
+            query = query.order_by(ConversationMessage.timestamp.asc(), ConversationMessage.id.asc())
+            if limit is not None:
+                query = query.limit(limit)
             
-            return [self._message_to_dict(msg) for msg in messages]
+            return [self._message_to_dict(msg) for msg in query.all()]
     
     def get_conversation_context(
         self,
@@ -284,6 +380,8 @@ class ConversationManager:
                 ~ConversationMessage.id.in_(keep_ids)
             ).delete(synchronize_session=False)
             
+            if deleted:
+                self._rebuild_threads(session)
             session.commit()
             return deleted
     
@@ -333,57 +431,248 @@ class ConversationManager:
                 "newest_message": newest.timestamp.isoformat() if newest else None
             }
     
-    def get_conversation_threads(self, user_email: Optional[str] = None) -> List[Dict[str, Any]]:
+    def get_conversation_threads(
+        self,
+        user_email: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
         """
         Get list of conversation threads (unique user+environment combinations).
         
         Args:
             user_email: Filter by specific user
+            limit: Maximum number of threads to return (default: all)
+            cursor: next_cursor from get_conversation_threads_page
             
         Returns:
             List of conversation threads with metadata (last message, count, etc.)
         """
-        from sqlalchemy import func, desc
-        
+        threads, _ = self.get_conversation_threads_page(user_email=user_email, limit=limit, cursor=cursor)
+        return threads
+
+    def get_conversation_threads_page(
+        self,
+        user_email: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Get one page of conversation threads, most recently active first.
+
+        Reads the maintained thread summaries, one row per thread.
+
+        Args:
+            user_email: Filter by specific user
+            limit: Maximum number of threads to return (default: all)
+            cursor: next_cursor from the previous page
+
+        Returns:
+            Tuple of (threads, cursor for the next page or None)
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
         with get_session() as session:
-            # Query for distinct user_email + environment_id combinations
-            query = session.query(
-                ConversationMessage.user_email,
-                ConversationMessage.environment_id,
-                func.max(ConversationMessage.timestamp).label('last_message_time'),
-                func.count(ConversationMessage.id).label('message_count')
-            ).filter(
-                ConversationMessage.mind_gmid == self.mind_gmid
+            if cursor is None:
+                self._ensure_threads(session)
+
+            query = session.query(ConversationThread).filter(
+                ConversationThread.mind_gmid == self.mind_gmid
             )
-            
             if user_email:
-                query = query.filter(ConversationMessage.user_email == user_email)
-            
-            threads = query.group_by(
-                ConversationMessage.user_email,
-                ConversationMessage.environment_id
-            ).order_by(desc('last_message_time')).all()
-            
-            # Get last message preview for each thread
-            result = []
-            for thread in threads:
-                # Get the actual last message
-                last_msg = session.query(ConversationMessage).filter(
-                    ConversationMessage.mind_gmid == self.mind_gmid,
-                    ConversationMessage.user_email == thread.user_email,
-                    ConversationMessage.environment_id == thread.environment_id
-                ).order_by(ConversationMessage.timestamp.desc()).first()
-                
-                result.append({
-                    "user_email": thread.user_email,
-                    "environment_id": thread.environment_id,
-                    "last_message_time": thread.last_message_time.isoformat() if thread.last_message_time else None,
-                    "message_count": thread.message_count,
-                    "last_message_preview": last_msg.content[:100] if last_msg else None,
-                    "last_message_role": last_msg.role if last_msg else None
-                })
+                query = query.filter(ConversationThread.user_email == user_email)
+            if cursor:
+                before_ts, before_id = decode_cursor(cursor)
+                query = query.filter(
+                    _before(ConversationThread.last_message_time, ConversationThread.id, before_ts, before_id)
+                )
+
+            query = query.order_by(
+                ConversationThread.last_message_time.desc(),
+                ConversationThread.id.desc()
+            )
+            rows = query.limit(limit + 1).all() if limit is not None else query.all()
+
+            threads = rows[:limit] if limit is not None else rows
+            next_cursor = None
+            if limit is not None and len(rows) > limit:
+                last = threads[-1]
+                next_cursor = encode_cursor(last.last_message_time, last.id)
+
+            return [self._thread_to_dict(thread) for thread in threads], next_cursor
+
+    def _ensure_threads(self, session) -> None:
+        """Build thread summaries for history written before they existed."""
+        has_threads = session.query(ConversationThread.id).filter(
+            ConversationThread.mind_gmid == self.mind_gmid
+        ).first()
+        if has_threads:
+            return
+        has_messages = session.query(ConversationMessage.id).filter(
+            ConversationMessage.mind_gmid == self.mind_gmid
+        ).first()
+        if has_messages:
+            try:
+                self._rebuild_threads(session)
+                session.commit()
+            except IntegrityError:
+                session.rollback()  # A concurrent reader or writer backfilled them first
+
+    def _touch_thread(self, session, message: ConversationMessage) -> None:
+        """Fold a newly added message into its thread summary."""
+        user_key = message.user_email or ""
+        env_key = message.environment_id or ""
+        key = and_(
+            ConversationThread.mind_gmid == self.mind_gmid,
+            ConversationThread.user_email == user_key,
+            ConversationThread.environment_id == env_key,
+        )
+
+        count_message = (
+            update(ConversationThread)
+            .where(key)
+            .values(message_count=ConversationThread.message_count + 1)
+        )
+        if not session.execute(count_message).rowcount:
+            try:
+                with session.begin_nested():
+                    self._seed_thread(session, user_key, env_key)
+                return
+            except IntegrityError:
+                # A concurrent first message created the summary; count into it
+                session.execute(count_message)
+
+        # Backdated messages don't replace a newer last message
+        session.execute(
+            update(ConversationThread)
+            .where(key, or_(
+                ConversationThread.last_message_time.is_(None),
+                ~_after(ConversationThread.last_message_time, ConversationThread.last_message_id,
+                        message.timestamp, message.id),
+            ))
+            .values(**self._last_message_values(message))
+        )
+
+    def _seed_thread(self, session, user_key: str, env_key: str) -> None:
+        """Create a missing thread summary from the messages already stored."""
+        has_threads = session.query(ConversationThread.id).filter(
+            ConversationThread.mind_gmid == self.mind_gmid
+        ).first()
+        if not has_threads:
+            # History written before the summaries existed - backfill every thread
+            self._rebuild_threads(session)
+            return
+
+        messages = session.query(ConversationMessage).filter(
+            ConversationMessage.mind_gmid == self.mind_gmid,
+            func.coalesce(ConversationMessage.user_email, "") == user_key,
+            func.coalesce(ConversationMessage.environment_id, "") == env_key,
+        )
+        latest = messages.order_by(
+            ConversationMessage.timestamp.desc(), ConversationMessage.id.desc()
+        ).first()
+        session.add(ConversationThread(
+            mind_gmid=self.mind_gmid,
+            user_email=user_key,
+            environment_id=env_key,
+            message_count=messages.count(),
+            **self._last_message_values(latest)
+        ))
+        session.flush()
+
+    def _rebuild_threads(self, session) -> None:
+        """Recompute every thread summary of this Mind from its messages."""
+        session.query(ConversationThread).filter(
+            ConversationThread.mind_gmid == self.mind_gmid
+        ).delete(synchronize_session=False)
+
+        user_key = func.coalesce(ConversationMessage.user_email, "")
+        env_key = func.coalesce(ConversationMessage.environment_id, "")
+        ranked = session.query(
+            ConversationMessage.id.label("id"),
+            func.count().over(partition_by=(user_key, env_key)).label("message_count"),
+            func.row_number().over(
+                partition_by=(user_key, env_key),
+                order_by=(ConversationMessage.timestamp.desc(), ConversationMessage.id.desc())
+            ).label("rank")
+        ).filter(ConversationMessage.mind_gmid == self.mind_gmid).subquery()
+
+        latest = session.query(ConversationMessage, ranked.c.message_count).join(
+            ranked, ranked.c.id == ConversationMessage.id
+        ).filter(ranked.c.rank == 1)
+
+        session.add_all(
+            ConversationThread(
+                mind_gmid=self.mind_gmid,
+                user_email=message.user_email or "",
+                environment_id=message.environment_id or "",
+                message_count=message_count,
+                **self._last_message_values(message)
+            )
+            for message, message_count in latest
+        )
+        session.flush()
+
+    @staticmethod
+    def _last_message_values(message: ConversationMessage) -> Dict[str, Any]:
+        """Thread summary columns describing its last message."""
+        return {
+            "last_message_id": message.id,
+            "last_message_time": message.timestamp,
+            "last_message_preview": (message.content or "")[:100],
+            "last_message_role": message.role,
+        }
+
+    @staticmethod
+    def _filter_thread(query, user_email: Optional[str], environment_id: Optional[str]):
+        """Apply optional user/environment filters to a message query."""
+        if user_email:
+            query = query.filter(ConversationMessage.user_email == user_email)
+        if environment_id:
+            query = query.filter(ConversationMessage.environment_id == environment_id)
+        return query
+    
+    def get_summaries(
+        self,
+        user_email: Optional[str] = None,
+        environment_id: Optional[str] = None,
+        limit: int = 20
+    ) -> List[Dict[str, Any]]:
+        """
+        Get summaries of compacted (archived) conversation spans.
+        
+        Args:
+            user_email: Filter by specific user
+            environment_id: Filter by environment
+            limit: Maximum number of summaries to return
             
-            return result
+        Returns:
+            List of summary dictionaries (chronological order)
+        """
+        with get_session() as session:
+            query = session.query(ConversationSummary).filter(
+                ConversationSummary.mind_gmid == self.mind_gmid
+            )
+            if user_email:
+                query = query.filter(ConversationSummary.user_email == user_email)
+            if environment_id:
+                query = query.filter(ConversationSummary.environment_id == environment_id)
+
+            summaries = query.order_by(ConversationSummary.end_time.desc()).limit(limit).all()
+            return [
+                {
+                    "id": summary.id,
+                    "user_email": summary.user_email,
+                    "environment_id": summary.environment_id,
+                    "start_time": summary.start_time.isoformat(),
+                    "end_time": summary.end_time.isoformat(),
+                    "message_count": summary.message_count,
+                    "content": summary.content,
+                    "archive_path": summary.archive_path
+                }
+                for summary in reversed(summaries)
+            ]
     
     def clear_all(self) -> int:
         """
@@ -396,6 +685,12 @@ class ConversationManager:
             deleted = session.query(ConversationMessage).filter(
                 ConversationMessage.mind_gmid == self.mind_gmid
             ).delete()
+            session.query(ConversationThread).filter(
+                ConversationThread.mind_gmid == self.mind_gmid
+            ).delete()
+            session.query(ConversationSummary).filter(
+                ConversationSummary.mind_gmid == self.mind_gmid
+            ).delete()
             session.commit()
             return deleted
     
@@ -410,3 +705,14 @@ class ConversationManager:
             "timestamp": msg.timestamp.isoformat() if msg.timestamp else None,
             "metadata": msg.extra_data
         }
+
+    def _thread_to_dict(self, thread: ConversationThread) -> Dict[str, Any]:
+        """Convert thread summary to dictionary."""
+        return {
+            "user_email": thread.user_email or None,
+            "environment_id": thread.environment_id or None,
+            "last_message_time": thread.last_message_time.isoformat() if thread.last_message_time else None,
+            "message_count": thread.message_count,
+            "last_message_preview": thread.last_message_preview,
+            "last_message_role": thread.last_message_role
+        }
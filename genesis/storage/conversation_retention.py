@@ -0,0 +1,289 @@
+"""
+Tiered retention for conversation history.
+
+Long-lived Minds accumulate conversation messages without bound, while
+prompts only need the last few turns. Retention keeps three tiers:
+
+- Hot: recent messages (newer than ``hot_days``, and always the newest
+  ``hot_messages`` of each thread) stay in ``conversation_messages``
+- Warm: older spans are compacted into ``conversation_summaries`` rows,
+  written by the Mind's fast model
+- Cold: the raw messages of each span are archived to a gzipped JSON
+  Lines file and deleted from the database
+
+Usage:
+    retention = ConversationRetention(
+        mind.identity.gmid,
+        archive_dir=settings.data_dir / "conversation_archive",
+        summarize=fast_model_summarizer(mind),
+    )
+    stats = await retention.run()
+"""
+
+import asyncio
+import gzip
+import json
+import logging
+import os
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from sqlalchemy import and_, or_, text, update
+
+from genesis.database.base import get_session
+from genesis.database.models import ConversationMessage, ConversationSummary, ConversationThread
+from genesis.storage.conversation import ConversationManager
+
+logger = logging.getLogger(__name__)
+
+# Summarizes a chronological span of message dicts
+Summarizer = Callable[[List[Dict[str, Any]]], Awaitable[str]]
+
+# Characters of transcript sent to the summarizer per span
+MAX_TRANSCRIPT_CHARS = 12000
+
+
+def fast_model_summarizer(mind) -> Summarizer:
+    """Build a summarizer that uses the Mind's fast model."""
+
+    async def summarize(messages: List[Dict[str, Any]]) -> str:
+        transcript = "\n".join(f"{m['role']}: {m['content']}" for m in messages)
+        if len(transcript) > MAX_TRANSCRIPT_CHARS:
+            transcript = transcript[-MAX_TRANSCRIPT_CHARS:]
+
+        prompt = f"""Summarize this earlier part of a conversation for your own long-term reference.
+Keep facts, decisions, commitments, preferences and open questions. Be concise (under 150 words).
+
+{transcript}
+
+Summary:"""
+
+        response = await mind.orchestrator.generate(
+            purpose="conversation_summary",
+            mind_id=mind.identity.gmid,
+            messages=[{"role": "user", "content": prompt}],
+            model=mind.intelligence.fast_model,
+            temperature=0.3,
+            max_tokens=300
+        )
+        return response.content.strip()
+
+    return summarize
+
+
+def load_archive(path: Path) -> List[Dict[str, Any]]:
+    """Read the raw messages of an archived span."""
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+class ConversationRetention:
+    """Compacts one Mind's old conversation history into summaries and archives."""
+
+    def __init__(
+        self,
+        mind_gmid: str,
+        archive_dir: Path,
+        summarize: Optional[Summarizer] = None,
+        hot_days: int = 30,
+        hot_messages: int = 200,
+        span_size: int = 200,
+        min_span: int = 20
+    ):
+        """
+        Initialize retention for a Mind.
+
+        Args:
+            mind_gmid: Genesis Mind ID
+            archive_dir: Root directory for cold archives (one subdirectory per Mind)
+            summarize: Async summarizer (default: a short extractive summary)
+            hot_days: Messages newer than this are never compacted
+            hot_messages: Newest messages per thread that are never compacted
+            span_size: Maximum messages per summary
+            min_span: Smallest span worth compacting
+        """
+        self.mind_gmid = mind_gmid
+        self.conversation = ConversationManager(mind_gmid)
+        self.archive_dir = Path(archive_dir) / mind_gmid
+        self.summarize = summarize
+        self.hot_days = hot_days
+        self.hot_messages = hot_messages
+        self.span_size = span_size
+        self.min_span = min_span
+
+    async def run(self) -> Dict[str, int]:
+        """
+        Compact every thread's messages outside the hot window.
+
+        Returns:
+            Statistics: spans compacted, messages archived, archive bytes
+            written and database bytes reclaimed
+        """
+        stats = {
+            "summaries_created": 0,
+            "messages_compacted": 0,
+            "archive_bytes": 0,
+            "reclaimed_bytes": 0,
+        }
+        cutoff = datetime.now() - timedelta(days=self.hot_days)
+        free_before = await asyncio.to_thread(self._free_bytes)
+        payload_bytes = 0
+
+        threads = await asyncio.to_thread(self.conversation.get_conversation_threads)
+        for thread in threads:
+            user_email, environment_id = thread["user_email"], thread["environment_id"]
+            while True:
+                span = await asyncio.to_thread(self._next_span, user_email, environment_id, cutoff)
+                if len(span) < self.min_span:
+                    break
+
+                content = await self._summarize(span)
+                archive_bytes = await asyncio.to_thread(
+                    self._compact, user_email, environment_id, span, content
+                )
+                stats["summaries_created"] += 1
+                stats["messages_compacted"] += len(span)
+                stats["archive_bytes"] += archive_bytes
+                payload_bytes += sum(len(m["content"].encode("utf-8")) for m in span)
+
+        free_after = await asyncio.to_thread(self._free_bytes)
+        if free_before is None or free_after is None:
+            # Backend can't report free space - estimate from message payloads
+            stats["reclaimed_bytes"] = payload_bytes
+        else:
+            stats["reclaimed_bytes"] = max(free_after - free_before, 0)
+
+        if stats["summaries_created"]:
+            logger.info(
+                f"[RETENTION] {self.mind_gmid}: compacted {stats['messages_compacted']} messages "
+                f"into {stats['summaries_created']} summaries, reclaimed {stats['reclaimed_bytes']} bytes"
+            )
+        return stats
+
+    # ------------------------------------------------------------------
+    # Steps
+    # ------------------------------------------------------------------
+
+    def _thread_filter(self, user_email: Optional[str], environment_id: Optional[str]):
+        """Match exactly one thread's messages (NULL keys included)."""
+        return and_(
+            ConversationMessage.mind_gmid == self.mind_gmid,
+            ConversationMessage.user_email == user_email if user_email else ConversationMessage.user_email.is_(None),
+            ConversationMessage.environment_id == environment_id
+            if environment_id else ConversationMessage.environment_id.is_(None),
+        )
+
+    def _next_span(
+        self,
+        user_email: Optional[str],
+        environment_id: Optional[str],
+        cutoff: datetime
+    ) -> List[Dict[str, Any]]:
+        """Oldest messages of a thread that are outside the hot window."""
+        with get_session() as session:
+            thread = self._thread_filter(user_email, environment_id)
+
+            # Oldest message that must stay hot by count
+            boundary = session.query(ConversationMessage.timestamp, ConversationMessage.id).filter(
+                thread
+            ).order_by(
+                ConversationMessage.timestamp.desc(),
+                ConversationMessage.id.desc()
+            ).offset(self.hot_messages - 1).limit(1).first()
+            if boundary is None:
+                return []
+
+            messages = session.query(ConversationMessage).filter(
+                thread,
+                ConversationMessage.timestamp < cutoff,
+                or_(
+                    ConversationMessage.timestamp < boundary.timestamp,
+                    and_(
+                        ConversationMessage.timestamp == boundary.timestamp,
+                        ConversationMessage.id < boundary.id
+                    )
+                )
+            ).order_by(
+                ConversationMessage.timestamp.asc(),
+                ConversationMessage.id.asc()
+            ).limit(self.span_size).all()
+
+            return [self.conversation._message_to_dict(msg) for msg in messages]
+
+    async def _summarize(self, span: List[Dict[str, Any]]) -> str:
+        """Summarize a span, falling back to an extractive summary."""
+        if self.summarize:
+            try:
+                content = await self.summarize(span)
+                if content:
+                    return content
+            except Exception as e:
+                logger.warning(f"[RETENTION] Summarizer failed, using extractive summary: {e}")
+
+        user_lines = [m["content"][:120] for m in span if m["role"] == "user"][:5]
+        lines = [f"{len(span)} messages from {span[0]['timestamp']} to {span[-1]['timestamp']}."]
+        lines.extend(f"- {line}" for line in user_lines)
+        return "\n".join(lines)
+
+    def _compact(
+        self,
+        user_email: Optional[str],
+        environment_id: Optional[str],
+        span: List[Dict[str, Any]],
+        content: str
+    ) -> int:
+        """Archive a span, replace it with a summary row and return the archive size."""
+        first, last = span[0], span[-1]
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        start_time = datetime.fromisoformat(first["timestamp"])
+        archive_path = self.archive_dir / f"{start_time:%Y%m%dT%H%M%S}-{first['id']}-{last['id']}.jsonl.gz"
+
+        # Write the cold copy first; the messages are only deleted once it is on disk
+        tmp_path = archive_path.with_suffix(".tmp")
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            for message in span:
+                f.write(json.dumps(message) + "\n")
+        os.replace(tmp_path, archive_path)
+
+        try:
+            with get_session() as session:
+                session.add(ConversationSummary(
+                    mind_gmid=self.mind_gmid,
+                    user_email=user_email,
+                    environment_id=environment_id,
+                    start_time=start_time,
+                    end_time=datetime.fromisoformat(last["timestamp"]),
+                    first_message_id=first["id"],
+                    last_message_id=last["id"],
+                    message_count=len(span),
+                    content=content,
+                    archive_path=str(archive_path)
+                ))
+                session.query(ConversationMessage).filter(
+                    ConversationMessage.id.in_([m["id"] for m in span])
+                ).delete(synchronize_session=False)
+                session.execute(
+                    update(ConversationThread)
+                    .where(
+                        ConversationThread.mind_gmid == self.mind_gmid,
+                        ConversationThread.user_email == (user_email or ""),
+                        ConversationThread.environment_id == (environment_id or ""),
+                    )
+                    .values(message_count=ConversationThread.message_count - len(span))
+                )
+        except Exception:
+            archive_path.unlink(missing_ok=True)
+            raise
+
+        return archive_path.stat().st_size
+
+    @staticmethod
+    def _free_bytes() -> Optional[int]:
+        """Free (reusable) bytes inside the database file, if the backend reports it."""
+        with get_session() as session:
+            if session.get_bind().dialect.name != "sqlite":
+                return None
+            page_size = session.execute(text("PRAGMA page_size")).scalar()
+            free_pages = session.execute(text("PRAGMA freelist_count")).scalar()
+            return page_size * free_pages
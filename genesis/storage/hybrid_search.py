@@ -0,0 +1,236 @@
+"""
+Hybrid retrieval - BM25 keyword search fused with vector similarity.
+
+Embeddings are good at paraphrases but poor at exact tokens: names, email
+addresses, code words, numbers. A Mind asked about "Anika" should find the
+memory that mentions Anika even when its embedding is closer to other
+memories. VectorStore.hybrid_search runs both retrievers and fuses their
+rankings:
+
+- BM25Index is an incremental inverted index over memory content, kept
+  next to the Chroma collection (added to and removed from alongside it)
+- Metadata filters use Chroma's ``where`` syntax and are applied inside
+  both retrievers, so filtered-out memories never take up result slots
+- reciprocal_rank_fusion combines the two rankings by rank, not score,
+  so BM25 scores and cosine distances never need to be calibrated
+
+Usage:
+    index = BM25Index()
+    index.add("m1", "Anika works as a marine biologist", {"type": "semantic"})
+    index.search("where does anika work", limit=5, where={"type": "semantic"})
+"""
+
+import math
+import re
+import threading
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:['@.][a-z0-9]+)*")
+
+# Words too common to say anything about a memory
+STOPWORDS = frozenset(
+    "a an and are as at be but by do does did for from had has have he her his how i i'm im in is it its "
+    "me my of on or our she so that the their them they this to was we were what when where which who "
+    "why will with you your".split()
+)
+
+# Standard BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Reciprocal rank fusion constant (60 in the original paper)
+RRF_K = 60
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens without stopwords (emails and "o'brien" stay whole)."""
+    return [token for token in TOKEN_PATTERN.findall(text.lower()) if token not in STOPWORDS]
+
+
+def combine_filters(*clauses: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """
+    AND together ``where`` clauses, dropping empty ones.
+
+    Chroma only accepts one top-level key per filter, so several
+    conditions have to be wrapped in ``$and``.
+    """
+    parts = []
+    for clause in clauses:
+        if not clause:
+            continue
+        if len(clause) == 1:
+            parts.append(clause)
+        else:
+            parts.extend({key: value} for key, value in clause.items())
+    if not parts:
+        return None
+    return parts[0] if len(parts) == 1 else {"$and": parts}
+
+
+def _compare(value: Any, condition: Any) -> bool:
+    if not isinstance(condition, dict):
+        return value == condition
+    for operator, operand in condition.items():
+        if operator == "$eq":
+            ok = value == operand
+        elif operator == "$ne":
+            ok = value != operand
+        elif operator == "$in":
+            ok = value in operand
+        elif operator == "$nin":
+            ok = value not in operand
+        elif value is None:
+            ok = False
+        elif operator == "$gt":
+            ok = value > operand
+        elif operator == "$gte":
+            ok = value >= operand
+        elif operator == "$lt":
+            ok = value < operand
+        elif operator == "$lte":
+            ok = value <= operand
+        else:
+            raise ValueError(f"Unsupported filter operator: {operator}")
+        if not ok:
+            return False
+    return True
+
+
+def matches_where(metadata: Dict[str, Any], where: Optional[Dict[str, Any]]) -> bool:
+    """Evaluate a Chroma ``where`` filter against one memory's metadata."""
+    if not where:
+        return True
+    for key, condition in where.items():
+        if key == "$and":
+            if not all(matches_where(metadata, clause) for clause in condition):
+                return False
+        elif key == "$or":
+            if not any(matches_where(metadata, clause) for clause in condition):
+                return False
+        elif not _compare(metadata.get(key), condition):
+            return False
+    return True
+
+
+class BM25Index:
+    """
+    Incremental BM25 inverted index with metadata-filtered search.
+
+    Postings map each term to {doc_id: term frequency}; adding or removing a
+    document only touches its own terms. Document metadata is kept so the
+    same ``where`` filters as the vector query can be applied to candidates.
+    Thread-safe: the async VectorStore API updates and searches it from
+    executor threads.
+    """
+
+    def __init__(self, k1: float = BM25_K1, b: float = BM25_B):
+        self.k1 = k1
+        self.b = b
+        self.postings: Dict[str, Dict[str, int]] = {}
+        self.doc_lengths: Dict[str, int] = {}
+        self.doc_terms: Dict[str, Tuple[str, ...]] = {}
+        self.metadata: Dict[str, Dict[str, Any]] = {}
+        self.total_length = 0
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self.doc_lengths)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self.doc_lengths
+
+    def add(self, doc_id: str, text: str, metadata: Optional[Dict[str, Any]] = None) -> None:
+        """Index a document (replaces an existing document with the same ID)."""
+        tokens = tokenize(text)
+        counts = Counter(tokens)
+        with self._lock:
+            self.remove(doc_id)
+            for term, count in counts.items():
+                self.postings.setdefault(term, {})[doc_id] = count
+            self.doc_lengths[doc_id] = len(tokens)
+            self.doc_terms[doc_id] = tuple(counts)
+            self.metadata[doc_id] = dict(metadata or {})
+            self.total_length += len(tokens)
+
+    def add_many(self, documents: Iterable[Tuple[str, str, Optional[Dict[str, Any]]]]) -> None:
+        """Index (doc_id, text, metadata) triples."""
+        for doc_id, text, metadata in documents:
+            self.add(doc_id, text, metadata)
+
+    def remove(self, doc_id: str) -> None:
+        """Remove a document (unknown IDs are ignored)."""
+        with self._lock:
+            length = self.doc_lengths.pop(doc_id, None)
+            if length is None:
+                return
+            self.metadata.pop(doc_id, None)
+            self.total_length -= length
+            for term in self.doc_terms.pop(doc_id, ()):
+                docs = self.postings[term]
+                del docs[doc_id]
+                if not docs:
+                    del self.postings[term]
+
+    def clear(self) -> None:
+        with self._lock:
+            self.postings.clear()
+            self.doc_lengths.clear()
+            self.doc_terms.clear()
+            self.metadata.clear()
+            self.total_length = 0
+
+    def search(
+        self,
+        query: str,
+        limit: int = 10,
+        where: Optional[Dict[str, Any]] = None,
+    ) -> List[Tuple[str, float]]:
+        """
+        Rank documents matching the filter by BM25 score.
+
+        Returns:
+            (doc_id, score) pairs, best first
+        """
+        terms = set(tokenize(query))
+        scores: Dict[str, float] = {}
+        allowed: Dict[str, bool] = {}
+
+        with self._lock:
+            count = len(self.doc_lengths)
+            if not count:
+                return []
+            average_length = self.total_length / count or 1.0
+            for term in terms:
+                docs = self.postings.get(term)
+                if not docs:
+                    continue
+                idf = math.log(1 + (count - len(docs) + 0.5) / (len(docs) + 0.5))
+                for doc_id, frequency in docs.items():
+                    if doc_id not in allowed:
+                        allowed[doc_id] = matches_where(self.metadata[doc_id], where)
+                    if not allowed[doc_id]:
+                        continue
+                    norm = self.k1 * (1 - self.b + self.b * self.doc_lengths[doc_id] / average_length)
+                    scores[doc_id] = scores.get(doc_id, 0.0) + idf * frequency * (self.k1 + 1) / (frequency + norm)
+
+        return sorted(scores.items(), key=lambda item: item[1], reverse=True)[:limit]
+
+
+def reciprocal_rank_fusion(
+    rankings: Sequence[Sequence[str]],
+    k: int = RRF_K,
+    weights: Optional[Sequence[float]] = None,
+) -> List[Tuple[str, float]]:
+    """
+    Fuse ranked ID lists: score(d) = sum(weight / (k + rank of d)).
+
+    Returns:
+        (doc_id, fused score) pairs, best first
+    """
+    weights = weights or [1.0] * len(rankings)
+    fused: Dict[str, float] = {}
+    for ranking, weight in zip(rankings, weights):
+        for rank, doc_id in enumerate(ranking, start=1):
+            fused[doc_id] = fused.get(doc_id, 0.0) + weight / (k + rank)
+    return sorted(fused.items(), key=lambda item: item[1], reverse=True)
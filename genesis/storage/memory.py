@@ -3,11 +3,14 @@
 import uuid
 from datetime import datetime
 from enum import Enum
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 
 from pydantic import BaseModel, Field
 
-from genesis.storage.vector_store import VectorStore
+from genesis.config import get_settings
+from genesis.storage.hybrid_search import combine_filters, reciprocal_rank_fusion
+from genesis.storage.memory_tiers import MemoryTiering
+from genesis.storage.vector_store import VectorStore, get_embedding_batcher, run_in_vector_executor
 
 
 class MemoryType(str, Enum):
@@ -127,6 +130,44 @@ class Memory(BaseModel):
 
         return cls(**data)
 
+    @classmethod
+    def from_vector_record(cls, memory_id: str, content: str, metadata: Dict[str, Any]) -> "Memory":
+        """Rebuild a memory from a vector store record (flat metadata)."""
+        return cls(
+            id=memory_id,
+            type=MemoryType(metadata.get("type", "episodic")),
+            content=content,
+            timestamp=datetime.fromisoformat(metadata.get("timestamp", datetime.now().isoformat())),
+            emotion=metadata.get("emotion"),
+            importance=float(metadata.get("importance", 0.5)),
+            access_count=int(metadata.get("access_count", 0)),
+            last_accessed=datetime.fromisoformat(metadata["last_accessed"]) if metadata.get("last_accessed") else None,
+            tags=metadata.get("tags", "").split(",") if metadata.get("tags") else [],
+            metadata=metadata,
+            user_email=metadata.get("user_email") or None,
+            relationship_context=metadata.get("relationship_context") or None,
+            environment_id=metadata.get("environment_id") or None,
+            environment_name=metadata.get("environment_name") or None,
+        )
+
+
+def user_scope_filter(user_email: str) -> Dict[str, Any]:
+    """
+    Metadata filter for the memories a user may see.
+
+    A user sees their own memories, generic memories with no user, and
+    other users' memories marked 'shared' - never another user's personal
+    ones. As a ``where`` filter this is applied inside retrieval, so every
+    result slot goes to a visible memory however many users a Mind has.
+    """
+    return {
+        "$or": [
+            {"user_email": user_email},
+            {"user_email": ""},
+            {"relationship_context": "shared"},
+        ]
+    }
+
 
 class MemoryManager:
     """
@@ -154,6 +195,16 @@ class MemoryManager:
 
         # Vector store for semantic search
         self.vector_store = VectorStore(mind_id)
+
+        # Hot/warm/cold tiers keep the hot collection and the cache above bounded
+        settings = get_settings()
+        self.tiering: Optional[MemoryTiering] = None
+        if settings.memory_tiering_enabled:
+            self.tiering = MemoryTiering(
+                self,
+                hot_capacity=settings.memory_hot_capacity,
+                warm_capacity=settings.memory_warm_capacity,
+            )
         
         # Smart deduplication (optional, will be initialized by SmartMemoryManager)
         self.deduplicator = None
@@ -178,13 +229,6 @@ class MemoryManager:
         Add a new memory.
 
         Supports both `memory_type` and legacy `type` parameter names for compatibility.
-        """
-        # Support legacy `type` param name
-        if memory_type is None and type is not None:
-            memory_type = type
-
-        """
-        Add a new memory.
 
         Args:
             content: Memory content
@@ -200,6 +244,54 @@ class MemoryManager:
         Returns:
             Created memory
         """
+        memory, vector_metadata = self._new_memory(
+            content,
+            memory_type=memory_type,
+            type=type,
+            emotion=emotion,
+            emotion_intensity=emotion_intensity,
+            importance=importance,
+            tags=tags,
+            metadata=metadata,
+            user_email=user_email,
+            relationship_context=relationship_context,
+            environment_id=environment_id,
+            environment_name=environment_name,
+        )
+        self.vector_store.add_memory(
+            memory_id=memory.id,
+            content=content,
+            metadata=vector_metadata,
+        )
+        return memory
+
+    async def add_memory_async(self, *args: Any, **kwargs: Any) -> Memory:
+        """Async add_memory (same arguments) - only embedding and indexing leave the event loop."""
+        memory, vector_metadata = self._new_memory(*args, **kwargs)
+        await self.vector_store.add_memory_async(memory.id, memory.content, vector_metadata)
+        return memory
+
+    def _new_memory(
+        self,
+        content: str,
+        memory_type: MemoryType = None,
+        # Backwards compatibility: accept `type` key from older code/tests
+        type: Optional[MemoryType] = None,
+        emotion: Optional[str] = None,
+        emotion_intensity: Optional[float] = None,
+        importance: float = 0.5,
+        tags: Optional[List[str]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        user_email: Optional[str] = None,
+        relationship_context: Optional[str] = None,
+        environment_id: Optional[str] = None,
+        environment_name: Optional[str] = None,
+    ) -> Tuple[Memory, Dict[str, Any]]:
+        """Create a memory in the index (and working memory); returns it with its vector metadata."""
+        # Support legacy `type` param name
+        if memory_type is None and type is not None:
+            memory_type = type
+
         memory = Memory(
             type=memory_type,
             content=content,
@@ -216,9 +308,10 @@ class MemoryManager:
 
         # Store in memory index
         self.memories[memory.id] = memory
+        if importance >= 0.7:
+            self._add_to_working_memory(memory.id)
 
-        # Add to vector store for semantic search
-        # Build metadata - ChromaDB requires all values to be non-None
+        # Metadata for the vector store - ChromaDB requires all values to be non-None
         vector_metadata = {
             "type": memory_type.value,
             "importance": float(importance),
@@ -245,18 +338,7 @@ class MemoryManager:
                     else:
                         # Convert complex types to strings
                         vector_metadata[key] = str(value)
-        
-        self.vector_store.add_memory(
-            memory_id=memory.id,
-            content=content,
-            metadata=vector_metadata,
-        )
-
-        # Add to working memory if important
-        if importance >= 0.7:
-            self._add_to_working_memory(memory.id)
-
-        return memory
+        return memory, vector_metadata
 
     def get_memory(self, memory_id: str) -> Optional[Memory]:
         """Get a specific memory and mark it as accessed."""
@@ -274,33 +356,148 @@ class MemoryManager:
         user_email: Optional[str] = None,
     ) -> List[Memory]:
         """
-        Search memories semantically.
+        Search memories semantically (fused with keyword matches when
+        memory_hybrid_search is enabled).
 
         Args:
             query: Search query
             memory_type: Filter by type
             limit: Max results
             min_importance: Minimum importance threshold
-            user_email: Filter by specific user's memories
+            user_email: Only memories this user may see (see user_scope_filter)
 
         Returns:
             List of matching memories
         """
-        # Build metadata filter
+        # Search vector store (filters apply inside both retrievers)
+        results = self._search(query, limit, self._search_filter(memory_type, min_importance, user_email))
+        return self._memories_from_results(results)
+
+    async def search_memories_async(
+        self,
+        query: str,
+        memory_type: Optional[MemoryType] = None,
+        limit: int = 10,
+        min_importance: Optional[float] = None,
+        user_email: Optional[str] = None,
+    ) -> List[Memory]:
+        """Async search_memories - embedding and index work stay off the event loop."""
+        embedding = await get_embedding_batcher().embed(query)
+        results = await run_in_vector_executor(
+            self._search,
+            query,
+            limit,
+            self._search_filter(memory_type, min_importance, user_email),
+            query_embedding=embedding,
+        )
+        return self._memories_from_results(results)
+
+    def _search(
+        self,
+        query: str,
+        n_results: int,
+        filter_metadata: Optional[Dict[str, Any]],
+        query_embedding: Optional[Any] = None,
+        include_warm: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """Vector store search over the hot (and, with tiering, warm) memories."""
+        hybrid = get_settings().memory_hybrid_search
+        if self.tiering:
+            return self.tiering.search(query, n_results, filter_metadata, hybrid, query_embedding, include_warm)
+        search = self.vector_store.hybrid_search if hybrid else self.vector_store.search
+        return search(query, n_results, filter_metadata, query_embedding=query_embedding)
+
+    def deep_recall(
+        self,
+        query: str,
+        limit: int = 10,
+        memory_type: Optional[MemoryType] = None,
+        min_importance: Optional[float] = None,
+        user_email: Optional[str] = None,
+    ) -> List[Memory]:
+        """
+        Search every tier, including the cold archive.
+
+        Slower than search_memories (the archive is scanned), so it is meant
+        for explicit "do you remember..." style lookups. Cold memories are
+        returned but not cached or promoted.
+
+        Args:
+            query: Search query
+            limit: Max results
+            memory_type: Filter by type
+            min_importance: Minimum importance threshold
+            user_email: Only memories this user may see (see user_scope_filter)
+
+        Returns:
+            List of matching memories, best first
+        """
+        filter_metadata = self._search_filter(memory_type, min_importance, user_email)
+        return self._deep_recall_memories(*self._deep_search(query, limit, filter_metadata), limit)
+
+    async def deep_recall_async(
+        self,
+        query: str,
+        limit: int = 10,
+        memory_type: Optional[MemoryType] = None,
+        min_importance: Optional[float] = None,
+        user_email: Optional[str] = None,
+    ) -> List[Memory]:
+        """Async deep_recall - the tier and archive scans run on the vector store executor."""
+        filter_metadata = self._search_filter(memory_type, min_importance, user_email)
+        results, cold_records = await run_in_vector_executor(self._deep_search, query, limit, filter_metadata)
+        return self._deep_recall_memories(results, cold_records, limit)
+
+    def _deep_search(
+        self,
+        query: str,
+        limit: int,
+        filter_metadata: Optional[Dict[str, Any]],
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Hot and warm results plus matching cold archive records."""
+        results = self._search(query, limit, filter_metadata, include_warm=True)
+        cold_records = self.tiering.cold.search(query, limit, filter_metadata) if self.tiering else []
+        return results, cold_records
+
+    def _deep_recall_memories(
+        self,
+        results: List[Dict[str, Any]],
+        cold_records: List[Dict[str, Any]],
+        limit: int,
+    ) -> List[Memory]:
+        """Fuse tier results (cached) with cold records (not cached)."""
+        memories = self._memories_from_results(results)
+        cold = {}
+        for record in cold_records:
+            try:
+                cold[record["id"]] = Memory.from_vector_record(record["id"], record["content"], record["metadata"])
+            except Exception:
+                continue
+        if not cold:
+            return memories[:limit]
+        found = {memory.id: memory for memory in memories}
+        found.update((memory_id, memory) for memory_id, memory in cold.items() if memory_id not in found)
+
+        fused = reciprocal_rank_fusion([[memory.id for memory in memories], list(cold)])
+        return [found[memory_id] for memory_id, _ in fused][:limit]
+
+    def _search_filter(
+        self,
+        memory_type: Optional[MemoryType],
+        min_importance: Optional[float],
+        user_email: Optional[str],
+    ) -> Optional[Dict[str, Any]]:
+        """The ``where`` filter for a memory search."""
         filter_metadata = {}
         if memory_type:
             filter_metadata["type"] = memory_type.value
         if min_importance is not None:
             filter_metadata["importance"] = {"$gte": min_importance}
+        scope = user_scope_filter(user_email) if user_email else None
+        return combine_filters(filter_metadata, scope)
 
-        # Search vector store
-        results = self.vector_store.search(
-            query=query,
-            n_results=limit,
-            filter_metadata=filter_metadata if filter_metadata else None,
-        )
-
-        # Convert to Memory objects and filter by user if specified
+    def _memories_from_results(self, results: List[Dict[str, Any]]) -> List[Memory]:
+        """Convert vector store results to (cached) Memory objects."""
         memories = []
         for result in results:
             # Try to get from cache first
@@ -309,21 +506,7 @@ class MemoryManager:
             # If not in cache, reconstruct from vector store result
             if not memory:
                 try:
-                    metadata = result.get("metadata", {})
-                    memory = Memory(
-                        id=result["id"],
-                        type=MemoryType(metadata.get("type", "episodic")),
-                        content=result["content"],
-                        timestamp=datetime.fromisoformat(metadata.get("timestamp", datetime.now().isoformat())),
-                        emotion=metadata.get("emotion"),
-                        importance=float(metadata.get("importance", 0.5)),
-                        tags=metadata.get("tags", "").split(",") if metadata.get("tags") else [],
-                        metadata=metadata,
-                        user_email=metadata.get("user_email") or None,
-                        relationship_context=metadata.get("relationship_context") or None,
-                        environment_id=metadata.get("environment_id") or None,
-                        environment_name=metadata.get("environment_name") or None,
-                    )
+                    memory = Memory.from_vector_record(result["id"], result["content"], result.get("metadata", {}))
                     # Add to cache for future use
                     self.memories[memory.id] = memory
                 except Exception as e:
@@ -331,17 +514,6 @@ class MemoryManager:
                     continue
             
             if memory:
-                # Filter by user_email only if explicitly specified
-                if user_email:
-                    # If the requesting user is specified, strictly enforce user scoping.
-                    # Memories tied to another user's email are only visible if marked as 'shared'.
-                    if memory.user_email and memory.user_email != user_email:
-                        rel = getattr(memory, 'relationship_context', None)
-                        # Treat missing relationship_context as personal (deny access) - only 'shared' allows cross-user visibility
-                        if rel != "shared":
-                            continue
-                    # Include all other memories (no user_email, matching user, or generic)
-                
                 memory.access()
                 memories.append(memory)
 
@@ -372,21 +544,7 @@ class MemoryManager:
                 # Convert to Memory objects and populate cache
                 for vm in vector_memories:
                     try:
-                        metadata = vm.get("metadata", {})
-                        memory = Memory(
-                            id=vm["id"],
-                            type=MemoryType(metadata.get("type", "episodic")),
-                            content=vm["content"],
-                            timestamp=datetime.fromisoformat(metadata.get("timestamp", datetime.now().isoformat())),
-                            emotion=metadata.get("emotion"),
-                            importance=float(metadata.get("importance", 0.5)),
-                            tags=metadata.get("tags", "").split(",") if metadata.get("tags") else [],
-                            metadata=metadata,
-                            user_email=metadata.get("user_email") or None,
-                            relationship_context=metadata.get("relationship_context") or None,
-                            environment_id=metadata.get("environment_id") or None,
-                            environment_name=metadata.get("environment_name") or None,
-                        )
+                        memory = Memory.from_vector_record(vm["id"], vm["content"], vm.get("metadata", {}))
                         self.memories[memory.id] = memory
                     except Exception as e:
                         # Skip invalid memories
@@ -696,7 +854,8 @@ class MemoryManager:
         Returns:
             List of memories ranked by relevance
         """
-        # Get more results initially for reranking
+        # Get more results initially for reranking (user scoping is already
+        # part of the query, so this is a candidate pool, not a visibility margin)
         search_limit = limit * 2 if use_relevance_scoring else limit
         
         # Use regular search
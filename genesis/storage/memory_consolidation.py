@@ -117,8 +117,10 @@ class MemoryConsolidator:
                 memories_to_archive.append(memory.id)
                 archived += 1
         
-        # Could optionally remove from active memory index
-        # For now, just mark as archived (still searchable if needed)
+        # With tiering, archived memories move to cold storage (deep_recall only);
+        # otherwise they are just marked as archived (still searchable)
+        if self.manager.tiering and memories_to_archive:
+            self.manager.tiering.archive_memories(memories_to_archive, reason="old_low_value")
         
         return archived
     
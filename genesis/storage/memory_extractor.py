@@ -160,6 +160,8 @@ If no memories should be extracted, respond with empty array: []
         try:
             # Use orchestrator's generate method - works with ANY provider
             response = await self.orchestrator.generate(
+                purpose="memory_extraction",
+                mind_id=self.memory_manager.mind_id,
                 messages=[
                     {
                         "role": "system",
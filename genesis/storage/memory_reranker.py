@@ -59,6 +59,7 @@ class MemoryReranker:
         try:
             # Get LLM ranking
             response = await self.orchestrator.generate(
+                purpose="memory_rerank",
                 messages=[{"role": "user", "content": prompt}],
                 model=self.model,
                 temperature=0.1,  # Low temperature for consistent ranking
@@ -0,0 +1,417 @@
+"""
+Tiered memory storage for long-lived Minds.
+
+Without tiers every memory a Mind ever formed stays in its Chroma
+collection and, once recalled, in ``MemoryManager.memories`` - RAM and query
+latency grow with the Mind's age. MemoryTiering keeps three tiers:
+
+- Hot: the main collection (plus its BM25 index) and the in-RAM cache,
+  searched on every recall. At most ``hot_capacity`` memories
+- Warm: a second on-disk collection (the "warm" shard), searched when the
+  hot tier misses. At most ``warm_capacity`` memories. A warm memory that
+  is recalled is promoted back to hot at the next rebalance
+- Cold: gzipped JSON Lines archives, searched only by an explicit deep
+  recall (MemoryManager.deep_recall). Archived memories go straight here
+
+rebalance() ranks memories by Memory.get_relevance_score() (importance with
+temporal decay plus an access boost) and demotes the least relevant ones
+when a tier is over capacity. Working memory and prospective memories are
+pinned to hot. Moves reuse the stored embeddings, so nothing is re-embedded.
+
+The Chroma work can run on the vector executor (rebalance_async), but the
+manager's RAM cache and working memory belong to the event loop: memories
+that leave hot are queued and dropped from them by evict_cached(), which
+rebalance() and rebalance_async() call on the caller's thread.
+
+Usage:
+    tiering = MemoryTiering(manager, hot_capacity=2000, warm_capacity=20000)
+    stats = await tiering.rebalance_async()
+"""
+
+import gzip
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Sequence
+
+from genesis.storage.hybrid_search import BM25Index, tokenize
+from genesis.storage.vector_store import VectorStore, run_in_vector_executor
+
+if TYPE_CHECKING:
+    from genesis.storage.memory import MemoryManager
+
+logger = logging.getLogger(__name__)
+
+HOT = "hot"
+WARM = "warm"
+COLD = "cold"
+
+# Records moved between tiers per Chroma call
+MOVE_BATCH = 256
+
+
+def _batches(ids: Sequence[str]) -> Iterator[List[str]]:
+    for start in range(0, len(ids), MOVE_BATCH):
+        yield list(ids[start:start + MOVE_BATCH])
+
+
+class ColdMemoryStore:
+    """
+    Compressed archive of a Mind's cold memories.
+
+    Each archive run writes one ``<timestamp>-<count>.jsonl.gz`` file of
+    {"id", "content", "metadata"} records, so counting needs no reads.
+    """
+
+    def __init__(self, archive_dir: Path):
+        self.archive_dir = Path(archive_dir)
+
+    def _files(self) -> List[Path]:
+        if not self.archive_dir.exists():
+            return []
+        return sorted(self.archive_dir.glob("*.jsonl.gz"))
+
+    def archive(self, records: List[Dict[str, Any]]) -> int:
+        """Write records to a new archive file and return its size in bytes."""
+        if not records:
+            return 0
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        archive_path = self.archive_dir / f"{datetime.now():%Y%m%dT%H%M%S%f}-{len(records)}.jsonl.gz"
+
+        tmp_path = archive_path.with_suffix(".tmp")
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            for record in records:
+                f.write(json.dumps(record) + "\n")
+        os.replace(tmp_path, archive_path)
+        return archive_path.stat().st_size
+
+    def iter_records(self) -> Iterator[Dict[str, Any]]:
+        for path in self._files():
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        yield json.loads(line)
+
+    def count(self) -> int:
+        return sum(int(path.name.split("-")[-1].split(".")[0]) for path in self._files())
+
+    def size_bytes(self) -> int:
+        return sum(path.stat().st_size for path in self._files())
+
+    def search(
+        self,
+        query: str,
+        limit: int = 10,
+        where: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """BM25 search over every archived memory (a full scan - deep recall only)."""
+        index = BM25Index()
+        records = {}
+        for record in self.iter_records():
+            records[record["id"]] = record
+            index.add(record["id"], record["content"], record["metadata"])
+        return [{**records[doc_id], "score": score} for doc_id, score in index.search(query, limit, where)]
+
+
+class MemoryTiering:
+    """Keeps a Mind's hot and warm tiers within capacity."""
+
+    def __init__(
+        self,
+        manager: "MemoryManager",
+        hot_capacity: int = 2000,
+        warm_capacity: int = 20000,
+        archive_dir: Optional[Path] = None,
+    ):
+        """
+        Initialize tiering for a Mind's memory manager.
+
+        Args:
+            manager: The Mind's MemoryManager (its vector_store is the hot tier)
+            hot_capacity: Most memories in the hot collection and RAM cache
+            warm_capacity: Most memories in the warm shard
+            archive_dir: Root directory for cold archives (one subdirectory per Mind)
+        """
+        if archive_dir is None:
+            from genesis.config import get_settings
+
+            archive_dir = get_settings().data_dir / "memory_archive"
+        self.manager = manager
+        self.hot_capacity = hot_capacity
+        self.warm_capacity = warm_capacity
+        self.cold = ColdMemoryStore(Path(archive_dir) / manager.mind_id)
+        self._warm: Optional[VectorStore] = None
+        self._warm_count = 0
+        # Searches (which queue promotions) and rebalances run on executor threads
+        self._lock = threading.RLock()
+        self._pending_promotions: set = set()
+        # Memory ID -> also drop from working memory; applied by evict_cached()
+        self._evictions: Dict[str, bool] = {}
+
+        # Statistics
+        self.demoted = 0
+        self.promoted = 0
+        self.archived = 0
+
+    @property
+    def warm(self) -> VectorStore:
+        if self._warm is None:
+            self._warm = VectorStore(self.manager.mind_id, shard=WARM)
+            # Tracked locally from here on, so a search can skip an empty
+            # warm shard without a Chroma call
+            self._warm_count = self._warm.count()
+        return self._warm
+
+    @property
+    def warm_count(self) -> int:
+        self.warm  # Opening the shard loads its count
+        return self._warm_count
+
+    # ------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------
+
+    def search(
+        self,
+        query: str,
+        n_results: int,
+        filter_metadata: Optional[Dict[str, Any]] = None,
+        hybrid: bool = True,
+        query_embedding: Optional[Sequence[float]] = None,
+        include_warm: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """
+        Search the hot tier, falling back to warm on a miss.
+
+        A miss is fewer than n_results hot matches, or (hybrid search) no
+        hot match for the query's keywords - a name or term the Mind has
+        stopped thinking about. Searching warm on every query would double
+        the cost of every recall.
+
+        Warm memories that make the cut are queued for promotion back to
+        hot at the next rebalance, so searches never write.
+
+        Args:
+            include_warm: Always search warm too (deep recall)
+        """
+        results = self._search_tier(
+            HOT, self.manager.vector_store, query, n_results, filter_metadata, hybrid, query_embedding
+        )
+        keyword_miss = hybrid and tokenize(query) and not any(r["lexical_rank"] for r in results)
+        missed = len(results) < n_results or keyword_miss
+        if not self.warm_count or not (include_warm or missed):
+            return results
+
+        results += self._search_tier(WARM, self.warm, query, n_results, filter_metadata, hybrid, query_embedding)
+        if hybrid:
+            results.sort(key=lambda r: r["score"], reverse=True)
+        else:
+            results.sort(key=lambda r: float("inf") if r["distance"] is None else r["distance"])
+        results = results[:n_results]
+        with self._lock:
+            self._pending_promotions.update(r["id"] for r in results if r["tier"] == WARM)
+        return results
+
+    def _search_tier(
+        self,
+        tier: str,
+        store: VectorStore,
+        query: str,
+        n_results: int,
+        filter_metadata: Optional[Dict[str, Any]],
+        hybrid: bool,
+        query_embedding: Optional[Sequence[float]],
+    ) -> List[Dict[str, Any]]:
+        search = store.hybrid_search if hybrid else store.search
+        return [
+            {**result, "tier": tier}
+            for result in search(query, n_results, filter_metadata, query_embedding=query_embedding)
+        ]
+
+    # ------------------------------------------------------------------
+    # Tier movement
+    # ------------------------------------------------------------------
+
+    def rebalance(self) -> Dict[str, int]:
+        """
+        Move memories between tiers.
+
+        - Warm memories recalled since the last rebalance go back to hot
+          (and stay there for this pass)
+        - Memories flagged as archived go to cold
+        - The least relevant memories beyond hot_capacity go to warm
+        - The least relevant memories beyond warm_capacity go to cold
+
+        Returns:
+            Statistics: promoted (warm -> hot), demoted (hot -> warm),
+            archived (-> cold), and the resulting size of each tier
+        """
+        return self._finish_rebalance(self._rebalance_locked())
+
+    async def rebalance_async(self) -> Dict[str, int]:
+        """rebalance() with the Chroma work on the vector store executor."""
+        return self._finish_rebalance(await run_in_vector_executor(self._rebalance_locked))
+
+    def _rebalance_locked(self) -> Dict[str, int]:
+        with self._lock:
+            stats = self._rebalance()
+        stats.update(self.get_stats())
+        return stats
+
+    def _finish_rebalance(self, stats: Dict[str, int]) -> Dict[str, int]:
+        self.evict_cached()
+        stats["cached"] = len(self.manager.memories)
+        if stats["promoted"] or stats["demoted"] or stats["archived"]:
+            logger.info(
+                f"[MEMORY_TIERS] {self.manager.mind_id}: promoted {stats['promoted']} to hot, "
+                f"demoted {stats['demoted']} to warm, archived {stats['archived']} to cold"
+            )
+        return stats
+
+    def _rebalance(self) -> Dict[str, int]:
+        promoted = list(self._pending_promotions)
+        self._pending_promotions.clear()
+        stats = {"promoted": self.promote(promoted), "demoted": 0, "archived": 0}
+
+        hot = self.manager.vector_store.collection.get(include=["metadatas"])
+        archived = [memory_id for memory_id, metadata in zip(hot["ids"], hot["metadatas"]) if metadata.get("archived")]
+        stats["archived"] += self._archive(self.manager.vector_store, archived)
+
+        excess = len(hot["ids"]) - len(archived) - self.hot_capacity
+        if excess > 0:
+            ranked = self._rank(hot["ids"], hot["metadatas"], exclude=set(archived), pinned=set(promoted))
+            stats["demoted"] = self._demote(ranked[-excess:])
+
+        excess = self.warm_count - self.warm_capacity
+        if excess > 0:
+            warm = self.warm.collection.get(include=["metadatas"])
+            ranked = self._rank(warm["ids"], warm["metadatas"])
+            stats["archived"] += self._archive(self.warm, ranked[-excess:])
+
+        # Memories that left hot must not linger in the RAM cache
+        self._trim_cache()
+        return stats
+
+    def archive_memories(self, memory_ids: List[str], reason: str = "archived") -> int:
+        """Move memories (from hot or warm) to cold storage."""
+        archived = 0
+        with self._lock:
+            for store in (self.manager.vector_store, self.warm):
+                archived += self._archive(store, memory_ids, reason=reason)
+        self.evict_cached()
+        return archived
+
+    def evict_cached(self) -> int:
+        """
+        Drop memories that left hot from the manager's cache and working memory.
+
+        Call on the thread that owns the manager (the event loop).
+        """
+        with self._lock:
+            evictions, self._evictions = self._evictions, {}
+        for memory_id, forget in evictions.items():
+            self.manager.memories.pop(memory_id, None)
+            if forget and memory_id in self.manager.working_memory:
+                self.manager.working_memory.remove(memory_id)
+        return len(evictions)
+
+    def promote(self, memory_ids: List[str]) -> int:
+        """Move warm memories back to hot."""
+        promoted = 0
+        with self._lock:
+            for ids in _batches(memory_ids):
+                records = self.warm.get_records(ids)
+                self.manager.vector_store.add_records(records)
+                self.warm.delete_memories(records["ids"])
+                self._warm_count -= len(records["ids"])
+                promoted += len(records["ids"])
+        self.promoted += promoted
+        return promoted
+
+    def _rank(
+        self,
+        ids: List[str],
+        metadatas: List[Dict[str, Any]],
+        exclude: Optional[set] = None,
+        pinned: Optional[set] = None,
+    ) -> List[str]:
+        """IDs from most to least worth keeping (pinned memories first)."""
+        from genesis.storage.memory import Memory, MemoryType
+
+        pinned = set(self.manager.working_memory) | (pinned or set())
+        scored = []
+        for memory_id, metadata in zip(ids, metadatas):
+            if exclude and memory_id in exclude:
+                continue
+            memory = self.manager.memories.get(memory_id) or Memory.from_vector_record(memory_id, "", metadata)
+            keep = memory_id in pinned or memory.type == MemoryType.PROSPECTIVE
+            scored.append((keep, memory.get_relevance_score(), memory_id))
+        scored.sort(reverse=True)
+        return [memory_id for _, _, memory_id in scored]
+
+    def _with_ram_state(self, records: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy access statistics from the RAM cache into the records' metadata."""
+        for memory_id, metadata in zip(records["ids"], records["metadatas"]):
+            memory = self.manager.memories.get(memory_id)
+            if memory is None:
+                continue
+            metadata["access_count"] = memory.access_count
+            if memory.last_accessed:
+                metadata["last_accessed"] = memory.last_accessed.isoformat()
+        return records
+
+    def _demote(self, memory_ids: List[str]) -> int:
+        demoted = 0
+        for ids in _batches(memory_ids):
+            records = self._with_ram_state(self.manager.vector_store.get_records(ids))
+            self.warm.add_records(records)
+            self.manager.vector_store.delete_memories(records["ids"])
+            self._warm_count += len(records["ids"])
+            demoted += len(records["ids"])
+        self.demoted += demoted
+        return demoted
+
+    def _archive(self, store: VectorStore, memory_ids: List[str], reason: Optional[str] = None) -> int:
+        archived = 0
+        for ids in _batches(memory_ids):
+            records = self._with_ram_state(store.get_records(ids))
+            if not records["ids"]:
+                continue
+            cold_records = []
+            for memory_id, content, metadata in zip(records["ids"], records["documents"], records["metadatas"]):
+                if reason:
+                    metadata.update(archived=True, archived_date=datetime.now().isoformat(), archive_reason=reason)
+                cold_records.append({"id": memory_id, "content": content, "metadata": metadata})
+            self.cold.archive(cold_records)
+            store.delete_memories(records["ids"])
+            if store is self._warm:
+                self._warm_count -= len(records["ids"])
+            self._evictions.update((memory_id, True) for memory_id in records["ids"])
+            archived += len(records["ids"])
+        self.archived += archived
+        return archived
+
+    def _trim_cache(self) -> None:
+        """Queue cached memories that are no longer hot for eviction."""
+        cached = list(self.manager.memories)
+        present = set()
+        for ids in _batches(cached):
+            present.update(self.manager.vector_store.collection.get(ids=ids, include=[])["ids"])
+        for memory_id in cached:
+            if memory_id not in present:
+                self._evictions.setdefault(memory_id, False)
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            "hot": self.manager.vector_store.count(),
+            "cached": len(self.manager.memories),
+            "warm": self.warm_count,
+            "cold": self.cold.count(),
+            "cold_bytes": self.cold.size_bytes(),
+            "total_demoted": self.demoted,
+            "total_promoted": self.promoted,
+            "total_archived": self.archived,
+        }
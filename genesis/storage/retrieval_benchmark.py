@@ -0,0 +1,342 @@
+"""
+Retrieval Benchmark - recall@k and latency of memory search on a synthetic corpus.
+
+Each synthetic person (a rare name) gets several facts (job, food, pet,
+hometown, ...) among filler episodic memories. Every query paraphrases one
+fact ("what does Anika Novak do for a living?"), so answering it needs both the
+name (exact token - BM25's strength) and the kind of fact (paraphrase - the
+embedding's strength). Half the queries carry a ``type`` filter to exercise
+filter push-down.
+
+The report compares vector-only, BM25-only and hybrid (RRF) retrieval:
+
+    python -m genesis.storage.retrieval_benchmark --memories 2000 --queries 200 --k 5
+
+``--stall`` instead measures how long concurrent memory searches freeze the
+event loop, calling the blocking API from coroutines (as Mind.think used to)
+versus the async API (embedding batcher + vector executor):
+
+    python -m genesis.storage.retrieval_benchmark --stall --concurrency 16
+
+``--embedding hashed`` swaps the embedding model for a bag-of-words hash
+(no model download, but then "vector" is lexical too - use it for smoke
+runs, not for comparing retrievers).
+"""
+
+import asyncio
+import random
+import re
+import statistics
+import time
+import zlib
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from chromadb.api.types import EmbeddingFunction
+
+FIRST_NAMES = [
+    "Anika", "Bjorn", "Chidi", "Dagny", "Emeka", "Farida", "Gunnar", "Hiroko", "Ilse", "Jovan",
+    "Kalani", "Leandro", "Maren", "Nnamdi", "Oksana", "Pilar", "Quillon", "Rashida", "Soren", "Tamsin",
+    "Ulrike", "Vesna", "Wendell", "Xiomara", "Yusuf", "Zofia",
+]
+SURNAMES = ["Okafor", "Lindqvist", "Moreau", "Takahashi", "Novak", "Haddad", "Castellano", "Brennan"]
+
+# (memory template, query paraphrases, values)
+FACTS: List[Tuple[str, List[str], List[str]]] = [
+    ("{name} works as a {value}.", ["What does {name} do for a living?", "What is {name}'s job?"],
+     ["marine biologist", "tax accountant", "pastry chef", "airline pilot", "civil engineer", "nurse"]),
+    ("{name}'s favorite food is {value}.", ["What does {name} like to eat?", "Which dish does {name} love most?"],
+     ["ramen", "paella", "jollof rice", "pierogi", "pad thai", "lasagna"]),
+    ("{name} adopted a dog named {value}.", ["What is the name of {name}'s pet?", "What is {name}'s dog called?"],
+     ["Biscuit", "Pepper", "Shadow", "Mochi", "Rocket", "Juniper"]),
+    ("{name} grew up in {value}.", ["Where is {name} from originally?", "Which town was {name} raised in?"],
+     ["Lisbon", "Osaka", "Lagos", "Krakow", "Valparaiso", "Tromso"]),
+    ("{name} is learning to play the {value}.", ["Which instrument is {name} practicing?",
+     "What music lessons is {name} taking?"], ["cello", "banjo", "saxophone", "harp", "drums", "violin"]),
+    ("{name} is allergic to {value}.", ["What can {name} not eat?", "Does {name} have any allergies?"],
+     ["peanuts", "shellfish", "penicillin", "cat dander", "pollen", "gluten"]),
+]
+
+FILLER = [
+    "I spent the afternoon thinking about {topic} and felt {mood}.",
+    "We talked about {topic} today; it left me feeling {mood}.",
+    "I read an article on {topic} this morning.",
+    "Someone asked me about {topic}, which made me {mood}.",
+    "I noticed how much I enjoy conversations about {topic}.",
+]
+TOPICS = ["the ocean", "old movies", "space travel", "gardening", "jazz", "mathematics", "rainy weather",
+          "friendship", "cooking", "history", "mountains", "poetry", "trains", "chess", "coffee"]
+MOODS = ["calm", "curious", "happy", "nostalgic", "restless", "grateful", "thoughtful"]
+
+MODES = ("vector", "bm25", "hybrid")
+
+
+class HashingEmbeddingFunction(EmbeddingFunction):
+    """Bag-of-words hashing "embedding" for offline smoke runs and tests."""
+
+    def __init__(self, dimensions: int = 512):
+        self.dimensions = dimensions
+
+    def __call__(self, input: List[str]) -> List[np.ndarray]:
+        vectors = []
+        for text in input:
+            vector = np.zeros(self.dimensions, dtype=np.float32)
+            for word in re.findall(r"[a-z0-9]+", text.lower()):
+                vector[zlib.crc32(word.encode()) % self.dimensions] += 1.0
+            vectors.append(vector)
+        return vectors
+
+    # Chroma persists embedding function configs with the collection
+    @staticmethod
+    def name() -> str:
+        return "genesis_hashing"
+
+    def get_config(self) -> Dict[str, Any]:
+        return {"dimensions": self.dimensions}
+
+    @staticmethod
+    def build_from_config(config: Dict[str, Any]) -> "HashingEmbeddingFunction":
+        return HashingEmbeddingFunction(**config)
+
+
+@dataclass
+class SyntheticCorpus:
+    """Memories (id, content, metadata) and queries (text, target id, where)."""
+
+    memories: List[Tuple[str, str, Dict[str, Any]]] = field(default_factory=list)
+    queries: List[Tuple[str, str, Optional[Dict[str, Any]]]] = field(default_factory=list)
+
+
+def build_corpus(memories: int = 2000, queries: int = 200, seed: int = 0) -> SyntheticCorpus:
+    """Generate a reproducible corpus: about a third facts, the rest filler."""
+    rng = random.Random(seed)
+    corpus = SyntheticCorpus()
+    people = [f"{first} {last}" for first in FIRST_NAMES for last in SURNAMES]
+    rng.shuffle(people)
+
+    facts = []
+    people_needed = max(1, memories // (3 * len(FACTS)))
+    for person in people[:people_needed]:
+        for kind, (template, questions, values) in enumerate(FACTS):
+            memory_id = f"fact-{len(facts)}"
+            content = template.format(name=person, value=rng.choice(values))
+            metadata = {"type": "semantic", "importance": round(rng.uniform(0.3, 1.0), 2), "fact": kind}
+            corpus.memories.append((memory_id, content, metadata))
+            facts.append((memory_id, person, questions))
+
+    while len(corpus.memories) < memories:
+        content = rng.choice(FILLER).format(topic=rng.choice(TOPICS), mood=rng.choice(MOODS))
+        metadata = {"type": "episodic", "importance": round(rng.uniform(0.1, 0.8), 2)}
+        corpus.memories.append((f"filler-{len(corpus.memories)}", content, metadata))
+    rng.shuffle(corpus.memories)
+
+    for index in range(queries):
+        memory_id, person, questions = rng.choice(facts)
+        where = {"type": "semantic"} if index % 2 else None
+        corpus.queries.append((rng.choice(questions).format(name=person), memory_id, where))
+    return corpus
+
+
+@dataclass
+class RetrievalReport:
+    """Recall@k and per-query latency for each retrieval mode."""
+
+    memories: int
+    queries: int
+    k: int
+    embedding: str
+    index_seconds: float = 0.0
+    recall: Dict[str, float] = field(default_factory=dict)
+    latency_ms_p50: Dict[str, float] = field(default_factory=dict)
+    latency_ms_p95: Dict[str, float] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class LoopStallReport:
+    """Event-loop stall while concurrent searches run, blocking vs async API."""
+
+    memories: int
+    searches: int
+    concurrency: int
+    embedding: str
+    # Per API ("blocking", "async"): the longest the loop could not run
+    # anything else, the summed lateness of a 1 ms heartbeat, and throughput
+    max_stall_ms: Dict[str, float] = field(default_factory=dict)
+    total_stall_ms: Dict[str, float] = field(default_factory=dict)
+    searches_per_second: Dict[str, float] = field(default_factory=dict)
+    embedding_batches: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def _indexed_store(corpus: SyntheticCorpus, seed: int, embedding: str) -> Any:
+    """A fresh VectorStore holding the corpus (bulk-added in chunks)."""
+    from genesis.storage import vector_store
+    from genesis.storage.vector_store import VectorStore
+
+    if embedding == "hashed":
+        vector_store._embedding_function = HashingEmbeddingFunction()
+    store = VectorStore(f"retrieval-bench-{seed}")
+    store.clear()
+    for start in range(0, len(corpus.memories), 256):
+        chunk = corpus.memories[start:start + 256]
+        store.collection.add(
+            ids=[memory_id for memory_id, _, _ in chunk],
+            documents=[content for _, content, _ in chunk],
+            metadatas=[metadata for _, _, metadata in chunk],
+        )
+    store.lexical_index  # Built from the collection, as on a Mind's first search
+    return store
+
+
+def run_benchmark(
+    memories: int = 2000,
+    queries: int = 200,
+    k: int = 5,
+    seed: int = 0,
+    embedding: str = "default",
+) -> RetrievalReport:
+    """
+    Index a synthetic corpus in a fresh VectorStore and measure each mode.
+
+    Uses the current settings' data_dir - point DATA_DIR at a scratch
+    directory first (main() does).
+    """
+    corpus = build_corpus(memories=memories, queries=queries, seed=seed)
+    started = time.perf_counter()
+    store = _indexed_store(corpus, seed, embedding)
+    report = RetrievalReport(
+        memories=len(corpus.memories), queries=len(corpus.queries), k=k, embedding=embedding,
+        index_seconds=round(time.perf_counter() - started, 3),
+    )
+
+    searches = {
+        "vector": lambda text, where: [r["id"] for r in store.search(text, n_results=k, filter_metadata=where)],
+        "bm25": lambda text, where: [doc_id for doc_id, _ in store.lexical_index.search(text, limit=k, where=where)],
+        "hybrid": lambda text, where: [r["id"] for r in store.hybrid_search(text, n_results=k, filter_metadata=where)],
+    }
+    for mode in MODES:
+        hits, latencies = 0, []
+        for text, target, where in corpus.queries:
+            query_started = time.perf_counter()
+            found = searches[mode](text, where)
+            latencies.append((time.perf_counter() - query_started) * 1000)
+            hits += target in found
+        latencies.sort()
+        report.recall[mode] = round(hits / len(corpus.queries), 4)
+        report.latency_ms_p50[mode] = round(statistics.median(latencies), 3)
+        report.latency_ms_p95[mode] = round(latencies[int(0.95 * (len(latencies) - 1))], 3)
+
+    store.clear()
+    return report
+
+
+def run_stall_benchmark(
+    memories: int = 2000,
+    searches: int = 200,
+    concurrency: int = 16,
+    seed: int = 0,
+    embedding: str = "default",
+) -> LoopStallReport:
+    """
+    Measure event-loop stall of concurrent hybrid searches.
+
+    ``concurrency`` coroutines share ``searches`` queries while a heartbeat
+    coroutine sleeps 1 ms at a time and records how late it wakes up.
+    """
+    from genesis.storage.vector_store import get_embedding_batcher
+
+    corpus = build_corpus(memories=memories, queries=searches, seed=seed)
+    store = _indexed_store(corpus, seed, embedding)
+    report = LoopStallReport(
+        memories=len(corpus.memories), searches=len(corpus.queries), concurrency=concurrency, embedding=embedding,
+    )
+
+    async def blocking_search(text: str, where: Optional[Dict[str, Any]]) -> Any:
+        return store.hybrid_search(text, n_results=5, filter_metadata=where)
+
+    async def measure(search: Any) -> Tuple[float, float, float]:
+        pending = list(corpus.queries)
+        stalls: List[float] = []
+        done = asyncio.Event()
+
+        async def heartbeat() -> None:
+            while not done.is_set():
+                started = time.perf_counter()
+                await asyncio.sleep(0.001)
+                stalls.append(max(0.0, time.perf_counter() - started - 0.001))
+
+        async def worker() -> None:
+            while pending:
+                text, _, where = pending.pop()
+                await search(text, where)
+                await asyncio.sleep(0)
+
+        monitor = asyncio.create_task(heartbeat())
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+        done.set()
+        await monitor
+        return max(stalls, default=0.0) * 1000, sum(stalls) * 1000, len(corpus.queries) / elapsed
+
+    async def async_search(text: str, where: Optional[Dict[str, Any]]) -> Any:
+        return await store.hybrid_search_async(text, n_results=5, filter_metadata=where)
+
+    apis = {"blocking": blocking_search, "async": async_search}
+    for api, search in apis.items():
+        batcher = get_embedding_batcher()
+        batches_before, texts_before = batcher.batches, batcher.texts
+        max_stall, total_stall, throughput = asyncio.run(measure(search))
+        report.max_stall_ms[api] = round(max_stall, 3)
+        report.total_stall_ms[api] = round(total_stall, 3)
+        report.searches_per_second[api] = round(throughput, 1)
+        if api == "async":
+            batches, texts = batcher.batches - batches_before, batcher.texts - texts_before
+            report.embedding_batches = {
+                "batches": batches,
+                "avg_batch_size": round(texts / batches, 2) if batches else 0.0,
+            }
+
+    store.clear()
+    return report
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command-line entry point."""
+    import argparse
+    import json
+    import os
+    import tempfile
+
+    parser = argparse.ArgumentParser(description="Benchmark memory retrieval on a synthetic corpus.")
+    parser.add_argument("--memories", type=int, default=2000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--embedding", choices=["default", "hashed"], default="default")
+    parser.add_argument("--stall", action="store_true", help="Measure event-loop stall instead of recall")
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent searches (with --stall)")
+    parser.add_argument("--data-dir", help="DATA_DIR for the vector store (default: a temporary directory)")
+    args = parser.parse_args(argv)
+
+    os.environ["DATA_DIR"] = args.data_dir or tempfile.mkdtemp(prefix="genesis-retrieval-")
+    if args.stall:
+        report = run_stall_benchmark(
+            memories=args.memories, searches=args.queries, concurrency=args.concurrency, seed=args.seed,
+            embedding=args.embedding,
+        )
+    else:
+        report = run_benchmark(
+            memories=args.memories, queries=args.queries, k=args.k, seed=args.seed, embedding=args.embedding,
+        )
+    print(json.dumps(report.to_dict(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,152 @@
 ﻿"""Vector storage using ChromaDB for semantic search."""
 
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
 import chromadb
 from chromadb.config import Settings
-from typing import List, Dict, Any, Optional
+from typing import Callable, List, Dict, Any, Optional, Sequence, Tuple
 from pathlib import Path
 
 from genesis.config import get_settings
+from genesis.storage.hybrid_search import BM25Index, reciprocal_rank_fusion
+
+# Candidates fetched from each retriever per requested hybrid result
+HYBRID_CANDIDATES = 4
+# Most texts embedded in one call by the embedding batcher
+MAX_EMBEDDING_BATCH = 32
+
+
+# ChromaDB clients and the embedding function are shared by every VectorStore
+# in the process, so hosting many Minds (see genesis.host) loads the embedding
+# model once instead of once per Mind.
+_clients: Dict[str, Any] = {}
+_embedding_function: Optional[Any] = None
+# Keyword indexes per collection, shared like the clients so every
+# VectorStore for the same Mind sees the same adds and deletes
+_lexical_indexes: Dict[str, BM25Index] = {}
+_lexical_index_lock = threading.Lock()
+# Embedding and index work from async code runs on one bounded executor
+_executor: Optional[ThreadPoolExecutor] = None
+_embedding_batcher: Optional["EmbeddingBatcher"] = None
+
+
+def get_chroma_client(path: Path) -> Any:
+    """Get (or create) the shared persistent ChromaDB client for a path."""
+    key = str(path)
+    client = _clients.get(key)
+    if client is None:
+        path.mkdir(parents=True, exist_ok=True)
+        client = chromadb.PersistentClient(
+            path=key,
+            settings=Settings(
+                anonymized_telemetry=False,
+                allow_reset=True,
+            ),
+        )
+        _clients[key] = client
+    return client
+
+
+def get_embedding_function() -> Any:
+    """Get the process-wide embedding function used by all collections."""
+    global _embedding_function
+    if _embedding_function is None:
+        from chromadb.utils import embedding_functions
+        _embedding_function = embedding_functions.DefaultEmbeddingFunction()
+    return _embedding_function
+
+
+def get_vector_executor() -> ThreadPoolExecutor:
+    """Get the process-wide executor for embedding and vector index work."""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=max(1, get_settings().vector_store_workers),
+            thread_name_prefix="vector-store",
+        )
+    return _executor
+
+
+async def run_in_vector_executor(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run a blocking vector store call without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_vector_executor(), lambda: func(*args, **kwargs))
+
+
+class EmbeddingBatcher:
+    """
+    Micro-batches concurrent embedding requests.
+
+    Texts submitted while a batch is waiting for an executor worker join
+    that batch, so N Minds searching at once cost one embedding call
+    instead of N. There is no added delay: an idle process embeds a lone
+    query immediately, and batches only form when workers are busy.
+    """
+
+    def __init__(self, max_batch: int = MAX_EMBEDDING_BATCH):
+        self.max_batch = max_batch
+        self._pending: List[Tuple[str, Future]] = []
+        self._lock = threading.Lock()
+
+        # Statistics
+        self.batches = 0
+        self.texts = 0
+        self.largest_batch = 0
+
+    def submit(self, text: str) -> Future:
+        """Queue a text; the future resolves to its embedding."""
+        future: Future = Future()
+        with self._lock:
+            self._pending.append((text, future))
+            first = len(self._pending) == 1
+        if first:
+            get_vector_executor().submit(self._run)
+        return future
+
+    async def embed(self, text: str) -> Sequence[float]:
+        return await asyncio.wrap_future(self.submit(text))
+
+    def _run(self) -> None:
+        with self._lock:
+            batch = self._pending[:self.max_batch]
+            self._pending = self._pending[self.max_batch:]
+            if self._pending:
+                get_vector_executor().submit(self._run)
+        # Drop callers that gave up while queued; the rest can no longer be cancelled
+        batch = [(text, future) for text, future in batch if future.set_running_or_notify_cancel()]
+        if not batch:
+            return
+        try:
+            vectors = get_embedding_function()([text for text, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+            return
+        with self._lock:
+            self.batches += 1
+            self.texts += len(batch)
+            self.largest_batch = max(self.largest_batch, len(batch))
+        for (_, future), vector in zip(batch, vectors):
+            future.set_result(vector)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "batches": self.batches,
+                "texts": self.texts,
+                "avg_batch_size": round(self.texts / self.batches, 2) if self.batches else 0.0,
+                "largest_batch": self.largest_batch,
+            }
+
+
+def get_embedding_batcher() -> EmbeddingBatcher:
+    """Get the process-wide embedding batcher."""
+    global _embedding_batcher
+    if _embedding_batcher is None:
+        _embedding_batcher = EmbeddingBatcher()
+    return _embedding_batcher
 
 
 class VectorStore:
@@ -15,27 +156,39 @@ class VectorStore:
     Enables semantic search across memories, thoughts, and conversations.
     """
 
-    def __init__(self, mind_id: str):
-        """Initialize vector store for a specific Mind."""
+    def __init__(self, mind_id: str, shard: Optional[str] = None):
+        """
+        Initialize vector store for a specific Mind.
+
+        Args:
+            mind_id: Mind identifier
+            shard: Separate collection for part of the Mind's memories
+                (e.g. "warm", see genesis.storage.memory_tiers); None is the
+                main collection
+        """
         self.mind_id = mind_id
+        self.shard = shard
+        self.collection_name = f"mind_{mind_id}_{shard}" if shard else f"mind_{mind_id}"
         self.settings = get_settings()
 
-        # Create persistent ChromaDB client
-        chroma_path = self.settings.data_dir / "chroma" / mind_id
-        chroma_path.mkdir(parents=True, exist_ok=True)
-
-        self.client = chromadb.PersistentClient(
-            path=str(chroma_path),
-            settings=Settings(
-                anonymized_telemetry=False,
-                allow_reset=True,
-            ),
-        )
+        # Persistent ChromaDB client: one per Mind by default, or a single
+        # client for every Mind when shared_vector_store is enabled
+        if self.settings.shared_vector_store:
+            chroma_path = self.settings.data_dir / "chroma" / "shared"
+        else:
+            chroma_path = self.settings.data_dir / "chroma" / mind_id
+        self.client = get_chroma_client(chroma_path)
+        self._index_key = f"{chroma_path}:{self.collection_name}"
 
         # Create or get collection
-        self.collection = self.client.get_or_create_collection(
-            name=f"mind_{mind_id}",
-            metadata={"description": f"Memories for Mind {mind_id}"},
+        self.collection = self._get_or_create_collection()
+
+    def _get_or_create_collection(self):
+        """Get or create this Mind's collection with the shared embedding function."""
+        return self.client.get_or_create_collection(
+            name=self.collection_name,
+            metadata={"description": f"Memories for Mind {self.mind_id}"},
+            embedding_function=get_embedding_function(),
         )
 
     def add_memory(
@@ -43,26 +196,36 @@ class VectorStore:
         memory_id: str,
         content: str,
         metadata: Optional[Dict[str, Any]] = None,
+        embedding: Optional[Sequence[float]] = None,
     ) -> None:
         """
-        Add a memory to the vector store.
+        Add a memory to the vector store (or replace one with the same ID).
 
         Args:
             memory_id: Unique memory identifier
             content: Text content to embed
             metadata: Additional metadata
+            embedding: Precomputed embedding of content (None = embed here)
         """
-        self.collection.add(
+        # Upsert: a plain add ignores known IDs, which would leave stale
+        # user/scope metadata behind when add_memory_smart merges a memory
+        self.collection.upsert(
             documents=[content],
             ids=[memory_id],
             metadatas=[metadata or {}],
+            embeddings=[embedding] if embedding is not None else None,
         )
+        # Until the first hybrid search builds it, the index has nothing to update
+        index = _lexical_indexes.get(self._index_key)
+        if index is not None:
+            index.add(memory_id, content, metadata)
 
     def search(
         self,
         query: str,
         n_results: int = 5,
         filter_metadata: Optional[Dict[str, Any]] = None,
+        query_embedding: Optional[Sequence[float]] = None,
     ) -> List[Dict[str, Any]]:
         """
         Search for similar memories.
@@ -71,13 +234,18 @@ class VectorStore:
             query: Search query
             n_results: Number of results to return
             filter_metadata: Metadata filters
+            query_embedding: Precomputed embedding of query (None = embed here)
 
         Returns:
             List of matching memories with scores
         """
+        if query_embedding is not None:
+            query_args = {"query_embeddings": [query_embedding]}
+        else:
+            query_args = {"query_texts": [query]}
         try:
             results = self.collection.query(
-                query_texts=[query],
+                **query_args,
                 n_results=n_results,
                 where=filter_metadata,
             )
@@ -85,10 +253,7 @@ class VectorStore:
             # If collection doesn't exist (e.g., after clear-memories), recreate it
             if "does not exist" in str(e):
                 print(f"[VECTOR_STORE] Collection not found, recreating for mind {self.mind_id}")
-                self.collection = self.client.get_or_create_collection(
-                    name=f"mind_{self.mind_id}",
-                    metadata={"description": f"Memories for Mind {self.mind_id}"},
-                )
+                self.collection = self._get_or_create_collection()
                 # Return empty results for this search
                 return []
             else:
@@ -110,6 +275,128 @@ class VectorStore:
 
         return memories
 
+    @property
+    def lexical_index(self) -> BM25Index:
+        """This collection's BM25 index (built from the collection on first use)."""
+        index = _lexical_indexes.get(self._index_key)
+        if index is None:
+            with _lexical_index_lock:
+                index = _lexical_indexes.get(self._index_key)
+                if index is None:
+                    index = BM25Index()
+                    results = self.collection.get(include=["documents", "metadatas"])
+                    index.add_many(zip(
+                        results["ids"],
+                        results["documents"] or [""] * len(results["ids"]),
+                        results["metadatas"] or [{}] * len(results["ids"]),
+                    ))
+                    _lexical_indexes[self._index_key] = index
+        return index
+
+    def hybrid_search(
+        self,
+        query: str,
+        n_results: int = 5,
+        filter_metadata: Optional[Dict[str, Any]] = None,
+        query_embedding: Optional[Sequence[float]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Search with vector similarity and BM25 keywords, fused by rank.
+
+        Both retrievers apply filter_metadata before ranking, so the
+        results are the best n_results among the memories that pass it.
+
+        Args:
+            query: Search query
+            n_results: Number of results to return
+            filter_metadata: Metadata filters (Chroma ``where`` syntax)
+            query_embedding: Precomputed embedding of query (None = embed here)
+
+        Returns:
+            Matching memories like search(), plus "score" (fused) and the
+            rank each retriever gave them ("vector_rank", "lexical_rank")
+        """
+        candidates = n_results * HYBRID_CANDIDATES
+        vector_results = self.search(
+            query, n_results=candidates, filter_metadata=filter_metadata, query_embedding=query_embedding
+        )
+        lexical_results = self.lexical_index.search(query, limit=candidates, where=filter_metadata)
+
+        vector_ids = [result["id"] for result in vector_results]
+        lexical_ids = [doc_id for doc_id, _ in lexical_results]
+        fused = reciprocal_rank_fusion([vector_ids, lexical_ids])[:n_results]
+
+        # Keyword-only hits still need their documents from Chroma
+        by_id = {result["id"]: result for result in vector_results}
+        missing = [doc_id for doc_id, _ in fused if doc_id not in by_id]
+        if missing:
+            results = self.collection.get(ids=missing, include=["documents", "metadatas"])
+            for i, memory_id in enumerate(results["ids"]):
+                by_id[memory_id] = {
+                    "id": memory_id,
+                    "content": results["documents"][i] if results["documents"] else "",
+                    "metadata": results["metadatas"][i] if results["metadatas"] else {},
+                    "distance": None,
+                }
+
+        vector_ranks = {doc_id: rank for rank, doc_id in enumerate(vector_ids, start=1)}
+        lexical_ranks = {doc_id: rank for rank, doc_id in enumerate(lexical_ids, start=1)}
+        memories = []
+        for doc_id, score in fused:
+            if doc_id not in by_id:
+                continue  # Deleted from the collection behind the index's back
+            memories.append({
+                **by_id[doc_id],
+                "score": score,
+                "vector_rank": vector_ranks.get(doc_id),
+                "lexical_rank": lexical_ranks.get(doc_id),
+            })
+        return memories
+
+    # ------------------------------------------------------------------
+    # Async API - for event-loop code paths. Embeddings go through the
+    # shared EmbeddingBatcher and Chroma/index work runs on the vector
+    # executor, so a search never blocks other Minds or websockets.
+    # ------------------------------------------------------------------
+
+    async def add_memory_async(
+        self,
+        memory_id: str,
+        content: str,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Async add_memory."""
+        embedding = await get_embedding_batcher().embed(content)
+        await run_in_vector_executor(self.add_memory, memory_id, content, metadata, embedding=embedding)
+
+    async def search_async(
+        self,
+        query: str,
+        n_results: int = 5,
+        filter_metadata: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Async search."""
+        embedding = await get_embedding_batcher().embed(query)
+        return await run_in_vector_executor(
+            self.search, query, n_results, filter_metadata, query_embedding=embedding
+        )
+
+    async def hybrid_search_async(
+        self,
+        query: str,
+        n_results: int = 5,
+        filter_metadata: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Async hybrid_search."""
+        embedding = await get_embedding_batcher().embed(query)
+        return await run_in_vector_executor(
+            self.hybrid_search, query, n_results, filter_metadata, query_embedding=embedding
+        )
+
+    async def get_all_async(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Async get_all."""
+        return await run_in_vector_executor(self.get_all, limit)
+
     def get_memory(self, memory_id: str) -> Optional[Dict[str, Any]]:
         """Get a specific memory by ID."""
         results = self.collection.get(ids=[memory_id])
@@ -126,10 +413,41 @@ class VectorStore:
     def delete_memory(self, memory_id: str) -> None:
         """Delete a memory from the vector store."""
         self.collection.delete(ids=[memory_id])
+        index = _lexical_indexes.get(self._index_key)
+        if index is not None:
+            index.remove(memory_id)
 
     def count(self) -> int:
         """Get total number of memories."""
         return self.collection.count()
+
+    def get_records(self, ids: List[str]) -> Dict[str, Any]:
+        """Raw Chroma records (documents, metadatas and embeddings) for moving between stores."""
+        return self.collection.get(ids=ids, include=["documents", "metadatas", "embeddings"])
+
+    def add_records(self, records: Dict[str, Any]) -> None:
+        """Store records from get_records (their embeddings are reused, not recomputed)."""
+        if not records["ids"]:
+            return
+        self.collection.upsert(
+            ids=records["ids"],
+            documents=records["documents"],
+            metadatas=records["metadatas"],
+            embeddings=records["embeddings"],
+        )
+        index = _lexical_indexes.get(self._index_key)
+        if index is not None:
+            index.add_many(zip(records["ids"], records["documents"], records["metadatas"]))
+
+    def delete_memories(self, memory_ids: List[str]) -> None:
+        """Delete several memories from the vector store."""
+        if not memory_ids:
+            return
+        self.collection.delete(ids=memory_ids)
+        index = _lexical_indexes.get(self._index_key)
+        if index is not None:
+            for memory_id in memory_ids:
+                index.remove(memory_id)
     
     def get_all(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """Get all memories from the vector store.
@@ -159,8 +477,6 @@ class VectorStore:
 
     def clear(self) -> None:
         """Clear all memories (dangerous!)."""
-        self.client.delete_collection(name=f"mind_{self.mind_id}")
-        self.collection = self.client.get_or_create_collection(
-            name=f"mind_{self.mind_id}",
-            metadata={"description": f"Memories for Mind {self.mind_id}"},
-        )
+        self.client.delete_collection(name=self.collection_name)
+        _lexical_indexes.pop(self._index_key, None)
+        self.collection = self._get_or_create_collection()
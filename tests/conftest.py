@@ -11,6 +11,7 @@ from genesis.config import Settings
 from genesis.core.mind import Mind
 from genesis.core.mind_config import MindConfig
 from genesis.core.intelligence import Intelligence
+from genesis.database.base import drop_db, init_db
 from genesis.storage.memory import MemoryManager, MemoryType
 
 
@@ -44,6 +45,14 @@ def test_settings(temp_dir: Path) -> Settings:
     return settings
 
 
+@pytest.fixture
+def fresh_db(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Empty database with every table created."""
+    monkeypatch.setenv("GENESIS_HOME", str(tmp_path))
+    drop_db()
+    init_db()
+
+
 @pytest.fixture
 def memory_manager() -> MemoryManager:
     """Create a memory manager for testing."""
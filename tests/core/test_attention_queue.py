@@ -0,0 +1,85 @@
+"""Tests for the heap-based attention queue."""
+
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from genesis.core.consciousness_v2 import AttentionManager, ConsciousnessEvent, EventType
+
+_counter = 0
+
+
+def _event(event_type=EventType.MESSAGE, content=None, age_seconds=0, **metadata) -> ConsciousnessEvent:
+    global _counter
+    _counter += 1
+    return ConsciousnessEvent(
+        event_id=f"EVT-{_counter}",
+        event_type=event_type,
+        source="user",
+        content=content if content is not None else f"message {_counter}",
+        timestamp=datetime.now() - timedelta(seconds=age_seconds),
+        metadata=metadata,
+    )
+
+
+def test_pops_in_priority_order_and_evicts_lowest():
+    attention = AttentionManager(max_queue_size=3)
+    routine = _event(EventType.ROUTINE)
+    message = _event(EventType.MESSAGE)
+    internal = _event(EventType.INTERNAL)
+    for event in (routine, message, internal):
+        attention.add_event(event)
+
+    # Full queue: an urgent event evicts the routine one, a lower one is dropped
+    urgent = _event(EventType.URGENT)
+    attention.add_event(urgent)
+    attention.add_event(_event(EventType.ROUTINE))
+
+    assert len(attention) == 3
+    assert attention.peek_next_event() is urgent
+    assert [attention.get_next_event() for _ in range(4)] == [urgent, message, internal, None]
+    assert attention.get_queue_summary()["evicted"] == 2
+
+
+def test_priorities_are_re_aged_lazily():
+    attention = AttentionManager()
+    fresh_task = _event(EventType.TASK_DUE)        # 0.75 + 0.1
+    stale_message = _event(EventType.MESSAGE)      # 0.8 + 0.1, scored now...
+    attention.add_event(fresh_task)
+    attention.add_event(stale_message)
+
+    # ...then it ages two hours: its bonus is gone (0.8 < 0.85)
+    stale_message.timestamp -= timedelta(hours=2)
+    assert attention.get_next_event() is fresh_task
+    assert attention.get_next_event() is stale_message
+    assert stale_message.priority == 0.8
+
+
+def test_duplicates_coalesce_into_one_event():
+    attention = AttentionManager()
+    first = _event(content="ping", age_seconds=600)
+    attention.add_event(first)
+    attention.add_event(_event(content="ping"))
+    attention.add_event(_event(content="pong", coalesce_key="thread-1"))
+    attention.add_event(_event(content="pong again", coalesce_key="thread-1"))
+
+    assert len(attention) == 2
+    assert first.metadata["coalesced"] == 1
+    assert first.priority > 0.89  # Refreshed to the newer timestamp
+    assert attention.get_queue_summary()["coalesced"] == 2
+
+
+@pytest.mark.benchmark
+def test_message_burst_stays_fast():
+    attention = AttentionManager(max_queue_size=1000)
+    events = [_event(EventType.MESSAGE if i % 2 else EventType.ROUTINE, age_seconds=i % 50) for i in range(20000)]
+
+    started = time.perf_counter()
+    for event in events:
+        attention.add_event(event)
+    popped = [attention.get_next_event() for _ in range(1000)]
+    elapsed = time.perf_counter() - started
+
+    assert len(attention) == 0 and all(e.event_type == EventType.MESSAGE for e in popped)
+    assert elapsed < 2.0
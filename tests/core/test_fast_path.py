@@ -0,0 +1,122 @@
+"""Tests for the rule-based fast path."""
+
+import json
+from datetime import datetime
+
+from genesis.config import get_settings
+from genesis.core import clock
+from genesis.core.consciousness_v2 import (
+    AwarenessLevel,
+    CircadianPhase,
+    ConsciousnessEngineV2,
+    ConsciousnessEvent,
+    EventType,
+    RuleEngine,
+)
+from genesis.core.environment import EnvironmentType
+from genesis.core.fast_path import FastPath, load_rules
+from genesis.core.mind import Mind
+from genesis.storage import vector_store
+from genesis.storage.retrieval_benchmark import HashingEmbeddingFunction
+
+
+def _message(content, event_type=EventType.MESSAGE):
+    return ConsciousnessEvent(
+        event_id="EVT-1", event_type=event_type, source="ada@example.com", content=content, requires_llm=True
+    )
+
+
+class _FixedClock(clock.Clock):
+    def now(self):
+        return datetime(2026, 1, 5, 10, 0)  # Monday morning
+
+
+def test_whole_messages_are_answered_and_questions_skip_the_classifier():
+    fast_path = FastPath(load_rules())
+    context = {"status": "focused on work"}
+
+    assert fast_path.answer("Hi there, Ada!", context, names=["Ada"]).response == "Hello! How can I help you today?"
+    assert fast_path.answer("how are you?", context).response.endswith("Currently focused on work.")
+    # Greetings with a request attached, and words that merely contain a pattern, are not answered
+    assert fast_path.answer("hello, can you write the quarterly report?", context) is None
+    assert fast_path.answer("this is the highest priority", context) is None
+
+    question = fast_path.answer("Tell me about the Roman empire", context)
+    assert question.response is None and question.skips_classifier
+
+    stats = fast_path.get_stats()
+    assert (stats["evaluations"], stats["hits"], stats["hit_rate"]) == (5, 3, 0.6)
+
+
+def test_rules_file_overrides_defaults(tmp_path):
+    rules_file = tmp_path / "rules.json"
+    rules_file.write_text(json.dumps({"rules": [
+        {"name": "greeting_response", "intent": "greeting", "patterns": ["ahoy"], "match": "whole",
+         "event_types": ["message"], "responses": ["Ahoy, {name}!"]},
+    ]}))
+
+    fast_path = FastPath(load_rules(rules_file))
+
+    assert fast_path.answer("Ahoy!", {"name": "Ada"}).response == "Ahoy, Ada!"
+    assert fast_path.answer("hello") is None
+    assert fast_path.rules[0].name == "greeting_response" and len(fast_path) == len(load_rules())
+
+
+def test_rule_engine_keeps_order_and_legacy_custom_rules():
+    engine = RuleEngine()
+    engine.add_rule({
+        "name": "coffee",
+        "trigger": {"event_type": EventType.MESSAGE, "patterns": ["coffee"]},
+        "response_template": "Coffee sounds great!",
+        "needs_llm": False,
+    })
+    phase = CircadianPhase.MORNING
+
+    needs_llm, rule = engine.evaluate(_message("Want some coffee?"), None, None, phase)
+    assert (needs_llm, rule["name"], rule["response"]) == (False, "coffee", "Coffee sounds great!")
+    assert RuleEngine().evaluate(_message("Want some coffee?"), None, None, phase) == (True, None)
+
+    # Rule order is preserved: an urgent event at night still hits the sleep rule first
+    needs_llm, rule = engine.evaluate(_message("fire!", EventType.URGENT), None, None, CircadianPhase.DEEP_NIGHT)
+    assert rule["name"] == "sleep_time_response"
+    needs_llm, rule = engine.evaluate(_message("fire!", EventType.URGENT), None, None, phase)
+    assert (needs_llm, rule["name"]) == (True, "urgent_escalation")
+
+
+async def test_consciousness_answers_greetings_without_llm(monkeypatch):
+    monkeypatch.setattr(clock, "_clock", _FixedClock())
+    engine = ConsciousnessEngineV2(mind_id="GMD-FAST", mind_name="Ada")
+    replies, llm_requests = [], []
+
+    async def on_rule_response(event, reply):
+        replies.append((event.source, reply))
+
+    async def on_need_llm(**kwargs):
+        llm_requests.append(kwargs)
+
+    engine.on_rule_response = on_rule_response
+    engine.on_need_llm = on_need_llm
+    engine.current_awareness = AwarenessLevel.ALERT
+    avoided = engine.rules.fast_path.get_stats()["llm_calls_avoided"]
+
+    engine.attention.add_event(_message("Good morning Ada"))
+    await engine._alert_process()
+    engine.attention.add_event(_message("Can you check my calendar?"))
+    await engine._alert_process()
+
+    assert replies == [("ada@example.com", "Hello! How can I help you today?")]
+    assert len(llm_requests) == 1
+    assert engine.rules.fast_path.get_stats()["llm_calls_avoided"] == avoided + 1
+
+
+async def test_mind_answers_locally_inside_its_environment(fresh_db, mock_intelligence, tmp_path, monkeypatch):
+    monkeypatch.setattr(get_settings(), "data_dir", tmp_path)
+    monkeypatch.setattr(get_settings(), "minds_dir", tmp_path / "minds")
+    monkeypatch.setattr(vector_store, "_embedding_function", HashingEmbeddingFunction())
+    mind = Mind.birth(name="Ada", intelligence=mock_intelligence, creator="ada@example.com")
+    env = mind.environments.create_environment("ENV-FAST", "Studio", EnvironmentType.DIGITAL)
+    mind.environments.enter_environment(env.id)
+
+    assert await mind.think("Hello Ada!", user_email="ada@example.com") == "Hello! How can I help you today?"
+    history = mind.conversation.get_conversation_context(user_email="ada@example.com", environment_id=env.id)
+    assert [message["role"] for message in history] == ["user", "assistant"]
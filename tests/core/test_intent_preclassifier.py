@@ -0,0 +1,129 @@
+"""Tests for the local intent pre-classifier."""
+
+import json
+import re
+import zlib
+from types import SimpleNamespace
+
+import numpy as np
+
+from genesis.core.intent_classifier import IntelligentIntentClassifier
+from genesis.core.intent_preclassifier import CONVERSATION, FOLLOW_UP, TASK, IntentPreClassifier, read_decision_log
+from genesis.models.base import ModelResponse
+
+
+def bag_of_words(texts):
+    """Deterministic stand-in for the sentence embedding model."""
+    vectors = np.zeros((len(texts), 512), dtype=np.float32)
+    for row, text in enumerate(texts):
+        for word in re.findall(r"[a-z]+", text.lower()):
+            vectors[row, zlib.crc32(word.encode()) % 512] += 1
+    return vectors
+
+
+class _Orchestrator:
+    def __init__(self, is_task):
+        self.is_task = is_task
+        self.calls = 0
+
+    async def generate(self, messages, **kwargs):
+        self.calls += 1
+        content = json.dumps({"is_task": self.is_task, "requires_background": self.is_task, "confidence": 0.9})
+        return ModelResponse(content=content, model="fake", provider="fake", tokens_used=10, latency_ms=0.0)
+
+
+def _classifier(preclassifier, is_task, shadow=False):
+    mind = SimpleNamespace(
+        identity=SimpleNamespace(gmid="GMD-INTENT"),
+        intelligence=SimpleNamespace(fast_model="fake/fast"),
+        orchestrator=_Orchestrator(is_task),
+    )
+    classifier = IntelligentIntentClassifier(mind)
+    classifier.preclassifier = preclassifier
+    classifier.shadow_mode = shadow
+    return classifier
+
+
+def test_nearest_centroid_labels():
+    preclassifier = IntentPreClassifier(embedding_function=bag_of_words)
+
+    chat = preclassifier.predict("how was your day today?")
+    assert (chat.label, chat.escalate) == (CONVERSATION, False)
+    assert chat.latency_ms < 5
+    assert preclassifier.predict("create a presentation on solar energy").label == TASK
+    follow_up = preclassifier.predict("yes, go ahead please")
+    assert (follow_up.label, follow_up.escalate) == (FOLLOW_UP, True)
+
+
+async def test_conversation_skips_the_llm_and_tasks_escalate(tmp_path):
+    log = tmp_path / "decisions.jsonl"
+    preclassifier = IntentPreClassifier(embedding_function=bag_of_words, log_path=log)
+
+    chat = _classifier(preclassifier, is_task=False)
+    classification = await chat.classify("how was your day today?")
+    assert not classification.is_task and classification.context["classified_by"] == "local"
+    assert chat.mind.orchestrator.calls == 0
+
+    task = _classifier(preclassifier, is_task=True)
+    assert (await task.classify("create a presentation on solar energy")).is_task
+    assert task.mind.orchestrator.calls == 1
+
+    records = read_decision_log(log)
+    assert [(r["local"]["label"], r["llm_label"]) for r in records] == [(CONVERSATION, None), (TASK, TASK)]
+    stats = preclassifier.get_stats()
+    assert (stats["llm_calls_skipped"], stats["shadow"]["compared"], stats["shadow"]["accuracy"]) == (1, 1, 1.0)
+
+
+async def test_shadow_mode_compares_and_log_retrains(tmp_path):
+    log = tmp_path / "decisions.jsonl"
+    preclassifier = IntentPreClassifier(embedding_function=bag_of_words, log_path=log)
+
+    # Shadow mode: the LLM always runs; here it disagrees with a confident local decision
+    shadow = _classifier(preclassifier, is_task=True, shadow=True)
+    await shadow.classify("tell me about your favorite book")
+    assert shadow.mind.orchestrator.calls == 1
+    assert preclassifier.get_stats()["shadow"] == {
+        "compared": 1, "accuracy": 0.0, "confident_compared": 1, "confident_accuracy": 0.0,
+    }
+
+    # Real traffic labeled by the LLM is used the next time the model is fitted
+    with open(log, "a") as f:
+        for _ in range(30):
+            f.write(json.dumps({"message": "bake sourdough loaves", "llm_label": TASK}) + "\n")
+    retrained = IntentPreClassifier(embedding_function=bag_of_words, log_path=log)
+    assert retrained.predict("bake sourdough loaves").label == TASK
+
+
+async def test_unavailable_embedding_model_backs_off_then_recovers():
+    online = False
+
+    def flaky(texts):
+        if not online:
+            raise ConnectionError("model download failed")
+        return bag_of_words(texts)
+
+    preclassifier = IntentPreClassifier(embedding_function=flaky)
+    assert await preclassifier.predict_async("hello") is None
+    assert (preclassifier.get_stats()["enabled"], preclassifier.failures) == (False, 1)
+    online = True
+    assert preclassifier.predict("hello") is None  # Still backing off
+
+    preclassifier._retry_at = 0.0
+    assert (await preclassifier.predict_async("how was your day today?")).label == CONVERSATION
+    assert preclassifier.get_stats()["enabled"] and preclassifier.failures == 0
+
+
+def test_decision_log_rotates_and_is_read_from_the_end(tmp_path):
+    log = tmp_path / "decisions.jsonl"
+    preclassifier = IntentPreClassifier(embedding_function=bag_of_words, log_path=log, log_max_bytes=4000)
+    chat = preclassifier.predict("how was your day today?")
+    preclassifier.record("how was your day today?", chat)
+    assert "message" not in read_decision_log(log)[0]  # Local decisions keep no message text
+
+    for i in range(40):
+        preclassifier.record(f"message {i}", chat, llm_label=TASK if i % 2 else CONVERSATION)
+    assert log.with_name("decisions.jsonl.1").exists() and log.stat().st_size < 4000
+
+    newest = read_decision_log(log, limit=3, labeled=True)
+    assert [r["message"] for r in newest] == ["message 37", "message 38", "message 39"]
+    assert read_decision_log(log) == read_decision_log(log, limit=1000)
@@ -0,0 +1,88 @@
+"""Tests for LivingMind's LLM gateway batching and persisted budgets."""
+
+import asyncio
+from datetime import datetime
+
+from genesis.core import clock
+from genesis.core.consciousness_v2 import AwarenessLevel
+from genesis.core.living_mind import LLMGateway, parse_batch_reply
+from genesis.core.simulation import FakeOrchestrator
+
+START = datetime(2026, 1, 5, 9, 0)
+
+
+def _gateway(orchestrator, mind_id=None):
+    return LLMGateway(orchestrator=orchestrator, reasoning_model="fake/reasoning", fast_model="fake/fast", mind_id=mind_id)
+
+
+def test_background_requests_are_coalesced_and_packed():
+    orchestrator = FakeOrchestrator(reply="Done.")
+    gateway = _gateway(orchestrator)
+    recorded = []
+
+    async def scenario():
+        futures = [
+            gateway.enqueue("Reflect.", {}, AwarenessLevel.FOCUSED, coalesce_key="reflection"),
+            gateway.enqueue("Next step on A.", {}, AwarenessLevel.FOCUSED, coalesce_key="activity:A"),
+            gateway.enqueue("Next step on A, again.", {}, AwarenessLevel.FOCUSED, coalesce_key="activity:A",
+                            on_response=recorded.append),
+            gateway.enqueue("Next step on B.", {}, AwarenessLevel.FOCUSED, coalesce_key="activity:B"),
+        ]
+        assert orchestrator.total_calls == 0 and len(gateway.request_queue) == 3
+        foreground = await gateway.request("Hi!", {}, AwarenessLevel.FOCUSED)
+        responses = await asyncio.gather(*futures)
+        return foreground, responses, clock.now()
+
+    foreground, responses, finished = clock.run_virtual(scenario(), start=START)
+
+    # The message went out alone, the three queued items in one call after the window
+    assert orchestrator.total_calls == 2
+    assert (finished - START).total_seconds() == gateway.batch_window
+    assert foreground.content == "Done." and not foreground.batched
+    assert all(r.content == "Done." and r.batched for r in responses)
+    assert responses[1] is responses[2]
+    assert recorded == [responses[2]]
+    assert (gateway.requests_submitted, gateway.requests_coalesced, gateway.requests_batched) == (5, 1, 3)
+
+
+def test_full_batch_is_sent_without_waiting():
+    orchestrator = FakeOrchestrator()
+    gateway = _gateway(orchestrator)
+
+    async def scenario():
+        futures = [
+            gateway.enqueue(f"Item {i}", {}, AwarenessLevel.ALERT) for i in range(gateway.max_batch_size)
+        ]
+        await asyncio.gather(*futures)
+        return clock.now()
+
+    assert clock.run_virtual(scenario(), start=START) == START
+    assert orchestrator.total_calls == 1
+
+
+def test_parse_batch_reply():
+    assert parse_batch_reply('```json\n{"1": "a", "2": "b", "9": "x"}\n```', 2) == {1: "a", 2: "b"}
+    assert parse_batch_reply("[1] first\n[2] second\nline", 3) == {1: "first", 2: "second\nline"}
+    assert parse_batch_reply("no structure", 2) == {}
+
+
+def test_budget_survives_restart(tmp_path, fresh_db):
+    mind_id = f"GMD-BUDGET-{tmp_path.name}"
+
+    async def chat(gateway):
+        return await gateway.request("Hello", {}, AwarenessLevel.ALERT)
+
+    first = _gateway(FakeOrchestrator(), mind_id=mind_id)
+    first.daily_request_limit = 2
+    assert clock.run_virtual(chat(first), start=START)
+    assert clock.run_virtual(chat(first), start=START)
+
+    # A new gateway for the same Mind (e.g. after a restart) sees today's usage
+    restarted = _gateway(FakeOrchestrator(), mind_id=mind_id)
+    restarted.daily_request_limit = 2
+    assert clock.run_virtual(chat(restarted), start=START) is None
+    assert restarted.requests_today == 2 and restarted.tokens_today == first.tokens_today
+
+    # ... until the next day
+    assert clock.run_virtual(chat(restarted), start=datetime(2026, 1, 6, 9, 0))
+    assert restarted.requests_today == 1
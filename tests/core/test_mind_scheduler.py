@@ -0,0 +1,70 @@
+"""Tests for the shared Mind scheduler."""
+
+import asyncio
+
+from genesis.core.mind_scheduler import MindScheduler
+
+
+async def test_job_returns_its_next_delay_and_wakes_early():
+    scheduler = MindScheduler()
+    runs = []
+
+    async def tick():
+        runs.append(asyncio.get_running_loop().time())
+        return 3600  # Idle: nothing to do for an hour
+
+    job = scheduler.schedule(tick, interval=3600, owner="GMID-1", name="tick", delay=0)
+    await asyncio.sleep(0.05)
+    assert len(runs) == 1
+
+    # Work arrived - wake() pulls the next run forward
+    job.wake()
+    await asyncio.sleep(0.05)
+    assert len(runs) == 2
+
+    job.cancel()
+    assert scheduler.get_jobs() == []
+
+
+async def test_idle_jobs_do_not_wake_the_driver():
+    scheduler = MindScheduler()
+
+    async def idle():
+        return None
+
+    for i in range(100):
+        scheduler.schedule(idle, interval=3600, owner=f"GMID-{i}", name="idle")
+
+    wakeups = scheduler.wakeups
+    await asyncio.sleep(0.1)
+    assert scheduler.wakeups - wakeups <= 1
+    assert scheduler.dispatched == 0
+
+    for i in range(100):
+        scheduler.cancel_owner(f"GMID-{i}")
+
+
+async def test_per_owner_backpressure_defers_jobs():
+    scheduler = MindScheduler(max_concurrent_per_owner=1)
+    release = asyncio.Event()
+    order = []
+
+    async def slow():
+        order.append("slow")
+        await release.wait()
+        return 3600
+
+    async def fast():
+        order.append("fast")
+        return 3600
+
+    scheduler.schedule(slow, interval=3600, owner="GMID-1", name="slow", delay=0)
+    scheduler.schedule(fast, interval=3600, owner="GMID-1", name="fast", delay=0)
+    await asyncio.sleep(0.05)
+    assert order == ["slow"]
+    assert scheduler.get_stats()["deferred_waiting"] == 1
+
+    release.set()
+    await asyncio.sleep(0.05)
+    assert order == ["slow", "fast"]
+    scheduler.cancel_owner("GMID-1")
@@ -0,0 +1,97 @@
+"""Tests for proactive concern persistence and follow-up scheduling."""
+
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from genesis.core.proactive_consciousness import ProactiveConcern, ProactiveConsciousnessModule
+from genesis.database.base import get_session
+from genesis.database.models import ConcernRecord, MindRecord
+
+
+def _make_module(gmid: str) -> ProactiveConsciousnessModule:
+    mind = SimpleNamespace(identity=SimpleNamespace(gmid=gmid, name="Test Mind"))
+    return ProactiveConsciousnessModule(mind)
+
+
+def _make_concern(concern_id: str, follow_up_at: datetime) -> ProactiveConcern:
+    return ProactiveConcern(
+        concern_id=concern_id,
+        concern_type="health",
+        user_email="tester@example.com",
+        description="has a fever",
+        severity=0.6,
+        created_at=datetime.now(),
+        follow_up_at=follow_up_at,
+    )
+
+
+def test_concerns_bulk_saved_and_scheduled_by_due_time(fresh_db):
+    gmid = 'test-mind-concerns'
+    with get_session() as session:
+        session.add(MindRecord(gmid=gmid, name='Test Mind', creator='tester'))
+
+    module = _make_module(gmid)
+    now = datetime.now()
+    later = _make_concern("later", now + timedelta(hours=2))
+    due = _make_concern("due", now - timedelta(minutes=1))
+    module._track_concern(later)
+    module._track_concern(due)
+    module._save_concerns()
+
+    assert module._dirty_concerns == {}
+    with get_session() as session:
+        assert session.query(ConcernRecord).filter_by(mind_gmid=gmid).count() == 2
+
+    # Only the due concern is popped; the loop should sleep until the later one
+    assert [c.concern_id for c in module._pop_due_concerns(now)] == ["due"]
+    module._next_scan_at = now + timedelta(days=1)
+    assert 0 < module._seconds_until_wakeup() <= 2 * 3600
+
+    # Rescheduling invalidates the old heap entry
+    later.follow_up_at = now - timedelta(seconds=1)
+    module._schedule_follow_up(later)
+    module._mark_dirty(later)
+    module._save_concerns()
+    assert [c.concern_id for c in module._pop_due_concerns(now)] == ["later"]
+
+    # A fresh module reloads the schedule from next_check_at
+    reloaded = _make_module(gmid)
+    assert [c.concern_id for c in reloaded._pop_due_concerns(now)] == ["due", "later"]
+
+
+class _FlakyNotifications:
+    def __init__(self):
+        self.sent = []
+
+    async def send_notification(self, **kwargs):
+        if not self.sent:
+            self.sent.append(None)
+            raise ConnectionError("websocket closed")
+        self.sent.append(kwargs["message"])
+
+
+async def test_failed_follow_up_is_retried(fresh_db):
+    gmid = 'test-mind-retry'
+    with get_session() as session:
+        session.add(MindRecord(gmid=gmid, name='Test Mind', creator='tester'))
+
+    module = _make_module(gmid)
+    module.mind.notification_manager = _FlakyNotifications()
+    now = datetime.now()
+    concern = _make_concern("flaky", now - timedelta(minutes=1))
+    concern.metadata["llm_followup_message"] = "How is the fever?"
+    module._track_concern(concern)
+
+    # The send fails: the concern goes back on the heap after the retry delay
+    await module._check_follow_ups()
+    assert concern.follow_up_count == 0
+    retry_at = now + timedelta(seconds=module.follow_up_retry_seconds)
+    assert module._pop_due_concerns(now) == []
+    assert [c.concern_id for c in module._pop_due_concerns(retry_at + timedelta(seconds=5))] == ["flaky"]
+
+    # Once due again the follow-up goes out
+    concern.follow_up_at = now
+    module._schedule_follow_up(concern)
+    await module._check_follow_ups()
+    assert concern.follow_up_count == 1
+    assert module.mind.notification_manager.sent[-1] == "How is the fever?"
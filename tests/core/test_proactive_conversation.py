@@ -0,0 +1,69 @@
+"""Tests for the proactive conversation context store."""
+
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from genesis.core.proactive_conversation import (
+    ConversationContext,
+    ConversationTopic,
+    ProactiveConversationManager,
+)
+from genesis.database.base import get_session
+from genesis.database.models import ConversationContextRecord, MindRecord
+
+
+def _make_manager(gmid: str) -> ProactiveConversationManager:
+    mind = SimpleNamespace(identity=SimpleNamespace(gmid=gmid, name="Test Mind"))
+    return ProactiveConversationManager(mind)
+
+
+async def test_contexts_persist_and_due_follow_ups_are_queried(fresh_db):
+    gmid = 'test-mind-contexts'
+    with get_session() as session:
+        session.add(MindRecord(gmid=gmid, name='Test Mind', creator='tester'))
+
+    manager = _make_manager(gmid)
+    now = datetime.now()
+    due = ConversationContext(
+        topic=ConversationTopic.HEALTH,
+        subject="fever",
+        user_email="alice@example.com",
+        follow_up_question="How are you feeling?",
+        follow_up_scheduled=now - timedelta(minutes=1),
+        metadata={"reasoning": "health"},
+    )
+    later = ConversationContext(
+        subject="interview",
+        user_email="alice@example.com",
+        follow_up_scheduled=now + timedelta(hours=1),
+    )
+    other_user = ConversationContext(
+        subject="exam",
+        user_email="bob@example.com",
+        follow_up_scheduled=now - timedelta(minutes=5),
+    )
+    for context in (due, later, other_user):
+        manager._index_context(context)
+        await manager._save_context(context)
+
+    with get_session() as session:
+        assert session.query(ConversationContextRecord).filter_by(mind_gmid=gmid).count() == 3
+
+    # A fresh manager bulk loads from the table
+    reloaded = _make_manager(gmid)
+    await reloaded._ensure_loaded()
+    assert set(reloaded.active_contexts) == {due.context_id, later.context_id, other_user.context_id}
+    assert [c.subject for c in reloaded.get_user_contexts("alice@example.com")] == ["fever", "interview"]
+    assert reloaded.get_context(due.context_id).metadata == {"reasoning": "health"}
+
+    pending = await reloaded.get_pending_follow_ups()
+    assert [c.subject for c in pending] == ["exam", "fever"]
+    assert [c.subject for c in await reloaded.get_pending_follow_ups("alice@example.com")] == ["fever"]
+
+    # Sent follow-ups drop out of the due query
+    await reloaded.send_follow_up(pending[0])
+    assert [c.subject for c in await reloaded.get_pending_follow_ups()] == ["fever"]
+
+    assert reloaded.delete_context(later.context_id) is not None
+    assert reloaded.get_context(later.context_id) is None
+    assert later.context_id not in reloaded.user_contexts["alice@example.com"]
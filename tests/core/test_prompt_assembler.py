@@ -0,0 +1,78 @@
+"""Tests for cached, token-budgeted system prompt assembly."""
+
+from genesis.core.environment import EnvironmentManager, EnvironmentType
+from genesis.core.prompt_assembler import PromptAssembler, PromptSection, context_window, estimate_tokens
+from genesis.plugins.environments import EnvironmentsPlugin
+
+
+def test_sections_are_cached_until_their_version_changes():
+    state = {"balance": 10, "builds": 0}
+
+    def build_balance():
+        state["builds"] += 1
+        return f"GEN BALANCE: {state['balance']}"
+
+    assembler = PromptAssembler()
+    sections = [
+        PromptSection("mood", lambda: "CURRENT STATE: calm"),
+        PromptSection("balance", build_balance, version=lambda: state["balance"], static=True),
+        PromptSection("rules", lambda: "CORE RULES", version=lambda: 0, static=True),
+    ]
+
+    first = assembler.assemble(sections)
+    assembler.assemble(sections)
+    assert state["builds"] == 1
+    # Static sections lead, in order, regardless of where they were listed
+    assert first.text == "GEN BALANCE: 10\n\nCORE RULES\n\nCURRENT STATE: calm"
+    assert first.static_text == "GEN BALANCE: 10\n\nCORE RULES"
+
+    state["balance"] = 25
+    assert "GEN BALANCE: 25" in assembler.assemble(sections).text
+    assert state["builds"] == 2
+    assert assembler.get_stats()["hits"] == 3
+
+
+def test_budget_drops_low_priority_then_truncates_required():
+    assembler = PromptAssembler()
+    sections = [
+        PromptSection("identity", lambda: "I" * 400, priority=100, required=True, static=True),
+        PromptSection("plugin", lambda: "P" * 400, priority=40, static=True),
+        PromptSection("memories", lambda: "M" * 400, priority=30),
+        PromptSection("state", lambda: "S" * 40, priority=70),
+    ]
+
+    fitted = assembler.assemble(sections, budget_tokens=200)
+    assert fitted.dropped == ["memories", "plugin"]
+    assert fitted.truncated == []
+    assert fitted.tokens <= 200
+
+    tight = assembler.assemble(sections, budget_tokens=50)
+    assert tight.dropped == ["memories", "plugin", "state"]
+    assert tight.truncated == ["identity"]
+    assert estimate_tokens(tight.text) <= 50
+
+
+def test_context_window_lookup():
+    assert context_window("openrouter/meta-llama/llama-3.3-70b-instruct:free") == 128_000
+    assert context_window("anthropic/claude-3-5-sonnet") == 200_000
+    assert context_window("gpt-4.1-mini") == 1_000_000
+    assert context_window("unknown-model") == 8_192
+
+
+def test_plugin_prompt_version_follows_rendered_state():
+    plugin = EnvironmentsPlugin()
+    plugin.environments = EnvironmentManager()
+    outside = plugin.get_prompt_version(None)
+
+    lab = plugin.environments.create_environment("ENV-1", "Lab", EnvironmentType.PROFESSIONAL)
+    plugin.environments.enter_environment("ENV-1")
+    inside = plugin.get_prompt_version(None)
+    assert inside != outside and plugin.get_prompt_version(None) == inside
+
+    lab.add_participant("Ada")
+    assert plugin.get_prompt_version(None) != inside
+
+    # State the stamp doesn't cover is refreshed by invalidating explicitly
+    stamp = plugin.get_prompt_version(None)
+    plugin.invalidate_prompt()
+    assert plugin.get_prompt_version(None) != stamp
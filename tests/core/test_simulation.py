@@ -0,0 +1,36 @@
+"""Tests for the virtual clock and the Mind simulation harness."""
+
+import asyncio
+import time
+from datetime import datetime
+
+from genesis.core import clock
+from genesis.core.simulation import MindSimulation
+
+
+def test_virtual_loop_jumps_over_sleeps():
+    start = datetime(2026, 1, 5, 6, 0)
+
+    async def day():
+        started = clock.now()
+        await asyncio.sleep(3600)
+        await asyncio.gather(asyncio.sleep(60), asyncio.sleep(86400 - 3600))
+        return started, clock.now()
+
+    wall = time.perf_counter()
+    assert clock.run_virtual(day(), start=start) == (start, datetime(2026, 1, 6, 6, 0))
+    assert time.perf_counter() - wall < 1.0
+    # The process-wide clock is restored afterwards
+    assert isinstance(clock.get_clock(), clock.SystemClock)
+
+
+def test_simulated_day_is_fast_and_deterministic(fresh_db):
+    runs = [MindSimulation(minds=2, days=0.25, messages_per_day=8, seed=7, trace_memory=False).run() for _ in range(2)]
+
+    first, second = runs
+    assert first.ticks > 100 and first.messages_sent == 4
+    assert first.llm_calls > 0 and first.llm_calls_per_mind_day == first.llm_calls / 0.5
+    assert (first.ticks, first.llm_calls, first.llm_calls_by_purpose) == (
+        second.ticks, second.llm_calls, second.llm_calls_by_purpose
+    )
+    assert first.wall_seconds < 30
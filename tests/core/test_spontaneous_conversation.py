@@ -0,0 +1,81 @@
+"""Tests for gated, concurrent interjection analysis."""
+
+import asyncio
+import json
+from datetime import datetime
+from types import SimpleNamespace
+
+from genesis.core.spontaneous_conversation import SpontaneousConversationEngine
+
+
+class _SlowOrchestrator:
+    """Answers every prompt after a delay, counting calls."""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.calls = 0
+
+    async def generate(self, messages, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if "clarifying question" in messages[0]["content"]:
+            content = json.dumps({
+                "needs_clarification": True,
+                "confidence": 0.9,
+                "clarifying_question": "Which exam?",
+            })
+        else:
+            content = "That's wonderful!"
+        return SimpleNamespace(content=content)
+
+
+def _make_engine(orchestrator) -> SpontaneousConversationEngine:
+    mind = SimpleNamespace(
+        orchestrator=orchestrator,
+        intelligence=SimpleNamespace(fast_model="fast"),
+    )
+    return SpontaneousConversationEngine(mind)
+
+
+async def test_only_sendable_checks_run_and_run_concurrently():
+    orchestrator = _SlowOrchestrator(delay=0.2)
+    engine = _make_engine(orchestrator)
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    moments = await engine.analyze_conversation_for_interjections(
+        user_message="I passed my exam, I'm so happy",
+        user_email="alice@example.com",
+        conversation_history=[],
+        assistant_response="Congratulations!",
+    )
+    elapsed = loop.time() - started
+
+    # Clarification and emotional response could be sent immediately; the
+    # delayed-only checks (memory, insight, knowledge) are never run
+    assert [m.trigger_type for m in moments] == ["emotional_response", "clarification_needed"]
+    assert orchestrator.calls == 2
+    assert elapsed < 0.35
+
+    stats = engine.get_check_stats()
+    assert stats["emotional_response"]["runs"] == 1
+    assert stats["emotional_response"]["hit_rate"] == 1.0
+    assert stats["insight"]["runs"] == 0
+    assert stats["insight"]["skipped"] == 1
+
+
+async def test_rate_limited_user_runs_no_checks():
+    orchestrator = _SlowOrchestrator(delay=0)
+    engine = _make_engine(orchestrator)
+    engine.last_interjection_time["alice@example.com"] = datetime.now()
+
+    moments = await engine.analyze_conversation_for_interjections(
+        user_message="I'm so stressed about this",
+        user_email="alice@example.com",
+        conversation_history=[],
+        assistant_response="I'm sorry to hear that.",
+    )
+
+    assert moments == []
+    assert orchestrator.calls == 0
+    assert all(s["runs"] == 0 for s in engine.get_check_stats().values())
@@ -0,0 +1,61 @@
+"""Tests for content-addressed workspace storage."""
+
+from genesis.core.workspace import WorkspaceManager
+from genesis.database.base import get_session
+from genesis.database.models import BlobRecord
+
+
+async def _chunks(data: bytes, size: int):
+    for i in range(0, len(data), size):
+        yield data[i:i + size]
+
+
+async def test_identical_files_across_minds_share_one_blob(tmp_path, fresh_db):
+    data = bytes(range(256)) * 4096  # 1 MB
+    alice = WorkspaceManager("GMID-ALICE", workspace_root=tmp_path / "workspaces")
+    bob = WorkspaceManager("GMID-BOB", workspace_root=tmp_path / "workspaces")
+
+    a = await alice.create_file_async("data.bin", _chunks(data, 64 * 1024), file_type="data")
+    b = await bob.create_file_async("copy.bin", data, file_type="data")
+
+    assert a.content_hash == b.content_hash
+    assert a.size_bytes == len(data)
+    with get_session() as session:
+        assert session.query(BlobRecord).one().ref_count == 2
+
+    # Range reads stream only the requested bytes
+    assert await bob.read_bytes_async(b.file_id, start=1000, end=1010) == data[1000:1010]
+    assert (tmp_path / "workspaces" / "GMID-BOB" / "copy.bin").read_bytes() == data
+
+    stats = alice.get_workspace_stats()
+    assert stats["store_physical_bytes"] == len(data)
+    assert stats["store_dedup_saved_bytes"] == len(data)
+
+    # The blob survives until its last reference is gone
+    alice.delete_file(a.file_id)
+    assert alice.blobs.exists(b.content_hash)
+    await bob.update_file_async(b.file_id, "now different")
+    assert bob.read_file(b.file_id) == "now different"
+    assert not bob.blobs.exists(a.content_hash)
+
+
+async def test_registry_survives_restart_and_puts_restore_missing_blobs(tmp_path, fresh_db):
+    root = tmp_path / "workspaces"
+    workspace = WorkspaceManager("GMID-CAROL", workspace_root=root)
+    saved_state = workspace.to_dict()
+    kept = workspace.create_file("notes.txt", "remember the milk")
+    gone = await workspace.create_file_async("draft.txt", "first draft")
+    workspace.delete_file(gone.file_id)
+
+    # A restart before the Mind's next save still knows which files hold references
+    restarted = WorkspaceManager.from_dict(saved_state, workspace_root=root)
+    assert list(restarted.files) == [kept.file_id]
+    assert restarted.read_file(kept.file_id) == "remember the milk"
+
+    # The reference and the blob on disk are taken together, so a blob
+    # missing from disk is written back rather than referenced as-is
+    restarted.blobs.path(kept.content_hash).unlink()
+    copy = restarted.create_file("copy.txt", "remember the milk")
+    assert restarted.read_file(copy.file_id) == "remember the milk"
+    with get_session() as session:
+        assert session.query(BlobRecord).filter_by(content_hash=kept.content_hash).one().ref_count == 2
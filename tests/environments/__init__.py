@@ -0,0 +1 @@
+"""Environment tests."""
@@ -0,0 +1,76 @@
+"""Tests for queued, delta-encoded environment broadcasts."""
+
+import asyncio
+import json
+import time
+
+from genesis.environments.realtime import ConnectionManager
+from genesis.environments.send_queue import SendQueue
+
+
+class FakeWebSocket:
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.sent = []
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, text: str):
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.sent.append(json.loads(text))
+
+
+async def test_fan_out_to_1000_members_is_not_stalled_by_a_slow_client():
+    manager = ConnectionManager(max_queue_size=32)
+    sockets = {f"mind-{i}": FakeWebSocket() for i in range(1000)}
+    sockets["mind-slow"] = FakeWebSocket(delay=5.0)
+    for mind_id, websocket in sockets.items():
+        await manager.connect("env-1", mind_id, websocket)
+
+    started = time.perf_counter()
+    for i in range(20):
+        await manager.broadcast("env-1", {"type": "chat_message", "content": str(i)})
+    fan_out = time.perf_counter() - started
+
+    fast = [ws for mind_id, ws in sockets.items() if mind_id != "mind-slow"]
+    for _ in range(100):
+        if all(len(ws.sent) == 20 for ws in fast):
+            break
+        await asyncio.sleep(0.05)
+
+    # Broadcasting only enqueues: 20 x 1000 sends finish without waiting on the slow client
+    assert fan_out < 1.0
+    assert all(len(ws.sent) == 20 for ws in fast)
+    assert manager.send_queues["env-1"]["mind-slow"].size >= 19
+
+    for mind_id in sockets:
+        manager.disconnect("env-1", mind_id)
+
+
+async def test_coalescing_and_snapshot_resync_after_dropped_delta():
+    sent = []
+    gate = asyncio.Event()
+
+    async def send(text):
+        await gate.wait()
+        sent.append(json.loads(text))
+
+    queue = SendQueue(send, name="mind-1", max_size=2,
+                      snapshot=lambda: json.dumps({"type": "state_update", "version": 9}))
+    queue.start()
+    queue.put(json.dumps({"type": "first"}))
+    await asyncio.sleep(0)  # Writer takes the first message and blocks on it
+    queue.put(json.dumps({"type": "object_updated", "version": 1}), key="object:a", state_change=True)
+    queue.put(json.dumps({"type": "object_updated", "version": 2}), key="object:a", state_change=True)
+    assert queue.coalesced == 1
+
+    queue.put(json.dumps({"type": "chat_message"}))
+    queue.put(json.dumps({"type": "typing"}))  # Overflow drops the queued delta
+    assert queue.dropped == 1
+
+    gate.set()
+    await asyncio.sleep(0.01)
+    assert [m["type"] for m in sent] == ["first", "state_update", "chat_message", "typing"]
+    queue.close()
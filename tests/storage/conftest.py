@@ -0,0 +1,15 @@
+"""Fixtures for storage tests."""
+
+import pytest
+
+from genesis.config import get_settings
+from genesis.storage import vector_store
+from genesis.storage.retrieval_benchmark import HashingEmbeddingFunction
+
+
+@pytest.fixture
+def offline_store(tmp_path, monkeypatch):
+    """Vector stores under tmp_path with an embedding function that needs no download."""
+    monkeypatch.setattr(get_settings(), "data_dir", tmp_path)
+    monkeypatch.setattr(vector_store, "_embedding_function", HashingEmbeddingFunction())
+    monkeypatch.setattr(vector_store, "_lexical_indexes", {})
@@ -0,0 +1,63 @@
+"""Tests for hybrid BM25 + vector memory retrieval."""
+
+from genesis.storage.hybrid_search import BM25Index, combine_filters, matches_where, reciprocal_rank_fusion
+from genesis.storage.memory import MemoryManager, MemoryType
+from genesis.storage.retrieval_benchmark import run_benchmark
+
+
+def test_bm25_index_is_incremental_and_filtered():
+    index = BM25Index()
+    index.add("a", "Anika works as a marine biologist", {"type": "semantic", "importance": 0.9})
+    index.add("b", "Anika adopted a dog named Biscuit", {"type": "semantic", "importance": 0.4})
+    index.add("c", "I thought about the ocean", {"type": "episodic", "importance": 0.9})
+
+    assert [doc_id for doc_id, _ in index.search("anika biologist")] == ["a", "b"]
+    assert [doc_id for doc_id, _ in index.search("anika", where={"importance": {"$gte": 0.5}})] == ["a"]
+
+    index.add("a", "Anika moved to Lisbon", {"type": "semantic", "importance": 0.9})
+    index.remove("b")
+    assert index.search("biologist") == [] and index.search("biscuit") == []
+    assert [doc_id for doc_id, _ in index.search("lisbon")] == ["a"]
+    assert len(index) == 2 and index.total_length == sum(index.doc_lengths.values())
+
+
+def test_where_filters_follow_chroma_semantics():
+    metadata = {"type": "semantic", "importance": 0.6, "user_email": ""}
+    scope = {"$or": [{"user_email": "u@example.com"}, {"user_email": ""}]}
+
+    assert matches_where(metadata, combine_filters({"type": "semantic", "importance": {"$gte": 0.5}}, scope))
+    assert not matches_where(metadata, {"type": {"$in": ["episodic", "procedural"]}})
+    assert not matches_where({"type": "semantic"}, {"importance": {"$gt": 0.1}})
+    assert combine_filters({}, None) is None
+    assert combine_filters({"type": "semantic"}) == {"type": "semantic"}
+
+
+def test_reciprocal_rank_fusion_rewards_agreement():
+    fused = reciprocal_rank_fusion([["x", "y", "z"], ["y", "w"]])
+    assert [doc_id for doc_id, _ in fused] == ["y", "x", "w", "z"]
+
+
+def test_keyword_matches_are_fused_into_memory_search(offline_store):
+    manager = MemoryManager(mind_id="hybrid-search")
+    for i in range(20):
+        manager.add_memory(f"I enjoyed a quiet conversation about the weather, number {i}", MemoryType.EPISODIC)
+    creator = manager.add_memory("Ship-name Zephyrine was chosen by my creator", MemoryType.SEMANTIC, importance=0.9)
+    manager.add_memory("Zephyrine is also a kind of weather pattern", MemoryType.EPISODIC, importance=0.2)
+
+    results = manager.vector_store.hybrid_search("Who chose Zephyrine?", n_results=3)
+    assert results[0]["id"] == creator.id and results[0]["lexical_rank"] == 1
+    assert all(result["lexical_rank"] or result["vector_rank"] for result in results)
+
+    # Type and importance filters are pushed into both retrievers
+    found = manager.search_memories("zephyrine weather", memory_type=MemoryType.SEMANTIC, min_importance=0.5)
+    assert [memory.id for memory in found] == [creator.id]
+
+    manager.vector_store.delete_memory(creator.id)
+    assert creator.id not in manager.vector_store.lexical_index
+
+
+def test_retrieval_benchmark_smoke(offline_store):
+    report = run_benchmark(memories=200, queries=20, k=5, embedding="hashed")
+
+    assert report.memories == 200 and set(report.recall) == {"vector", "bm25", "hybrid"}
+    assert report.recall["bm25"] > 0 and report.latency_ms_p95["hybrid"] > 0
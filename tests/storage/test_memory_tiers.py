@@ -0,0 +1,80 @@
+"""Tests for hot/warm/cold memory tiering."""
+
+from datetime import datetime, timedelta
+
+from genesis.storage.memory import MemoryManager, MemoryType
+from genesis.storage.memory_consolidation import MemoryConsolidator
+from genesis.storage.memory_tiers import MemoryTiering
+
+
+def _manager(mind_id, hot_capacity=10, warm_capacity=25):
+    manager = MemoryManager(mind_id=mind_id)
+    manager.tiering = MemoryTiering(manager, hot_capacity=hot_capacity, warm_capacity=warm_capacity)
+    return manager
+
+
+async def test_rebalance_bounds_hot_tier_and_cache(offline_store):
+    manager = _manager("tiers-bounded")
+    plan = manager.add_memory("I need to call the harbour master", MemoryType.PROSPECTIVE, importance=0.1)
+    important = manager.add_memory("My creator named me Zephyrine", MemoryType.SEMANTIC, importance=0.95)
+    for i in range(30):
+        manager.add_memory(f"Small talk about the weather, number {i}", MemoryType.EPISODIC, importance=0.3)
+
+    stats = manager.tiering.rebalance()
+    assert (stats["demoted"], stats["hot"], stats["warm"], stats["cold"]) == (22, 10, 22, 0)
+    assert len(manager.memories) <= 10
+    assert plan.id in manager.memories and important.id in manager.memories
+
+    # Warm overflow goes to cold; the counts are tracked without scanning.
+    # Off the event loop, the cache is only trimmed once the work returns
+    for i in range(10):
+        manager.add_memory(f"Another chat about the rain, number {i}", MemoryType.EPISODIC, importance=0.2)
+    stats = await manager.tiering.rebalance_async()
+    assert (stats["hot"], stats["warm"], stats["cold"], stats["cached"]) == (10, 25, 7, 10)
+    assert manager.tiering.warm.count() == 25 and stats["cold_bytes"] > 0
+
+
+def test_search_promotes_warm_memories(offline_store):
+    manager = _manager("tiers-promote", hot_capacity=5)
+    lighthouse = manager.add_memory("The lighthouse keeper is called Oskar Lindqvist", MemoryType.SEMANTIC, importance=0.1)
+    for i in range(10):
+        manager.add_memory(f"A quiet evening reading, number {i}", MemoryType.EPISODIC, importance=0.6)
+    manager.tiering.rebalance()
+    assert lighthouse.id not in manager.memories and manager.tiering.warm_count == 6
+
+    # No hot memory mentions the name, so warm is searched
+    found = manager.search_memories("Who is Oskar Lindqvist?", limit=3)
+    assert found[0].id == lighthouse.id
+
+    # Promotion waits for the next rebalance, which keeps it hot despite its low importance
+    assert manager.tiering.warm.get_memory(lighthouse.id) is not None
+    stats = manager.tiering.rebalance()
+    assert (stats["promoted"], stats["demoted"], stats["hot"]) == (1, 1, 5)
+    assert manager.vector_store.get_memory(lighthouse.id) is not None
+
+
+async def test_deep_recall_reaches_archived_memories(offline_store):
+    manager = _manager("tiers-cold")
+    old = manager.add_memory("We once sailed to Tórshavn with Ingrid Halvorsen", MemoryType.EPISODIC, importance=0.2)
+    old.timestamp = datetime.now() - timedelta(days=400)
+    private = manager.add_memory(
+        "Ingrid Halvorsen told me a secret", MemoryType.EPISODIC, importance=0.2, user_email="b@example.com"
+    )
+    private.timestamp = old.timestamp
+    manager.add_memory("Today I organised my notes", MemoryType.EPISODIC, importance=0.9)
+
+    # The consolidator's archive step moves old, low-value memories to cold storage
+    assert MemoryConsolidator(manager)._archive_old_memories() == 2
+    assert manager.vector_store.count() == 1 and manager.tiering.cold.count() == 2
+    assert old.id not in manager.memories
+
+    found = await manager.search_memories_async("Ingrid Halvorsen")
+    assert {memory.id for memory in found}.isdisjoint({old.id, private.id})
+
+    recalled = manager.deep_recall("Ingrid Halvorsen", user_email="a@example.com")
+    assert old.id in [memory.id for memory in recalled] and private.id not in [memory.id for memory in recalled]
+    assert old.id not in manager.memories
+
+    # What Mind.think uses for "do you remember" requests
+    recalled = await manager.deep_recall_async("Ingrid Halvorsen", user_email="a@example.com")
+    assert old.id in [memory.id for memory in recalled] and private.id not in [memory.id for memory in recalled]
@@ -0,0 +1,106 @@
+"""Tests for the async vector store API."""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from genesis.storage import vector_store
+from genesis.storage.memory import MemoryManager, MemoryType
+from genesis.storage.retrieval_benchmark import HashingEmbeddingFunction, run_stall_benchmark
+
+
+class _CountingEmbedding(HashingEmbeddingFunction):
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    def __call__(self, input):
+        self.calls.append(len(input))
+        return super().__call__(input)
+
+
+@pytest.fixture
+def single_worker(monkeypatch):
+    executor = ThreadPoolExecutor(max_workers=1)
+    monkeypatch.setattr(vector_store, "_executor", executor)
+    monkeypatch.setattr(vector_store, "_embedding_batcher", None)
+    yield executor
+    executor.shutdown(wait=True)
+
+
+async def test_concurrent_searches_share_one_embedding_call(offline_store, single_worker, monkeypatch):
+    manager = MemoryManager(mind_id="async-search")
+    for topic in ["gardening", "jazz", "chess", "trains"]:
+        await manager.add_memory_async(f"We talked about {topic} today", MemoryType.EPISODIC)
+    embedding = _CountingEmbedding()
+    monkeypatch.setattr(vector_store, "_embedding_function", embedding)
+
+    # Hold the only worker so all queries queue up behind it, as under load
+    release = threading.Event()
+    single_worker.submit(release.wait)
+    queries = ["gardening", "jazz", "chess", "trains"] * 2
+    searches = asyncio.gather(*(manager.search_memories_async(query, limit=1) for query in queries))
+    await asyncio.sleep(0.05)
+    release.set()
+    results = await searches
+
+    assert embedding.calls == [len(queries)]
+    assert [memories[0].content for memories in results] == [f"We talked about {q} today" for q in queries]
+    assert [m.id for m in manager.search_memories("jazz", limit=1)] == [results[1][0].id]
+    assert vector_store.get_embedding_batcher().get_stats()["largest_batch"] == len(queries)
+
+
+async def test_add_memory_async_updates_the_cache_on_the_loop(offline_store, single_worker):
+    manager = MemoryManager(mind_id="async-add")
+
+    # With the only worker busy, the memory is already cached while its embedding waits
+    release = threading.Event()
+    single_worker.submit(release.wait)
+    adding = asyncio.ensure_future(manager.add_memory_async("Ada likes jazz", MemoryType.EPISODIC, importance=0.9))
+    await asyncio.sleep(0.05)
+    [memory] = manager.memories.values()
+    assert manager.working_memory == [memory.id] and not adding.done()
+
+    release.set()
+    assert await adding is memory
+    assert [m.id for m in await manager.search_memories_async("jazz", limit=1)] == [memory.id]
+
+
+async def test_embedding_errors_reach_every_waiting_search(offline_store, single_worker, monkeypatch):
+    def offline(texts):
+        raise ConnectionError("model download failed")
+
+    store = vector_store.VectorStore("async-errors")
+    monkeypatch.setattr(vector_store, "_embedding_function", offline)
+
+    results = await asyncio.gather(store.search_async("a"), store.search_async("b"), return_exceptions=True)
+    assert all(isinstance(result, ConnectionError) for result in results)
+
+
+async def test_cancelled_search_does_not_strand_its_batch(offline_store, single_worker, monkeypatch):
+    embedding = _CountingEmbedding()
+    monkeypatch.setattr(vector_store, "_embedding_function", embedding)
+    batcher = vector_store.get_embedding_batcher()
+
+    release = threading.Event()
+    single_worker.submit(release.wait)
+    waiting = [asyncio.ensure_future(batcher.embed(text)) for text in ["a", "b", "c"]]
+    await asyncio.sleep(0.05)
+    waiting[1].cancel()
+    await asyncio.sleep(0.05)  # Let the cancellation reach the batcher's future
+    release.set()
+    first, third = await asyncio.wait_for(asyncio.gather(waiting[0], waiting[2]), timeout=5)
+
+    assert waiting[1].cancelled()
+    assert embedding.calls == [2]
+    assert list(first) == list(embedding(["a"])[0])
+    assert list(third) == list(embedding(["c"])[0])
+
+
+def test_stall_benchmark_smoke(offline_store):
+    report = run_stall_benchmark(memories=200, searches=24, concurrency=4, embedding="hashed")
+
+    assert set(report.max_stall_ms) == {"blocking", "async"}
+    assert report.embedding_batches["batches"] >= 1
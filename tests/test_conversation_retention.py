@@ -0,0 +1,52 @@
+"""Tests for tiered conversation retention."""
+
+from datetime import datetime, timedelta
+
+from genesis.database.base import get_session
+from genesis.database.models import MindRecord
+from genesis.storage.conversation import ConversationManager
+from genesis.storage.conversation_retention import ConversationRetention, load_archive
+
+
+async def test_old_spans_become_summaries_and_archives(tmp_path, fresh_db):
+    with get_session() as session:
+        session.add(MindRecord(gmid='GMID-R', name='Retained', creator='tester'))
+
+    cm = ConversationManager('GMID-R')
+    old = datetime.now() - timedelta(days=60)
+    for i in range(30):
+        cm.add_message('user' if i % 2 == 0 else 'assistant', f'old {i}', user_email='a@x.com',
+                       timestamp=old + timedelta(minutes=i))
+    for i in range(5):
+        cm.add_message('user', f'new {i}', user_email='a@x.com')
+    cm.add_message('user', 'other thread', user_email='b@x.com', timestamp=old)
+
+    spans = []
+
+    async def summarize(messages):
+        spans.append(len(messages))
+        return f"Talked about {messages[0]['content']} onwards"
+
+    retention = ConversationRetention(
+        'GMID-R', archive_dir=tmp_path / 'archive', summarize=summarize,
+        hot_days=30, hot_messages=10, span_size=12, min_span=2,
+    )
+    stats = await retention.run()
+
+    # Newest 10 of the thread stay hot; 25 old ones are compacted in spans of <= 12
+    assert spans == [12, 12]
+    assert stats['messages_compacted'] == 24
+    assert stats['summaries_created'] == 2
+    assert stats['archive_bytes'] > 0
+
+    remaining = cm.get_recent_messages(limit=100, user_email='a@x.com')
+    assert len(remaining) == 11
+    assert cm.get_conversation_threads(user_email='a@x.com')[0]['message_count'] == 11
+
+    summaries = cm.get_summaries(user_email='a@x.com')
+    assert [s['content'] for s in summaries] == ['Talked about old 0 onwards', 'Talked about old 12 onwards']
+    archived = load_archive(summaries[0]['archive_path'])
+    assert [m['content'] for m in archived] == [f'old {i}' for i in range(12)]
+
+    # A lone message in another thread is below min_span and stays
+    assert len(cm.get_recent_messages(user_email='b@x.com')) == 1
@@ -0,0 +1,87 @@
+"""Tests for keyset message pages and maintained conversation threads."""
+
+from datetime import datetime, timedelta
+
+from genesis.database.base import get_session
+from genesis.database.models import ConversationThread, MindRecord
+from genesis.storage.conversation import ConversationManager
+
+
+def _make_manager() -> ConversationManager:
+    with get_session() as session:
+        session.add(MindRecord(gmid='GMID-T', name='Test Mind', creator='tester'))
+    return ConversationManager(mind_gmid='GMID-T')
+
+
+def test_message_pages_with_equal_timestamps(fresh_db):
+    cm = _make_manager()
+    # Identical timestamps force the id tie-breaker
+    ts = datetime(2026, 1, 1, 12, 0)
+    ids = [cm.add_message('user', f'm{i}', user_email='a@x.com', timestamp=ts).id for i in range(23)]
+
+    seen, cursor = [], None
+    while True:
+        page, cursor = cm.get_messages_page(limit=5, user_email='a@x.com', cursor=cursor)
+        seen = [m['id'] for m in page] + seen
+        if cursor is None:
+            break
+    assert seen == ids
+
+    forward = cm.get_messages_since(ts, user_email='a@x.com', after_id=ids[19], limit=2)
+    assert [m['id'] for m in forward] == ids[20:22]
+
+
+def test_threads_are_maintained_and_paged(fresh_db):
+    cm = _make_manager()
+    base = datetime(2026, 1, 1)
+    cm.add_message('user', 'hello lab', user_email='a@x.com', environment_id='ENV-1', timestamp=base)
+    cm.add_message('assistant', 'hi there', user_email='a@x.com', environment_id='ENV-1',
+                   timestamp=base + timedelta(minutes=5))
+    cm.add_message('user', 'direct', user_email='a@x.com', timestamp=base + timedelta(minutes=1))
+    cm.add_message('user', 'other user', user_email='b@x.com', timestamp=base + timedelta(minutes=2))
+    # A backdated message counts but doesn't become the last message
+    cm.add_message('user', 'late import', user_email='a@x.com', environment_id='ENV-1',
+                   timestamp=base - timedelta(days=1))
+
+    threads = cm.get_conversation_threads(user_email='a@x.com')
+    assert [(t['environment_id'], t['message_count']) for t in threads] == [('ENV-1', 3), (None, 1)]
+    assert threads[0]['last_message_preview'] == 'hi there'
+    assert threads[0]['last_message_role'] == 'assistant'
+
+    first, cursor = cm.get_conversation_threads_page(limit=2)
+    rest, end = cm.get_conversation_threads_page(limit=2, cursor=cursor)
+    assert [t['user_email'] for t in first + rest] == ['a@x.com', 'b@x.com', 'a@x.com']
+    assert end is None
+
+    # Summaries missing for older history are rebuilt on first read
+    with get_session() as session:
+        session.query(ConversationThread).delete()
+    assert cm.get_conversation_threads(user_email='a@x.com') == threads
+
+    cm.clear_all()
+    assert cm.get_conversation_threads() == []
+
+
+def test_first_write_backfills_older_history(fresh_db):
+    cm = _make_manager()
+    base = datetime(2026, 1, 1)
+    for i in range(5):
+        cm.add_message('user', f'old {i}', user_email='a@x.com', timestamp=base + timedelta(minutes=i))
+    cm.add_message('user', 'elsewhere', user_email='b@x.com', environment_id='ENV-2', timestamp=base)
+    # History written before the threads table existed
+    with get_session() as session:
+        session.query(ConversationThread).delete()
+
+    cm.add_message('user', 'new', user_email='a@x.com', timestamp=base + timedelta(hours=1))
+    threads = cm.get_conversation_threads()
+    assert [(t['user_email'], t['message_count']) for t in threads] == [('a@x.com', 6), ('b@x.com', 1)]
+    assert threads[0]['last_message_preview'] == 'new'
+
+    # A key missing from an otherwise populated table is seeded from its messages
+    with get_session() as session:
+        session.query(ConversationThread).filter_by(user_email='b@x.com').delete()
+    cm.add_message('assistant', 'reply', user_email='b@x.com', environment_id='ENV-2',
+                   timestamp=base - timedelta(minutes=1))
+    thread = cm.get_conversation_threads(user_email='b@x.com')[0]
+    assert (thread['message_count'], thread['last_message_preview']) == (2, 'elsewhere')
+
@@ -0,0 +1,71 @@
+"""Import-time benchmark guarding CLI startup (python -X importtime).
+
+`genesis`, the CLI and the model orchestrator must not pull in the Mind
+stack, ChromaDB, SQLAlchemy or provider SDKs at import time - those load
+only when a command or provider actually needs them.
+"""
+
+import subprocess
+import sys
+from typing import Dict
+
+import pytest
+
+HEAVY_MODULES = (
+    "genesis.core.mind",
+    "chromadb",
+    "sqlalchemy",
+    "openai",
+    "anthropic",
+    "groq",
+    "google.generativeai",
+)
+
+# Generous ceiling for the CLI import (it took ~5s before lazy imports)
+CLI_IMPORT_BUDGET_US = 2_000_000
+
+
+def _import_profile(module: str) -> Dict[str, int]:
+    """Cumulative import time (microseconds) of every module loaded by `import module`."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    profile = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        profile[name.strip()] = int(cumulative)
+    return profile
+
+
+def _slowest(profile: Dict[str, int], n: int = 10) -> str:
+    top = sorted(profile.items(), key=lambda item: item[1], reverse=True)[:n]
+    return "\n".join(f"{us / 1000:8.1f} ms  {name}" for name, us in top)
+
+
+def test_package_import_is_lazy():
+    profile = _import_profile("genesis")
+    loaded = [m for m in HEAVY_MODULES if m in profile]
+    assert not loaded, f"`import genesis` loaded {loaded}\n{_slowest(profile)}"
+
+
+def test_cli_import_skips_mind_stack():
+    profile = _import_profile("genesis.cli.main")
+    loaded = [m for m in HEAVY_MODULES if m in profile]
+    assert not loaded, f"CLI import loaded {loaded}\n{_slowest(profile)}"
+
+
+@pytest.mark.benchmark
+def test_cli_import_stays_fast():
+    profile = _import_profile("genesis.cli.main")
+    assert profile["genesis.cli.main"] < CLI_IMPORT_BUDGET_US, _slowest(profile)
+
+
+def test_orchestrator_defers_provider_sdks():
+    profile = _import_profile("genesis.models.orchestrator")
+    loaded = [m for m in ("openai", "anthropic", "groq", "google.generativeai") if m in profile]
+    assert not loaded, f"Orchestrator import loaded {loaded}\n{_slowest(profile)}"
@@ -0,0 +1,99 @@
+"""Tests for per-call LLM spans and the metrics registry."""
+
+import pytest
+
+from genesis.models.base import ModelResponse
+from genesis.models.orchestrator import ModelOrchestrator
+from genesis.models.telemetry import LLMMetricsRegistry, estimate_cost, get_llm_metrics
+
+
+class _FakeProvider:
+    supports_prompt_caching = False
+
+    def __init__(self, usage=None, fail=False):
+        self.usage = usage
+        self.fail = fail
+        self.kwargs = None
+
+    async def generate(self, messages, model, temperature, max_tokens, **kwargs):
+        self.kwargs = kwargs
+        if self.fail:
+            raise RuntimeError("rate limited")
+        return ModelResponse(content="Hello there", model=model, provider="openai", usage=self.usage)
+
+    async def stream_generate(self, messages, model, temperature, max_tokens, **kwargs):
+        for chunk in ("Hel", "lo"):
+            yield chunk
+
+
+def _orchestrator(provider) -> ModelOrchestrator:
+    orchestrator = ModelOrchestrator.__new__(ModelOrchestrator)
+    orchestrator.providers = {"openai": provider}
+    return orchestrator
+
+
+@pytest.fixture(autouse=True)
+def _reset_metrics():
+    get_llm_metrics().reset()
+    yield
+    get_llm_metrics().reset()
+
+
+async def test_generate_records_tagged_span():
+    provider = _FakeProvider(usage={"input_tokens": 1000, "output_tokens": 200, "cached_tokens": 800,
+                                    "cache_write_tokens": 0})
+    orchestrator = _orchestrator(provider)
+
+    await orchestrator.generate(
+        [{"role": "user", "content": "Hi"}], model="openai/gpt-4o",
+        purpose="intent_classification", mind_id="GMD-1"
+    )
+
+    # Telemetry tags are not forwarded to the provider
+    assert provider.kwargs == {}
+    snapshot = get_llm_metrics().snapshot()
+    [series] = snapshot["series"]
+    assert (series["purpose"], series["provider"], series["model"]) == ("intent_classification", "openai", "gpt-4o")
+    assert (series["prompt_tokens"], series["completion_tokens"], series["cached_tokens"]) == (1000, 200, 800)
+    assert series["cost_usd"] == pytest.approx(estimate_cost("openai", "gpt-4o", 1000, 200, 800))
+    assert snapshot["by_mind"]["GMD-1"]["calls"] == 1
+
+    [span] = snapshot["recent"]
+    assert span["success"] and not span["tokens_estimated"] and span["latency_ms"] >= span["queue_wait_ms"]
+
+
+async def test_errors_and_streams_are_recorded():
+    orchestrator = _orchestrator(_FakeProvider(fail=True))
+    with pytest.raises(RuntimeError):
+        await orchestrator.generate([{"role": "user", "content": "Hi"}], model="openai/gpt-4o", purpose="reranker")
+
+    orchestrator = _orchestrator(_FakeProvider())
+    chunks = [c async for c in orchestrator.stream_generate(
+        [{"role": "user", "content": "Hi"}], model="openai/gpt-4o", purpose="chat_stream"
+    )]
+    assert "".join(chunks) == "Hello"
+
+    snapshot = get_llm_metrics().snapshot()
+    assert snapshot["by_purpose"]["reranker"]["errors"] == 1
+    stream = snapshot["recent"][-1]
+    assert stream["streamed"] and stream["ttft_ms"] is not None and stream["tokens_estimated"]
+    assert stream["completion_tokens"] == 2
+
+
+def test_cost_estimates_and_prometheus_format():
+    assert estimate_cost("openrouter", "meta-llama/llama-3.3-70b-instruct:free", 1000, 1000) == 0.0
+    assert estimate_cost("ollama", "llama3", 1000, 1000) == 0.0
+    assert estimate_cost("openai", "some-new-model", 1000, 1000) is None
+
+    from genesis.models.telemetry import LLMSpan
+
+    registry = LLMMetricsRegistry()
+    span = LLMSpan(purpose='say "hi"', provider="openai", model="gpt-4o")
+    span.dispatched()
+    registry.record(span.finish([{"role": "user", "content": "x" * 40}], content="ok"))
+
+    text = registry.to_prometheus()
+    labels = 'purpose="say \\"hi\\"",provider="openai",model="gpt-4o"'
+    assert f"genesis_llm_calls_total{{{labels}}} 1" in text
+    assert f'genesis_llm_latency_seconds_bucket{{{labels},le="+Inf"}} 1' in text
+    assert "# TYPE genesis_llm_ttft_seconds histogram" in text
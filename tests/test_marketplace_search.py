@@ -0,0 +1,80 @@
+"""Tests for indexed marketplace search and keyset pagination."""
+
+from genesis.database.base import get_session_factory
+from genesis.database.init_marketplace import init_marketplace_tables
+from genesis.database.marketplace_models import ItemType
+from genesis.marketplace.manager import MarketplaceManager
+
+
+def _make_manager() -> MarketplaceManager:
+    return MarketplaceManager(get_session_factory()())
+
+
+def _create(manager, title, description, tags, price=10.0):
+    return manager.create_listing(
+        seller_id="seller",
+        seller_name="Seller",
+        item_type=ItemType.SKILL,
+        title=title,
+        description=description,
+        price=price,
+        data={},
+        tags=tags,
+    )
+
+
+def test_full_text_search_ranks_and_filters_tags(fresh_db):
+    manager = _make_manager()
+    in_title = _create(manager, "Python tutor", "Teaches programming", ["Education", "python"])
+    in_body = _create(manager, "Code helper", "Knows some python tricks", ["tools"])
+    _create(manager, "Gardening guide", "Plants and soil", ["outdoors"])
+
+    results = manager.search_listings(query="python")
+    assert [listing.id for listing in results] == [in_title.id, in_body.id]
+
+    # Prefix match, and user input with FTS syntax is treated as plain words
+    assert [listing.id for listing in manager.search_listings(query='progr"(')] == [in_title.id]
+    assert manager.search_listings(query="***") == []
+
+    # Tag filters are case-insensitive and require every tag
+    assert [listing.id for listing in manager.search_listings(tags=["education", "PYTHON"])] == [in_title.id]
+    assert manager.search_listings(tags=["education", "tools"]) == []
+
+    # Updates and soft deletes keep the index in sync
+    manager.update_listing(in_body.id, "seller", title="Python code helper", tags=["python"])
+    assert {listing.id for listing in manager.search_listings(tags=["python"])} == {in_title.id, in_body.id}
+    manager.delete_listing(in_title.id, "seller")
+    assert [listing.id for listing in manager.search_listings(query="python")] == [in_body.id]
+
+
+def test_keyset_pages_cover_every_listing_once(fresh_db):
+    manager = _make_manager()
+    # Duplicate prices force the id tie-breaker
+    ids = {_create(manager, f"Skill {i}", "A useful skill", [], price=float(i % 3)).id for i in range(25)}
+
+    for sort_by, query in (("price", None), ("created_at", None), ("relevance", "skill")):
+        seen, cursor = [], None
+        while True:
+            page, cursor = manager.search_listings_page(query=query, sort_by=sort_by, limit=7, cursor=cursor)
+            seen.extend(listing.id for listing in page)
+            if cursor is None:
+                break
+        assert len(seen) == len(set(seen)) == 25, sort_by
+        assert set(seen) == ids
+
+
+def test_existing_listings_are_backfilled(fresh_db):
+    manager = _make_manager()
+    chess = _create(manager, "Chess coach", "Openings and endgames", ["games"])
+
+    # Simulate a database created before the search index existed
+    from sqlalchemy import text
+    manager.session.execute(text("DELETE FROM marketplace_listings_fts"))
+    manager.session.execute(text("DELETE FROM marketplace_search_docs"))
+    manager.session.execute(text("DELETE FROM marketplace_listing_tags"))
+    manager.session.commit()
+    assert manager.search_listings(query="chess") == []
+
+    init_marketplace_tables()
+    assert [listing.id for listing in manager.search_listings(query="chess")] == [chess.id]
+    assert [listing.id for listing in manager.search_listings(tags=["games"])] == [chess.id]
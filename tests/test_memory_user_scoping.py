@@ -1,6 +1,9 @@
 """Tests to ensure memory user scoping and privacy."""
 
+from genesis.config import get_settings
+from genesis.storage import vector_store
 from genesis.storage.memory import MemoryManager, MemoryType
+from genesis.storage.retrieval_benchmark import HashingEmbeddingFunction
 
 
 def test_memory_user_scoping_personal_vs_shared():
@@ -56,3 +59,44 @@ def test_get_recent_memories_restores_user_email():
     found = next((m for m in recent if m.id == mem.id), None)
     assert found is not None
     assert found.user_email == "u@example.com"
+
+
+def test_user_scope_is_part_of_the_query(tmp_path, monkeypatch):
+    monkeypatch.setattr(get_settings(), "data_dir", tmp_path)
+    monkeypatch.setattr(vector_store, "_embedding_function", HashingEmbeddingFunction())
+    monkeypatch.setattr(vector_store, "_lexical_indexes", {})
+    manager = MemoryManager(mind_id="test-scope-pushdown")
+
+    # A busy Mind: many other users' personal memories match the query better
+    for i in range(30):
+        manager.add_memory(
+            content=f"User {i} planned the garden party menu",
+            memory_type=MemoryType.EPISODIC,
+            user_email=f"user{i}@example.com",
+            relationship_context="personal",
+        )
+    mine = manager.add_memory(
+        content="The party is on Saturday",
+        memory_type=MemoryType.EPISODIC,
+        user_email="me@example.com",
+        relationship_context="personal",
+    )
+    shared = manager.add_memory(
+        content="Everyone is invited to the garden party",
+        memory_type=MemoryType.SEMANTIC,
+        user_email="user0@example.com",
+        relationship_context="shared",
+    )
+
+    results = manager.search_memories(query="garden party menu", limit=2, user_email="me@example.com")
+    assert {m.id for m in results} == {mine.id, shared.id}
+
+    # Merging a memory into another user's personal context updates what the query sees
+    manager.deduplicator = type("Always", (), {"should_merge": lambda self, c, t: (True, shared.id, 0.9)})()
+    manager.add_memory_smart(
+        "Only user0 is invited to the garden party",
+        MemoryType.SEMANTIC,
+        relationship_context="personal",
+    )
+    results = manager.search_memories(query="garden party menu", limit=2, user_email="me@example.com")
+    assert [m.id for m in results] == [mine.id]
@@ -0,0 +1,43 @@
+"""Tests for materialized metaverse statistics."""
+
+from genesis.database.base import get_session
+from genesis.database.manager import MetaverseDB, adjust_metaverse_stats
+from genesis.database.models import EnvironmentRecord
+
+
+def test_counters_track_writes_and_reconcile(fresh_db):
+    db = MetaverseDB()
+    db.register_mind(gmid="GMID-A", name="A", creator="tester")
+    db.register_mind(gmid="GMID-B", name="B", creator="tester")
+    db.register_mind(gmid="GMID-A", name="A", creator="tester")  # Already registered
+    db.register_environment("ENV-1", "Lab", "professional", owner_gmid="GMID-A")
+    db.update_environment_occupancy("ENV-1", [{"gmid": "GMID-A", "name": "A"}])
+    db.update_environment_occupancy("ENV-1", [{"gmid": "GMID-A", "name": "A"}, {"gmid": "GMID-B", "name": "B"}])
+    db.record_visit_start("GMID-A", "ENV-1")
+    db.create_relationship("GMID-A", "GMID-B", "friend")
+    db.create_relationship("GMID-A", "GMID-B", "colleague")  # Updates the existing one
+
+    stats = db.get_metaverse_stats()
+    assert stats["total_minds"] == 2
+    assert stats["active_minds"] == 2
+    assert stats["total_environments"] == 1
+    assert stats["occupied_environments"] == 1
+    assert stats["total_visits"] == 1
+    assert stats["total_relationships"] == 1
+
+    # A write that bypasses the counters drifts until reconciliation
+    with get_session() as session:
+        session.add(EnvironmentRecord(env_id="ENV-2", name="Side door", env_type="social"))
+    assert db.get_metaverse_stats()["total_environments"] == 1
+
+    reconciled = db.reconcile_metaverse_stats()
+    assert reconciled["total_environments"] == 2
+    assert reconciled["online_now"] == 2
+    assert reconciled["reconciled_at"] is not None
+    assert {k: reconciled[k] for k in ("total_minds", "active_minds", "occupied_environments", "total_visits")} == {
+        "total_minds": 2, "active_minds": 2, "occupied_environments": 1, "total_visits": 1,
+    }
+
+    with get_session() as session:
+        adjust_metaverse_stats(session, total_visits=3)
+    assert db.get_metaverse_stats()["total_visits"] == 4
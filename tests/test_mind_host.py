@@ -0,0 +1,93 @@
+"""Tests for multi-Mind host sharding and fault isolation."""
+
+import json
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from genesis.core.mind_scheduler import get_mind_scheduler
+from genesis.daemon import MindDaemon
+from genesis.host import MindHost, list_mind_gmids, shard_for_gmid
+
+
+def test_shard_assignment_is_stable_and_covers_all_minds(tmp_path):
+    gmids = [f"GMID-{i:04d}" for i in range(200)]
+    for gmid in gmids:
+        (tmp_path / f"{gmid}.json").write_text(json.dumps({"identity": {"gmid": gmid, "name": gmid}}))
+    (tmp_path / "broken.json").write_text("{not json")
+
+    assert sorted(list_mind_gmids(tmp_path)) == gmids
+
+    shards = [shard_for_gmid(gmid, 4) for gmid in gmids]
+    assert shards == [shard_for_gmid(gmid, 4) for gmid in gmids]
+    assert set(shards) == {0, 1, 2, 3}
+    assert all(shard_for_gmid(gmid, 1) == 0 for gmid in gmids)
+
+
+async def test_failed_mind_is_isolated_and_recorded(tmp_path, monkeypatch):
+    monkeypatch.setenv('GENESIS_HOME', str(tmp_path))
+
+    host = MindHost(mind_ids=["GMID-missing"])
+    assert await host.add_mind("GMID-missing") is False
+    assert host.daemons == {}
+    assert host.failed["GMID-missing"]["attempts"] == 1
+
+    # Retries wait for the Mind's backoff, which doubles per failure up to the cap
+    await host._retry_failed()
+    assert host.failed["GMID-missing"]["attempts"] == 1
+    host.failed["GMID-missing"]["retry_at"] = datetime.now().isoformat()
+    await host._retry_failed()
+    assert host.failed["GMID-missing"]["attempts"] == 2
+    base = host.settings.host_restart_backoff
+    assert host._retry_delay(2) == timedelta(seconds=2 * base)
+    assert host._retry_delay(50) == timedelta(seconds=host.settings.host_restart_backoff_max)
+
+    report = host.get_report()
+    assert report["minds_running"] == 0
+    assert report["minds_failed"] == 1
+
+
+async def test_removed_mind_leaves_no_scheduler_jobs(tmp_path, monkeypatch):
+    monkeypatch.setenv('GENESIS_HOME', str(tmp_path))
+    scheduler = get_mind_scheduler()
+    gmid = "GMID-removed"
+
+    async def tick():
+        pass
+
+    stopped = []
+
+    async def stop_living():
+        stopped.append(True)
+
+    daemon = MindDaemon(gmid)
+    daemon.is_running = True
+    daemon.mind = SimpleNamespace(identity=SimpleNamespace(name="Removed"), stop_living=stop_living, save=lambda: None)
+    for name in ("daemon_save", "living_heartbeat", "notification_delivery", "llm_batch"):
+        scheduler.schedule(tick, interval=3600, owner=gmid, name=name)
+
+    host = MindHost(mind_ids=[gmid])
+    host.daemons[gmid] = daemon
+    await host.remove_mind(gmid)
+
+    assert stopped == [True]
+    assert scheduler.get_jobs(owner=gmid) == []
+
+
+async def test_minds_born_after_launch_are_discovered(tmp_path, monkeypatch):
+    host = MindHost()
+    minds_dir = tmp_path
+    monkeypatch.setattr(host.settings, "minds_dir", minds_dir)
+    (minds_dir / "GMID-old.json").write_text(json.dumps({"identity": {"gmid": "GMID-old"}}))
+    assert host.assigned_mind_ids() == ["GMID-old"]
+
+    added = []
+
+    async def add_mind(gmid):
+        added.append(gmid)
+        return True
+
+    monkeypatch.setattr(host, "add_mind", add_mind)
+    (minds_dir / "GMID-new.json").write_text(json.dumps({"identity": {"gmid": "GMID-new"}}))
+    await host._discover_minds()
+    await host._discover_minds()
+    assert added == ["GMID-new"]
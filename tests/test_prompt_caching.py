@@ -0,0 +1,81 @@
+"""Tests for provider-side prompt caching hints and cached-token usage."""
+
+from types import SimpleNamespace
+
+from genesis.models.anthropic_provider import AnthropicProvider, format_messages
+from genesis.models.base import CacheHint
+from genesis.models.openai_provider import OpenAIProvider
+from genesis.models.openrouter_provider import apply_cache_hint
+
+STATIC = "You are Ada.\n\nCORE RULES"
+MESSAGES = [
+    {"role": "system", "content": STATIC + "\n\nCURRENT STATE: calm"},
+    {"role": "user", "content": "Hi"},
+    {"role": "assistant", "content": "Hello!"},
+    {"role": "user", "content": "How are you?"},
+]
+
+
+class _Recorder:
+    """Fake SDK endpoint that records the request and returns a canned response."""
+
+    def __init__(self, response):
+        self.response = response
+        self.kwargs = None
+
+    async def create(self, **kwargs):
+        self.kwargs = kwargs
+        return self.response
+
+
+def test_anthropic_breakpoints_after_static_prefix_and_history():
+    system, messages = format_messages(MESSAGES, CacheHint(system_prefix=STATIC))
+    assert system == [
+        {"type": "text", "text": STATIC, "cache_control": {"type": "ephemeral"}},
+        {"type": "text", "text": "\n\nCURRENT STATE: calm"},
+    ]
+    assert messages[1]["content"][0]["cache_control"] == {"type": "ephemeral"}
+    assert messages[2]["content"] == "How are you?"
+
+    # A prefix that doesn't match leaves the request untouched
+    system, messages = format_messages(MESSAGES, CacheHint(system_prefix="Other", cache_history=False))
+    assert system == MESSAGES[0]["content"]
+    assert all(isinstance(m["content"], str) for m in messages)
+
+
+async def test_anthropic_reports_cached_tokens():
+    provider = AnthropicProvider()
+    recorder = _Recorder(SimpleNamespace(
+        content=[SimpleNamespace(text="Fine")],
+        stop_reason="end_turn",
+        usage=SimpleNamespace(input_tokens=10, output_tokens=5, cache_read_input_tokens=900,
+                              cache_creation_input_tokens=0),
+    ))
+    provider.client = SimpleNamespace(messages=recorder)
+
+    response = await provider.generate(MESSAGES, model="claude-3-5-sonnet", cache=CacheHint(system_prefix=STATIC))
+    assert response.usage == {"input_tokens": 910, "output_tokens": 5, "cached_tokens": 900, "cache_write_tokens": 0}
+    assert recorder.kwargs["system"][0]["cache_control"] == {"type": "ephemeral"}
+
+
+async def test_openai_keeps_prefix_first_and_routes_by_key():
+    provider = OpenAIProvider()
+    recorder = _Recorder(SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content="Fine"), finish_reason="stop")],
+        usage=SimpleNamespace(prompt_tokens=1200, completion_tokens=5, total_tokens=1205,
+                              prompt_tokens_details=SimpleNamespace(cached_tokens=1024)),
+    ))
+    provider.client = SimpleNamespace(chat=SimpleNamespace(completions=recorder))
+
+    shuffled = [MESSAGES[1], MESSAGES[0]]
+    response = await provider.generate(shuffled, model="gpt-4o", cache=CacheHint(system_prefix=STATIC, key="GMID-1"))
+    assert [m["role"] for m in recorder.kwargs["messages"]] == ["system", "user"]
+    assert recorder.kwargs["extra_body"] == {"prompt_cache_key": "GMID-1"}
+    assert response.usage["cached_tokens"] == 1024
+
+
+def test_openrouter_breakpoints_only_for_upstreams_that_need_them():
+    hint = CacheHint(system_prefix=STATIC)
+    claude = apply_cache_hint(MESSAGES, "anthropic/claude-3.5-sonnet", hint)
+    assert claude[0]["content"][0]["cache_control"] == {"type": "ephemeral"}
+    assert apply_cache_hint(MESSAGES, "deepseek/deepseek-chat", hint) == MESSAGES
@@ -145,7 +145,7 @@ export default function EnvironmentChatPage() {
           timestamp: message.timestamp,
         },
       ]);
-      setPresentMinds(message.present_minds);
+      setPresentMinds((prev) => (prev.includes(message.mind_id) ? prev : [...prev, message.mind_id]));
     } else if (message.type === 'mind_left') {
       setMessages((prev) => [
         ...prev,
@@ -155,7 +155,12 @@ export default function EnvironmentChatPage() {
           timestamp: message.timestamp,
         },
       ]);
-      setPresentMinds(message.present_minds);
+      setPresentMinds((prev) => prev.filter((id) => id !== message.mind_id));
+    } else if (message.type === 'state_update') {
+      // Full snapshot (periodic, or after this client fell behind)
+      if (message.state?.present_minds) {
+        setPresentMinds(message.state.present_minds);
+      }
     } else if (message.type === 'chat_message') {
       setMessages((prev) => [
         ...prev,
@@ -4,11 +4,11 @@
 
 export type EnvironmentMessage =
   | { type: 'welcome'; environment: any; message: string }
-  | { type: 'mind_joined'; mind_id: string; mind_name: string; present_minds: string[]; count: number; timestamp: string }
-  | { type: 'mind_left'; mind_id: string; mind_name: string; present_minds: string[]; count: number; timestamp: string }
+  | { type: 'mind_joined'; mind_id: string; mind_name: string; count: number; version: number; timestamp: string }
+  | { type: 'mind_left'; mind_id: string; mind_name: string; count: number; version: number; timestamp: string }
   | { type: 'chat_message'; from_mind_id: string; from_mind_name: string; content: string; emotion?: string; timestamp: string }
-  | { type: 'object_updated'; object_id: string; data: any; updated_by: string; timestamp: string }
-  | { type: 'variable_set'; name: string; value: any; set_by: string; timestamp: string }
+  | { type: 'object_updated'; object_id: string; data: any; updated_by: string; version: number; timestamp: string }
+  | { type: 'variable_set'; name: string; value: any; set_by: string; version: number; timestamp: string }
   | { type: 'state_update'; state: any }
   | { type: 'typing'; mind_id: string; mind_name: string; is_typing: boolean };
 